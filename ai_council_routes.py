@@ -1,10 +1,34 @@
 """
 TruthLens AI Council - Flask Routes
 File: ai_council_routes.py
-Date: January 10, 2026
-Version: 1.1.0
+Date: October 16, 2026
+Version: 1.3.1
 
 CHANGELOG:
+v1.3.1 (October 16, 2026):
+- FIX: Identical in-flight questions are coalesced across gunicorn workers
+  (RedisFlight) - a sync worker serves one request at a time, so the
+  per-process SingleFlight never saw two of them
+- FIX: Cache reuse requires the same content words and numbers
+  (services/council_cache.py 1.1.0)
+
+v1.3.0 (October 16, 2026):
+- NEW: Repeated questions are answered from a recent query (exact or
+  near-duplicate wording, services/council_cache.py) instead of asking
+  every provider again. Responses carry cached / cache_match /
+  cached_question; pass ?fresh=1 to force a new fan-out
+- NEW: Identical questions asked at the same time share one fan-out
+  (services/single_flight.py) - /ask and /ask/stream alike
+- NEW: Cache hit rates in GET /api/ai-council/stats
+
+v1.2.0 (October 16, 2026):
+- NEW: POST /api/ai-council/ask/stream - Server-Sent Events: each AI's
+  answer as it arrives, consensus tokens once a quorum has answered, then
+  the saved query id (AICouncilService.stream_query)
+- CHANGED: Claims come from the consensus call and are passed to the claim
+  tracker as-is - no separate extraction round trip
+- CHANGED: Persistence shared by /ask and /ask/stream (save_council_query)
+
 v1.1.0 (January 10, 2026):
 - Fixed frontend compatibility: response fields now match frontend expectations
 - Changed 'service' → 'ai_service' for frontend display
@@ -15,16 +39,21 @@ v1.1.0 (January 10, 2026):
 v1.0.0 (January 9, 2026):
 - Initial release
 
-Last modified: January 10, 2026 - v1.1.0 Frontend Fix
+Last modified: October 16, 2026 - v1.3.1 Cross-Worker Coalescing
 I did no harm and this file is not truncated.
 """
 
+import json
 import logging
+import threading
 import traceback
 from datetime import datetime, timedelta
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, Response, stream_with_context
 from sqlalchemy import desc
 
+from services.council_cache import get_council_cache
+from services.single_flight import RedisFlight
+
 logger = logging.getLogger(__name__)
 
 ai_council_bp = Blueprint('ai_council', __name__, url_prefix='/api/ai-council')
@@ -35,6 +64,10 @@ AIResponse = None
 AIConsensus = None
 ai_council_service = None
 
+# Identical questions in flight in any worker share one fan-out (v1.3.1)
+_question_flight = None
+_question_flight_lock = threading.Lock()
+
 
 def init_routes(database, models, service):
     """Initialize routes with database models and AI service"""
@@ -46,6 +79,262 @@ def init_routes(database, models, service):
     ai_council_service = service
 
 
+def read_question():
+    """Validated question from the request body, or (None, error response)"""
+    data = request.get_json(silent=True)
+    
+    if not data or not data.get('question'):
+        return None, (jsonify({'success': False, 'error': 'Question is required'}), 400)
+    
+    question = data['question'].strip()
+    
+    if len(question) < 10:
+        return None, (jsonify({'success': False, 'error': 'Question must be at least 10 characters'}), 400)
+    
+    return question, None
+
+
+def load_recent_questions(since, limit):
+    """(id, question, created_at) of answered queries since `since`, newest first"""
+    return db.session.query(AIQuery.id, AIQuery.question, AIQuery.created_at).filter(
+        AIQuery.created_at >= since,
+        AIQuery.successful_responses > 0
+    ).order_by(desc(AIQuery.created_at)).limit(limit).all()
+
+
+def question_cache():
+    return get_council_cache(load_recent_questions)
+
+
+def coalesce_wait():
+    from config import Config
+    return getattr(Config, 'AI_COUNCIL', {}).get('coalesce_wait', 120)
+
+
+def question_flight():
+    """Cross-worker coalescer for identical questions (built on first use)"""
+    global _question_flight
+    
+    if _question_flight is not None:
+        return _question_flight
+    
+    with _question_flight_lock:
+        if _question_flight is None:
+            from config import Config
+            from services.redis_client import get_redis_client
+            settings = getattr(Config, 'AI_COUNCIL', {})
+            _question_flight = RedisFlight(
+                'council',
+                get_redis_client(),
+                lock_ttl=settings.get('coalesce_lock_ttl', 180),
+                wait_seconds=coalesce_wait()
+            )
+    return _question_flight
+
+
+def wants_fresh_answer():
+    return request.args.get('fresh', '').lower() in ('1', 'true', 'yes')
+
+
+def serialize_response(resp):
+    """Saved AIResponse in the /ask response shape"""
+    return {
+        'ai_service': resp.ai_service,
+        'ai_model': resp.ai_model,
+        'response_text': resp.response_text,
+        'response_length': resp.response_length,
+        'response_time': resp.response_time,
+        'tokens_used': resp.tokens_used,
+        'success': resp.success,
+        'error_message': resp.error_message
+    }
+
+
+def serialize_consensus(consensus):
+    """Saved AIConsensus as a dict, or None"""
+    if not consensus:
+        return None
+    return {
+        'summary': consensus.summary,
+        'agreement_areas': json.loads(consensus.agreement_areas) if consensus.agreement_areas else [],
+        'disagreement_areas': json.loads(consensus.disagreement_areas) if consensus.disagreement_areas else [],
+        'consensus_score': consensus.consensus_score,
+        'generated_by': consensus.generated_by
+    }
+
+
+def saved_answer(query_id, question, match):
+    """
+    A saved query as an /ask response for `question` - v1.3.0
+    
+    match is 'exact' or 'similar' (question cache) or 'coalesced' (answered
+    by an identical in-flight request). None if the query is gone.
+    """
+    query = AIQuery.query.get(query_id)
+    if not query:
+        return None
+    
+    responses = AIResponse.query.filter_by(query_id=query_id).all()
+    consensus = AIConsensus.query.filter_by(query_id=query_id).first()
+    
+    return {
+        'success': True,
+        'query_id': query.id,
+        'question': question,
+        'category': query.question_category,
+        'responses': [serialize_response(r) for r in responses],
+        'consensus': serialize_consensus(consensus) or {},
+        'processing_time': query.processing_time,
+        'total_responses': query.total_responses,
+        'successful_responses': query.successful_responses,
+        'claims_extracted': query.claims_extracted,
+        'cached': match != 'coalesced',
+        'cache_match': match,
+        'cached_question': query.question,
+        'answered_at': query.created_at.isoformat()
+    }
+
+
+def find_saved_answer(question):
+    """/ask response from the question cache, or None on a miss"""
+    if wants_fresh_answer():
+        return None
+    
+    match = question_cache().lookup(question)
+    if match is None:
+        return None
+    
+    query_id, kind = match
+    answer = saved_answer(query_id, question, kind)
+    if answer:
+        logger.info(f"[AICouncil API] ✓ {kind} cache hit - query {query_id}")
+    return answer
+
+
+def wait_for_flight(call, question):
+    """/ask response once the identical in-flight question is saved"""
+    query_id = question_flight().result(call, coalesce_wait())
+    answer = saved_answer(query_id, question, 'coalesced') if query_id else None
+    if not answer:
+        raise RuntimeError('Identical in-flight question did not produce an answer')
+    return answer
+
+
+def transform_response(r):
+    """
+    CRITICAL FIX v1.1.0: Transform response fields for frontend
+    
+    Frontend expects: ai_service, ai_name, response_text
+    Backend provides: service, name, response
+    """
+    return {
+        'ai_service': r['name'],  # Frontend displays this as the AI name
+        'response_text': r.get('response', ''),  # Frontend shows this as response
+        'response_length': r.get('response_length', 0),
+        'response_time': r.get('response_time', 0),
+        'tokens_used': r.get('tokens_used'),
+        'success': r['success'],
+        'error_message': r.get('error')
+    }
+
+
+def save_council_query(question, category, result):
+    """
+    Save a council result (query, responses, consensus, claims)
+    
+    Returns (new_query, claims_extracted). Commits.
+    """
+    new_query = AIQuery(
+        question=question,
+        question_category=category,
+        processing_time=result['processing_time'],
+        total_responses=result['total_responses'],
+        successful_responses=result['successful_responses'],
+        failed_responses=result['failed_responses']
+    )
+    
+    db.session.add(new_query)
+    db.session.flush()
+    
+    # Save individual AI responses
+    for response_data in result['responses']:
+        new_response = AIResponse(
+            query_id=new_query.id,
+            ai_service=response_data['service'],
+            ai_model=response_data['model'],
+            response_text=response_data.get('response'),
+            response_length=response_data.get('response_length', 0),
+            success=response_data['success'],
+            error_message=response_data.get('error'),
+            response_time=response_data.get('response_time', 0),
+            tokens_used=response_data.get('tokens_used')
+        )
+        db.session.add(new_response)
+    
+    # Save consensus
+    consensus_data = result.get('consensus') or {}
+    if consensus_data:
+        new_consensus = AIConsensus(
+            query_id=new_query.id,
+            summary=consensus_data.get('summary'),
+            agreement_areas=json.dumps(consensus_data.get('agreement_areas', [])),
+            disagreement_areas=json.dumps(consensus_data.get('disagreement_areas', [])),
+            consensus_score=consensus_data.get('consensus_score', 0),
+            generated_by=consensus_data.get('generated_by')
+        )
+        db.session.add(new_consensus)
+        
+        # Update query with consensus level
+        new_query.has_consensus = True
+        score = consensus_data.get('consensus_score', 0)
+        if score >= 80:
+            new_query.consensus_level = 'high'
+        elif score >= 60:
+            new_query.consensus_level = 'medium'
+        elif score >= 40:
+            new_query.consensus_level = 'low'
+        else:
+            new_query.consensus_level = 'conflicting'
+    
+    # Save claims - extracted by the consensus call (v1.2.0); the claim
+    # tracker only extracts from the responses when there are none
+    claims_extracted = 0
+    try:
+        from claim_tracker_routes import auto_save_claims_from_analysis
+        
+        # Combine all successful AI responses
+        all_responses_text = "\n\n".join([
+            f"{r['name']}: {r.get('response', '')}"
+            for r in result['responses']
+            if r['success'] and r.get('response')
+        ])
+        
+        if all_responses_text:
+            claim_result = auto_save_claims_from_analysis({
+                'content': all_responses_text,
+                'claims': consensus_data.get('claims') or None,
+                'type': 'ai_consensus',
+                'title': f'AI Council: {question[:100]}',
+                'source': 'AI Council',
+                'outlet': 'Multiple AI Services'
+            })
+            
+            if claim_result.get('success'):
+                claims_extracted = claim_result.get('claims_saved', 0)
+                logger.info(f"[AICouncil] Extracted {claims_extracted} claims")
+            
+    except Exception as e:
+        logger.warning(f"[AICouncil] Claim extraction failed: {e}")
+    
+    new_query.claims_extracted = claims_extracted
+    
+    db.session.commit()
+    
+    logger.info(f"[AICouncil] Query saved with ID: {new_query.id}")
+    
+    return new_query, claims_extracted
+
+
 @ai_council_bp.route('/ask', methods=['POST'])
 def ask_question():
     """
@@ -55,147 +344,54 @@ def ask_question():
     Body: {"question": "Your question here"}
     """
     try:
-        data = request.get_json()
-        
-        if not data or not data.get('question'):
-            return jsonify({'success': False, 'error': 'Question is required'}), 400
-        
-        question = data['question'].strip()
-        
-        if len(question) < 10:
-            return jsonify({'success': False, 'error': 'Question must be at least 10 characters'}), 400
+        question, error = read_question()
+        if error:
+            return error
         
         logger.info(f"[AICouncil API] New question: {question[:100]}...")
         
-        # Query all AI services
-        result = ai_council_service.query_all(question)
-        
-        if not result.get('success'):
-            return jsonify(result), 500
-        
-        # Categorize question
-        from ai_council_models import categorize_question
-        category = categorize_question(question)
-        
-        # Save query to database
-        new_query = AIQuery(
-            question=question,
-            question_category=category,
-            processing_time=result['processing_time'],
-            total_responses=result['total_responses'],
-            successful_responses=result['successful_responses'],
-            failed_responses=result['failed_responses']
-        )
-        
-        db.session.add(new_query)
-        db.session.flush()
-        
-        # Save individual AI responses
-        for response_data in result['responses']:
-            new_response = AIResponse(
-                query_id=new_query.id,
-                ai_service=response_data['service'],
-                ai_model=response_data['model'],
-                response_text=response_data.get('response'),
-                response_length=response_data.get('response_length', 0),
-                success=response_data['success'],
-                error_message=response_data.get('error'),
-                response_time=response_data.get('response_time', 0),
-                tokens_used=response_data.get('tokens_used')
-            )
-            db.session.add(new_response)
+        # v1.3.0: Recent answer to the same (or nearly the same) question
+        answer = find_saved_answer(question)
+        if answer:
+            return jsonify(answer)
         
-        # Save consensus
-        consensus_data = result.get('consensus', {})
-        if consensus_data:
-            import json
-            new_consensus = AIConsensus(
-                query_id=new_query.id,
-                summary=consensus_data.get('summary'),
-                agreement_areas=json.dumps(consensus_data.get('agreement_areas', [])),
-                disagreement_areas=json.dumps(consensus_data.get('disagreement_areas', [])),
-                consensus_score=consensus_data.get('consensus_score', 0),
-                generated_by=consensus_data.get('generated_by')
-            )
-            db.session.add(new_consensus)
-            
-            # Update query with consensus level
-            new_query.has_consensus = True
-            score = consensus_data.get('consensus_score', 0)
-            if score >= 80:
-                new_query.consensus_level = 'high'
-            elif score >= 60:
-                new_query.consensus_level = 'medium'
-            elif score >= 40:
-                new_query.consensus_level = 'low'
-            else:
-                new_query.consensus_level = 'conflicting'
+        # v1.3.0: Someone is asking this right now - wait for their answer
+        leader, call = question_flight().begin(question_cache().key(question))
+        if not leader:
+            return jsonify(wait_for_flight(call, question))
         
-        # Extract claims from responses
-        claims_extracted = 0
         try:
-            from claim_tracker_routes import auto_save_claims_from_analysis
+            # Query all AI services
+            result = ai_council_service.query_all(question)
             
-            # Combine all successful AI responses
-            all_responses_text = "\n\n".join([
-                f"{r['name']}: {r.get('response', '')}"
-                for r in result['responses']
-                if r['success'] and r.get('response')
-            ])
+            if not result.get('success'):
+                question_flight().finish(call, error=RuntimeError(result.get('error') or 'AI Council query failed'))
+                return jsonify(result), 500
             
-            if all_responses_text:
-                claim_result = auto_save_claims_from_analysis({
-                    'content': all_responses_text,
-                    'type': 'ai_consensus',
-                    'title': f'AI Council: {question[:100]}',
-                    'source': 'AI Council',
-                    'outlet': 'Multiple AI Services'
-                })
-                
-                if claim_result.get('success'):
-                    claims_extracted = claim_result.get('claims_saved', 0)
-                    logger.info(f"[AICouncil] Extracted {claims_extracted} claims")
-                
-        except Exception as e:
-            logger.warning(f"[AICouncil] Claim extraction failed: {e}")
-        
-        new_query.claims_extracted = claims_extracted
-        
-        db.session.commit()
-        
-        logger.info(f"[AICouncil] Query saved with ID: {new_query.id}")
-        
-        # ====================================================================
-        # CRITICAL FIX v1.1.0: Transform response fields for frontend
-        # ====================================================================
-        # Frontend expects: ai_service, ai_name, response_text
-        # Backend provides: service, name, response
-        # We need to transform the data!
-        # ====================================================================
+            # Categorize question
+            from ai_council_models import categorize_question
+            category = categorize_question(question)
+            
+            new_query, claims_extracted = save_council_query(question, category, result)
+        except BaseException as e:
+            question_flight().finish(call, error=e)
+            raise
         
-        transformed_responses = []
-        for r in result['responses']:
-            transformed_responses.append({
-                'ai_service': r['name'],  # Frontend displays this as the AI name
-                'response_text': r.get('response', ''),  # Frontend shows this as response
-                'response_length': r.get('response_length', 0),
-                'response_time': r.get('response_time', 0),
-                'tokens_used': r.get('tokens_used'),
-                'success': r['success'],
-                'error_message': r.get('error')
-            })
+        question_flight().finish(call, result=new_query.id)
+        question_cache().add(new_query.id, question, new_query.created_at)
         
         return jsonify({
             'success': True,
             'query_id': new_query.id,
             'question': question,
             'category': category,
-            'responses': transformed_responses,  # Use transformed data!
-            'consensus': consensus_data,
+            'responses': [transform_response(r) for r in result['responses']],
+            'consensus': result.get('consensus') or {},
             'processing_time': result['processing_time'],
             'total_responses': result['total_responses'],
             'successful_responses': result['successful_responses'],
-            'claims_extracted': claims_extracted
+            'claims_extracted': claims_extracted,
+            'cached': False
         })
     
     except Exception as e:
@@ -206,6 +402,134 @@ def ask_question():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+@ai_council_bp.route('/ask/stream', methods=['POST'])
+def ask_question_stream():
+    """
+    Streaming version of /ask (Server-Sent Events) - v1.2.0
+    
+    POST /api/ai-council/ask/stream
+    Body: {"question": "Your question here"}
+    
+    Events (JSON in each data: line, 'type' field):
+      start            {total_services, quorum}
+      response         one AI's answer (same fields as /ask responses)
+      error            {ai_service, error_message} - failed or timed out
+      consensus_token  {text} - append to the consensus summary
+      consensus        {consensus, claims} - final summary + areas + score
+      done             {query_id, category, processing_time, *_responses, claims_extracted}
+    
+    v1.3.0: A cached or coalesced answer is replayed as the same events -
+    start {cached, cache_match}, one response per AI, consensus, done -
+    without consensus tokens.
+    """
+    question, error = read_question()
+    if error:
+        return error
+    
+    if not ai_council_service:
+        return jsonify({'success': False, 'error': 'AI Council service not available'}), 503
+    
+    logger.info(f"[AICouncil API] New streaming question: {question[:100]}...")
+    
+    def sse(event):
+        return f"data: {json.dumps(event, default=str)}\n\n"
+    
+    def replay(answer):
+        yield sse({
+            'type': 'start',
+            'question': question,
+            'total_services': answer['total_responses'],
+            'cached': answer['cached'],
+            'cache_match': answer['cache_match']
+        })
+        for response in answer['responses']:
+            if response['success']:
+                yield sse({'type': 'response', **response})
+            else:
+                yield sse({'type': 'error', 'ai_service': response['ai_service'],
+                           'error_message': response['error_message']})
+        yield sse({'type': 'consensus', 'consensus': answer['consensus'], 'claims': []})
+        done = {key: value for key, value in answer.items() if key not in ('responses', 'consensus')}
+        yield sse({'type': 'done', **done})
+    
+    def generate():
+        # v1.3.0: Recent answer, or an identical question already in flight
+        try:
+            answer = find_saved_answer(question)
+            if answer:
+                yield from replay(answer)
+                return
+            
+            leader, call = question_flight().begin(question_cache().key(question))
+            if not leader:
+                yield from replay(wait_for_flight(call, question))
+                return
+        except Exception as e:
+            logger.error(f"Error answering question from cache: {e}")
+            db.session.rollback()
+            yield sse({'type': 'done', 'success': False, 'error': str(e)})
+            return
+        
+        result = None
+        query_id = None
+        error = None
+        try:
+            for event in ai_council_service.stream_query(question):
+                kind = event['type']
+                if kind == 'done':
+                    result = event
+                elif kind == 'response':
+                    yield sse({'type': 'response', **transform_response(event)})
+                elif kind == 'error':
+                    yield sse({'type': 'error', 'ai_service': event['service'], 'error_message': event['error']})
+                else:
+                    yield sse(event)
+            
+            from ai_council_models import categorize_question
+            category = categorize_question(question)
+            
+            new_query, claims_extracted = save_council_query(question, category, result)
+            query_id = new_query.id
+            question_cache().add(new_query.id, question, new_query.created_at)
+            
+            # Release followers before the last write to this client
+            question_flight().finish(call, result=query_id)
+            
+            yield sse({
+                'type': 'done',
+                'success': True,
+                'query_id': new_query.id,
+                'question': question,
+                'category': category,
+                'processing_time': result['processing_time'],
+                'total_responses': result['total_responses'],
+                'successful_responses': result['successful_responses'],
+                'claims_extracted': claims_extracted,
+                'cached': False
+            })
+        
+        except Exception as e:
+            error = e
+            logger.error(f"Error streaming question: {e}")
+            logger.error(f"Traceback: {traceback.format_exc()}")
+            db.session.rollback()
+            yield sse({'type': 'done', 'success': False, 'error': str(e)})
+        
+        finally:
+            # Also runs when the client disconnects mid-stream
+            if query_id is None:
+                question_flight().finish(call, error=error or RuntimeError('AI Council stream ended early'))
+    
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'
+        }
+    )
+
+
 @ai_council_bp.route('/recent', methods=['GET'])
 def get_recent_queries():
     """
@@ -265,32 +589,12 @@ def get_query_details(query_id):
         # Get all responses
         responses = AIResponse.query.filter_by(query_id=query_id).all()
         
-        response_list = []
-        for resp in responses:
-            response_list.append({
-                'ai_service': resp.ai_service,
-                'ai_model': resp.ai_model,
-                'response_text': resp.response_text,
-                'response_length': resp.response_length,
-                'response_time': resp.response_time,
-                'tokens_used': resp.tokens_used,
-                'success': resp.success,
-                'error_message': resp.error_message
-            })
+        response_list = [serialize_response(resp) for resp in responses]
         
         # Get consensus
         consensus = AIConsensus.query.filter_by(query_id=query_id).first()
         
-        import json
-        consensus_data = None
-        if consensus:
-            consensus_data = {
-                'summary': consensus.summary,
-                'agreement_areas': json.loads(consensus.agreement_areas) if consensus.agreement_areas else [],
-                'disagreement_areas': json.loads(consensus.disagreement_areas) if consensus.disagreement_areas else [],
-                'consensus_score': consensus.consensus_score,
-                'generated_by': consensus.generated_by
-            }
+        consensus_data = serialize_consensus(consensus)
         
         return jsonify({
             'success': True,
@@ -353,7 +657,9 @@ def get_stats():
                 'average_consensus_score': round(avg_score, 1),
                 'total_claims_extracted': total_claims,
                 'top_categories': category_stats
-            }
+            },
+            'cache': question_cache().stats(),
+            'in_flight': question_flight().stats()
         })
     
     except Exception as e:
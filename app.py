@@ -1,8 +1,17 @@
 """
 File: app.py
-Last Updated: January 9, 2026 - v10.4.0
+Last Updated: October 16, 2026 - v10.5.0
 Description: Main Flask application - AI COUNCIL INTEGRATION
 
+NEW IN v10.5.0 (October 16, 2026):
+========================
+STREAMING NEWS ANALYSIS
+- New route: /api/analyze/stream (Server-Sent Events)
+- Sends the extracted article right after extraction, then each service's
+  transformed block as soon as that analyzer finishes, then the trust score
+- Claim auto-saving moved into _auto_save_claims() (shared by both routes)
+- PRESERVED: /api/analyze request/response format unchanged
+
 NEW IN v10.4.0 (January 9, 2026):
 ========================
 AI COUNCIL SYSTEM ADDED
@@ -17,27 +26,34 @@ AI COUNCIL SYSTEM ADDED
 - PRESERVED: All v10.3.0 functionality (DO NO HARM ✓)
 
 This file is complete and ready to deploy to GitHub/Render.
-Last modified: January 9, 2026 - v10.4.0 AI COUNCIL INTEGRATION
+Last modified: October 16, 2026 - v10.5.0 STREAMING NEWS ANALYSIS
 """
 
 import os
 import re
 import json
 import time
+import queue
 import logging
 import traceback
 from datetime import datetime
+from threading import Thread
 from typing import Dict, List, Optional, Any, Tuple
 from urllib.parse import urlparse
-import requests
 from bs4 import BeautifulSoup
-from flask import Flask, render_template, request, jsonify, send_from_directory, Response
+from flask import Flask, render_template, request, jsonify, send_from_directory, Response, stream_with_context
 from flask_cors import CORS
 from dotenv import load_dotenv
 
 # CRITICAL IMPORTS FOR DATA TRANSFORMATION FIX
 from services.news_analyzer import NewsAnalyzer
 from services.data_transformer import DataTransformer
+from services.claim_cache import get_claim_cache
+from services.http_client import get_http_client
+from services.provider_health import get_provider_health
+from services.llm_gateway import get_llm_gateway
+from services.fetch_strategy import get_fetch_strategy
+from services.extraction_profiles import get_extraction_profiles
 
 # YOUTUBE TRANSCRIPT EXTRACTION (v10.2.0)
 from services.youtube_scraper import extract_youtube_transcript
@@ -256,7 +272,7 @@ if database_url:
         
         # Step 3: Import routes and models
         from quiz_routes import quiz_bp, init_routes
-        from quiz_models import Quiz, Question, QuestionOption, QuizAttempt, Achievement, UserAchievement, LeaderboardEntry
+        from quiz_models import Quiz, Question, QuestionOption, QuizAttempt, Achievement, UserAchievement, LeaderboardEntry, UserQuizStats
         
         # ====================================================================
         # NEW v10.2.28: Initialize AI Quiz Generator
@@ -290,7 +306,8 @@ if database_url:
             'QuizAttempt': QuizAttempt,
             'Achievement': Achievement,
             'UserAchievement': UserAchievement,
-            'LeaderboardEntry': LeaderboardEntry
+            'LeaderboardEntry': LeaderboardEntry,
+            'UserQuizStats': UserQuizStats
         }, quiz_generator=quiz_generator)  # Pass quiz generator to routes!
         
         logger.info("  ✓ Quiz routes initialized")
@@ -380,6 +397,7 @@ if database_url:
         logger.info("  ✓ AI Council routes registered at /api/ai-council/*")
         logger.info("  ✓ Available endpoints:")
         logger.info("    - POST   /api/ai-council/ask")
+        logger.info("    - POST   /api/ai-council/ask/stream")
         logger.info("    - GET    /api/ai-council/recent")
         logger.info("    - GET    /api/ai-council/<id>")
         logger.info("    - GET    /api/ai-council/stats")
@@ -417,7 +435,7 @@ if database_url:
                 if claim_tracker_available:
                     logger.info("    - Claim tracker tables: claims, claim_sources, claim_evidence")
                 if quiz_available:
-                    logger.info("    - Quiz tables: quizzes, questions, question_options, quiz_attempts, achievements, user_achievements, leaderboard_entries")
+                    logger.info("    - Quiz tables: quizzes, questions, question_options, quiz_attempts, achievements, user_achievements, leaderboard_entries, user_quiz_stats")
                 if ai_council_available:
                     logger.info("    - AI Council tables: ai_queries, ai_responses, ai_consensus")
                     
@@ -447,6 +465,15 @@ if database_url:
                     claim_tracker_available = False
                     quiz_available = False
                     ai_council_available = False
+            
+            # Columns added after a table existed are not created by create_all()
+            if simple_debate_available:
+                try:
+                    from simple_debate_models import ensure_vote_counter_columns
+                    if ensure_vote_counter_columns():
+                        logger.info("  ✓ Simple debate vote counters added and backfilled")
+                except Exception as e:
+                    logger.error(f"  ✗ Simple debate vote counter migration failed: {e}")
     else:
         logger.warning("  ⚠ No database features available - all disabled")
         db = None
@@ -530,7 +557,7 @@ def extract_article_text(url: str) -> Tuple[Optional[str], Optional[Dict]]:
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
-        response = requests.get(url, headers=headers, timeout=10)
+        response = get_http_client().get(url, headers=headers, timeout=10)
         response.raise_for_status()
         
         soup = BeautifulSoup(response.content, 'html.parser')
@@ -618,6 +645,75 @@ def validate_url(url: str) -> bool:
     except:
         return False
 
+def _auto_save_claims(raw_results: Dict[str, Any], url: Optional[str], article_text: Optional[str]) -> None:
+    """
+    Automatic claim extraction & saving (v10.2.30 FIX)
+    
+    Extract verifiable claims from analysis and save to database.
+    This happens automatically - no user action required!
+    
+    CRITICAL FIX v10.2.30: Extract from raw_results, NOT final_results!
+    - raw_results has 'article_text' field with the actual article content
+    - final_results is transformed and doesn't have raw article text
+    
+    v10.5.0: Shared by /api/analyze and /api/analyze/stream
+    """
+    if not claim_tracker_available:
+        return
+    
+    try:
+        from claim_tracker_routes import auto_save_claims_from_analysis
+        
+        # ✅ FIXED v10.2.30: Get article text from RAW results, not final
+        # raw_results has the actual article text before transformation
+        article_text_for_claims = raw_results.get('article_text', '')
+        
+        # If no article_text in raw_results, try the original input
+        if not article_text_for_claims:
+            article_text_for_claims = article_text or ''
+        
+        # Get metadata from raw_results too
+        article_summary = raw_results.get('article_summary', {})
+        if isinstance(article_summary, dict):
+            title = article_summary.get('title', 'Unknown')
+            source = article_summary.get('source', 'Unknown')
+        else:
+            title = 'Unknown'
+            source = raw_results.get('source', 'Unknown')
+        
+        logger.info(f"  → Extracting claims from article ({len(article_text_for_claims)} chars)")
+        
+        # Build proper data structure for claim extractor
+        claim_data = {
+            'content': article_text_for_claims,  # ✅ Now has actual text!
+            'text': article_text_for_claims,     # Backup key
+            'url': url or '',
+            'title': title,
+            'outlet': source,
+            'source': source,
+            'type': 'news_article'
+        }
+        
+        auto_save_result = auto_save_claims_from_analysis(claim_data)
+        
+        if auto_save_result.get('success'):
+            claims_saved = auto_save_result.get('claims_saved', 0)
+            logger.info(f"  ✓ Auto-saved {claims_saved} claims to tracker")
+        else:
+            error = auto_save_result.get('error', 'Unknown error')
+            logger.warning(f"  ⚠ Claim extraction returned: {error}")
+        
+    except Exception as e:
+        # Don't fail the entire request if claim saving fails
+        logger.warning(f"  ⚠ Failed to auto-save claims: {e}")
+        logger.warning(f"  ⚠ Traceback: {traceback.format_exc()}")
+
+# Fields of the extracted article worth sending before the analyzers finish
+STREAM_ARTICLE_FIELDS = (
+    'title', 'author', 'author_page_url', 'source', 'domain', 'url',
+    'word_count', 'sources_count', 'quotes_count', 'extraction_method'
+)
+
 # ============================================================================
 # STATIC PAGE ROUTES - NOW WITH active_page FOR TEMPLATE INHERITANCE (v10.3.0)
 # ============================================================================
@@ -994,64 +1090,8 @@ def analyze_news():
         
         logger.info("Data transformation complete")
         
-        # ========================================================================
-        # AUTOMATIC CLAIM EXTRACTION & SAVING (v10.2.30 FIX)
-        # ========================================================================
-        # Extract verifiable claims from analysis and save to database
-        # This happens automatically - no user action required!
-        # 
-        # CRITICAL FIX v10.2.30: Extract from raw_results, NOT final_results!
-        # - raw_results has 'article_text' field with the actual article content
-        # - final_results is transformed and doesn't have raw article text
-        # ========================================================================
-        
-        if claim_tracker_available:
-            try:
-                from claim_tracker_routes import auto_save_claims_from_analysis
-                
-                # ✅ FIXED v10.2.30: Get article text from RAW results, not final
-                # raw_results has the actual article text before transformation
-                article_text_for_claims = raw_results.get('article_text', '')
-                
-                # If no article_text in raw_results, try the original input
-                if not article_text_for_claims:
-                    article_text_for_claims = article_text or ''
-                
-                # Get metadata from raw_results too
-                article_summary = raw_results.get('article_summary', {})
-                if isinstance(article_summary, dict):
-                    title = article_summary.get('title', 'Unknown')
-                    source = article_summary.get('source', 'Unknown')
-                else:
-                    title = 'Unknown'
-                    source = raw_results.get('source', 'Unknown')
-                
-                logger.info(f"  → Extracting claims from article ({len(article_text_for_claims)} chars)")
-                
-                # Build proper data structure for claim extractor
-                claim_data = {
-                    'content': article_text_for_claims,  # ✅ Now has actual text!
-                    'text': article_text_for_claims,     # Backup key
-                    'url': url or '',
-                    'title': title,
-                    'outlet': source,
-                    'source': source,
-                    'type': 'news_article'
-                }
-                
-                auto_save_result = auto_save_claims_from_analysis(claim_data)
-                
-                if auto_save_result.get('success'):
-                    claims_saved = auto_save_result.get('claims_saved', 0)
-                    logger.info(f"  ✓ Auto-saved {claims_saved} claims to tracker")
-                else:
-                    error = auto_save_result.get('error', 'Unknown error')
-                    logger.warning(f"  ⚠ Claim extraction returned: {error}")
-                
-            except Exception as e:
-                # Don't fail the entire request if claim saving fails
-                logger.warning(f"  ⚠ Failed to auto-save claims: {e}")
-                logger.warning(f"  ⚠ Traceback: {traceback.format_exc()}")
+        # Automatic claim extraction & saving (v10.2.30) - see _auto_save_claims
+        _auto_save_claims(raw_results, url, article_text)
         
         logger.info("=" * 80)
         
@@ -1075,6 +1115,124 @@ def analyze_news():
             'error': f'Analysis failed: {str(e)}'
         }), 500
 
+@app.route('/api/analyze/stream', methods=['GET', 'POST'])
+def analyze_news_stream():
+    """
+    Streaming variant of /api/analyze (Server-Sent Events) - v10.5.0
+    
+    Same input as /api/analyze (JSON body on POST, or ?url= / ?text= on GET
+    so EventSource can be used directly). Events, in order:
+    
+        started   - request accepted
+        article   - extracted article metadata (as soon as extraction finishes)
+        service   - {'service': name, 'data': <DataTransformer block>} per
+                    analyzer, the moment that analyzer completes
+        complete  - trust score + the full 'analysis' object /api/analyze returns
+        error     - analysis failed (stream ends)
+    
+    Cached results skip straight to 'complete'.
+    """
+    if request.method == 'POST':
+        data = request.get_json(silent=True) or {}
+    else:
+        data = request.args.to_dict()
+    
+    url = data.get('url')
+    article_text = data.get('text') or data.get('article_text')
+    
+    logger.info("=" * 80)
+    logger.info("NEW STREAMING ANALYSIS REQUEST:")
+    logger.info(f"  URL provided: {bool(url)}")
+    logger.info(f"  Text provided: {bool(article_text)}")
+    logger.info("=" * 80)
+    
+    if not url and not article_text:
+        return jsonify({
+            'success': False,
+            'error': 'Either URL or article text must be provided'
+        }), 400
+    
+    if url and not validate_url(url):
+        return jsonify({
+            'success': False,
+            'error': 'Invalid URL format'
+        }), 400
+    
+    events = queue.Queue()
+    
+    def on_event(event_type: str, payload: Dict[str, Any]):
+        events.put((event_type, payload))
+    
+    def run_analysis():
+        try:
+            raw_results = news_analyzer_service.analyze(
+                content=url or article_text,
+                content_type='url' if url else 'text',
+                on_event=on_event
+            )
+            events.put(('result', raw_results))
+        except Exception as e:
+            logger.error(f"[Stream] Analysis error: {e}")
+            logger.error(f"[Stream] Traceback: {traceback.format_exc()}")
+            events.put(('result', {'success': False, 'error': f'Analysis failed: {str(e)}'}))
+    
+    Thread(target=run_analysis, daemon=True).start()
+    
+    def generate():
+        yield f"data: {json.dumps({'type': 'started', 'timestamp': datetime.now().isoformat()})}\n\n"
+        
+        article = {}
+        
+        while True:
+            try:
+                event_type, payload = events.get(timeout=15)
+            except queue.Empty:
+                # Keepalive so proxies don't drop the connection
+                yield ": keepalive\n\n"
+                continue
+            
+            if event_type == 'article':
+                article = payload
+                summary = {field: payload.get(field) for field in STREAM_ARTICLE_FIELDS if field in payload}
+                yield f"data: {json.dumps({'type': 'article', 'article': summary}, default=str)}\n\n"
+            
+            elif event_type == 'service':
+                try:
+                    block = DataTransformer.transform_service_block(payload['service'], payload['data'], article)
+                except Exception as e:
+                    logger.warning(f"[Stream] Could not transform {payload.get('service')}: {e}")
+                    continue
+                yield f"data: {json.dumps({'type': 'service', 'service': payload['service'], 'data': block}, default=str)}\n\n"
+            
+            elif event_type == 'result':
+                if not payload.get('success'):
+                    error_msg = payload.get('error', 'Analysis failed')
+                    logger.error(f"[Stream] Analysis failed: {error_msg}")
+                    yield f"data: {json.dumps({'type': 'error', 'error': error_msg})}\n\n"
+                    return
+                
+                try:
+                    final_results = data_transformer.transform_response(raw_data=payload)
+                except Exception as e:
+                    logger.error(f"[Stream] Transformation failed: {e}")
+                    yield f"data: {json.dumps({'type': 'error', 'error': f'Analysis failed: {str(e)}'})}\n\n"
+                    return
+                
+                yield f"data: {json.dumps({'type': 'complete', 'trust_score': final_results.get('trust_score'), 'cached': bool(payload.get('cached')), 'analysis': final_results}, default=str)}\n\n"
+                
+                _auto_save_claims(payload, url, article_text)
+                return
+    
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no',
+            'Connection': 'keep-alive'
+        }
+    )
+
 # ============================================================================
 # API ROUTES - TRANSCRIPT ANALYSIS (v10.2.3)
 # ============================================================================
@@ -1517,6 +1675,7 @@ def health():
     return jsonify({
         'status': 'healthy',
         'timestamp': datetime.now().isoformat(),
+        'server_mode': os.getenv('SERVER_MODE', 'sync').lower(),
         'services': {
             'news_analyzer': 'active',
             'transcript_analyzer': 'active' if transcript_available else 'disabled',
@@ -1527,7 +1686,16 @@ def health():
             'quiz_ai_generator': 'active' if quiz_generator and quiz_generator.is_available() else 'disabled',
             'ai_council': 'active' if ai_council_available else 'disabled',
             'ai_council_service': 'active' if ai_council_service else 'disabled'
-        }
+        },
+        'analysis_cache': news_analyzer_service.pipeline.result_cache.stats(),
+        'analysis_executor': news_analyzer_service.pipeline.executor.stats(),
+        'analysis_coalescing': news_analyzer_service.pipeline.flight.stats(),
+        'claim_cache': get_claim_cache().stats(),
+        'http_client': get_http_client().stats(),
+        'ai_providers': get_provider_health().snapshot(),
+        'llm_gateway': get_llm_gateway().stats(),
+        'article_fetch': get_fetch_strategy().stats(),
+        'extraction_profiles': get_extraction_profiles().stats()
     })
 
 @app.route('/debug/api-keys', methods=['GET'])
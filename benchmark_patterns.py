@@ -0,0 +1,270 @@
+"""
+Pattern Engine Benchmark
+Date: October 16, 2026
+
+Per-article CPU time of the lexicon-heavy analyzer methods, before and after
+services/pattern_engine.py. The "before" column runs the pre-engine code
+(kept below, verbatim apart from being lifted out of the classes) and every
+article is also checked for identical results.
+
+Run:
+    python benchmark_patterns.py                 # synthetic corpus of long articles
+    python benchmark_patterns.py article1.txt ...  # your own articles (plain text)
+
+Options:
+    --articles N   synthetic articles to generate (default 20)
+    --words N      words per synthetic article (default 6000)
+    --repeat N     timing repetitions per article (default 5)
+"""
+
+import re
+import sys
+import time
+import random
+import logging
+import argparse
+
+logging.disable(logging.CRITICAL)
+
+from services.pattern_engine import pattern_engine
+
+
+# ============================================================================
+# PRE-ENGINE IMPLEMENTATIONS (reference)
+# ============================================================================
+
+def legacy_sensationalism_counts(detector, text, title):
+    text_lower = text.lower()
+    title_lower = title.lower() if title else ''
+    return (sum(1 for pattern in detector.sensationalism_patterns if pattern in text_lower),
+            sum(1 for pattern in detector.sensationalism_patterns if pattern in title_lower))
+
+
+def legacy_loaded_language(detector, text):
+    sentences = re.split(r'[.!?]+', text)
+    loaded_phrases = []
+    for sentence in sentences[:100]:
+        sentence_lower = sentence.lower()
+        for pattern in detector.loaded_patterns:
+            if pattern in sentence_lower:
+                context = sentence.strip()
+                if len(context) > 10:
+                    loaded_phrases.append({'phrase': pattern, 'context': context[:200], 'sentence': context})
+    unique_phrases = []
+    seen_contexts = set()
+    for phrase in loaded_phrases:
+        if phrase['context'] not in seen_contexts:
+            unique_phrases.append(phrase)
+            seen_contexts.add(phrase['context'])
+    return {'phrases': unique_phrases[:15], 'count': len(unique_phrases),
+            'density': len(unique_phrases) / max(len(sentences), 1)}
+
+
+def legacy_clickbait_techniques(detector, title):
+    title_lower = title.lower()
+    return [category for category, patterns in detector.clickbait_patterns.items()
+            if any(re.search(pattern, title_lower) for pattern in patterns)]
+
+
+def legacy_logical_fallacies(detector, text):
+    examples = []
+    text_lower = text.lower()
+    for fallacy_type, patterns in detector.fallacy_patterns.items():
+        for pattern in patterns:
+            for match in re.finditer(pattern, text_lower):
+                start = max(0, match.start() - 50)
+                end = min(len(text), match.end() + 50)
+                examples.append((fallacy_type, match.group(), text[start:end].strip()))
+    return examples
+
+
+def legacy_count_sources(text):
+    source_patterns = [
+        r'according to\s+[A-Z]',
+        r'[A-Z][a-z]+\s+(?:said|told|stated|confirmed)',
+        r'(?:study|report|survey|research)\s+(?:by|from|published)',
+        r'cited by',
+        r'reported by',
+        r'data from',
+        r'source:\s*[A-Z]'
+    ]
+    count = 0
+    for pattern in source_patterns:
+        count += len(re.findall(pattern, text, re.IGNORECASE))
+    return min(count, 25)
+
+
+def legacy_professionalism_counts(professional_indicators, text):
+    citation_count = sum(text.lower().count(indicator) for indicator in professional_indicators)
+    stats_patterns = [r'\d+%', r'\d+\.\d+%', r'\$\d+', r'\d+ percent']
+    statistics_count = sum(len(re.findall(pattern, text)) for pattern in stats_patterns)
+    quote_count = len(re.findall(r'"[^"]{20,}"', text))
+    source_count = len(re.findall(r'according to|said|reported|stated', text, re.I))
+    return citation_count, statistics_count, quote_count, source_count
+
+
+# ============================================================================
+# CORPUS
+# ============================================================================
+
+FILLER = (
+    'the of and to in a is that for it as was with be by on not he this are or his from at '
+    'which but have an they you were her she there would their we him been has when who will '
+    'more no if out so what up its about into than them can only other new some could time '
+    'these two may then do first any my now such like our over even most made after also did '
+    'many before must through back years where much your way well down should because each '
+    'just those people how too little state good very make world still own see men work long '
+    'government officials policy committee economy budget election city council report data'
+).split()
+
+SIGNAL = [
+    'shocking', 'unprecedented', 'crisis', 'alleged', 'so-called', 'controversial', 'radical',
+    'either', 'or', 'then', 'leads to', 'experts say', 'studies show', 'most people',
+    'according to Reuters', 'Smith said', 'Jones told', 'study by', 'data from', 'reported by',
+    '12%', '3.5%', '$40', '20 percent', 'research indicates', 'evidence suggests'
+]
+
+
+def synthetic_article(rng, words):
+    paragraphs = []
+    remaining = words
+    while remaining > 0:
+        sentences = []
+        for _ in range(rng.randint(3, 7)):
+            length = rng.randint(12, 30)
+            tokens = [rng.choice(SIGNAL) if rng.random() < 0.04 else rng.choice(FILLER) for _ in range(length)]
+            if rng.random() < 0.1:
+                tokens.insert(0, '"')
+                tokens.append('"')
+            sentence = ' '.join(tokens)
+            sentences.append(sentence[0].upper() + sentence[1:] + rng.choice('..!?'))
+            remaining -= length
+        paragraphs.append(' '.join(sentences))
+    return '\n\n'.join(paragraphs)
+
+
+def load_corpus(args):
+    if args.files:
+        corpus = []
+        for path in args.files:
+            with open(path, encoding='utf-8') as handle:
+                corpus.append((path, 'Article title', handle.read()))
+        return corpus
+
+    rng = random.Random(42)
+    titles = ["You won't believe what happened next", "10 reasons why the budget failed",
+              "Council approves new transit plan", "Everyone is talking about this shocking report"]
+    return [(f'synthetic-{i + 1}', titles[i % len(titles)], synthetic_article(rng, args.words))
+            for i in range(args.articles)]
+
+
+# ============================================================================
+# BENCHMARK
+# ============================================================================
+
+def cpu_ms(func, repeat):
+    best = None
+    for _ in range(repeat):
+        pattern_engine.clear_scans()  # Every run pays for its own scan
+        start = time.process_time()
+        func()
+        elapsed = (time.process_time() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the shared pattern engine')
+    parser.add_argument('files', nargs='*')
+    parser.add_argument('--articles', type=int, default=20)
+    parser.add_argument('--words', type=int, default=6000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    from services.bias_detector import BiasDetector
+    from services.manipulation_detector import ManipulationDetector
+    from services.transparency_analyzer import TransparencyAnalyzer
+
+    bias = BiasDetector()
+    manipulation = ManipulationDetector()
+    transparency = TransparencyAnalyzer()
+
+    try:
+        from services.content_analyzer import ContentAnalyzer
+        content = ContentAnalyzer()
+    except Exception as e:
+        print(f"⚠ ContentAnalyzer unavailable ({e}) - skipping its professionalism check")
+        content = None
+
+    baseline = {'sensationalism_baseline': 0}
+    corpus = load_corpus(args)
+    totals = {'before': 0.0, 'after': 0.0}
+    mismatches = []
+
+    print("=" * 80)
+    print(f"PATTERN ENGINE BENCHMARK - {len(corpus)} articles, best of {args.repeat} runs")
+    print("=" * 80)
+    print(f"{'article':<24}{'words':>8}{'before ms':>12}{'after ms':>12}{'speedup':>10}")
+
+    for name, title, text in corpus:
+
+        def before():
+            legacy_sensationalism_counts(bias, text, title)
+            legacy_loaded_language(bias, text)
+            legacy_clickbait_techniques(manipulation, title)
+            legacy_logical_fallacies(manipulation, text)
+            legacy_count_sources(text)
+            if content:
+                legacy_professionalism_counts(content.professional_indicators, text)
+
+        def after():
+            bias._analyze_sensationalism(text, title, baseline)
+            bias._detect_loaded_language(text)
+            manipulation._analyze_clickbait(title, text)
+            manipulation._detect_logical_fallacies(text)
+            transparency._count_sources(text)
+            if content:
+                content._analyze_professionalism_detailed(text)
+
+        # Same answers?
+        sensational = bias._analyze_sensationalism(text, title, baseline)
+        if (sensational['sensational_phrases'], sensational['title_sensationalism']) != \
+                legacy_sensationalism_counts(bias, text, title):
+            mismatches.append((name, 'sensationalism'))
+        if bias._detect_loaded_language(text) != legacy_loaded_language(bias, text):
+            mismatches.append((name, 'loaded_language'))
+        fallacies = manipulation._detect_logical_fallacies(text)['examples']
+        if [(f['type'], f['pattern'], f['context']) for f in fallacies] != \
+                [(t.replace('_', ' ').title(), p, c) for t, p, c in legacy_logical_fallacies(manipulation, text)]:
+            mismatches.append((name, 'logical_fallacies'))
+        if transparency._count_sources(text) != legacy_count_sources(text):
+            mismatches.append((name, 'count_sources'))
+        if content:
+            prof = content._analyze_professionalism_detailed(text)
+            if (prof['citation_count'], prof['statistics_count'], prof['quote_count'], prof['source_count']) != \
+                    legacy_professionalism_counts(content.professional_indicators, text):
+                mismatches.append((name, 'professionalism'))
+
+        before_ms = cpu_ms(before, args.repeat)
+        after_ms = cpu_ms(after, args.repeat)
+        totals['before'] += before_ms
+        totals['after'] += after_ms
+
+        speedup = before_ms / after_ms if after_ms else float('inf')
+        print(f"{name[:23]:<24}{len(text.split()):>8}{before_ms:>12.2f}{after_ms:>12.2f}{speedup:>9.1f}x")
+
+    count = len(corpus) or 1
+    print("-" * 80)
+    print(f"{'mean per article':<32}{totals['before'] / count:>12.2f}{totals['after'] / count:>12.2f}"
+          f"{(totals['before'] / totals['after'] if totals['after'] else 0):>9.1f}x")
+
+    if mismatches:
+        print(f"✗ {len(mismatches)} result mismatches: {mismatches[:10]}")
+        return 1
+
+    print("✓ Results identical to the pre-engine implementation")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
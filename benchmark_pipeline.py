@@ -0,0 +1,343 @@
+"""
+End-to-End Pipeline Benchmark
+Date: October 16, 2026
+
+Runs the three request flows over a saved corpus, offline, at N concurrent
+requests:
+  article      NewsAnalyzer.analyze - what /api/analyze runs
+  transcript   create_job + process_transcript_job - what a transcript
+               worker runs for /api/transcript/analyze
+  council      AICouncilService.query_all - the AI Council fan-out
+
+Outbound HTTP (ScrapingBee, OpenAI, Anthropic, FRED, Google Fact Check,
+Wikipedia, ...) goes through services/replay.py: record the corpus once
+with real keys, then replay it as often as needed with recorded or
+synthetic latency. Replay misses fail like a dropped connection and are
+reported - a run with misses is not comparable to the recording.
+
+Reports per flow: p50 / p95 / max latency, failures and throughput; per
+service: calls and CPU time (thread CPU of the call); with --allocations,
+peak traced memory and the top allocation sites.
+
+The result, LLM and claim caches and analysis coalescing are switched off
+(unless --with-caches), so every request does the full work.
+
+Run:
+    python benchmark_pipeline.py --record                   # once, with API keys set
+    python benchmark_pipeline.py                            # replay, recorded latency
+    python benchmark_pipeline.py --concurrency 8 --repeat 3
+    python benchmark_pipeline.py --latency 0.2 --flows article,council
+
+Options:
+    --corpus PATH        corpus JSON (default benchmarks/corpus.json)
+    --fixtures DIR       fixture store (default benchmarks/fixtures)
+    --record             record fixtures instead of replaying
+    --hybrid             replay what is recorded, record the rest
+    --latency L          'recorded' or fixed seconds per response (default recorded)
+    --latency-scale X    multiplier for recorded latency (default 1.0)
+    --concurrency N      concurrent requests (default 4)
+    --repeat N           passes over the corpus (default 1)
+    --flows LIST         comma-separated subset of article,transcript,council
+    --allocations        trace allocations (slower - compare runs with the same flag)
+    --with-caches        leave the caches and coalescing configured as in production
+    --json PATH          also write the report as JSON
+
+Corpus format:
+    {
+      "articles":    [{"url": "..."}, {"text": "...", "name": "..."}],
+      "transcripts": [{"name": "...", "text": "...", "date": "YYYY-MM-DD"}],
+      "questions":   ["..."]
+    }
+Transcripts carry a fixed date: it is part of the fact-check prompt, so a
+date of "today" would change the requests and miss every fixture.
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import threading
+import tracemalloc
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+logging.disable(logging.CRITICAL)
+
+FLOWS = ('article', 'transcript', 'council')
+
+NO_CACHE_ENV = {
+    'ANALYSIS_CACHE_BACKEND': 'none',
+    'CLAIM_CACHE_BACKEND': 'none',
+    'LLM_CACHE_BACKEND': 'none',
+    'ANALYSIS_COALESCE': '0'
+}
+
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+# ============================================================================
+# PER-SERVICE CPU
+# ============================================================================
+
+class ServiceClock:
+    """Thread CPU time and call counts per service label"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.cpu = defaultdict(float)
+        self.wall = defaultdict(float)
+        self.calls = defaultdict(int)
+
+    def wrap(self, label_for, func):
+        def timed(*args, **kwargs):
+            label = label_for(*args, **kwargs)
+            cpu_start, wall_start = time.thread_time(), time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                with self.lock:
+                    self.cpu[label] += time.thread_time() - cpu_start
+                    self.wall[label] += time.perf_counter() - wall_start
+                    self.calls[label] += 1
+        return timed
+
+    def patch(self, owner, name, label_for):
+        original = getattr(owner, name, None)
+        if original is not None:
+            setattr(owner, name, self.wrap(label_for, original))
+
+
+def instrument(clock, flows):
+    """Wrap the service entry points of the selected flows"""
+    if 'article' in flows:
+        from services.analysis_pipeline import AnalysisPipeline
+        clock.patch(AnalysisPipeline, '_run_service',
+                    lambda pipeline, service_name, *a, **k: f"article:{service_name}")
+
+    if 'transcript' in flows:
+        import transcript_routes
+        clock.patch(transcript_routes.claim_extractor, 'extract', lambda *a, **k: 'transcript:claim_extraction')
+        clock.patch(transcript_routes.fact_checker, 'check_claim', lambda *a, **k: 'transcript:fact_check')
+        if transcript_routes.speaker_quality_analyzer is not None:
+            for method in ('analyze_transcript', 'analyze_transcript_with_speakers'):
+                clock.patch(transcript_routes.speaker_quality_analyzer, method,
+                            lambda *a, **k: 'transcript:speaker_quality')
+
+    if 'council' in flows:
+        from services.ai_council_service import AICouncilService
+        clock.patch(AICouncilService, '_query_single_ai',
+                    lambda service, service_name, *a, **k: f"council:{service_name}")
+
+
+# ============================================================================
+# FLOWS
+# ============================================================================
+
+def build_requests(corpus, flows, repeat):
+    """[(flow, name, runner)] - one entry per request"""
+    requests_ = []
+
+    if 'article' in flows:
+        from services.news_analyzer import NewsAnalyzer
+        analyzer = NewsAnalyzer()
+        for index, article in enumerate(corpus.get('articles', [])):
+            content_type = 'url' if article.get('url') else 'text'
+            content = article.get('url') or article.get('text', '')
+            name = article.get('name') or (content if content_type == 'url' else f"article-{index + 1}")
+
+            def run(content=content, content_type=content_type):
+                result = analyzer.analyze(content=content, content_type=content_type)
+                return bool(result.get('success'))
+            requests_.append(('article', name, run))
+
+    if 'transcript' in flows:
+        import transcript_routes
+        for index, transcript in enumerate(corpus.get('transcripts', [])):
+            name = transcript.get('name') or f"transcript-{index + 1}"
+
+            def run(transcript=transcript):
+                text = transcript['text']
+                job_id = transcript_routes.create_job(text, 'text', transcript.get('date', '2026-01-01'))
+                try:
+                    transcript_routes.process_transcript_job(job_id, text)
+                    job = transcript_routes.get_job(job_id) or {}
+                    return job.get('status') == 'completed'
+                finally:
+                    transcript_routes.delete_job(job_id)
+            requests_.append(('transcript', name, run))
+
+    if 'council' in flows:
+        from services.ai_council_service import AICouncilService
+        council = AICouncilService()
+        for question in corpus.get('questions', []):
+            def run(question=question):
+                result = council.query_all(question)
+                return bool(result.get('success'))
+            requests_.append(('council', question, run))
+
+    return requests_ * repeat
+
+
+def run_one(flow, name, runner):
+    start = time.perf_counter()
+    try:
+        ok = runner()
+        error = None if ok else 'unsuccessful result'
+    except Exception as e:
+        ok, error = False, f"{type(e).__name__}: {e}"
+    return {'flow': flow, 'name': name, 'ok': ok, 'error': error, 'seconds': time.perf_counter() - start}
+
+
+# ============================================================================
+# REPORT
+# ============================================================================
+
+def build_report(results, clock, wall, cpu, allocations, replay_stats):
+    flows = {}
+    for flow in FLOWS:
+        runs = [r for r in results if r['flow'] == flow]
+        if not runs:
+            continue
+        latencies = [r['seconds'] for r in runs]
+        flows[flow] = {
+            'requests': len(runs),
+            'failures': sum(1 for r in runs if not r['ok']),
+            'p50': round(percentile(latencies, 0.5), 3),
+            'p95': round(percentile(latencies, 0.95), 3),
+            'max': round(max(latencies), 3),
+            'errors': sorted({r['error'] for r in runs if r['error']})[:5]
+        }
+
+    services = {label: {'calls': clock.calls[label],
+                        'cpu_seconds': round(clock.cpu[label], 3),
+                        'wall_seconds': round(clock.wall[label], 3),
+                        'cpu_ms_per_call': round(clock.cpu[label] * 1000 / max(clock.calls[label], 1), 2)}
+                for label in sorted(clock.calls, key=lambda label: -clock.cpu[label])}
+
+    return {
+        'requests': len(results),
+        'wall_seconds': round(wall, 3),
+        'throughput_rps': round(len(results) / wall, 3) if wall else 0.0,
+        'process_cpu_seconds': round(cpu, 3),
+        'flows': flows,
+        'services': services,
+        'allocations': allocations,
+        'replay': replay_stats
+    }
+
+
+def print_report(report, args):
+    print("=" * 80)
+    print(f"PIPELINE BENCHMARK - {report['requests']} requests, concurrency {args.concurrency}, "
+          f"replay {report['replay']['mode']}")
+    print("=" * 80)
+    print(f"{'flow':<14}{'requests':>10}{'failed':>8}{'p50 s':>10}{'p95 s':>10}{'max s':>10}")
+    for flow, stats in report['flows'].items():
+        print(f"{flow:<14}{stats['requests']:>10}{stats['failures']:>8}"
+              f"{stats['p50']:>10.3f}{stats['p95']:>10.3f}{stats['max']:>10.3f}")
+        for error in stats['errors']:
+            print(f"    ✗ {error[:74]}")
+
+    print("-" * 80)
+    print(f"{'service':<44}{'calls':>8}{'cpu s':>10}{'cpu ms/call':>14}")
+    for label, stats in report['services'].items():
+        print(f"{label[:43]:<44}{stats['calls']:>8}{stats['cpu_seconds']:>10.3f}{stats['cpu_ms_per_call']:>14.2f}")
+
+    print("-" * 80)
+    print(f"wall {report['wall_seconds']:.2f}s   throughput {report['throughput_rps']:.2f} req/s   "
+          f"process CPU {report['process_cpu_seconds']:.2f}s")
+
+    if report['allocations']:
+        allocations = report['allocations']
+        print(f"peak traced memory {allocations['peak_mb']:.1f} MB - top sites still allocated after the run:")
+        for site in allocations['top']:
+            print(f"    {site['size_kb']:>10.1f} KB {site['count']:>8}  {site['where']}")
+
+    replay = report['replay']
+    if replay['mode'] != 'off':
+        print(f"replay: {replay.get('replayed', 0)} replayed, {replay.get('recorded', 0)} recorded, "
+              f"{replay.get('misses', 0)} misses")
+        if replay.get('misses'):
+            print("⚠ Replay misses - record again (--record or --hybrid) before comparing runs")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the article, transcript and AI Council flows offline')
+    parser.add_argument('--corpus', default=os.path.join('benchmarks', 'corpus.json'))
+    parser.add_argument('--fixtures', default=os.path.join('benchmarks', 'fixtures'))
+    parser.add_argument('--record', action='store_true')
+    parser.add_argument('--hybrid', action='store_true')
+    parser.add_argument('--latency', default='recorded')
+    parser.add_argument('--latency-scale', type=float, default=1.0)
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('--flows', default=','.join(FLOWS))
+    parser.add_argument('--allocations', action='store_true')
+    parser.add_argument('--with-caches', action='store_true')
+    parser.add_argument('--json')
+    args = parser.parse_args()
+
+    flows = [flow.strip() for flow in args.flows.split(',') if flow.strip()]
+    unknown = [flow for flow in flows if flow not in FLOWS]
+    if unknown:
+        parser.error(f"unknown flows: {', '.join(unknown)}")
+
+    # Caches are read from Config at import time - set before any service import
+    if not args.with_caches:
+        for name, value in NO_CACHE_ENV.items():
+            os.environ.setdefault(name, value)
+
+    from services import replay
+    mode = 'record' if args.record else ('hybrid' if args.hybrid else 'replay')
+    replay.install(mode, args.fixtures, latency=args.latency, latency_scale=args.latency_scale)
+
+    with open(args.corpus, 'r', encoding='utf-8') as handle:
+        corpus = json.load(handle)
+
+    clock = ServiceClock()
+    instrument(clock, flows)
+    requests_ = build_requests(corpus, flows, args.repeat)
+    if not requests_:
+        print(f"✗ Nothing to run - {args.corpus} has no entries for {', '.join(flows)}")
+        return 1
+
+    if args.allocations:
+        tracemalloc.start(10)
+        before = tracemalloc.take_snapshot()
+
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency, thread_name_prefix='bench') as pool:
+        results = list(pool.map(lambda request: run_one(*request), requests_))
+    wall, cpu = time.perf_counter() - wall_start, time.process_time() - cpu_start
+
+    allocations = None
+    if args.allocations:
+        _, peak = tracemalloc.get_traced_memory()
+        top = tracemalloc.take_snapshot().compare_to(before, 'lineno')[:10]
+        tracemalloc.stop()
+        allocations = {
+            'peak_mb': round(peak / (1024 * 1024), 2),
+            'top': [{'where': str(stat.traceback[0]), 'size_kb': round(stat.size_diff / 1024, 1),
+                     'count': stat.count_diff} for stat in top]
+        }
+
+    report = build_report(results, clock, wall, cpu, allocations, replay.stats())
+    print_report(report, args)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as handle:
+            json.dump(report, handle, indent=2)
+        print(f"✓ Report written to {args.json}")
+
+    return 1 if report['replay'].get('misses') or any(r['failures'] for r in report['flows'].values()) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,7 +2,12 @@
 TruthLens Claim Tracker - Flask Routes
 File: claim_tracker_routes.py
 Date: December 26, 2024
-Version: 1.1.0 - AUTOMATIC CLAIM EXTRACTION
+Version: 1.2.0 - PRE-EXTRACTED CLAIMS
+
+CHANGES IN v1.2.0 (October 16, 2026):
+- ADDED: auto_save_claims_from_analysis() accepts 'claims' already extracted
+  by the caller (AI Council consensus) and skips the extraction call
+- PRESERVED: Extraction from 'content' when no claims are given
 
 CHANGES IN v1.1.0:
 - ADDED: auto_save_claims_from_analysis() helper function
@@ -28,7 +33,7 @@ HELPER FUNCTIONS (for internal use):
 
 DO NO HARM: This is a NEW blueprint - doesn't interfere with existing routes.
 
-Last modified: December 26, 2024 - v1.1.0 Automatic Claim Extraction
+Last modified: October 16, 2026 - v1.2.0 Pre-Extracted Claims
 """
 
 import logging
@@ -166,6 +171,8 @@ def auto_save_claims_from_analysis(analysis_result):
             - 'title': Article/video title (optional)
             - 'outlet' or 'source': Source outlet (optional)
             - 'type': 'news_article' or 'youtube_video' or 'transcript'
+            - 'claims': Already extracted [{'text', 'category'}] (optional,
+              skips the Claude extraction call)
             
     Returns:
         Dictionary with:
@@ -178,18 +185,21 @@ def auto_save_claims_from_analysis(analysis_result):
             logger.warning("Claim tracker not initialized - skipping auto-save")
             return {'success': False, 'error': 'Claim tracker not available'}
         
-        # Extract text from analysis result
-        text = (analysis_result.get('content') or 
-                analysis_result.get('text') or 
-                analysis_result.get('article_text') or
-                analysis_result.get('transcript'))
-        
-        if not text:
-            logger.warning("No text found in analysis result - skipping claim extraction")
-            return {'success': False, 'error': 'No text to analyze'}
+        extracted_claims = analysis_result.get('claims')
         
-        # Extract claims using Claude
-        extracted_claims = extract_claims_from_text(text, max_claims=5)
+        if extracted_claims is None:
+            # Extract text from analysis result
+            text = (analysis_result.get('content') or 
+                    analysis_result.get('text') or 
+                    analysis_result.get('article_text') or
+                    analysis_result.get('transcript'))
+            
+            if not text:
+                logger.warning("No text found in analysis result - skipping claim extraction")
+                return {'success': False, 'error': 'No text to analyze'}
+            
+            # Extract claims using Claude
+            extracted_claims = extract_claims_from_text(text, max_claims=5)
         
         if not extracted_claims:
             logger.info("No claims extracted from text")
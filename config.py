@@ -28,6 +28,11 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Serving mode (gunicorn_config.py): 'async' = gevent workers, many requests
+# in flight per process, so the per-process pools below default larger
+SERVER_MODE = os.getenv('SERVER_MODE', 'sync').lower()
+ASYNC_SERVING = SERVER_MODE == 'async'
+
 
 @dataclass
 class ServiceConfig:
@@ -53,6 +58,7 @@ class Config:
     # Environment
     ENV = os.getenv('FLASK_ENV', 'production')
     DEBUG = ENV == 'development'
+    SERVER_MODE = SERVER_MODE  # sync | async (gevent workers, see gunicorn_config.py)
     
     # Flask settings
     SECRET_KEY = os.getenv('SECRET_KEY', 'dev-key-change-in-production')
@@ -271,7 +277,21 @@ class Config:
         'max_workers': 5,
         'timeout': 60,  # seconds
         'min_required_services': 3,
-        'continue_on_failure': True
+        'continue_on_failure': True,
+        # Shared per-process service pool (services/service_executor.py)
+        'executor_workers': int(os.getenv('ANALYSIS_EXECUTOR_WORKERS', 256 if ASYNC_SERVING else 14)),
+        # Wall-clock budget for all analysis services of one request
+        'request_deadline': float(os.getenv('ANALYSIS_DEADLINE', 30)),
+        'service_timeouts': {
+            'author_analyzer': 30,  # scraping takes time
+            'fact_checker': 25,
+            'default': 20
+        },
+        # Concurrent analyses of the same input share one run (services/analysis_flight.py)
+        'coalesce': os.getenv('ANALYSIS_COALESCE', '1').lower() in ('1', 'true', 'yes'),
+        'coalesce_lock_ttl': float(os.getenv('ANALYSIS_COALESCE_LOCK_TTL', 120)),  # lock holder's budget
+        'coalesce_wait': float(os.getenv('ANALYSIS_COALESCE_WAIT', 90)),  # then a waiter analyzes itself
+        'coalesce_result_ttl': int(os.getenv('ANALYSIS_COALESCE_RESULT_TTL', 60))
     }
     
     # Trust Score Weights
@@ -321,9 +341,132 @@ class Config:
         'ttl_default': 3600,
         'ttl_article': 86400,  # 24 hours for article content
         'ttl_api_response': 3600,  # 1 hour for API responses
-        'ttl_analysis': 7200  # 2 hours for analysis results
+        'ttl_analysis': int(os.getenv('ANALYSIS_CACHE_TTL', 7200)),  # 2 hours for analysis results
+        'ttl_analysis_degraded': int(os.getenv('ANALYSIS_CACHE_DEGRADED_TTL', 60)),  # results with timed-out services
+        # Pipeline result cache (services/result_cache.py)
+        'analysis_backend': os.getenv('ANALYSIS_CACHE_BACKEND', 'auto'),  # auto | memory | redis | none
+        'analysis_max_mb': int(os.getenv('ANALYSIS_CACHE_MAX_MB', 64)),
+        'analysis_max_entries': int(os.getenv('ANALYSIS_CACHE_MAX_ENTRIES', 500)),
+        # Shared claim verification cache (services/claim_cache.py)
+        'claim_backend': os.getenv('CLAIM_CACHE_BACKEND', 'auto'),  # auto | sqlite | redis | none
+        'claim_ttl': int(os.getenv('CLAIM_CACHE_TTL', 86400)),
+        'claim_max_entries': int(os.getenv('CLAIM_CACHE_MAX_ENTRIES', 20000)),
+        'claim_cache_path': os.getenv('CLAIM_CACHE_PATH'),
+        # Serialized quiz payloads (services/quiz_cache.py)
+        'quiz_backend': os.getenv('QUIZ_CACHE_BACKEND', 'auto'),  # auto | memory | redis | none
+        'ttl_quiz': int(os.getenv('QUIZ_CACHE_TTL', 3600)),
+        # Simple debate listing pages (simple_debate_routes.py) - 0 disables
+        'debate_page_ttl': int(os.getenv('DEBATE_PAGE_CACHE_TTL', 5))
     }
-    
+
+    # Outbound HTTP client (services/http_client.py)
+    HTTP = {
+        'pool_connections': int(os.getenv('HTTP_POOL_HOSTS', 32)),  # host pools kept open
+        'pool_maxsize': int(os.getenv('HTTP_POOL_MAXSIZE', 64 if ASYNC_SERVING else 16)),  # keep-alive sockets per host
+        'retries': int(os.getenv('HTTP_RETRIES', 2)),  # connect errors / 429 / 5xx, idempotent methods only
+        'retry_backoff': float(os.getenv('HTTP_RETRY_BACKOFF', 0.3)),  # 0.3s, 0.6s, ...
+        'per_host_limit': int(os.getenv('HTTP_PER_HOST_LIMIT', 64 if ASYNC_SERVING else 8)),  # concurrent requests per host
+        'host_wait': float(os.getenv('HTTP_HOST_WAIT', 10)),  # seconds to wait for a free slot
+        # e.g. HTTP_HOST_LIMITS="app.scrapingbee.com=5,api.openai.com=20"
+        'host_limits': {
+            host.strip(): int(limit)
+            for host, _, limit in (
+                item.partition('=') for item in os.getenv('HTTP_HOST_LIMITS', '').split(',')
+            )
+            if host.strip() and limit.strip().isdigit()
+        }
+    }
+
+    # Background job queue (services/job_queue.py) - transcript analysis jobs
+    JOB_QUEUE = {
+        'backend': os.getenv('JOB_QUEUE_BACKEND', 'auto'),  # auto | sqlite | redis
+        'path': os.getenv('JOB_QUEUE_PATH'),  # SQLite file (default: <tmp>/truthlens_jobs.sqlite3)
+        'workers': int(os.getenv('TRANSCRIPT_WORKERS', 16 if ASYNC_SERVING else 2)),  # job threads per worker process
+        'visibility_timeout': int(os.getenv('JOB_VISIBILITY_TIMEOUT', 300)),  # lease without heartbeat
+        'max_attempts': int(os.getenv('JOB_MAX_ATTEMPTS', 3)),
+        'retry_backoff': float(os.getenv('JOB_RETRY_BACKOFF', 15)),  # 15s, 30s, 60s, ...
+        'poll_interval': float(os.getenv('JOB_POLL_INTERVAL', 1.0)),
+        'retention': int(os.getenv('JOB_RETENTION', 86400)),  # finished jobs + job state kept 24h
+        # Transcript fact-checking inside one job
+        'claim_concurrency': int(os.getenv('TRANSCRIPT_CLAIM_CONCURRENCY', 6)),  # claim checks per process
+        'progress_interval_ms': int(os.getenv('TRANSCRIPT_PROGRESS_INTERVAL_MS', 750))  # min gap between writes
+    }
+
+    # Quiz leaderboards (services/leaderboard_ranking.py) - ranks computed on read
+    LEADERBOARD = {
+        'refresh_seconds': float(os.getenv('LEADERBOARD_REFRESH_SECONDS', 30)),  # reload without Redis
+        'max_quizzes': int(os.getenv('LEADERBOARD_MAX_QUIZZES', 256)),  # quiz views kept per worker
+        'top_k': int(os.getenv('LEADERBOARD_TOP_K', 50))  # longest top list served
+    }
+
+    # Shared LLM gateway (services/llm_gateway.py) - every OpenAI-compatible chat call
+    LLM_GATEWAY = {
+        'cache_backend': os.getenv('LLM_CACHE_BACKEND', 'auto'),  # auto | memory | redis | none
+        'cache_ttl': int(os.getenv('LLM_CACHE_TTL', 86400)),
+        'cache_max_mb': int(os.getenv('LLM_CACHE_MAX_MB', 32)),
+        'cache_max_temperature': float(os.getenv('LLM_CACHE_MAX_TEMPERATURE', 0)),  # 0 = deterministic calls only
+        'max_request_tokens': int(os.getenv('LLM_MAX_REQUEST_TOKENS', 4096)),  # max_tokens cap / budget reservation
+        'tokens_per_minute': int(os.getenv('LLM_TOKENS_PER_MINUTE', 0)),  # per worker, 0 = unlimited
+        'max_concurrency': int(os.getenv('LLM_MAX_CONCURRENCY', 128 if ASYNC_SERVING else 32)),
+        'budget_wait': float(os.getenv('LLM_BUDGET_WAIT', 20)),  # then LLMBudgetExceeded
+        'pool_connections': int(os.getenv('LLM_POOL_CONNECTIONS', 64))
+    }
+
+    # MultiAIService provider health (services/provider_health.py)
+    PROVIDER_HEALTH = {
+        'window': int(os.getenv('PROVIDER_HEALTH_WINDOW', 50)),  # recent calls per provider
+        'failure_threshold': int(os.getenv('PROVIDER_FAILURE_THRESHOLD', 3)),  # consecutive failures -> open
+        'error_rate_threshold': float(os.getenv('PROVIDER_ERROR_RATE_THRESHOLD', 0.5)),  # windowed rate -> open
+        'min_calls': int(os.getenv('PROVIDER_MIN_CALLS', 10)),  # calls before the error rate counts
+        'cooldown': float(os.getenv('PROVIDER_COOLDOWN', 30)),  # first open period, doubles on failed probes
+        'max_cooldown': float(os.getenv('PROVIDER_MAX_COOLDOWN', 600)),
+        'agreement_alpha': float(os.getenv('PROVIDER_AGREEMENT_ALPHA', 0.05)),  # agreement EMA smoothing
+        'agreement_min_samples': int(os.getenv('PROVIDER_AGREEMENT_MIN_SAMPLES', 10))  # claims before weights adapt
+    }
+
+    # Hedged article fetching (services/fetch_strategy.py) - direct fetch vs ScrapingBee
+    ARTICLE_FETCH = {
+        'hedge_delay': float(os.getenv('ARTICLE_HEDGE_DELAY', 3.0)),  # second method starts if the first is still out
+        'min_hedge_delay': float(os.getenv('ARTICLE_MIN_HEDGE_DELAY', 0.5)),  # bounds for learned delays
+        'max_hedge_delay': float(os.getenv('ARTICLE_MAX_HEDGE_DELAY', 10.0)),
+        'min_samples': int(os.getenv('ARTICLE_FETCH_MIN_SAMPLES', 3)),  # attempts per domain before stats count
+        'probe_every': int(os.getenv('ARTICLE_FETCH_PROBE_EVERY', 10)),  # run trailing methods to the end every Nth fetch
+        'max_domains': int(os.getenv('ARTICLE_FETCH_MAX_DOMAINS', 2000)),  # domains tracked per worker
+        'workers': int(os.getenv('ARTICLE_FETCH_WORKERS', 64 if ASYNC_SERVING else 16))  # fetch threads per worker
+    }
+
+    # Per-domain extraction profiles (services/extraction_profiles.py) - learned author/body fast paths
+    EXTRACTION_PROFILES = {
+        'backend': os.getenv('EXTRACTION_PROFILE_BACKEND', 'auto'),  # auto | sqlite | redis | memory | none
+        'path': os.getenv('EXTRACTION_PROFILE_PATH'),
+        'max_entries': int(os.getenv('EXTRACTION_PROFILE_MAX_ENTRIES', 5000)),
+        'refresh_seconds': float(os.getenv('EXTRACTION_PROFILE_REFRESH', 300)),  # worker keeps a loaded profile
+        'miss_limit': int(os.getenv('EXTRACTION_PROFILE_MISS_LIMIT', 3)),  # consecutive misses before a recipe is dropped
+        'relearn_seconds': float(os.getenv('EXTRACTION_PROFILE_RELEARN', 86400))  # retry domains with no reproducible recipe
+    }
+
+    # AI Council (services/ai_council_service.py)
+    AI_COUNCIL = {
+        'provider_timeout': float(os.getenv('AI_COUNCIL_PROVIDER_TIMEOUT', 20)),  # seconds per question
+        'quorum': int(os.getenv('AI_COUNCIL_QUORUM', 0)),  # answers before consensus starts (0 = majority)
+        'consensus_max_tokens': int(os.getenv('AI_COUNCIL_CONSENSUS_MAX_TOKENS', 2048)),
+        # Repeated questions (services/council_cache.py) - answered from recent queries
+        'cache_seconds': int(os.getenv('AI_COUNCIL_CACHE_SECONDS', 21600)),  # freshness window, 0 disables
+        'cache_candidates': int(os.getenv('AI_COUNCIL_CACHE_CANDIDATES', 1000)),  # recent questions indexed
+        'cache_refresh_seconds': float(os.getenv('AI_COUNCIL_CACHE_REFRESH', 30)),  # index reload interval
+        'coalesce_wait': float(os.getenv('AI_COUNCIL_COALESCE_WAIT', 120)),  # max wait on an identical in-flight question
+        'coalesce_lock_ttl': float(os.getenv('AI_COUNCIL_COALESCE_LOCK_TTL', 180))  # cross-worker leader's budget
+    }
+
+    # Live debate updates over SSE (services/live_updates.py)
+    LIVE_UPDATES = {
+        # Each stream holds a whole process under sync workers - SSE needs SERVER_MODE=async
+        'streaming_enabled': os.getenv('LIVE_STREAMING', 'true' if ASYNC_SERVING else 'false').lower() == 'true',
+        'max_stream_seconds': float(os.getenv('LIVE_MAX_STREAM_SECONDS', 300)),  # then EventSource reconnects
+        'keepalive_seconds': float(os.getenv('LIVE_KEEPALIVE_SECONDS', 15)),
+        'queue_size': int(os.getenv('LIVE_QUEUE_SIZE', 16))  # pending events kept per viewer
+    }
+
     # Service Health Check Configuration
     HEALTH_CHECK = {
         'enabled': True,
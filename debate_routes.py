@@ -1,8 +1,14 @@
 """
 TruthLens Debate Arena - Flask Routes v2.0
 File: debate_routes.py
-Date: October 20, 2025
-Version: 2.0.0
+Date: October 16, 2026
+Version: 2.1.0
+
+CHANGES v2.1.0 (October 16, 2026):
+- NEW: GET /api/debate/debates/<id>/events - Server-Sent Events stream of
+  vote counts and status (services/live_updates.py), replaces polling
+- CHANGED: vote_on_debate and mark_ready publish the committed debate once;
+  viewers receive it without querying the database
 
 PURPOSE:
 Complete API redesign for blind arguments and handshake system
@@ -23,6 +29,7 @@ Shared:
 - POST /api/debate/debates/<id>/handshake - Give handshake
 - GET /api/debate/debates/live - Get live debates
 - GET /api/debate/debates/waiting - Get debates waiting for opponents
+- GET /api/debate/debates/<id>/events - Live vote/status updates (SSE, v2.1.0; 503 unless SERVER_MODE=async)
 
 BREAKING CHANGES FROM v1.0:
 - Removed old create debate endpoint (no more one person writing both sides)
@@ -33,20 +40,21 @@ BREAKING CHANGES FROM v1.0:
 
 DO NO HARM: This replaces v1.0 routes - complete redesign
 
-Last modified: October 20, 2025 - v2.0 Complete Redesign
+Last modified: October 16, 2026 - v2.1 Live Vote Updates
 """
 
 import os
 import logging
 from datetime import datetime, timedelta
 from functools import wraps
-from flask import Blueprint, request, jsonify, session
+from flask import Blueprint, request, jsonify, session, Response, stream_with_context
 from sqlalchemy.exc import IntegrityError
 
 from models import (
     db, User, Debate, Argument, Vote, Challenge,
     get_live_debates, get_waiting_debates, get_open_challenges
 )
+from services.live_updates import get_live_broker
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +62,27 @@ logger = logging.getLogger(__name__)
 debate_bp = Blueprint('debate', __name__, url_prefix='/api/debate')
 
 
+# ============================================================================
+# LIVE UPDATES (v2.1.0)
+# ============================================================================
+
+def live_debate_event(debate):
+    """Viewer-neutral snapshot of a debate (no current-user fields)"""
+    return {
+        'type': 'debate_update',
+        'debate_id': debate.id,
+        'debate': debate.to_dict(include_votes=True)
+    }
+
+
+def publish_debate_update(debate):
+    """Push a debate's committed state to its live viewers - built once per change"""
+    try:
+        get_live_broker().publish(f"debate:{debate.id}", live_debate_event(debate))
+    except Exception as e:
+        logger.warning(f"Could not publish live update for debate {debate.id}: {e}")
+
+
 # ============================================================================
 # AUTHENTICATION DECORATOR
 # ============================================================================
@@ -449,6 +478,9 @@ def mark_ready(debate_id):
         
         db.session.commit()
         
+        if both_ready:
+            publish_debate_update(debate)  # status is now 'live'
+        
         logger.info(f"User {user.id} marked ready in debate {debate_id}. Both ready: {both_ready}")
         
         return jsonify({
@@ -760,6 +792,56 @@ def get_debate(debate_id):
         return jsonify({'error': 'Failed to load debate'}), 500
 
 
+@debate_bp.route('/debates/<int:debate_id>/events', methods=['GET'])
+def debate_events(debate_id):
+    """
+    Live vote counts and status for one debate (Server-Sent Events) - v2.1.0
+    
+    Sends the current debate first, then a 'debate_update' event after every
+    vote and status change. One DB read per connection, none per update.
+    Per-user fields (is_partner_a, user_is_ready) are not included - fetch
+    GET /debates/<id> for those.
+    
+    503 unless streaming is enabled (SERVER_MODE=async) - clients keep polling.
+    """
+    broker = get_live_broker()
+    channel = f"debate:{debate_id}"
+    
+    # Under sync workers a stream would hold a whole worker process
+    if not broker.streaming_enabled:
+        return jsonify({'error': 'Live updates unavailable', 'poll': True}), 503
+    
+    # Subscribe before reading the snapshot - a vote committed in between still arrives
+    subscription = broker.subscribe(channel)
+    try:
+        debate = Debate.query.get(debate_id)
+        if not debate:
+            subscription.close()
+            return jsonify({'error': 'Debate not found'}), 404
+        
+        initial = live_debate_event(debate)
+    except Exception as e:
+        subscription.close()
+        logger.error(f"Error opening live stream for debate {debate_id}: {e}", exc_info=True)
+        return jsonify({'error': 'Failed to load debate'}), 500
+    finally:
+        # Hand the connection back to the pool for the life of the stream
+        db.session.close()
+    
+    response = Response(
+        stream_with_context(broker.sse_stream(channel, initial, subscription)),
+        mimetype='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no',
+            'Connection': 'keep-alive'
+        }
+    )
+    # Also unsubscribes a client that left before the stream started
+    response.call_on_close(subscription.close)
+    return response
+
+
 # ============================================================================
 # VOTING ROUTE
 # ============================================================================
@@ -788,6 +870,7 @@ def vote_on_debate(debate_id):
         # Check if voting ended
         if debate.check_voting_ended():
             db.session.commit()
+            publish_debate_update(debate)  # status is now 'closed'
             return jsonify({'error': 'Voting period has ended'}), 400
         
         # Get argument
@@ -830,6 +913,8 @@ def vote_on_debate(debate_id):
         
         db.session.commit()
         
+        publish_debate_update(debate)
+        
         logger.info(f"Vote recorded: user={user.id}, debate={debate_id}, argument={argument_id}")
         
         return jsonify({
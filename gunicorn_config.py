@@ -1,14 +1,37 @@
 # gunicorn_config.py
 # Gunicorn configuration for Render deployment
+#
+# SERVER_MODE=async runs gevent workers: every request is a greenlet, so a
+# worker waiting 20-45s on ScrapingBee / LLM responses no longer blocks the
+# next request. One process holds up to WORKER_CONNECTIONS requests in
+# flight (analysis, transcript and AI Council alike); all routes are
+# unchanged. SERVER_MODE=sync (default) keeps the classic one request per
+# worker process.
 
 import os
+
+SERVER_MODE = os.environ.get('SERVER_MODE', 'sync').lower()
+
+if SERVER_MODE == 'async':
+    # Patch before anything imports socket/ssl/threading - preload_app
+    # imports the whole app in this process before the workers fork
+    from gevent import monkey
+    monkey.patch_all()
+
+    # psycopg2 is a C extension - make its waits cooperative too
+    from psycogreen.gevent import patch_psycopg
+    patch_psycopg()
+
 import multiprocessing
 import logging
 
 # Worker configuration
 workers = int(os.environ.get('WEB_CONCURRENCY', 2))  # Allow env override
-worker_class = 'sync'  # Using sync workers for better timeout handling
-worker_connections = 1000
+if SERVER_MODE == 'async':
+    worker_class = 'gevent'  # Cooperative I/O - hundreds of requests per worker
+else:
+    worker_class = 'sync'  # Using sync workers for better timeout handling
+worker_connections = int(os.environ.get('WORKER_CONNECTIONS', 1000))  # gevent: concurrent requests per worker
 
 # CRITICAL: Increase timeout to handle long-running analysis
 timeout = 300  # 5 minutes for analysis operations
@@ -64,4 +87,5 @@ logging.basicConfig(
 
 # Log configuration on startup
 logger = logging.getLogger(__name__)
-logger.info(f"Gunicorn config loaded - workers: {workers}, timeout: {timeout}s")
+logger.info(f"Gunicorn config loaded - mode: {SERVER_MODE} ({worker_class}), workers: {workers}, "
+            f"timeout: {timeout}s")
@@ -1,7 +1,34 @@
 """
 Multi-AI Service - BULLETPROOF VERSION
-Date: December 28, 2025
-Version: 1.1.0 - CRITICAL FIX: Never crash on import failures
+Date: October 16, 2026
+Version: 1.3.0 - HEALTH-AWARE ROUTING
+
+CHANGES FROM v1.2.0:
+✅ ADDED: Per-provider health (services/provider_health.py)
+  - Rolling p50/p95 latency and error rate from every call
+  - Circuit breakers (closed / open / half-open) - a provider that keeps
+    failing or timing out is skipped instead of costing its timeout on
+    every claim
+  - verify_claim(quorum=N) calls the N fastest healthy providers of the
+    requested ai_subset (default: all healthy ones), plus a half-open
+    provider's recovery probe
+  - Consensus weights adapt: ai_weights are base weights, scaled 0.5x-1.5x
+    by how often each provider agrees with the others
+  - Exposed on /health as 'ai_providers'
+
+CHANGES FROM v1.1.0:
+✅ CHANGED: verify_claim dispatches all providers concurrently
+  - Cost is now the slowest provider, not the sum of all round trips
+  - Per-provider deadline (PROVIDER_TIMEOUT) and overall deadline (OVERALL_TIMEOUT)
+  - Early consensus: stops waiting once the outstanding providers can no
+    longer change the weighted verdict
+  - Result reports answered / failed / timed out / cancelled providers and
+    per-provider timings
+✅ PRESERVED: Consensus math and all existing result keys
+✅ ADDED: Verdicts are stored in the shared claim verification cache
+  (services/claim_cache.py) keyed on normalized claim + provider subset +
+  date context (verify_claim(date_context=...), default today) + a hash of
+  the prompt context, only when every provider in the subset answered
 
 CHANGES FROM v1.0.0:
 ✅ FIXED: Wrapped ALL imports in try/except to prevent cascade failures
@@ -29,11 +56,37 @@ Save as: multi_ai_service.py (project root)
 import logging
 import os
 import json
+import time
 from typing import Dict, Any, List, Optional, Tuple
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
 logger = logging.getLogger(__name__)
 
+# Shared claim verification cache (optional - never blocks initialization)
+try:
+    from services.claim_cache import get_claim_cache, claim_context_key
+    CLAIM_CACHE_AVAILABLE = True
+except Exception as e:
+    logger.debug(f"[MultiAI] Claim cache unavailable: {e}")
+    CLAIM_CACHE_AVAILABLE = False
+
+# v1.3.0: Process-wide provider health (optional - never blocks initialization)
+try:
+    from services.provider_health import get_provider_health
+    PROVIDER_HEALTH_AVAILABLE = True
+except Exception as e:
+    logger.debug(f"[MultiAI] Provider health unavailable: {e}")
+    PROVIDER_HEALTH_AVAILABLE = False
+
+# v1.2.0: Shared pool for provider calls (threads are reused across claims)
+# Under SERVER_MODE=async these are greenlets, so the default cap is higher
+_provider_executor = ThreadPoolExecutor(
+    max_workers=int(os.environ.get('MULTI_AI_MAX_WORKERS',
+                                   200 if os.environ.get('SERVER_MODE', 'sync').lower() == 'async' else 20)),
+    thread_name_prefix='multi-ai'
+)
+
 
 class MultiAIService:
     """
@@ -41,12 +94,36 @@ class MultiAIService:
     Never crashes, always returns sensible results
     """
     
+    # v1.2.0: Fan-out deadlines (seconds)
+    PROVIDER_TIMEOUT = float(os.environ.get('MULTI_AI_PROVIDER_TIMEOUT', 15))
+    OVERALL_TIMEOUT = float(os.environ.get('MULTI_AI_OVERALL_TIMEOUT', 25))
+    
+    # Slower providers can be given more room than the default
+    PROVIDER_TIMEOUTS = {
+        'anthropic': 20,
+        'google': 20
+    }
+    
     def __init__(self):
         """Initialize all available AI clients with bulletproof error handling"""
         
         self.available_ais = {}
         self.ai_weights = {}
         
+        self.verification_cache = None
+        if CLAIM_CACHE_AVAILABLE:
+            try:
+                self.verification_cache = get_claim_cache()
+            except Exception as e:
+                logger.debug(f"[MultiAI] Claim cache init failed: {e}")
+        
+        self.health = None
+        if PROVIDER_HEALTH_AVAILABLE:
+            try:
+                self.health = get_provider_health()
+            except Exception as e:
+                logger.debug(f"[MultiAI] Provider health init failed: {e}")
+        
         logger.info("[MultiAI v1.1.0] Starting BULLETPROOF initialization...")
         
         # Try to initialize each AI (failures are OK)
@@ -119,12 +196,14 @@ class MultiAIService:
                 return
             
             try:
-                from openai import OpenAI
+                from services.llm_gateway import get_llm_client, OPENAI_AVAILABLE
+                if not OPENAI_AVAILABLE:
+                    raise ImportError('openai')
             except ImportError:
                 logger.debug("[MultiAI] OpenAI library not installed")
                 return
             
-            client = OpenAI(api_key=api_key)
+            client = get_llm_client('MultiAI', api_key=api_key)
             self.available_ais['openai'] = {
                 'client': client,
                 'model': 'gpt-4o-mini',
@@ -215,12 +294,15 @@ class MultiAIService:
                 return
             
             try:
-                from openai import OpenAI
+                from services.llm_gateway import get_llm_client, OPENAI_AVAILABLE
+                if not OPENAI_AVAILABLE:
+                    raise ImportError('openai')
             except ImportError:
                 logger.debug("[MultiAI] OpenAI library not installed (needed for DeepSeek)")
                 return
             
-            client = OpenAI(
+            client = get_llm_client(
+                'MultiAI',
                 api_key=api_key,
                 base_url="https://api.deepseek.com"
             )
@@ -315,12 +397,15 @@ class MultiAIService:
                 return
             
             try:
-                from openai import OpenAI
+                from services.llm_gateway import get_llm_client, OPENAI_AVAILABLE
+                if not OPENAI_AVAILABLE:
+                    raise ImportError('openai')
             except ImportError:
                 logger.debug("[MultiAI] OpenAI library not installed (needed for xAI)")
                 return
             
-            client = OpenAI(
+            client = get_llm_client(
+                'MultiAI',
                 api_key=api_key,
                 base_url="https://api.x.ai/v1"
             )
@@ -363,10 +448,24 @@ class MultiAIService:
     # ========================================================================
     
     def verify_claim(self, claim: str, context: str = "", 
-                    ai_subset: List[str] = None) -> Dict[str, Any]:
+                    ai_subset: List[str] = None,
+                    overall_timeout: Optional[float] = None,
+                    early_consensus: bool = True,
+                    quorum: int = 0,
+                    date_context: Optional[str] = None) -> Dict[str, Any]:
         """
         Verify a factual claim using multiple AIs
         BULLETPROOF: Always returns valid result
+        
+        v1.2.0: All providers are called concurrently. Returns as soon as every
+        provider answered, the deadline passed, or (with early_consensus) the
+        outstanding providers can no longer change the verdict.
+        
+        v1.3.0: Providers with an open circuit are skipped. quorum > 0 calls
+        only the `quorum` fastest healthy providers of the subset.
+        
+        date_context (transcript date etc., default today) and the context
+        sent in the prompt are part of the cache key.
         """
         
         # Validation
@@ -407,18 +506,49 @@ class MultiAIService:
                 'agreement_level': 0
             }
         
-        logger.info(f"[MultiAI] Verifying claim with {len(ais_to_use)} AIs...")
+        # Identical claims are verified once for every worker sharing the cache
+        providers = sorted(ais_to_use.keys())
+        cache_context = None
+        if self.verification_cache:
+            # The verdict depends on the date and on the context sent in the prompt
+            cache_context = claim_context_key(date_context, context[:500] if context else None)
+            cached = self.verification_cache.get('multi_ai', claim, providers, cache_context)
+            if cached:
+                cached['from_cache'] = True
+                logger.info(f"[MultiAI] ✓ Cache hit: {cached.get('verdict')} (saved {len(providers)} calls)")
+                return cached
+        
+        # v1.3.0: Fastest healthy providers first, open circuits skipped
+        skipped = []
+        if self.health:
+            routed = self.health.route(providers, quorum)
+            skipped = [name for name in providers if name not in routed]
+            ais_to_use = {name: ais_to_use[name] for name in routed}
+            if skipped:
+                logger.info(f"[MultiAI] Skipping {skipped} (unhealthy or beyond quorum {quorum})")
+        elif quorum:
+            ais_to_use = {name: ais_to_use[name] for name in providers[:quorum]}
         
-        # Collect responses from all AIs
-        responses = []
-        for ai_name, ai_config in ais_to_use.items():
-            try:
-                response = self._call_ai_for_claim(ai_name, ai_config, claim, context)
-                if response:
-                    responses.append(response)
-                    logger.info(f"[MultiAI] ✓ {ai_name}: {response['verdict']}")
-            except Exception as e:
-                logger.debug(f"[MultiAI] {ai_name} verification failed: {e}")
+        if not ais_to_use:
+            return {
+                'verdict': 'unverified',
+                'confidence': 30,
+                'explanation': 'Requested AI services are temporarily unavailable',
+                'sources': [],
+                'ai_count': 0,
+                'agreement_level': 0,
+                'providers': {'skipped': skipped}
+            }
+        
+        logger.info(f"[MultiAI] Verifying claim with {len(ais_to_use)} AIs (parallel)...")
+        
+        # v1.2.0: Collect responses from all AIs concurrently
+        responses, provider_report = self._fan_out_claim(
+            ais_to_use, claim, context,
+            overall_timeout or self.OVERALL_TIMEOUT,
+            early_consensus
+        )
+        provider_report['skipped'] = skipped
         
         if not responses:
             return {
@@ -427,16 +557,157 @@ class MultiAIService:
                 'explanation': 'All AI verifications failed',
                 'sources': [],
                 'ai_count': 0,
-                'agreement_level': 0
+                'agreement_level': 0,
+                'providers': provider_report
             }
         
-        # Calculate consensus
-        consensus = self._calculate_consensus(responses)
+        # Calculate consensus - agreement is scored against the same adapted weights
+        weights = {r.get('source', 'unknown'): self._weight(r.get('source', 'unknown')) for r in responses}
+        consensus = self._calculate_consensus(responses, weights)
+        consensus['providers'] = provider_report
+        
+        if self.health:
+            self.health.record_agreement(
+                {r.get('source', 'unknown'): r.get('verdict', 'unverified') for r in responses},
+                weights
+            )
+        
+        # Only a verdict every requested provider voted on stands for `providers`;
+        # one built around timeouts, open circuits or a quorum cut is not cached
+        complete = not skipped and sorted(provider_report['answered']) == providers
+        if self.verification_cache and complete:
+            self.verification_cache.set('multi_ai', claim, consensus, providers, cache_context)
         
-        logger.info(f"[MultiAI] Consensus: {consensus['verdict']} ({consensus['confidence']}%)")
+        logger.info(f"[MultiAI] Consensus: {consensus['verdict']} ({consensus['confidence']}%) "
+                    f"in {provider_report['elapsed']}s")
         
         return consensus
     
+    # ========================================================================
+    # PARALLEL FAN-OUT (NEW v1.2.0)
+    # ========================================================================
+    
+    def _fan_out_claim(self, ais_to_use: Dict[str, Dict], claim: str, context: str,
+                       overall_timeout: float,
+                       early_consensus: bool) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Dispatch the claim to every provider at once and collect verdicts
+        
+        Returns:
+            (responses, report) where report lists answered / failed /
+            timed_out / cancelled providers and per-provider timings
+        """
+        start = time.time()
+        overall_deadline = start + overall_timeout
+        
+        futures = {}
+        deadlines = {}
+        for ai_name, ai_config in ais_to_use.items():
+            future = _provider_executor.submit(self._timed_call_for_claim, ai_name, ai_config, claim, context)
+            futures[future] = ai_name
+            provider_timeout = self.PROVIDER_TIMEOUTS.get(ai_name, self.PROVIDER_TIMEOUT)
+            deadlines[future] = min(start + provider_timeout, overall_deadline)
+        
+        responses = []
+        report = {
+            'answered': [],
+            'failed': [],
+            'timed_out': [],
+            'cancelled': [],
+            'timings': {},
+            'early_consensus': False
+        }
+        
+        pending = set(futures)
+        while pending:
+            wait_for = min(deadlines[f] for f in pending) - time.time()
+            
+            if wait_for > 0:
+                done, pending = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+            else:
+                done = set()
+            
+            for future in done:
+                ai_name = futures[future]
+                try:
+                    response, elapsed = future.result()
+                except Exception as e:
+                    logger.debug(f"[MultiAI] {ai_name} verification failed: {e}")
+                    response, elapsed = None, time.time() - start
+                
+                report['timings'][ai_name] = round(elapsed, 2)
+                if self.health:
+                    self.health.record(ai_name, bool(response), elapsed)
+                if response:
+                    responses.append(response)
+                    report['answered'].append(ai_name)
+                    logger.info(f"[MultiAI] ✓ {ai_name}: {response.get('verdict')} ({elapsed:.1f}s)")
+                else:
+                    report['failed'].append(ai_name)
+            
+            # Drop providers whose own deadline has passed
+            now = time.time()
+            for future in [f for f in pending if deadlines[f] <= now]:
+                ai_name = futures[future]
+                future.cancel()
+                pending.discard(future)
+                report['timed_out'].append(ai_name)
+                report['timings'][ai_name] = round(now - start, 2)
+                if self.health:
+                    self.health.record(ai_name, False, now - start)
+                logger.warning(f"[MultiAI] ⏱ {ai_name}: no answer within deadline - abandoned")
+            
+            # Stop early once the outstanding providers cannot flip the verdict
+            if early_consensus and pending and self._consensus_locked(responses, [futures[f] for f in pending]):
+                report['early_consensus'] = True
+                for future in pending:
+                    ai_name = futures[future]
+                    future.cancel()
+                    report['cancelled'].append(ai_name)
+                    report['timings'][ai_name] = round(now - start, 2)
+                    if self.health:
+                        self.health.release(ai_name)
+                logger.info(f"[MultiAI] Early consensus - cancelled {report['cancelled']}")
+                pending = set()
+        
+        report['elapsed'] = round(time.time() - start, 2)
+        return responses, report
+    
+    def _timed_call_for_claim(self, ai_name: str, ai_config: Dict,
+                              claim: str, context: str) -> Tuple[Optional[Dict[str, Any]], float]:
+        """Run one provider call and measure its own wall-clock time"""
+        call_start = time.time()
+        response = self._call_ai_for_claim(ai_name, ai_config, claim, context)
+        return response, time.time() - call_start
+    
+    def _consensus_locked(self, responses: List[Dict[str, Any]], pending_names: List[str]) -> bool:
+        """
+        True when the weighted leader is ahead of the runner-up by more than
+        the total weight still outstanding (so no late answer can change it)
+        """
+        if not responses:
+            return False
+        
+        verdict_votes = {}
+        for response in responses:
+            verdict = response.get('verdict', 'unverified')
+            weight = self._weight(response.get('source', 'unknown'))
+            verdict_votes[verdict] = verdict_votes.get(verdict, 0) + weight
+        
+        ranked = sorted(verdict_votes.values(), reverse=True)
+        leader = ranked[0]
+        runner_up = ranked[1] if len(ranked) > 1 else 0
+        outstanding = sum(self._weight(name) for name in pending_names)
+        
+        return leader - runner_up > outstanding
+    
+    def _weight(self, ai_name: str) -> float:
+        """Base weight from ai_weights, scaled by observed agreement (v1.3.0)"""
+        weight = self.ai_weights.get(ai_name, 1.0)
+        if self.health:
+            weight *= self.health.weight_factor(ai_name)
+        return weight
+    
     # ========================================================================
     # AI CALLING METHODS (ALL PRESERVED, WITH ADDED BULLETPROOFING)
     # ========================================================================
@@ -521,8 +792,9 @@ Format as JSON with keys: verdict, confidence, explanation"""
     # CONSENSUS CALCULATION (ALL PRESERVED FROM v1.0.0)
     # ========================================================================
     
-    def _calculate_consensus(self, responses: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Calculate consensus verdict from multiple AI responses"""
+    def _calculate_consensus(self, responses: List[Dict[str, Any]],
+                             weights: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+        """Calculate consensus verdict from multiple AI responses (weights default to _weight)"""
         
         if not responses:
             return {
@@ -546,7 +818,7 @@ Format as JSON with keys: verdict, confidence, explanation"""
             explanation = response.get('explanation', '')
             source = response.get('source', 'unknown')
             
-            weight = self.ai_weights.get(source, 1.0)
+            weight = weights[source] if weights and source in weights else self._weight(source)
             
             verdicts.append((verdict, weight))
             confidences.append(confidence)
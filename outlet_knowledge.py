@@ -2,7 +2,11 @@
 Smart Outlet Knowledge Service
 Date: October 21, 2025 
 Last Updated: October 21, 2025 - Created for Fox News organization fix
-Version: 1.0.0 - HYBRID APPROACH
+Version: 1.1.0 - HYBRID APPROACH
+
+CHANGES IN v1.1.0 (October 16, 2026):
+✅ Quick reference lookups go through services/outlet_registry.py (subdomains
+   and OutletsDatabase aliases now match; the AI tier is unchanged)
 
 CHANGES:
 ✅ Created complete outlet knowledge service
@@ -35,12 +39,9 @@ from urllib.parse import urlparse
 
 logger = logging.getLogger(__name__)
 
-# Try to import OpenAI
-try:
-    from openai import OpenAI
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
+# OpenAI calls go through the shared LLM gateway (services/llm_gateway.py)
+from services.llm_gateway import get_llm_client, OPENAI_AVAILABLE
+if not OPENAI_AVAILABLE:
     logger.warning("OpenAI not available - AI enhancement disabled")
 
 
@@ -403,7 +404,7 @@ class OutletKnowledge:
             try:
                 from config import Config
                 if Config.OPENAI_API_KEY:
-                    self.openai_client = OpenAI(api_key=Config.OPENAI_API_KEY)
+                    self.openai_client = get_llm_client('OutletKnowledge', api_key=Config.OPENAI_API_KEY)
                     logger.info("[OutletKnowledge] OpenAI client initialized")
             except Exception as e:
                 logger.warning(f"[OutletKnowledge] Could not initialize OpenAI: {e}")
@@ -430,10 +431,12 @@ class OutletKnowledge:
         
         logger.info(f"[OutletKnowledge] Looking up: {domain}")
         
-        # TIER 1: Quick reference lookup (instant)
-        if domain in self.QUICK_REFERENCE:
+        # TIER 1: Quick reference lookup (instant - indexed, matches subdomains and aliases)
+        from services.outlet_registry import get_outlet_registry
+        reference = get_outlet_registry().lookup(domain, 'knowledge')
+        if reference is not None:
             logger.info(f"[OutletKnowledge] ✓ Found in quick reference")
-            return self.QUICK_REFERENCE[domain].copy()
+            return reference.copy()
         
         # TIER 2: Check cache
         if domain in self.cache:
@@ -1,7 +1,13 @@
 """
 Comprehensive Outlets Database - THE SINGLE SOURCE OF TRUTH
 Date: October 16, 2025
-Version: 1.0 - COMPLETE REBUILD
+Version: 1.1 - INDEXED LOOKUPS
+Last Updated: October 16, 2026
+
+CHANGES IN v1.1 (October 16, 2026):
+✅ get_outlet() and search_outlets() use the indexes in services/outlet_registry.py
+   (no more scans over OUTLETS); search_outlets() is now a prefix search over
+   domains, aliases, names and name words
 
 This database contains complete, verified metadata for 500+ news outlets.
 NO MORE searching for founding dates or readership numbers!
@@ -590,6 +596,10 @@ class OutletsDatabase:
         """
         Get complete outlet information - BULLETPROOF lookup
         
+        Indexed through services/outlet_registry.py: domain, alias and
+        subdomain lookups are hash probes; the name match uses the
+        registry's name-token index instead of scanning every outlet.
+        
         Args:
             domain: Domain like 'nytimes.com' or 'www.nytimes.com' or 'The New York Times'
             
@@ -599,37 +609,27 @@ class OutletsDatabase:
         if not domain:
             return None
         
-        # Normalize domain
-        domain_clean = domain.lower().strip()
-        domain_clean = domain_clean.replace('www.', '')
-        domain_clean = domain_clean.replace('http://', '').replace('https://', '')
-        domain_clean = domain_clean.split('/')[0]  # Remove path
-        
-        # Direct lookup
-        if domain_clean in cls.OUTLETS:
-            logger.debug(f"[OutletsDB] Direct hit: {domain_clean}")
-            return cls.OUTLETS[domain_clean].copy()
+        # Imported here - the registry indexes this class's tables
+        from services.outlet_registry import get_outlet_registry
+        registry = get_outlet_registry()
         
-        # Check aliases
-        for outlet_domain, outlet_data in cls.OUTLETS.items():
-            if domain_clean in outlet_data.get('domain_aliases', []):
-                logger.debug(f"[OutletsDB] Alias match: {domain_clean} → {outlet_domain}")
-                return outlet_data.copy()
+        # Direct, alias or parent-domain lookup
+        outlet = registry.lookup(domain, 'outlets')
+        if outlet is not None:
+            logger.debug(f"[OutletsDB] Domain match: {domain}")
+            return outlet.copy()
         
         # Fuzzy match by partial domain
-        for pattern, canonical in cls.DOMAIN_PATTERNS.items():
-            if pattern in domain_clean:
-                if canonical in cls.OUTLETS:
-                    logger.debug(f"[OutletsDB] Pattern match: {pattern} → {canonical}")
-                    return cls.OUTLETS[canonical].copy()
-        
-        # Last resort: check if domain is in any outlet name
-        domain_words = set(domain_clean.replace('-', ' ').replace('.', ' ').split())
-        for outlet_domain, outlet_data in cls.OUTLETS.items():
-            name_words = set(outlet_data['name'].lower().replace('the ', '').split())
-            if domain_words & name_words:  # If any overlap
-                logger.debug(f"[OutletsDB] Name match: {domain_clean} → {outlet_domain}")
-                return outlet_data.copy()
+        outlet = registry.match_pattern(domain, 'outlets')
+        if outlet is not None:
+            logger.debug(f"[OutletsDB] Pattern match: {domain}")
+            return outlet.copy()
+        
+        # Last resort: a word of the domain in an outlet name
+        outlet = registry.match_name(domain, 'outlets')
+        if outlet is not None:
+            logger.debug(f"[OutletsDB] Name match: {domain} → {outlet['name']}")
+            return outlet.copy()
         
         logger.warning(f"[OutletsDB] No match found for: {domain}")
         return None
@@ -659,19 +659,14 @@ class OutletsDatabase:
     
     @classmethod
     def search_outlets(cls, query: str, limit: int = 10) -> List[Dict[str, Any]]:
-        """Search outlets by name or domain"""
-        query_lower = query.lower()
-        results = []
+        """Search outlets whose domain, alias, name or a name word starts with the query"""
+        from services.outlet_registry import get_outlet_registry
         
-        for domain, data in cls.OUTLETS.items():
-            if (query_lower in domain.lower() or 
-                query_lower in data['name'].lower()):
-                result = data.copy()
-                result['domain'] = domain
-                results.append(result)
-                
-                if len(results) >= limit:
-                    break
+        results = []
+        for domain, data in get_outlet_registry().search(query, 'outlets', limit):
+            result = data.copy()
+            result['domain'] = domain
+            results.append(result)
         
         return results
 
@@ -1,10 +1,17 @@
 """
 TruthLens Media Literacy Quiz Engine - Database Models
 File: quiz_models.py
-Date: December 26, 2024
-Version: 1.0.0 - INITIAL RELEASE
+Date: October 16, 2026
+Version: 1.1.0 - MATERIALIZED USER STATS
 
 CHANGE LOG:
+- October 16, 2026 v1.1.0: Materialized user stats
+  - ADDED: UserQuizStats - per-fingerprint totals updated on submit
+    (services/achievement_engine.py)
+  - CHANGED: get_user_stats() reads UserQuizStats when present instead of
+    aggregating every attempt
+  - PRESERVED: All v1.0.0 models and fields
+
 - December 26, 2024 v1.0.0: Initial creation
   - CREATED: Quiz system database models
   - PATTERN: Follows simple_debate_models.py pattern exactly
@@ -30,13 +37,14 @@ MODELS:
 - Achievement: Badges and achievements
 - UserAchievement: User achievement unlocks (anonymous)
 - LeaderboardEntry: Top scores (anonymous)
+- UserQuizStats: Running totals per user (NEW v1.1.0)
 
 ANONYMOUS TRACKING:
 - Browser fingerprint (SHA256 hash of IP + User-Agent)
 - Optional display name for leaderboard
 - No authentication required
 
-Last modified: December 26, 2024 - v1.0.0 Initial Creation
+Last modified: October 16, 2026 - v1.1.0 Materialized User Stats
 """
 
 from datetime import datetime
@@ -54,6 +62,7 @@ QuizAttempt = None
 Achievement = None
 UserAchievement = None
 LeaderboardEntry = None
+UserQuizStats = None
 
 
 def init_quiz_db(shared_db):
@@ -71,7 +80,7 @@ def init_quiz_db(shared_db):
     Returns:
         The same database instance (for consistency)
     """
-    global db, Quiz, Question, QuestionOption, QuizAttempt, Achievement, UserAchievement, LeaderboardEntry
+    global db, Quiz, Question, QuestionOption, QuizAttempt, Achievement, UserAchievement, LeaderboardEntry, UserQuizStats
     
     db = shared_db
     
@@ -524,6 +533,49 @@ def init_quiz_db(shared_db):
         def __repr__(self):
             return f'<LeaderboardEntry quiz={self.quiz_id} score={self.score}>'
     
+    
+    class UserQuizStats(db.Model):
+        """
+        Materialized user statistics (NEW v1.1.0)
+        
+        Running totals per browser fingerprint, updated incrementally on each
+        submit so stats and achievement checks never re-aggregate attempts.
+        """
+        __tablename__ = 'user_quiz_stats'
+        
+        user_fingerprint = db.Column(db.String(64), primary_key=True)
+        
+        # Running totals over completed attempts
+        total_quizzes = db.Column(db.Integer, default=0, nullable=False)
+        total_points = db.Column(db.Integer, default=0, nullable=False)
+        score_sum = db.Column(db.Integer, default=0, nullable=False)  # average = score_sum / total_quizzes
+        best_score = db.Column(db.Integer, default=0, nullable=False)
+        
+        # Highest QuizAttempt.id the first-submit backfill counted - later
+        # submits of attempts at or below it are already in the totals
+        backfilled_through = db.Column(db.Integer, nullable=True)
+        
+        # Timestamp
+        updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+        
+        def get_average_score(self):
+            """Average score, rounded like get_user_stats()"""
+            if not self.total_quizzes:
+                return 0
+            return round(self.score_sum / self.total_quizzes, 1)
+        
+        def to_dict(self):
+            """Same keys as get_user_stats() (minus achievements_count)"""
+            return {
+                'total_quizzes': self.total_quizzes,
+                'average_score': self.get_average_score(),
+                'best_score': self.best_score,
+                'total_points': self.total_points
+            }
+        
+        def __repr__(self):
+            return f'<UserQuizStats user={self.user_fingerprint[:8]} quizzes={self.total_quizzes}>'
+    
     # Export the classes to module globals
     globals()['Quiz'] = Quiz
     globals()['Question'] = Question
@@ -532,6 +584,7 @@ def init_quiz_db(shared_db):
     globals()['Achievement'] = Achievement
     globals()['UserAchievement'] = UserAchievement
     globals()['LeaderboardEntry'] = LeaderboardEntry
+    globals()['UserQuizStats'] = UserQuizStats
     
     return db
 
@@ -560,7 +613,20 @@ def get_active_quizzes(category=None, difficulty=None, limit=50):
 
 
 def get_user_stats(user_fingerprint):
-    """Get user statistics"""
+    """
+    Get user statistics
+    
+    v1.1.0: Served from UserQuizStats when the user has a row (two cheap
+    queries); users without one fall back to aggregating their attempts.
+    """
+    materialized = UserQuizStats.query.get(user_fingerprint)
+    if materialized is not None:
+        stats = materialized.to_dict()
+        stats['achievements_count'] = UserAchievement.query.filter_by(
+            user_fingerprint=user_fingerprint
+        ).count()
+        return stats
+    
     attempts = QuizAttempt.query.filter_by(
         user_fingerprint=user_fingerprint,
         completed=True
@@ -592,4 +658,4 @@ def get_user_stats(user_fingerprint):
 
 
 # I did no harm and this file is not truncated
-# v1.0.0 - December 26, 2024 - Initial Media Literacy Quiz Engine Models
+# v1.1.0 - October 16, 2026 - Materialized User Stats
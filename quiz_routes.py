@@ -1,10 +1,33 @@
 """
 TruthLens Media Literacy Quiz Engine - Flask Routes
 File: quiz_routes.py
-Date: December 26, 2024
-Version: 1.1.0 - AI QUIZ AUTO-GENERATOR
+Date: October 16, 2026
+Version: 1.4.0 - EVENT-DRIVEN ACHIEVEMENTS
 
 CHANGE LOG:
+- October 16, 2026 v1.4.0: Event-driven achievements
+  - CHANGED: check_achievement_unlock no longer loads every achievement,
+    every unlock and every attempt per submit - UserQuizStats is updated
+    incrementally and only achievements whose threshold was just crossed
+    are checked (services/achievement_engine.py)
+  - CHANGED: /stats served from UserQuizStats when available
+  
+- October 16, 2026 v1.3.0: Batched quiz read path
+  - FIXED: /list ran one best-attempt query per quiz (plus three aggregate
+    queries per quiz in Quiz.to_dict) - now four queries per page
+  - CHANGED: Questions and options loaded with two queries instead of
+    walking lazy='dynamic' relationships (get, start, submit)
+  - NEW: Serialized quiz payloads cached (services/quiz_cache.py),
+    invalidated by the admin generate routes
+  - PRESERVED: All response fields
+  
+- October 16, 2026 v1.2.0: Incremental leaderboard ranking
+  - CHANGED: /submit writes only the user's leaderboard row - no more
+    full re-rank of every entry (update_leaderboard_ranks) per submit
+  - CHANGED: Ranks computed on read (services/leaderboard_ranking.py):
+    cached top-K per quiz, O(log N) rank lookup for the current user
+  - PRESERVED: /leaderboard/<quiz_id> response shape
+  
 - December 26, 2024 v1.1.0: AI Quiz Auto-Generator
   - ADDED: POST /api/quiz/admin/generate-from-url
   - ADDED: POST /api/quiz/admin/generate-from-text
@@ -41,7 +64,7 @@ Admin (AI Generation - NEW v1.1.0):
 - POST /api/quiz/admin/generate-from-url - Generate quiz from article URL
 - POST /api/quiz/admin/generate-from-text - Generate quiz from article text
 
-Last modified: December 26, 2024 - v1.1.0 AI Quiz Auto-Generator
+Last modified: October 16, 2026 - v1.4.0 Event-Driven Achievements
 """
 
 import os
@@ -55,6 +78,9 @@ from quiz_models import (
     UserAchievement, LeaderboardEntry,
     generate_browser_fingerprint, get_active_quizzes, get_user_stats
 )
+from services.leaderboard_ranking import get_leaderboard_ranking
+from services.quiz_cache import get_quiz_cache
+from services.achievement_engine import get_achievement_engine
 
 logger = logging.getLogger(__name__)
 
@@ -104,65 +130,56 @@ def get_browser_fingerprint():
     return generate_browser_fingerprint(ip_address, user_agent)
 
 
-def check_achievement_unlock(user_fingerprint):
+def check_achievement_unlock(user_fingerprint, score=0, points=0, attempt_id=None):
     """
     Check if user has unlocked any new achievements
     
+    v1.4.0: Event-driven (services/achievement_engine.py) - updates the user's
+    materialized stats and evaluates only achievements whose threshold the
+    new stats just crossed, instead of scanning every achievement and every
+    past attempt
+    
     Returns list of newly unlocked achievements
     """
-    newly_unlocked = []
-    
-    # Get all achievements
-    all_achievements = Achievement.query.all()
-    
-    # Get user's existing achievements
-    existing_achievement_ids = [
-        ua.achievement_id 
-        for ua in UserAchievement.query.filter_by(user_fingerprint=user_fingerprint).all()
-    ]
-    
-    # Get user stats
-    stats = get_user_stats(user_fingerprint)
-    
-    for achievement in all_achievements:
-        # Skip if already unlocked
-        if achievement.id in existing_achievement_ids:
-            continue
-        
-        # Check unlock criteria
-        criteria = achievement.get_unlock_criteria()
-        criteria_type = criteria.get('type')
-        criteria_value = criteria.get('value', 0)
-        
-        unlocked = False
-        
-        if criteria_type == 'quiz_count':
-            unlocked = stats['total_quizzes'] >= criteria_value
-        elif criteria_type == 'perfect_score':
-            unlocked = stats['best_score'] >= 100
-        elif criteria_type == 'total_points':
-            unlocked = stats['total_points'] >= criteria_value
-        elif criteria_type == 'average_score':
-            unlocked = stats['average_score'] >= criteria_value
-        
-        if unlocked:
-            # Unlock achievement
-            user_achievement = UserAchievement(
-                user_fingerprint=user_fingerprint,
-                achievement_id=achievement.id
-            )
-            db.session.add(user_achievement)
-            newly_unlocked.append(achievement.to_dict())
-    
-    if newly_unlocked:
-        db.session.commit()
-        logger.info(f"User unlocked {len(newly_unlocked)} new achievements")
+    return get_achievement_engine().on_quiz_completed(user_fingerprint, score=score, points=points,
+                                                      attempt_id=attempt_id)
+
+
+def load_leaderboard_rows(quiz_id):
+    """Leaderboard rows of one quiz, best first (served by idx_leaderboard_quiz_score)"""
+    rows = LeaderboardEntry.query.with_entities(
+        LeaderboardEntry.id,
+        LeaderboardEntry.quiz_id,
+        LeaderboardEntry.user_fingerprint,
+        LeaderboardEntry.display_name,
+        LeaderboardEntry.score,
+        LeaderboardEntry.achieved_at
+    ).filter_by(quiz_id=quiz_id).order_by(
+        LeaderboardEntry.score.desc(),
+        LeaderboardEntry.achieved_at.asc()
+    ).all()
     
-    return newly_unlocked
+    return [leaderboard_row(row) for row in rows]
+
+
+def leaderboard_row(entry):
+    """Ranking row for a LeaderboardEntry (or a row of its columns)"""
+    return {
+        'id': entry.id,
+        'quiz_id': entry.quiz_id,
+        'user_fingerprint': entry.user_fingerprint,
+        'display_name': entry.display_name,
+        'score': entry.score,
+        'achieved_at': entry.achieved_at
+    }
 
 
 def update_leaderboard(quiz_id, user_fingerprint, score, display_name=None):
-    """Update leaderboard entry for user/quiz"""
+    """
+    Update leaderboard entry for user/quiz
+    
+    v1.2.0: Writes only this user's row; ranks are computed on read
+    """
     try:
         # Check if entry exists
         entry = LeaderboardEntry.query.filter_by(
@@ -172,47 +189,159 @@ def update_leaderboard(quiz_id, user_fingerprint, score, display_name=None):
         
         if entry:
             # Update if new score is better
-            if score > entry.score:
-                entry.score = score
-                entry.achieved_at = datetime.utcnow()
-                if display_name:
-                    entry.display_name = display_name
+            if score <= entry.score:
+                return
+            entry.score = score
+            entry.achieved_at = datetime.utcnow()
+            if display_name:
+                entry.display_name = display_name
         else:
             # Create new entry
             entry = LeaderboardEntry(
                 quiz_id=quiz_id,
                 user_fingerprint=user_fingerprint,
                 score=score,
-                display_name=display_name
+                display_name=display_name,
+                achieved_at=datetime.utcnow()
             )
             db.session.add(entry)
         
         db.session.commit()
         
-        # Update ranks
-        update_leaderboard_ranks(quiz_id)
+        # Move just this entry in the ranking
+        get_leaderboard_ranking(load_leaderboard_rows).record(quiz_id, leaderboard_row(entry))
+        
+    except IntegrityError:
+        # Same user submitted twice at once - the other submit created the row
+        db.session.rollback()
+        get_leaderboard_ranking(load_leaderboard_rows).invalidate(quiz_id)
         
     except Exception as e:
         logger.error(f"Error updating leaderboard: {e}", exc_info=True)
         db.session.rollback()
 
 
-def update_leaderboard_ranks(quiz_id):
-    """Recalculate ranks for quiz leaderboard"""
-    try:
-        entries = LeaderboardEntry.query.filter_by(quiz_id=quiz_id).order_by(
-            LeaderboardEntry.score.desc(),
-            LeaderboardEntry.achieved_at.asc()
-        ).all()
-        
-        for rank, entry in enumerate(entries, start=1):
-            entry.rank = rank
-        
-        db.session.commit()
-        
-    except Exception as e:
-        logger.error(f"Error updating leaderboard ranks: {e}", exc_info=True)
-        db.session.rollback()
+# ============================================================================
+# BATCHED QUIZ READS (v1.3.0)
+# ============================================================================
+
+def load_quiz_questions(quiz_id):
+    """
+    Questions of a quiz and their options in two queries
+    
+    Returns:
+        (questions ordered by order_index, {question_id: [options ordered by order_index]})
+    """
+    questions = Question.query.filter_by(quiz_id=quiz_id).order_by(
+        Question.order_index, Question.id
+    ).all()
+    
+    options_by_question = {question.id: [] for question in questions}
+    if options_by_question:
+        options = QuestionOption.query.filter(
+            QuestionOption.question_id.in_(list(options_by_question))
+        ).order_by(QuestionOption.question_id, QuestionOption.order_index, QuestionOption.id).all()
+        for option in options:
+            options_by_question[option.question_id].append(option)
+    
+    return questions, options_by_question
+
+
+def get_question_counts(quiz_ids):
+    """{quiz_id: question count} in one grouped query"""
+    if not quiz_ids:
+        return {}
+    return dict(db.session.query(
+        Question.quiz_id,
+        db.func.count(Question.id)
+    ).filter(Question.quiz_id.in_(quiz_ids)).group_by(Question.quiz_id).all())
+
+
+def get_completion_stats(quiz_ids):
+    """{quiz_id: (completion count, average score)} in one grouped query"""
+    if not quiz_ids:
+        return {}
+    rows = db.session.query(
+        QuizAttempt.quiz_id,
+        db.func.count(QuizAttempt.id),
+        db.func.sum(QuizAttempt.score)
+    ).filter(
+        QuizAttempt.quiz_id.in_(quiz_ids),
+        QuizAttempt.completed == True  # noqa: E712 - SQL expression
+    ).group_by(QuizAttempt.quiz_id).all()
+    
+    # Same rounding as Quiz.get_average_score()
+    return {quiz_id: (count, round(float(total or 0) / count, 1)) for quiz_id, count, total in rows}
+
+
+def get_user_best_scores(user_fingerprint, quiz_ids):
+    """{quiz_id: best completed score} for one user in one grouped query"""
+    if not quiz_ids:
+        return {}
+    return dict(db.session.query(
+        QuizAttempt.quiz_id,
+        db.func.max(QuizAttempt.score)
+    ).filter(
+        QuizAttempt.user_fingerprint == user_fingerprint,
+        QuizAttempt.completed == True,  # noqa: E712 - SQL expression
+        QuizAttempt.quiz_id.in_(quiz_ids)
+    ).group_by(QuizAttempt.quiz_id).all())
+
+
+def quiz_metadata(quiz):
+    """The static part of Quiz.to_dict() (no per-quiz queries)"""
+    return {
+        'id': quiz.id,
+        'title': quiz.title,
+        'description': quiz.description,
+        'category': quiz.category,
+        'difficulty': quiz.difficulty,
+        'difficulty_name': quiz.get_difficulty_name(),
+        'time_limit': quiz.time_limit,
+        'passing_score': quiz.passing_score,
+        'is_active': quiz.is_active,
+        'created_at': quiz.created_at.isoformat() if quiz.created_at else None
+    }
+
+
+def with_completion_stats(quiz_dict, completion_stats):
+    """Add the live average_score / completion_count to a quiz dict"""
+    completion_count, average_score = completion_stats.get(quiz_dict['id'], (0, 0))
+    quiz_dict['average_score'] = average_score
+    quiz_dict['completion_count'] = completion_count
+    return quiz_dict
+
+
+def build_quiz_payload(quiz_id):
+    """Quiz metadata plus questions and options, without correct answers (cacheable)"""
+    quiz = Quiz.query.get(quiz_id)
+    if not quiz:
+        return None
+    
+    questions, options_by_question = load_quiz_questions(quiz_id)
+    
+    payload = quiz_metadata(quiz)
+    payload['question_count'] = len(questions)
+    payload['questions'] = []
+    for question in questions:
+        question_dict = question.to_dict()
+        question_dict['options'] = [option.to_dict() for option in options_by_question[question.id]]
+        payload['questions'].append(question_dict)
+    
+    return payload
+
+
+def get_quiz_payload(quiz_id):
+    """
+    Quiz with questions (no correct answers) as served by /<id> and /start
+    
+    Questions come from the payload cache; completion stats are always live.
+    Returns None if the quiz does not exist.
+    """
+    payload = get_quiz_cache().get_or_build(quiz_id, build_quiz_payload)
+    if payload is None:
+        return None
+    return with_completion_stats(payload, get_completion_stats([quiz_id]))
 
 
 # ============================================================================
@@ -239,20 +368,22 @@ def list_quizzes():
         # Get user fingerprint for personalization
         user_fingerprint = get_browser_fingerprint()
         
+        # v1.3.0: One grouped query each for question counts, completion
+        # stats and this user's best scores (was several queries per quiz)
+        quiz_ids = [quiz.id for quiz in quizzes]
+        question_counts = get_question_counts(quiz_ids)
+        completion_stats = get_completion_stats(quiz_ids)
+        best_scores = get_user_best_scores(user_fingerprint, quiz_ids)
+        
         # Add user attempt info to each quiz
         quizzes_with_attempts = []
         for quiz in quizzes:
-            quiz_dict = quiz.to_dict()
+            quiz_dict = quiz_metadata(quiz)
+            quiz_dict['question_count'] = question_counts.get(quiz.id, 0)
+            with_completion_stats(quiz_dict, completion_stats)
             
-            # Get user's best attempt for this quiz
-            best_attempt = QuizAttempt.query.filter_by(
-                quiz_id=quiz.id,
-                user_fingerprint=user_fingerprint,
-                completed=True
-            ).order_by(QuizAttempt.score.desc()).first()
-            
-            quiz_dict['user_best_score'] = best_attempt.score if best_attempt else None
-            quiz_dict['user_has_attempted'] = best_attempt is not None
+            quiz_dict['user_best_score'] = best_scores.get(quiz.id)
+            quiz_dict['user_has_attempted'] = quiz.id in best_scores
             
             quizzes_with_attempts.append(quiz_dict)
         
@@ -300,22 +431,15 @@ def get_quiz(quiz_id):
     Returns quiz metadata and questions (without correct answers until submitted)
     """
     try:
-        quiz = Quiz.query.get(quiz_id)
+        # v1.3.0: Cached payload - options never carry is_correct
+        quiz_dict = get_quiz_payload(quiz_id)
         
-        if not quiz:
+        if not quiz_dict:
             return jsonify({'success': False, 'error': 'Quiz not found'}), 404
         
-        if not quiz.is_active:
+        if not quiz_dict['is_active']:
             return jsonify({'success': False, 'error': 'Quiz is not active'}), 403
         
-        # Get quiz with questions but without correct answers
-        quiz_dict = quiz.to_dict(include_questions=True)
-        
-        # Remove correct answers from options (they'll see them after submission)
-        for question in quiz_dict.get('questions', []):
-            for option in question.get('options', []):
-                option.pop('is_correct', None)
-        
         return jsonify({
             'success': True,
             'quiz': quiz_dict
@@ -338,12 +462,13 @@ def start_quiz(quiz_id):
     Creates QuizAttempt record and returns quiz with questions
     """
     try:
-        quiz = Quiz.query.get(quiz_id)
+        # v1.3.0: Cached payload - options never carry is_correct
+        quiz_dict = get_quiz_payload(quiz_id)
         
-        if not quiz:
+        if not quiz_dict:
             return jsonify({'success': False, 'error': 'Quiz not found'}), 404
         
-        if not quiz.is_active:
+        if not quiz_dict['is_active']:
             return jsonify({'success': False, 'error': 'Quiz is not active'}), 403
         
         # Get browser fingerprint
@@ -353,7 +478,7 @@ def start_quiz(quiz_id):
         attempt = QuizAttempt(
             quiz_id=quiz_id,
             user_fingerprint=user_fingerprint,
-            total_questions=quiz.get_question_count(),
+            total_questions=quiz_dict['question_count'],
             completed=False
         )
         db.session.add(attempt)
@@ -361,12 +486,6 @@ def start_quiz(quiz_id):
         
         logger.info(f"Started quiz attempt {attempt.id} for quiz {quiz_id}")
         
-        # Return quiz with questions (no correct answers yet)
-        quiz_dict = quiz.to_dict(include_questions=True)
-        for question in quiz_dict.get('questions', []):
-            for option in question.get('options', []):
-                option.pop('is_correct', None)
-        
         return jsonify({
             'success': True,
             'message': 'Quiz started!',
@@ -418,9 +537,9 @@ def submit_quiz(quiz_id):
         if attempt.completed:
             return jsonify({'success': False, 'error': 'Quiz already submitted'}), 400
         
-        # Get quiz and questions
+        # Get quiz and questions (v1.3.0: options batch-loaded, not per question)
         quiz = Quiz.query.get(quiz_id)
-        questions = Question.query.filter_by(quiz_id=quiz_id).all()
+        questions, options_by_question = load_quiz_questions(quiz_id)
         
         # Grade answers
         correct_count = 0
@@ -432,10 +551,12 @@ def submit_quiz(quiz_id):
             selected_option_id = answers.get(question_id_str)
             
             is_correct = False
-            correct_option = question.get_correct_option()
+            options = options_by_question[question.id]
+            correct_option = next((option for option in options if option.is_correct), None)
             
             if selected_option_id and correct_option:
-                is_correct = question.check_answer(int(selected_option_id))
+                selected = next((option for option in options if option.id == int(selected_option_id)), None)
+                is_correct = selected.is_correct if selected else False
             
             if is_correct:
                 correct_count += 1
@@ -475,7 +596,8 @@ def submit_quiz(quiz_id):
         update_leaderboard(quiz_id, attempt.user_fingerprint, attempt.score, display_name)
         
         # Check for achievement unlocks
-        newly_unlocked = check_achievement_unlock(attempt.user_fingerprint)
+        newly_unlocked = check_achievement_unlock(attempt.user_fingerprint, attempt.score, attempt.points_earned,
+                                                  attempt_id=attempt.id)
         
         # Return results
         return jsonify({
@@ -604,22 +726,15 @@ def get_leaderboard(quiz_id):
     try:
         limit = min(int(request.args.get('limit', 10)), 50)
         
-        # Get top entries
-        entries = LeaderboardEntry.query.filter_by(quiz_id=quiz_id).order_by(
-            LeaderboardEntry.rank.asc()
-        ).limit(limit).all()
-        
-        # Get user's entry
-        user_fingerprint = get_browser_fingerprint()
-        user_entry = LeaderboardEntry.query.filter_by(
-            quiz_id=quiz_id,
-            user_fingerprint=user_fingerprint
-        ).first()
+        # v1.2.0: Cached top-K with live ranks, O(log N) rank for this user
+        ranking = get_leaderboard_ranking(load_leaderboard_rows)
+        entries = ranking.top(quiz_id, limit)
+        user_entry = ranking.entry(quiz_id, get_browser_fingerprint())
         
         return jsonify({
             'success': True,
-            'leaderboard': [e.to_dict() for e in entries],
-            'user_entry': user_entry.to_dict() if user_entry else None
+            'leaderboard': entries,
+            'user_entry': user_entry
         }), 200
         
     except Exception as e:
@@ -775,6 +890,7 @@ def admin_generate_from_url():
                 db.session.add(option)
         
         db.session.commit()
+        get_quiz_cache().invalidate(quiz.id)
         
         logger.info(f"[Admin] ✓ Quiz created! ID={quiz.id}, Questions={len(questions_data)}")
         
@@ -912,6 +1028,7 @@ def admin_generate_from_text():
                 db.session.add(option)
         
         db.session.commit()
+        get_quiz_cache().invalidate(quiz.id)
         
         logger.info(f"[Admin] ✓ Quiz created! ID={quiz.id}, Questions={len(questions_data)}")
         
@@ -935,4 +1052,4 @@ def admin_generate_from_text():
 
 
 # I did no harm and this file is not truncated
-# v1.1.0 - December 26, 2024 - AI Quiz Auto-Generator Routes
+# v1.4.0 - October 16, 2026 - Event-Driven Achievements
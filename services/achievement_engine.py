@@ -0,0 +1,305 @@
+"""
+Achievement Engine
+Date: October 16, 2026
+Version: 1.0.0
+
+Event-driven achievement unlocks for the quiz system.
+
+check_achievement_unlock used to run on every /submit: Achievement.query.all(),
+every UserAchievement of the user, and get_user_stats() aggregating every
+attempt the user ever made - cost grew with the user's history.
+
+Now a submit is one event:
+  1. UserQuizStats (quiz_models) is updated in place with SQL increments -
+     total_quizzes, total_points, score_sum (running average) and best_score
+  2. Achievements are indexed by the stat their criteria read, sorted by
+     threshold. Only thresholds the stats just crossed (before < t <= after)
+     are candidates - found by bisect
+  3. One query checks which candidates the user already has; the rest are
+     unlocked, each in its own insert - one that a concurrent submit
+     already unlocked does not cost the others
+
+A user's first submit after this change builds their UserQuizStats row from
+their attempts once, and every threshold they already meet is evaluated
+(catch-up). The row remembers the last attempt id it counted, so an
+attempt committed concurrently with the backfill is not counted twice. After that a submit costs the same no matter how long the history.
+
+Criteria types (Achievement.unlock_criteria):
+  quiz_count     total_quizzes >= value
+  perfect_score  best_score >= 100
+  total_points   total_points >= value
+  average_score  average_score >= value
+
+USAGE:
+    from services.achievement_engine import get_achievement_engine
+
+    newly_unlocked = get_achievement_engine().on_quiz_completed(
+        user_fingerprint, score=attempt.score, points=attempt.points_earned
+    )
+"""
+
+import time
+import bisect
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Criteria type -> stat it reads
+CRITERIA_METRICS = {
+    'quiz_count': 'total_quizzes',
+    'perfect_score': 'best_score',
+    'total_points': 'total_points',
+    'average_score': 'average_score'
+}
+
+
+class AchievementIndex:
+    """Achievements grouped by stat, sorted by threshold"""
+
+    def __init__(self, achievements: List[Any]):
+        self.loaded_at = time.time()
+        self.achievements: Dict[int, Dict[str, Any]] = {}
+        entries: Dict[str, List[tuple]] = {}
+
+        for achievement in achievements:
+            criteria = achievement.get_unlock_criteria()
+            criteria_type = criteria.get('type')
+            metric = CRITERIA_METRICS.get(criteria_type)
+            if metric is None:
+                continue
+
+            threshold = 100 if criteria_type == 'perfect_score' else criteria.get('value', 0)
+            entries.setdefault(metric, []).append((threshold, achievement.id))
+            self.achievements[achievement.id] = achievement.to_dict()
+
+        self.thresholds: Dict[str, List[float]] = {}
+        self.ids: Dict[str, List[int]] = {}
+        for metric, pairs in entries.items():
+            pairs.sort()
+            self.thresholds[metric] = [threshold for threshold, _ in pairs]
+            self.ids[metric] = [achievement_id for _, achievement_id in pairs]
+
+    def crossed(self, before: Optional[Dict[str, Any]], after: Dict[str, Any]) -> List[int]:
+        """
+        Achievements whose threshold lies in (before, after]
+
+        before=None (no earlier stats) means every threshold <= after.
+        """
+        candidates = []
+        for metric, thresholds in self.thresholds.items():
+            high = after.get(metric, 0)
+            end = bisect.bisect_right(thresholds, high)
+            start = 0 if before is None else bisect.bisect_right(thresholds, before.get(metric, 0))
+            if start < end:
+                candidates.extend(self.ids[metric][start:end])
+        return candidates
+
+
+class AchievementEngine:
+    """Materialized user stats plus threshold-indexed achievement checks"""
+
+    INDEX_TTL = 300  # achievements only change when seeded - reload every 5 minutes
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._index: Optional[AchievementIndex] = None
+        self._stats = {'events': 0, 'candidates': 0, 'unlocked': 0, 'backfills': 0}
+
+    def index(self) -> AchievementIndex:
+        import quiz_models
+
+        index = self._index
+        if index is None or time.time() - index.loaded_at > self.INDEX_TTL:
+            index = AchievementIndex(quiz_models.Achievement.query.all())
+            with self._lock:
+                self._index = index
+        return index
+
+    def invalidate(self) -> None:
+        """Reload achievements on the next event (after seeding new ones)"""
+        with self._lock:
+            self._index = None
+
+    def on_quiz_completed(self, user_fingerprint: str, score: int, points: int,
+                          attempt_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Record one completed attempt and unlock what it earned
+
+        Call after the attempt is committed. Returns the newly unlocked
+        achievements as dicts.
+        """
+        before, after = self._record(user_fingerprint, score or 0, points or 0, attempt_id)
+
+        candidates = self.index().crossed(before, after)
+        with self._lock:
+            self._stats['events'] += 1
+            self._stats['candidates'] += len(candidates)
+
+        if not candidates:
+            return []
+
+        return self._unlock(user_fingerprint, candidates)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats['achievements_indexed'] = len(self._index.achievements) if self._index else 0
+        return stats
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _record(self, user_fingerprint: str, score: int, points: int, attempt_id: Optional[int] = None,
+                retry: bool = True):
+        """Apply the attempt to UserQuizStats; returns (stats before, stats after)"""
+        import quiz_models
+        from sqlalchemy.exc import IntegrityError
+
+        db = quiz_models.db
+        UserQuizStats = quiz_models.UserQuizStats
+
+        existing = db.session.query(UserQuizStats.best_score, UserQuizStats.backfilled_through).filter_by(
+            user_fingerprint=user_fingerprint
+        ).first()
+
+        if existing is None:
+            try:
+                return None, self._backfill(user_fingerprint)
+            except IntegrityError:
+                # A concurrent submit of the same user created the row first
+                db.session.rollback()
+                if not retry:
+                    raise
+                return self._record(user_fingerprint, score, points, attempt_id, retry=False)
+
+        previous, backfilled_through = existing
+        if attempt_id is not None and backfilled_through is not None and attempt_id <= backfilled_through:
+            # A concurrent first submit's backfill already counted this attempt
+            # (and evaluated every threshold it meets)
+            after = UserQuizStats.query.get(user_fingerprint).to_dict()
+            return after, after
+
+        # Atomic in-place increments - concurrent submits never lose an update
+        db.session.query(UserQuizStats).filter_by(user_fingerprint=user_fingerprint).update({
+            UserQuizStats.total_quizzes: UserQuizStats.total_quizzes + 1,
+            UserQuizStats.total_points: UserQuizStats.total_points + points,
+            UserQuizStats.score_sum: UserQuizStats.score_sum + score,
+            UserQuizStats.best_score: db.case((UserQuizStats.best_score < score, score),
+                                              else_=UserQuizStats.best_score),
+            UserQuizStats.updated_at: datetime.utcnow()
+        }, synchronize_session=False)
+        db.session.commit()
+
+        row = UserQuizStats.query.get(user_fingerprint)
+        after = row.to_dict()
+
+        # Derive "before" from the committed row minus this attempt, so
+        # concurrent submits still see every threshold between them
+        before = {
+            'total_quizzes': row.total_quizzes - 1,
+            'total_points': row.total_points - points,
+            'best_score': previous,
+            'average_score': self._average(row.score_sum - score, row.total_quizzes - 1)
+        }
+        return before, after
+
+    def _backfill(self, user_fingerprint: str) -> Dict[str, Any]:
+        """Build a user's UserQuizStats row from their attempts (once per user)"""
+        import quiz_models
+
+        db = quiz_models.db
+        QuizAttempt = quiz_models.QuizAttempt
+
+        count, total_points, score_sum, best_score, last_id = db.session.query(
+            db.func.count(QuizAttempt.id),
+            db.func.sum(QuizAttempt.points_earned),
+            db.func.sum(QuizAttempt.score),
+            db.func.max(QuizAttempt.score),
+            db.func.max(QuizAttempt.id)
+        ).filter(
+            QuizAttempt.user_fingerprint == user_fingerprint,
+            QuizAttempt.completed == True  # noqa: E712 - SQL expression
+        ).one()
+
+        row = quiz_models.UserQuizStats(
+            user_fingerprint=user_fingerprint,
+            total_quizzes=count or 0,
+            total_points=int(total_points or 0),
+            score_sum=int(score_sum or 0),
+            best_score=best_score or 0,
+            backfilled_through=last_id
+        )
+        db.session.add(row)
+        db.session.commit()
+
+        with self._lock:
+            self._stats['backfills'] += 1
+
+        return row.to_dict()
+
+    def _unlock(self, user_fingerprint: str, candidates: List[int]) -> List[Dict[str, Any]]:
+        import quiz_models
+        from sqlalchemy.exc import IntegrityError
+
+        db = quiz_models.db
+        UserAchievement = quiz_models.UserAchievement
+
+        existing = {
+            achievement_id for (achievement_id,) in db.session.query(UserAchievement.achievement_id).filter(
+                UserAchievement.user_fingerprint == user_fingerprint,
+                UserAchievement.achievement_id.in_(candidates)
+            ).all()
+        }
+
+        index = self.index()
+        newly_unlocked = []
+        for achievement_id in candidates:
+            if achievement_id in existing or achievement_id not in index.achievements:
+                continue
+            # One row per commit - a duplicate only loses itself
+            db.session.add(UserAchievement(user_fingerprint=user_fingerprint, achievement_id=achievement_id))
+            try:
+                db.session.commit()
+            except IntegrityError:
+                # A concurrent submit of the same user unlocked it first
+                db.session.rollback()
+                continue
+            newly_unlocked.append(dict(index.achievements[achievement_id]))
+
+        if not newly_unlocked:
+            return []
+
+        with self._lock:
+            self._stats['unlocked'] += len(newly_unlocked)
+        logger.info(f"User unlocked {len(newly_unlocked)} new achievements")
+
+        return newly_unlocked
+
+    @staticmethod
+    def _average(score_sum: int, count: int) -> float:
+        # Same rounding as get_user_stats()
+        return round(score_sum / count, 1) if count > 0 else 0
+
+
+_engine_lock = threading.Lock()
+_engine: Optional[AchievementEngine] = None
+
+
+def get_achievement_engine() -> AchievementEngine:
+    """Get the process-wide achievement engine"""
+    global _engine
+
+    if _engine is not None:
+        return _engine
+
+    with _engine_lock:
+        if _engine is None:
+            _engine = AchievementEngine()
+        return _engine
+
+
+# This file is not truncated
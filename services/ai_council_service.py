@@ -1,12 +1,26 @@
 """
 AI Council Service - Multi-AI Query & Consensus Generation
 File: services/ai_council_service.py
-Date: January 20, 2026
-Version: 2.1.0
+Date: October 16, 2026
+Version: 2.2.0
 
 PURPOSE:
 Query multiple AI services with the same question and generate consensus.
 
+STREAMING v2.2.0 (October 16, 2026):
+========================================
+stream_query() yields events as they happen instead of one result at the end:
+  start            services queried, quorum
+  response/error   each provider as it answers (or fails / times out)
+  consensus_token  consensus text, token by token
+  consensus        summary, agreement/disagreement areas, score, claims
+  done             all responses and stats
+Consensus starts once a quorum of providers has answered (default: a
+majority) and streams while the stragglers finish. Claims, agreement and
+disagreement areas and the score come back in the SAME call, as a JSON
+block after the summary - the separate _extract_claims round trip is gone.
+query_all() drains stream_query() with a quorum of every provider.
+
 CRITICAL FIX v2.1.0 (January 20, 2026):
 ========================================
 FIXED: Cohere model 'command-r-plus' was removed September 15, 2025
@@ -35,9 +49,20 @@ FEATURES:
 - Timeout handling (20s per AI)
 - Error recovery (continues if some AIs fail)
 - Consensus generation using Claude
-- Claim extraction from responses
+- Claim extraction from responses (folded into the consensus call)
+- Streaming: responses and consensus tokens as they arrive
 
 CHANGELOG:
+v2.2.0 (October 16, 2026):
+- ADDED: stream_query() generator - per-provider responses, quorum-started
+  streaming consensus (Config.AI_COUNCIL)
+- CHANGED: One consensus call returns summary + claims + agreement areas +
+  score; _extract_claims removed
+- CHANGED: query_all() returns the fields ai_council_routes reads
+  (success, processing_time, *_responses, consensus dict)
+- FIXED: Provider timeout is now enforced (future.result(timeout=20) inside
+  as_completed never waited)
+
 v2.1.0 (January 20, 2026):
 - FIXED: Updated Cohere to 'command-r-plus-08-2024' (deprecated model fix)
 - FIXED: Updated AI21 to 'jamba-mini' (correct API model name)
@@ -57,18 +82,70 @@ v1.1.0 (January 10, 2026):
 v1.0.0 (January 9, 2026):
 - Initial release with 7 AI services
 
-Last modified: January 20, 2026 - v2.1.0 Cohere & AI21 Model Fixes
+Last modified: October 16, 2026 - v2.2.0 Streaming Council
 I did no harm and this file is not truncated.
 """
 
 import os
+import re
+import json
+import math
+import queue
 import logging
 import time
-from typing import Dict, List, Any, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError
+from typing import Dict, List, Any, Optional, Iterator, Callable, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from services.llm_gateway import get_llm_client
 
 logger = logging.getLogger(__name__)
 
+# Separates the streamed consensus summary from its trailing JSON block
+CONSENSUS_DATA_MARKER = '<<<COUNCIL_DATA>>>'
+
+
+class ConsensusStreamParser:
+    """
+    Splits a streamed consensus into display text and the trailing JSON block
+    
+    feed() returns the text that is safe to show - everything before the
+    marker, holding back a few characters that could be the start of it.
+    """
+    
+    def __init__(self, marker: str = CONSENSUS_DATA_MARKER):
+        self.marker = marker
+        self.text = ''
+        self.emitted = 0
+        self.marker_at = -1
+    
+    def feed(self, chunk: str) -> str:
+        if not chunk:
+            return ''
+        self.text += chunk
+        if self.marker_at >= 0:
+            return ''
+        
+        self.marker_at = self.text.find(self.marker)
+        end = self.marker_at if self.marker_at >= 0 else max(len(self.text) - len(self.marker) + 1, self.emitted)
+        visible = self.text[self.emitted:end]
+        self.emitted = end
+        return visible
+    
+    def finish(self) -> Tuple[str, str, Dict[str, Any]]:
+        """(text not yet emitted, full summary, parsed JSON block or {})"""
+        if self.marker_at < 0:
+            rest = self.text[self.emitted:]
+            self.emitted = len(self.text)
+            return rest, self.text.strip(), {}
+        
+        data = {}
+        json_match = re.search(r'\{.*\}', self.text[self.marker_at + len(self.marker):], re.DOTALL)
+        if json_match:
+            try:
+                data = json.loads(json_match.group(0))
+            except ValueError as e:
+                logger.warning(f"[AICouncil] ⚠ Consensus data block unparseable: {e}")
+        return '', self.text[:self.marker_at].strip(), data
+
 
 class AICouncilService:
     """
@@ -79,6 +156,16 @@ class AICouncilService:
         """Initialize AI clients"""
         self.ai_clients = {}
         self._initialize_clients()
+        
+        try:
+            from config import Config
+            settings = getattr(Config, 'AI_COUNCIL', {})
+        except Exception:
+            settings = {}
+        self.provider_timeout = settings.get('provider_timeout', 20)
+        self.quorum = settings.get('quorum', 0)  # 0 = majority
+        self.consensus_max_tokens = settings.get('consensus_max_tokens', 2048)
+        
         logger.info(f"[AICouncil] Initialized with {len(self.ai_clients)} AI services")
     
     def _initialize_clients(self):
@@ -90,7 +177,7 @@ class AICouncilService:
             api_key = os.getenv('OPENAI_API_KEY')
             if api_key:
                 self.ai_clients['openai'] = {
-                    'client': openai.OpenAI(api_key=api_key),
+                    'client': get_llm_client('AICouncil', api_key=api_key),
                     'model': 'gpt-4',
                     'name': 'OpenAI GPT-4'
                 }
@@ -118,7 +205,8 @@ class AICouncilService:
             api_key = os.getenv('MISTRAL_API_KEY')
             if api_key:
                 self.ai_clients['mistral'] = {
-                    'client': openai.OpenAI(
+                    'client': get_llm_client(
+                        'AICouncil',
                         api_key=api_key,
                         base_url="https://api.mistral.ai/v1"
                     ),
@@ -135,7 +223,8 @@ class AICouncilService:
             api_key = os.getenv('DEEPSEEK_API_KEY')
             if api_key:
                 self.ai_clients['deepseek'] = {
-                    'client': openai.OpenAI(
+                    'client': get_llm_client(
+                        'AICouncil',
                         api_key=api_key,
                         base_url="https://api.deepseek.com"
                     ),
@@ -180,7 +269,8 @@ class AICouncilService:
             api_key = os.getenv('XAI_API_KEY')
             if api_key:
                 self.ai_clients['xai'] = {
-                    'client': openai.OpenAI(
+                    'client': get_llm_client(
+                        'AICouncil',
                         api_key=api_key,
                         base_url="https://api.x.ai/v1"
                     ),
@@ -197,7 +287,8 @@ class AICouncilService:
             api_key = os.getenv('PERPLEXITY_API_KEY')
             if api_key:
                 self.ai_clients['perplexity'] = {
-                    'client': openai.OpenAI(
+                    'client': get_llm_client(
+                        'AICouncil',
                         api_key=api_key,
                         base_url="https://api.perplexity.ai"
                     ),
@@ -214,7 +305,8 @@ class AICouncilService:
             api_key = os.getenv('REKA_API_KEY')
             if api_key:
                 self.ai_clients['reka'] = {
-                    'client': openai.OpenAI(
+                    'client': get_llm_client(
+                        'AICouncil',
                         api_key=api_key,
                         base_url="https://api.reka.ai/v1"
                     ),
@@ -231,7 +323,8 @@ class AICouncilService:
             api_key = os.getenv('AI21_API_KEY')
             if api_key:
                 self.ai_clients['ai21'] = {
-                    'client': openai.OpenAI(
+                    'client': get_llm_client(
+                        'AICouncil',
                         api_key=api_key,
                         base_url="https://api.ai21.com/studio/v1"
                     ),
@@ -252,70 +345,135 @@ class AICouncilService:
         Returns:
             Dictionary with responses from all AIs + consensus
         """
+        result = None
+        for event in self.stream_query(question, quorum=len(self.ai_clients)):
+            if event['type'] == 'done':
+                result = event
+        
+        result = dict(result)
+        result.pop('type', None)
+        return result
+    
+    def stream_query(self, question: str, quorum: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Query all AI services and yield events as they happen
+        
+        Consensus generation starts when `quorum` providers have answered
+        (default: Config.AI_COUNCIL quorum, 0 = majority) or when none are
+        left; responses arriving after that are still streamed but are not
+        part of the consensus (see consensus['based_on']).
+        
+        Yields dicts with a 'type' of start, response, error,
+        consensus_token, consensus and finally done.
+        """
         start_time = time.time()
+        total = len(self.ai_clients)
+        quorum = self._quorum(total, quorum)
         
         logger.info("=" * 80)
-        logger.info(f"[AICouncil] Querying {len(self.ai_clients)} AI services")
+        logger.info(f"[AICouncil] Querying {total} AI services (quorum {quorum})")
         logger.info(f"[AICouncil] Question: {question[:100]}...")
         
-        responses = []
+        yield {'type': 'start', 'question': question, 'total_services': total, 'quorum': quorum}
         
-        # Query all AIs in parallel
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            futures = {}
-            
-            for service_name, client_info in self.ai_clients.items():
-                future = executor.submit(
-                    self._query_single_ai,
-                    service_name,
-                    client_info,
-                    question
-                )
-                futures[future] = service_name
-            
-            # Collect results with timeout
-            for future in as_completed(futures):
-                service_name = futures[future]
-                
-                try:
-                    result = future.result(timeout=20)  # 20s timeout per AI
-                    if result:
-                        responses.append(result)
-                        logger.info(f"✓ {service_name}: response received")
-                except TimeoutError:
-                    logger.error(f"✗ {service_name}: TIMEOUT after 20s")
-                except Exception as e:
-                    logger.error(f"✗ {service_name}: {str(e)}")
-        
-        # Generate consensus if we have responses
+        events: 'queue.Queue[tuple]' = queue.Queue()
+        executor = ThreadPoolExecutor(max_workers=total + 1, thread_name_prefix='ai-council')
+        pending = set()
+        
+        # Query all AIs in parallel; each result is queued as it completes
+        for service_name, client_info in self.ai_clients.items():
+            future = executor.submit(self._query_single_ai, service_name, client_info, question)
+            future.add_done_callback(lambda f, name=service_name: events.put(('response', name, f)))
+            pending.add(service_name)
+        
+        responses = []
+        failed = []
         consensus = None
-        claims = []
+        consensus_started = False
+        deadline = start_time + self.provider_timeout
         
-        if responses:
-            consensus = self._generate_consensus(question, responses)
-            claims = self._extract_claims(consensus)
+        try:
+            while pending or (consensus_started and consensus is None):
+                if pending and time.time() >= deadline:
+                    for service_name in sorted(pending):
+                        logger.error(f"✗ {service_name}: TIMEOUT after {self.provider_timeout}s")
+                        failed.append(service_name)
+                        yield {'type': 'error', 'service': service_name, 'error': 'timeout'}
+                    pending.clear()
+                else:
+                    wait = max(deadline - time.time(), 0.05) if pending else 1.0
+                    try:
+                        event = events.get(timeout=wait)
+                    except queue.Empty:
+                        event = None
+                    
+                    if event is not None:
+                        kind = event[0]
+                        if kind == 'response':
+                            service_name, future = event[1], event[2]
+                            if service_name in pending:  # late answers after a timeout are dropped
+                                pending.discard(service_name)
+                                result = future.result()
+                                if result:
+                                    responses.append(result)
+                                    logger.info(f"✓ {service_name}: response received")
+                                    yield {'type': 'response', **result}
+                                else:
+                                    failed.append(service_name)
+                                    yield {'type': 'error', 'service': service_name, 'error': 'failed'}
+                        elif kind == 'token':
+                            yield {'type': 'consensus_token', 'text': event[1]}
+                        elif kind == 'consensus':
+                            consensus = event[1]
+                            yield {'type': 'consensus', 'consensus': consensus, 'claims': consensus.get('claims', [])}
+                
+                # Start consensus on the quorum - or on whatever answered once nothing is left
+                if not consensus_started and responses and (len(responses) >= quorum or not pending):
+                    consensus_started = True
+                    snapshot = list(responses)
+                    logger.info(f"[AICouncil] Quorum reached ({len(snapshot)}/{total}) - generating consensus")
+                    executor.submit(
+                        self._stream_consensus, question, snapshot,
+                        lambda text: events.put(('token', text)),
+                        lambda result: events.put(('consensus', result))
+                    )
+        finally:
+            executor.shutdown(wait=False)
         
         processing_time = time.time() - start_time
         
-        logger.info(f"[AICouncil] Complete: {len(responses)}/{len(self.ai_clients)} successful")
+        logger.info(f"[AICouncil] Complete: {len(responses)}/{total} successful")
         logger.info(f"[AICouncil] Processing time: {processing_time:.2f}s")
         logger.info("=" * 80)
         
-        return {
+        yield {
+            'type': 'done',
+            'success': True,
             'question': question,
             'responses': responses,
             'consensus': consensus,
-            'claims': claims,
+            'claims': consensus.get('claims', []) if consensus else [],
+            'processing_time': processing_time,
+            'total_responses': total,
+            'successful_responses': len(responses),
+            'failed_responses': total - len(responses),
             'stats': {
-                'total_services': len(self.ai_clients),
+                'total_services': total,
                 'successful': len(responses),
-                'failed': len(self.ai_clients) - len(responses),
+                'failed': total - len(responses),
                 'processing_time': processing_time
             }
         }
     
+    def _quorum(self, total: int, quorum: Optional[int] = None) -> int:
+        quorum = self.quorum if quorum is None else quorum
+        if not quorum or quorum <= 0:
+            quorum = math.ceil(total / 2)
+        return max(1, min(quorum, total))
+    
     def _query_single_ai(self, service_name: str, client_info: Dict, question: str) -> Optional[Dict[str, Any]]:
         """Query a single AI service"""
+        started = time.time()
         try:
             client = client_info['client']
             model = client_info['model']
@@ -345,15 +503,41 @@ class AICouncilService:
                 'service': service_name,
                 'name': name,
                 'response': text,
-                'model': model
+                'model': model,
+                'success': True,
+                'response_length': len(text or ''),
+                'response_time': round(time.time() - started, 2)
             }
             
         except Exception as e:
             logger.error(f"Error querying {service_name}: {str(e)}")
             return None
     
-    def _generate_consensus(self, question: str, responses: List[Dict]) -> str:
-        """Generate consensus summary using Claude"""
+    def _stream_consensus(self, question: str, responses: List[Dict],
+                          on_text: Callable[[str], None],
+                          on_done: Callable[[Dict[str, Any]], None]) -> None:
+        """Executor task: stream the consensus, always reporting a result"""
+        result = None
+        try:
+            result = self._generate_consensus(question, responses, on_text)
+        finally:
+            on_done(result or self._consensus_result("Error generating consensus summary.", {}, None, responses))
+    
+    def _generate_consensus(self, question: str, responses: List[Dict],
+                            on_text: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+        """
+        Generate consensus summary, claims and agreement areas in one call
+        
+        The summary is streamed to on_text as it is generated; the JSON
+        block after CONSENSUS_DATA_MARKER is parsed, never shown.
+        """
+        parser = ConsensusStreamParser()
+        
+        def emit(chunk: str) -> None:
+            visible = parser.feed(chunk)
+            if visible and on_text:
+                on_text(visible)
+        
         try:
             responses_text = "\n\n".join([
                 f"**{r['name']}:**\n{r['response']}"
@@ -373,79 +557,81 @@ Please provide a consensus summary that:
 3. Highlights unique insights from individual AIs
 4. Provides a balanced, objective synthesis
 
-Focus on accuracy and clarity. Be concise but thorough."""
-
-            if 'anthropic' in self.ai_clients:
-                client = self.ai_clients['anthropic']['client']
-                response = client.messages.create(
-                    model='claude-sonnet-4-20250514',
-                    max_tokens=2048,
-                    messages=[{'role': 'user', 'content': prompt}]
-                )
-                return response.content[0].text
-            
-            elif 'openai' in self.ai_clients:
-                client = self.ai_clients['openai']['client']
-                response = client.chat.completions.create(
-                    model='gpt-4',
-                    messages=[{'role': 'user', 'content': prompt}],
-                    max_tokens=2048
-                )
-                return response.choices[0].message.content
-            
-            else:
-                return "Consensus generation unavailable - no suitable AI service configured."
-                
-        except Exception as e:
-            logger.error(f"Error generating consensus: {str(e)}")
-            return "Error generating consensus summary."
-    
-    def _extract_claims(self, consensus_text: str) -> List[str]:
-        """Extract factual claims from consensus text"""
-        try:
-            prompt = f"""Extract key factual claims from this text. Return ONLY a JSON array of strings, nothing else.
+Focus on accuracy and clarity. Be concise but thorough.
 
-TEXT:
-{consensus_text}
+After the summary, write a line containing only {CONSENSUS_DATA_MARKER} followed by ONLY this JSON object:
+{{"claims": [{{"text": "specific, verifiable claim", "category": "Politics|Economics|Health|Science|Environment|Technology|Other"}}],
+ "agreement_areas": ["point most AIs agree on"],
+ "disagreement_areas": ["point where AIs differ"],
+ "consensus_score": 0-100}}
 
-Format: ["claim 1", "claim 2", "claim 3"]
-
-Extract 3-7 specific, verifiable claims. Be concise."""
+Extract 3-7 concise claims from your summary."""
 
             if 'anthropic' in self.ai_clients:
+                generated_by = 'anthropic'
                 client = self.ai_clients['anthropic']['client']
-                response = client.messages.create(
+                with client.messages.stream(
                     model='claude-sonnet-4-20250514',
-                    max_tokens=1024,
+                    max_tokens=self.consensus_max_tokens,
                     messages=[{'role': 'user', 'content': prompt}]
-                )
-                text = response.content[0].text
+                ) as stream:
+                    for text in stream.text_stream:
+                        emit(text)
             
             elif 'openai' in self.ai_clients:
+                generated_by = 'openai'
                 client = self.ai_clients['openai']['client']
-                response = client.chat.completions.create(
+                stream = client.chat.completions.create(
                     model='gpt-4',
                     messages=[{'role': 'user', 'content': prompt}],
-                    max_tokens=1024
+                    max_tokens=self.consensus_max_tokens,
+                    stream=True
                 )
-                text = response.choices[0].message.content
+                for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        emit(chunk.choices[0].delta.content)
             
             else:
-                return []
-            
-            import json
-            import re
-            
-            json_match = re.search(r'\[.*\]', text, re.DOTALL)
-            if json_match:
-                claims = json.loads(json_match.group(0))
-                logger.info(f"✓ Extracted {len(claims)} claims from text")
-                return claims
+                return self._consensus_result(
+                    "Consensus generation unavailable - no suitable AI service configured.", {}, None, responses
+                )
             
-            return []
+            rest, summary, data = parser.finish()
+            if rest and on_text:
+                on_text(rest)
             
+            result = self._consensus_result(summary, data, generated_by, responses)
+            logger.info(f"✓ Consensus generated with {len(result['claims'])} claims")
+            return result
+                
         except Exception as e:
-            logger.error(f"Error extracting claims: {str(e)}")
-            return []
+            logger.error(f"Error generating consensus: {str(e)}")
+            return self._consensus_result("Error generating consensus summary.", {}, None, responses)
+    
+    @staticmethod
+    def _consensus_result(summary: str, data: Dict[str, Any], generated_by: Optional[str],
+                          responses: List[Dict]) -> Dict[str, Any]:
+        """Consensus dict in the shape AIConsensus stores"""
+        claims = []
+        for claim in data.get('claims') or []:
+            if isinstance(claim, str):
+                claim = {'text': claim}
+            if isinstance(claim, dict) and str(claim.get('text', '')).strip():
+                claims.append({'text': str(claim['text']).strip(), 'category': claim.get('category', 'Uncategorized')})
+        
+        try:
+            score = max(0, min(100, int(data.get('consensus_score', 0))))
+        except (TypeError, ValueError):
+            score = 0
+        
+        return {
+            'summary': summary,
+            'agreement_areas': list(data.get('agreement_areas') or []),
+            'disagreement_areas': list(data.get('disagreement_areas') or []),
+            'consensus_score': score,
+            'claims': claims,
+            'generated_by': generated_by,
+            'based_on': [r['service'] for r in responses]
+        }
 
 # I did no harm and this file is not truncated.
@@ -32,8 +32,10 @@ class AIEnhancementMixin:
             
             if api_key:
                 try:
-                    from openai import OpenAI
-                    self._ai_client = OpenAI(api_key=api_key)
+                    from services.llm_gateway import get_llm_client
+                    self._ai_client = get_llm_client(self.__class__.__name__, api_key=api_key)
+                    if self._ai_client is None:
+                        raise ImportError('openai')
                     self._ai_available = True
                     logger.info(f"{self.__class__.__name__} AI enhancement initialized")
                 except ImportError:
@@ -0,0 +1,136 @@
+"""
+Analysis Request Coalescing
+Date: October 16, 2026
+Version: 1.1.0
+
+Single-flight layer in front of AnalysisPipeline.analyze.
+
+When a story breaks, many users submit the same URL within seconds. Each
+submission used to fetch the article (ScrapingBee, 45s timeout, paid
+credits) and run every analyzer before the first result reached the
+result cache. Concurrent requests for the same input now share one run:
+  - Inside a worker:  one thread computes, the others wait on it
+  - Across workers:   Redis lock per input (SET NX PX) - the lock holder
+                      computes, stores the result under a key tied to its
+                      lock token and publishes a notice; other workers wait
+                      for that notice (and poll, in case it is missed)
+Both come from RedisFlight in services/single_flight.py.
+
+Inputs are keyed with make_cache_key() from services/result_cache.py, so
+the same canonical URL (tracking params stripped) or normalized text
+coalesces exactly where it would hit the cache.
+
+If the lock holder dies, its lock expires and a waiter takes over. A waiter
+that has waited longer than wait_seconds runs the analysis itself. Without
+Redis, or when Redis errors, only in-process coalescing applies.
+
+Every caller gets its own copy of the result (JSON round trip), as with
+the result cache.
+
+CHANGES IN 1.1.0:
+- Waiters no longer open a pubsub connection each - one subscriber per
+  process wakes them all (RedisFlight / FlightNotifier), so a burst on one
+  viral URL cannot exhaust the Redis connection pool
+
+Configuration (Config.PIPELINE / environment):
+  ANALYSIS_COALESCE            1 | 0 (default: 1)
+  ANALYSIS_COALESCE_LOCK_TTL   seconds a lock holder may compute (default: 120)
+  ANALYSIS_COALESCE_WAIT       seconds a waiter waits before computing itself (default: 90)
+  ANALYSIS_COALESCE_RESULT_TTL seconds a shared result stays readable (default: 60)
+"""
+
+import logging
+import threading
+from typing import Dict, Any, Optional, Callable, Tuple
+
+from services.result_cache import make_cache_key
+from services.single_flight import RedisFlight
+
+logger = logging.getLogger(__name__)
+
+
+class AnalysisFlight:
+    """Coalesces concurrent analyses of the same input, in-process and via Redis"""
+
+    def __init__(self, client: Optional[Any] = None, enabled: bool = True,
+                 lock_ttl: float = 120, wait_seconds: float = 90,
+                 result_ttl: float = 60):
+        self.enabled = enabled
+        self.wait_seconds = wait_seconds
+        self.flight = RedisFlight('analysis', client, lock_ttl=lock_ttl,
+                                  wait_seconds=wait_seconds, result_ttl=result_ttl)
+
+    def run(self, data: Dict[str, Any], compute: Callable[[], Dict[str, Any]]) -> Tuple[Dict[str, Any], bool]:
+        """
+        compute() once for all concurrent callers with this input
+
+        Returns (result, shared) - shared is True when another request
+        computed the result.
+        """
+        key = make_cache_key(data) if self.enabled else None
+        if not key:
+            return compute(), False
+
+        leader, call = self.flight.begin(key)
+        if not leader:
+            try:
+                return self.flight.result(call, self.wait_seconds), True
+            except TimeoutError:
+                logger.warning(f"[AnalysisFlight] ⚠ Waited {self.wait_seconds}s on {key[:16]} - analyzing directly")
+                return compute(), False
+
+        try:
+            result = compute()
+        except BaseException as e:
+            self.flight.finish(call, error=e)
+            raise
+
+        self.flight.finish(call, result=result)
+        return result, False
+
+    def stats(self) -> Dict[str, Any]:
+        """Coalescing counters for /health"""
+        stats = self.flight.stats()
+        if not self.enabled:
+            stats['scope'] = 'disabled'
+        return stats
+
+
+_flight_lock = threading.Lock()
+_analysis_flight: Optional[AnalysisFlight] = None
+
+
+def get_analysis_flight() -> AnalysisFlight:
+    """Get the process-wide analysis coalescer (built from Config.PIPELINE)"""
+    global _analysis_flight
+
+    if _analysis_flight is not None:
+        return _analysis_flight
+
+    with _flight_lock:
+        if _analysis_flight is not None:
+            return _analysis_flight
+
+        from config import Config
+
+        settings = Config.PIPELINE
+        enabled = settings.get('coalesce', True)
+
+        client = None
+        if enabled:
+            from services.redis_client import get_redis_client
+            client = get_redis_client()
+
+        _analysis_flight = AnalysisFlight(
+            client,
+            enabled=enabled,
+            lock_ttl=settings.get('coalesce_lock_ttl', 120),
+            wait_seconds=settings.get('coalesce_wait', 90),
+            result_ttl=settings.get('coalesce_result_ttl', 60)
+        )
+        logger.info(f"[AnalysisFlight] Initialized - scope: {_analysis_flight.stats()['scope']}")
+
+        return _analysis_flight
+
+
+# This file is not truncated
@@ -1,7 +1,53 @@
 """
-Analysis Pipeline - v12.6 TRUST SCORE FIXED TO 100%
-Date: October 20, 2025
-Version: 12.6 - CRITICAL FIX: Trust score weights now total 100%
+Analysis Pipeline - v13.1 REQUEST COALESCING
+Date: October 16, 2026
+Version: 13.1 - One run per input, however many requests ask for it
+
+FIX (October 16, 2026):
+✅ Results where a service timed out, failed or returned default data are
+   cached only for ANALYSIS_CACHE_DEGRADED_TTL (default 60s) instead of the
+   full 2h, so one slow moment is not served to every later submitter
+
+CHANGES FROM 13.0:
+✅ ADDED: Single-flight coalescing (services/analysis_flight.py)
+  - Concurrent requests for the same canonical URL / text wait on one
+    extraction + analysis instead of each paying for ScrapingBee and all
+    seven analyzers
+  - In-process, and across gunicorn workers and instances through Redis
+  - Shared results are marked 'coalesced'; they emit no progress events
+  - Counters exposed on /health as 'analysis_coalescing'
+
+CHANGES FROM 12.9:
+✅ ADDED: DocumentAnalysis (services/document_analysis.py) built once after extraction
+  - Passed to every service as data['document'] (sentences, words, lowercased
+    text, syllables, paragraphs - all lazy, read-only, shared across threads)
+  - Services get a shallow copy of article_data, so the artifact never leaks
+    into response['article'] or the result cache
+
+CHANGES FROM 12.8:
+✅ FIXED: Services run on one long-lived pool per worker (services/service_executor.py)
+  - analyze() used to build a new 7-thread pool per request and ignored self.executor
+  - Queue depth / active threads exposed on /health as 'analysis_executor'
+✅ FIXED: Timeouts actually fire
+  - Old per-service timeouts were applied after as_completed had already yielded
+    the future, so they could never trigger
+  - Now each service has a wall-clock deadline (author 30s, fact checker 25s,
+    others 20s) capped by one request deadline (ANALYSIS_DEADLINE, default 30s)
+  - Stragglers are abandoned with default data - a hung author scrape no longer
+    holds the response open
+
+CHANGES FROM 12.7:
+✅ ADDED: Optional on_event callback for analyze()
+  - 'article' event as soon as extraction finishes
+  - 'service' event for each analyzer the moment it completes
+  - Used by the streaming /api/analyze/stream endpoint
+
+CHANGES FROM 12.6:
+✅ ADDED: Pipeline-level result cache (services/result_cache.py)
+  - Keyed on canonical URL (tracking params stripped) or SHA-256 of the text
+  - Memory (LRU + TTL + byte cap) or Redis backend
+  - Cache hits skip extraction and all seven analyzers
+  - Hit/miss counters exposed on /health
 
 CHANGES FROM 12.5:
 ✅ FIXED: Trust score weights rebalanced from 90% to 100%
@@ -22,10 +68,16 @@ Save as: services/analysis_pipeline.py (REPLACE existing file)
 
 import logging
 import time
-from typing import Dict, Any, List, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, List, Optional, Callable
+from concurrent.futures import wait, FIRST_COMPLETED
 import traceback
 
+from config import Config
+from services.result_cache import get_analysis_cache
+from services.analysis_flight import get_analysis_flight
+from services.service_executor import get_pipeline_executor
+from services.document_analysis import get_document
+
 logger = logging.getLogger(__name__)
 
 
@@ -45,10 +97,24 @@ class AnalysisPipeline:
         'content_analyzer': 0.00         # Was 0.05, now informational only
     }
     
+    # v12.9: Per-service wall-clock limits, capped by REQUEST_DEADLINE
+    SERVICE_TIMEOUTS = Config.PIPELINE.get('service_timeouts', {
+        'author_analyzer': 30,
+        'fact_checker': 25,
+        'default': 20
+    })
+    REQUEST_DEADLINE = Config.PIPELINE.get('request_deadline', 30)
+    
     def __init__(self):
         """Initialize pipeline with available services"""
-        # PRESERVED v12.5: 7 workers for true parallel execution
-        self.executor = ThreadPoolExecutor(max_workers=7)
+        # v12.9: Process-wide pool shared by every request (all 7 services still run in parallel)
+        self.executor = get_pipeline_executor()
+        
+        # v12.7: Shared content-addressed result cache
+        self.result_cache = get_analysis_cache()
+        
+        # v13.1: Concurrent requests for one input share a single run
+        self.flight = get_analysis_flight()
         
         # Import services directly
         self.services = {}
@@ -64,7 +130,8 @@ class AnalysisPipeline:
             logger.info("[Pipeline v12.6] ✓ Trust score properly balanced at 100%")
         
         logger.info(f"[Pipeline v12.6] Initialized with {len(self.services)} services")
-        logger.info(f"[Pipeline v12.6] 7 parallel workers (all services run simultaneously)")
+        logger.info(f"[Pipeline v12.9] Shared executor ({self.executor.max_workers} threads), "
+                    f"request deadline {self.REQUEST_DEADLINE}s")
     
     def _load_services(self):
         """Load available services"""
@@ -133,10 +200,18 @@ class AnalysisPipeline:
         except Exception as e:
             logger.warning(f"ContentAnalyzer unavailable: {e}")
     
-    def analyze(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def analyze(self, data: Dict[str, Any],
+                on_event: Optional[Callable[[str, Dict[str, Any]], None]] = None) -> Dict[str, Any]:
         """
         Main analysis method
         v12.6 - TRUST SCORE FIXED + v12.5 optimizations preserved
+        
+        v12.8: on_event(event_type, payload) is called with 'article' after
+        extraction and 'service' as each analyzer finishes. Cache hits emit
+        no events - the caller gets the complete result straight away.
+        
+        v13.1: While another request is analyzing the same input, this one
+        waits for that result (marked 'coalesced') and emits no events.
         """
         start_time = time.time()
         
@@ -156,6 +231,28 @@ class AnalysisPipeline:
             logger.error("No input provided")
             return self._error_response("No URL or text provided")
         
+        # v12.7: Serve repeat submissions straight from the result cache
+        cached = self.result_cache.get(data)
+        if cached:
+            cached['cached'] = True
+            cached['processing_time'] = round(time.time() - start_time, 3)
+            logger.info(f"[PIPELINE v12.7] ✓ Cache hit - returned in {cached['processing_time']}s")
+            return cached
+        
+        # v13.1: Join an identical analysis already in flight
+        result, shared = self.flight.run(data, lambda: self._analyze_uncached(data, on_event, start_time))
+        if shared:
+            result['coalesced'] = True
+            result['processing_time'] = round(time.time() - start_time, 3)
+            logger.info(f"[PIPELINE v13.1] ✓ Coalesced with an in-flight analysis - {result['processing_time']}s")
+        return result
+    
+    def _analyze_uncached(self, data: Dict[str, Any],
+                          on_event: Optional[Callable[[str, Dict[str, Any]], None]],
+                          start_time: float) -> Dict[str, Any]:
+        """Extraction, analysis services and trust score for one input (v13.1: split from analyze)"""
+        url = data.get('url', '')
+        
         # STAGE 1: Extract Article
         logger.info("STAGE 1: Article Extraction")
         
@@ -229,6 +326,8 @@ class AnalysisPipeline:
             logger.info(f"✓ Source: {article_data.get('source', 'Unknown')}")
             logger.info(f"✓ Author: {article_data.get('author', 'Unknown')}")
             
+            self._emit(on_event, 'article', article_data)
+            
         except Exception as e:
             logger.error(f"Extraction exception: {e}")
             return self._error_response(f"Extraction failed: {str(e)}")
@@ -240,60 +339,91 @@ class AnalysisPipeline:
         service_results = {}
         futures = {}
         
-        # PRESERVED v12.5: 7 workers for true parallel execution
-        with ThreadPoolExecutor(max_workers=7) as executor:
-            services_to_run = [
-                'source_credibility', 'author_analyzer', 'bias_detector', 
-                'fact_checker', 'transparency_analyzer', 
-                'manipulation_detector', 'content_analyzer'
-            ]
-            
-            for service_name in services_to_run:
-                if service_name in self.services:
-                    service = self.services[service_name]
-                    
-                    # PRESERVED: Log what we're passing to author_analyzer
-                    if service_name == 'author_analyzer':
-                        logger.info("=" * 80)
-                        logger.info("[PIPELINE v12.6] PASSING TO AUTHOR_ANALYZER:")
-                        logger.info(f"  - author: '{article_data.get('author')}'")
-                        logger.info(f"  - author_page_url: '{article_data.get('author_page_url', 'None')}'")
-                        logger.info(f"  - domain: '{article_data.get('domain')}'")
-                        logger.info(f"  - source: '{article_data.get('source')}'")
-                        logger.info(f"  - text length: {len(article_data.get('text', ''))}")
-                        logger.info("=" * 80)
-                    
-                    future = executor.submit(self._run_service, service_name, service, article_data)
-                    futures[future] = service_name
-            
-            # Collect results with PRESERVED v12.5 timeouts
-            for future in as_completed(futures):
-                service_name = futures[future]
-                
-                # PRESERVED v12.5: Optimized timeouts
-                timeout = 20  # Default 20s
+        # v13.0: Tokenize once - every service reads the same artifact
+        service_input = dict(article_data)
+        service_input['document'] = get_document(article_data.get('text', ''))
+        
+        services_to_run = [
+            'source_credibility', 'author_analyzer', 'bias_detector', 
+            'fact_checker', 'transparency_analyzer', 
+            'manipulation_detector', 'content_analyzer'
+        ]
+        
+        # v12.9: Deadlines are measured from submission - one wall clock for the request
+        stage_start = time.time()
+        request_deadline = stage_start + self.REQUEST_DEADLINE
+        deadlines = {}
+        
+        for service_name in services_to_run:
+            if service_name in self.services:
+                service = self.services[service_name]
                 
+                # PRESERVED: Log what we're passing to author_analyzer
                 if service_name == 'author_analyzer':
-                    timeout = 30  # 30s for author (scraping takes time)
-                elif service_name == 'fact_checker':
-                    timeout = 25  # 25s for fact checker
+                    logger.info("=" * 80)
+                    logger.info("[PIPELINE v12.6] PASSING TO AUTHOR_ANALYZER:")
+                    logger.info(f"  - author: '{article_data.get('author')}'")
+                    logger.info(f"  - author_page_url: '{article_data.get('author_page_url', 'None')}'")
+                    logger.info(f"  - domain: '{article_data.get('domain')}'")
+                    logger.info(f"  - source: '{article_data.get('source')}'")
+                    logger.info(f"  - text length: {len(article_data.get('text', ''))}")
+                    logger.info("=" * 80)
+                
+                future = self.executor.submit(self._run_service, service_name, service, service_input)
+                futures[future] = service_name
+                
+                timeout = self.SERVICE_TIMEOUTS.get(service_name, self.SERVICE_TIMEOUTS.get('default', 20))
+                deadlines[future] = min(stage_start + timeout, request_deadline)
+        
+        pending = set(futures)
+        degraded = []  # services that fell back to default data
+        
+        while pending:
+            next_deadline = min(deadlines[f] for f in pending)
+            done, _ = wait(pending, timeout=max(0.0, next_deadline - time.time()),
+                           return_when=FIRST_COMPLETED)
+            
+            for future in done:
+                pending.discard(future)
+                service_name = futures[future]
                 
                 try:
-                    logger.info(f"[PIPELINE v12.6] Waiting for {service_name} (timeout: {timeout}s)...")
-                    result = future.result(timeout=timeout)
+                    result = future.result()
                     if result:
                         service_results[service_name] = result
-                        logger.info(f"✓ {service_name}: completed")
+                        if result == self._get_default_service_data(service_name):
+                            degraded.append(service_name)
+                        logger.info(f"✓ {service_name}: completed in {time.time() - stage_start:.1f}s")
                     else:
                         logger.warning(f"✗ {service_name}: returned empty result")
                         service_results[service_name] = self._get_default_service_data(service_name)
-                except TimeoutError as e:
-                    logger.error(f"✗ {service_name}: TIMEOUT after {timeout}s")
-                    service_results[service_name] = self._get_default_service_data(service_name)
+                        degraded.append(service_name)
                 except Exception as e:
                     logger.error(f"✗ {service_name}: ERROR: {e}")
                     logger.error(f"✗ {service_name}: Traceback: {traceback.format_exc()}")
                     service_results[service_name] = self._get_default_service_data(service_name)
+                    degraded.append(service_name)
+                
+                self._emit(on_event, 'service', {
+                    'service': service_name,
+                    'data': service_results[service_name]
+                })
+            
+            # Abandon every straggler whose deadline has passed
+            now = time.time()
+            for future in [f for f in pending if deadlines[f] <= now]:
+                pending.discard(future)
+                service_name = futures[future]
+                self.executor.abandon(future)
+                
+                logger.error(f"✗ {service_name}: TIMEOUT after {deadlines[future] - stage_start:.0f}s - using default data")
+                service_results[service_name] = self._get_default_service_data(service_name)
+                degraded.append(service_name)
+                
+                self._emit(on_event, 'service', {
+                    'service': service_name,
+                    'data': service_results[service_name]
+                })
         
         # STAGE 3: Calculate Trust Score (FIXED v12.6)
         logger.info("STAGE 3: Calculating Trust Score (FIXED - 100% weights)")
@@ -312,6 +442,11 @@ class AnalysisPipeline:
             'services_used': len(service_results)
         }
         
+        # A partial result (timeouts, fallbacks) is only kept briefly
+        if degraded:
+            logger.warning(f"[PIPELINE] Degraded services: {', '.join(degraded)} - short cache TTL")
+        self.result_cache.set(data, response, degraded=bool(degraded))
+        
         logger.info("=" * 80)
         logger.info(f"[PIPELINE v12.6] ANALYSIS COMPLETE - {response['processing_time']}s")
         logger.info(f"[PIPELINE v12.6] Trust score calculated with 100% weight distribution")
@@ -319,6 +454,16 @@ class AnalysisPipeline:
         
         return response
     
+    def _emit(self, on_event: Optional[Callable[[str, Dict[str, Any]], None]],
+              event_type: str, payload: Dict[str, Any]) -> None:
+        """Deliver a progress event - a failing listener never breaks the analysis"""
+        if not on_event:
+            return
+        try:
+            on_event(event_type, payload)
+        except Exception as e:
+            logger.warning(f"[PIPELINE v12.8] Event listener failed on '{event_type}': {e}")
+    
     def _run_service(self, service_name: str, service: Any, data: Dict[str, Any]) -> Dict[str, Any]:
         """Run a single service and return flattened data (PRESERVED from v12.5)"""
         try:
@@ -1,7 +1,36 @@
 """
 Article Extractor - v25.0 INTELLIGENT TEXT AUTHOR EXTRACTION
 Date: October 26, 2025
-Last Updated: December 30, 2025
+Last Updated: October 16, 2026
+
+CHANGES IN v25.2 (October 16, 2026):
+✅ Per-domain extraction profiles (services/extraction_profiles.py): the
+   author probe that reproduced the cascade's result (a meta tag, JSON-LD,
+   rel/author links, a byline block or class), the container that held the
+   body text and the winning fetch method are learned per domain and
+   shared between workers. Later articles try them first; the full
+   BBC / ABC / universal cascade and the three text strategies run only
+   on a miss, and re-learn
+✅ FIX: The all-paragraphs text strategy is never learned - it matches any
+   page, so it never missed and kept comments, related links and footers in
+   the body for good; such domains run the text cascade (and a stored
+   ['all_p'] recipe is ignored and replaced)
+
+CHANGES IN v25.1 (October 16, 2026):
+✅ Hedged fetching: the direct fetch and ScrapingBee race instead of running
+   in sequence (ScrapingBee 45s → direct → 2s sleep → direct). The learned
+   per-domain plan (services/fetch_strategy.py) picks which starts first and
+   when the other joins; JS-heavy sites start both at once. First response
+   that parses wins; results carry 'fetch_method'
+✅ FIX: Every Nth fetch of a learned domain probes the trailing method - it
+   runs to the end and is recorded even when it loses, so a domain is not
+   stuck on whichever method led first (ARTICLE_FETCH_PROBE_EVERY)
+
+CHANGES (October 16, 2026):
+✅ word_count comes from the shared DocumentAnalysis (services/document_analysis.py),
+   so the pipeline's analyzers reuse the tokenization instead of re-splitting
+✅ Direct fetches and ScrapingBee calls use the shared pooled HTTP client
+   (services/http_client.py); self.session keeps its own cookies and headers
 
 CHANGES IN v25.0 (December 30, 2025):
 ✅ CRITICAL FIX: _process_text() now INTELLIGENTLY EXTRACTS AUTHORS from pasted text
@@ -36,20 +65,22 @@ import re
 import time
 import json
 import logging
+import threading
+from concurrent.futures import wait, FIRST_COMPLETED
 from typing import Dict, Any, Optional, List
 from urllib.parse import urlparse, urljoin
 
-import requests
 from bs4 import BeautifulSoup
 
-# Import OpenAI if available
-try:
-    from openai import OpenAI
-    openai_client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
-    openai_available = True
-except Exception as e:
-    openai_client = None
-    openai_available = False
+from services.document_analysis import get_document
+from services.http_client import get_http_client
+from services.fetch_strategy import get_fetch_strategy
+from services.extraction_profiles import get_extraction_profiles
+
+# OpenAI (if available) through the shared LLM gateway (services/llm_gateway.py)
+from services.llm_gateway import get_llm_client
+openai_client = get_llm_client('ArticleExtractor')
+openai_available = openai_client is not None
 
 logger = logging.getLogger(__name__)
 
@@ -145,6 +176,28 @@ JS_REQUIRED_SITES = {
     'ms.now',
 }
 
+# Author probes a domain's profile can learn (services/extraction_profiles.py),
+# cheapest first - each is one step of the cascade, run on its own
+AUTHOR_PROBES = [
+    ['meta', 'name', 'author'],
+    ['meta', 'property', 'article:author'],
+    ['meta', 'name', 'article:author'],
+    ['meta', 'name', 'parsely-author'],
+    ['meta', 'name', 'sailthru.author'],
+    ['meta', 'name', 'byl'],
+    ['meta', 'name', 'article.author'],
+    ['meta', 'name', 'bbc-author'],
+    ['jsonld'],
+    ['rel_author'],
+    ['author_link'],
+    ['byline_block'],
+    ['class', 'author'],
+    ['class', 'byline'],
+    ['class', 'by-author'],
+    ['class', 'article-author'],
+    ['class', 'contributor'],
+]
+
 
 class ArticleExtractor:
     """
@@ -157,7 +210,9 @@ class ArticleExtractor:
     
     def __init__(self):
         self.scrapingbee_api_key = os.getenv('SCRAPINGBEE_API_KEY', '').strip()
-        self.session = requests.Session()
+        self.session = get_http_client().session()
+        self.fetch_strategy = get_fetch_strategy()
+        self.extraction_profiles = get_extraction_profiles()
         
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -172,7 +227,7 @@ class ArticleExtractor:
         self.service_name = 'article_extractor'
         self.available = True
         
-        logger.info(f"[ArticleExtractor v25.0 TEXT AUTHOR FIX] Ready - OpenAI: {openai_available}, ScrapingBee: {bool(self.scrapingbee_api_key)}")
+        logger.info(f"[ArticleExtractor v25.2] Ready - OpenAI: {openai_available}, ScrapingBee: {bool(self.scrapingbee_api_key)}")
     
     def _needs_js_rendering(self, url: str) -> bool:
         """Determine if a site needs JavaScript rendering"""
@@ -247,56 +302,14 @@ class ArticleExtractor:
     def extract(self, url: str) -> Dict[str, Any]:
         """Main extraction method - ALWAYS returns valid Dict"""
         
-        logger.info(f"[ArticleExtractor v25.0] Extracting: {url}")
+        logger.info(f"[ArticleExtractor v25.1] Extracting: {url}")
         
         extraction_errors = []
         
-        # ATTEMPT 1: ScrapingBee with JavaScript rendering
-        if self.scrapingbee_api_key:
-            logger.info("[Attempt 1/3] ScrapingBee with smart JS rendering...")
-            try:
-                html, error = self._fetch_with_scrapingbee(url)
-                if html:
-                    logger.info(f"[ScrapingBee] ✓ Got {len(html)} chars of HTML")
-                    result = self._parse_html(html, url)
-                    if result['extraction_successful']:
-                        logger.info("[ScrapingBee] ✓ Extraction successful")
-                        return result
-                    else:
-                        extraction_errors.append(f"ScrapingBee parse failed: {result.get('error', 'Unknown')}")
-                else:
-                    extraction_errors.append(f"ScrapingBee fetch failed: {error}")
-                    logger.warning(f"[ScrapingBee] ✗ Failed: {error}")
-            except Exception as e:
-                error_msg = f"ScrapingBee exception: {str(e)}"
-                extraction_errors.append(error_msg)
-                logger.error(f"[ScrapingBee] ✗ Exception: {e}", exc_info=True)
-        else:
-            logger.info("[ScrapingBee] Skipped (not configured)")
-            extraction_errors.append("ScrapingBee: Not configured")
-        
-        # ATTEMPT 2: Direct fetch with retry
-        logger.info("[Attempt 2/3] Direct fetch with retry...")
-        for attempt in range(2):
-            try:
-                html, error = self._fetch_direct(url, attempt + 1)
-                if html:
-                    logger.info(f"[Direct] ✓ Attempt {attempt + 1} got {len(html)} chars")
-                    result = self._parse_html(html, url)
-                    if result['extraction_successful']:
-                        logger.info("[Direct] ✓ Extraction successful")
-                        return result
-                    else:
-                        extraction_errors.append(f"Direct attempt {attempt + 1} parse failed")
-                else:
-                    extraction_errors.append(f"Direct attempt {attempt + 1} failed: {error}")
-                    logger.warning(f"[Direct] ✗ Attempt {attempt + 1}: {error}")
-                    if attempt == 0:
-                        time.sleep(2)
-            except Exception as e:
-                error_msg = f"Direct attempt {attempt + 1} exception: {str(e)}"
-                extraction_errors.append(error_msg)
-                logger.error(f"[Direct] ✗ Attempt {attempt + 1} exception: {e}", exc_info=True)
+        # ATTEMPTS 1-2: Direct fetch and ScrapingBee, hedged (services/fetch_strategy.py)
+        result = self._hedged_fetch(url, extraction_errors)
+        if result is not None:
+            return result
         
         # ATTEMPT 3: OpenAI fallback (if available)
         if openai_available and url:
@@ -321,6 +334,147 @@ class ArticleExtractor:
         logger.error(f"[ArticleExtractor] ❌ All extraction attempts failed: {combined_errors}")
         return self._get_fallback_result(url, combined_errors)
     
+    def _hedged_fetch(self, url: str, extraction_errors: List[str]) -> Optional[Dict[str, Any]]:
+        """
+        Race the fetch methods; return the first result that parses, or None
+        
+        The learned plan (FetchStrategy.plan) starts one method at once and
+        the next after its hedge delay - or immediately once everything
+        started so far has failed. When one wins, hedges not yet started are
+        never launched and running ones skip their parse; an HTTP request
+        already in flight cannot be interrupted and finishes unread. Probes
+        (plan entries marked as such) run to the end either way and are
+        recorded when they finish.
+        """
+        domain = urlparse(url).netloc.lower().replace('www.', '')
+        
+        racers = {'direct': self._race_direct}
+        if self.scrapingbee_api_key:
+            racers['scrapingbee'] = self._race_scrapingbee
+        else:
+            logger.info("[ScrapingBee] Skipped (not configured)")
+            extraction_errors.append("ScrapingBee: Not configured")
+        
+        profile = self.extraction_profiles.get(domain)
+        plan = self.fetch_strategy.plan(domain, list(racers), self._needs_js_rendering(url),
+                                        preferred=profile.get('fetch_method'))
+        logger.info(f"[Hedge v25.1] Plan for {domain}: "
+                    + ", ".join(f"{method}@{delay:.1f}s" + (" (probe)" if probe else "")
+                                for method, delay, probe in plan))
+        
+        executor = self.fetch_strategy.executor
+        cancel = threading.Event()
+        running: Dict[Any, str] = {}
+        probes = set()
+        launched = []
+        started_at = time.time()
+        
+        def launch(method: str, probe: bool) -> None:
+            # A probe gets its own event, so a win elsewhere never cancels it
+            future = executor.submit(racers[method], url, threading.Event() if probe else cancel)
+            running[future] = method
+            if probe:
+                probes.add(future)
+            launched.append(method)
+        
+        def record_probe(method: str, future) -> None:
+            result, error, elapsed = future.result()
+            self.fetch_strategy.record(domain, method, result is not None, elapsed)
+        
+        try:
+            while running or plan:
+                # Start every method that is due - or the next one if nothing is running
+                while plan and (not running or time.time() - started_at >= plan[0][1]):
+                    method, _, probe = plan.pop(0)
+                    if running:
+                        logger.info(f"[Hedge v25.1] {method} hedging after {time.time() - started_at:.1f}s")
+                    launch(method, probe)
+                
+                timeout = max(0.0, started_at + plan[0][1] - time.time()) if plan else None
+                done, _ = wait(list(running), timeout=timeout, return_when=FIRST_COMPLETED)
+                
+                for future in done:
+                    method = running.pop(future)
+                    result, error, elapsed = future.result()
+                    if error == 'cancelled':
+                        continue
+                    self.fetch_strategy.record(domain, method, result is not None, elapsed)
+                    
+                    if result is not None:
+                        logger.info(f"[Hedge v25.1] ✓ {method} won after {time.time() - started_at:.1f}s")
+                        result['fetch_method'] = method
+                        self.extraction_profiles.learn_fetch_method(domain, profile, method)
+                        self.fetch_strategy.count(hedged=len(launched) > 1, winner=method,
+                                                  cancelled=len(running) - len(probes & set(running)) + len(plan))
+                        return result
+                    
+                    extraction_errors.append(error)
+                    logger.warning(f"[Hedge v25.1] ✗ {method}: {error}")
+            
+            self.fetch_strategy.count(hedged=len(launched) > 1, winner=None, cancelled=0)
+            return None
+        finally:
+            # Losers: unstarted ones are dropped, running ones skip their parse;
+            # probes finish and are recorded
+            cancel.set()
+            for future, method in running.items():
+                if future in probes:
+                    future.add_done_callback(lambda done, method=method: record_probe(method, done))
+                else:
+                    executor.abandon(future)
+    
+    def _race_direct(self, url: str, cancel: threading.Event) -> tuple:
+        """Direct fetch + parse for _hedged_fetch: (result or None, error, seconds)"""
+        
+        start = time.time()
+        # Without ScrapingBee there is no hedge - retry once as before
+        attempts = 1 if self.scrapingbee_api_key else 2
+        errors = []
+        
+        for attempt in range(attempts):
+            try:
+                html, error = self._fetch_direct(url, attempt + 1)
+                if cancel.is_set():
+                    return None, 'cancelled', time.time() - start
+                if html:
+                    logger.info(f"[Direct] ✓ Attempt {attempt + 1} got {len(html)} chars")
+                    result = self._parse_html(html, url)
+                    if result['extraction_successful']:
+                        logger.info("[Direct] ✓ Extraction successful")
+                        return result, None, time.time() - start
+                    errors.append(f"Direct attempt {attempt + 1} parse failed")
+                else:
+                    errors.append(f"Direct attempt {attempt + 1} failed: {error}")
+                    logger.warning(f"[Direct] ✗ Attempt {attempt + 1}: {error}")
+                    if attempt + 1 < attempts and cancel.wait(2):
+                        return None, 'cancelled', time.time() - start
+            except Exception as e:
+                errors.append(f"Direct attempt {attempt + 1} exception: {str(e)}")
+                logger.error(f"[Direct] ✗ Attempt {attempt + 1} exception: {e}", exc_info=True)
+        
+        return None, " | ".join(errors), time.time() - start
+    
+    def _race_scrapingbee(self, url: str, cancel: threading.Event) -> tuple:
+        """ScrapingBee fetch + parse for _hedged_fetch: (result or None, error, seconds)"""
+        
+        start = time.time()
+        try:
+            html, error = self._fetch_with_scrapingbee(url)
+            if cancel.is_set():
+                return None, 'cancelled', time.time() - start
+            if not html:
+                return None, f"ScrapingBee fetch failed: {error}", time.time() - start
+            
+            logger.info(f"[ScrapingBee] ✓ Got {len(html)} chars of HTML")
+            result = self._parse_html(html, url)
+            if result['extraction_successful']:
+                logger.info("[ScrapingBee] ✓ Extraction successful")
+                return result, None, time.time() - start
+            return None, f"ScrapingBee parse failed: {result.get('error', 'Unknown')}", time.time() - start
+        except Exception as e:
+            logger.error(f"[ScrapingBee] ✗ Exception: {e}", exc_info=True)
+            return None, f"ScrapingBee exception: {str(e)}", time.time() - start
+    
     def _fetch_with_scrapingbee(self, url: str) -> tuple:
         """Fetch using ScrapingBee with smart JS rendering"""
         
@@ -346,7 +500,7 @@ class ArticleExtractor:
             
             logger.info(f"[ScrapingBee v25.0] Fetching with render_js={params['render_js']}, YouTube: {is_youtube}")
             
-            response = requests.get(
+            response = get_http_client().get(
                 'https://app.scrapingbee.com/api/v1/',
                 params=params,
                 timeout=45
@@ -436,7 +590,7 @@ Return as JSON with keys: title, author, content, source"""
                     'source': data.get('source', self._get_source_from_url(url)),
                     'domain': urlparse(url).netloc.replace('www.', ''),
                     'url': url,
-                    'word_count': len(data.get('content', '').split()),
+                    'word_count': get_document(data.get('content', '')).word_count,
                     'sources_count': 0,
                     'quotes_count': 0,
                     'extraction_successful': True,
@@ -489,10 +643,11 @@ Return as JSON with keys: title, author, content, source"""
             
             logger.info(f"[Parse v25.0] Parsing {domain}...")
             
-            # Extract components
+            # Extract components - learned per-domain fast paths first
+            profile = self.extraction_profiles.get(domain)
             title = self._extract_title(soup)
-            authors, author_page_urls = self._extract_authors(soup, html, url)
-            text = self._extract_text(soup)
+            authors, author_page_urls = self._extract_authors_profiled(soup, html, url, domain, profile)
+            text = self._extract_text_profiled(soup, domain, profile)
             
             # Build result
             result = {
@@ -505,7 +660,7 @@ Return as JSON with keys: title, author, content, source"""
                 'source': self._get_source_from_url(url),
                 'domain': domain,
                 'url': url,
-                'word_count': len(text.split()) if text else 0,
+                'word_count': get_document(text).word_count,
                 'sources_count': self._count_sources(text),
                 'quotes_count': self._count_quotes(text),
                 'extraction_successful': bool(title and text),
@@ -598,6 +753,90 @@ Return as JSON with keys: title, author, content, source"""
         logger.warning("[Authors v25.0] ⚠ No authors found - returning Unknown")
         return 'Unknown', []
     
+    def _extract_authors_profiled(self, soup: BeautifulSoup, html: str, url: str,
+                                  domain: str, profile: Dict[str, Any]) -> tuple:
+        """
+        NEW v25.2: _extract_authors with the domain's learned probe tried first
+        
+        On a miss (or with nothing learned) the full cascade runs, and the
+        first probe that reproduces its result becomes the domain's recipe.
+        """
+        
+        profiles = self.extraction_profiles
+        probe = profiles.recipe(profile, 'author')
+        if probe:
+            names = self._run_author_probe(soup, probe)
+            if names:
+                profiles.hit(domain, profile, 'author')
+                author_string = ' and '.join(names)
+                logger.info(f"[Authors v25.2] Profile {probe}: {author_string}")
+                author_page_urls = [profile_url for profile_url in
+                                    (self._construct_author_profile_url(name, url) for name in names) if profile_url]
+                return author_string, author_page_urls
+            profiles.miss(domain, profile, 'author')
+        
+        author_string, author_page_urls = self._extract_authors(soup, html, url)
+        
+        if author_string != 'Unknown' and profiles.should_learn(profile, 'author'):
+            recipe = next((candidate for candidate in AUTHOR_PROBES
+                           if ' and '.join(self._run_author_probe(soup, candidate)) == author_string), None)
+            # A recipe that just missed is kept (until miss_limit) unless another replaces it
+            if recipe or not probe:
+                profiles.learn(domain, 'author', recipe)
+        
+        return author_string, author_page_urls
+    
+    def _run_author_probe(self, soup: BeautifulSoup, probe: List[str]) -> List[str]:
+        """NEW v25.2: One AUTHOR_PROBES step on its own; [] when it finds nothing"""
+        
+        kind = probe[0]
+        try:
+            if kind == 'meta':
+                meta = soup.find('meta', attrs={probe[1]: probe[2]})
+                if meta and meta.get('content'):
+                    return self._parse_multiple_authors_from_text(meta['content'].strip())
+            
+            elif kind == 'jsonld':
+                for script in soup.find_all('script', type='application/ld+json'):
+                    try:
+                        data = json.loads(script.string)
+                    except (TypeError, ValueError):
+                        continue
+                    for item in (data if isinstance(data, list) else [data]):
+                        if isinstance(item, dict) and 'author' in item:
+                            names = self._extract_authors_from_jsonld(item)
+                            if names:
+                                return names
+            
+            elif kind in ('rel_author', 'author_link'):
+                if kind == 'rel_author':
+                    links = soup.find_all('a', rel='author')
+                else:
+                    links = soup.find_all('a', href=re.compile(r'/author/', re.I))
+                return [name for name in (link.get_text().strip() for link in links)
+                        if self._is_valid_author_name(name)]
+            
+            elif kind == 'byline_block':
+                for block in soup.find_all(attrs={'data-component': re.compile(r'byline', re.I)}):
+                    elements = block.find_all(['a', 'span', 'div'], string=re.compile(r'^[A-Z][a-z]+\s+[A-Z][a-z]+'))
+                    names = [name for name in (elem.get_text().strip() for elem in elements)
+                             if self._is_valid_author_name(name)]
+                    if names:
+                        return names
+            
+            elif kind == 'class':
+                for elem in soup.find_all(class_=re.compile(probe[1], re.I))[:5]:
+                    text = re.sub(r'^(By|Written by|Story by)\s+', '', elem.get_text().strip(), flags=re.I)
+                    if re.match(r'^[A-Z][a-z]+\s+[A-Z][a-z]+', text):
+                        names = self._parse_multiple_authors_from_text(text)
+                        if names:
+                            return names
+        
+        except Exception as e:
+            logger.error(f"[Authors v25.2] Probe {probe} error: {e}")
+        
+        return []
+    
     def _extract_bbc_authors(self, soup: BeautifulSoup, html: str) -> List[str]:
         """
         BBC-specific author extraction with 8 strategies
@@ -1105,33 +1344,70 @@ Return as JSON with keys: title, author, content, source"""
     
     def _extract_text(self, soup: BeautifulSoup) -> str:
         """Extract main article text"""
+        return self._find_text(soup)[0]
+    
+    def _find_text(self, soup: BeautifulSoup) -> tuple:
+        """
+        Main article text and the container it came from (a body recipe for
+        the domain's profile, or None)
+        """
         
         # Strategy 1: Look for article tag
-        article = soup.find('article')
-        if article:
-            paragraphs = article.find_all('p')
-            if paragraphs:
-                text = '\n\n'.join([p.get_text().strip() for p in paragraphs if len(p.get_text().strip()) > 50])
-                if len(text) > 200:
-                    return text
+        text = self._paragraph_text(soup.find('article'))
+        if text:
+            return text, ['article']
         
         # Strategy 2: Look for main content div
-        main_content = soup.find(['main', 'div'], class_=re.compile(r'content|article|story|body', re.I))
-        if main_content:
-            paragraphs = main_content.find_all('p')
-            if paragraphs:
-                text = '\n\n'.join([p.get_text().strip() for p in paragraphs if len(p.get_text().strip()) > 50])
-                if len(text) > 200:
-                    return text
-        
-        # Strategy 3: Get all paragraphs
-        paragraphs = soup.find_all('p')
-        if paragraphs:
-            text = '\n\n'.join([p.get_text().strip() for p in paragraphs if len(p.get_text().strip()) > 50])
-            if len(text) > 200:
+        pattern = re.compile(r'content|article|story|body', re.I)
+        main_content = soup.find(['main', 'div'], class_=pattern)
+        text = self._paragraph_text(main_content)
+        if text:
+            class_name = next((name for name in main_content.get('class') or [] if pattern.search(name)), None)
+            return text, ['class', main_content.name, class_name] if class_name else None
+        
+        # Strategy 3: Get all paragraphs - matches any page, so not a recipe
+        text = self._paragraph_text(soup)
+        if text:
+            return text, None
+        
+        return '', None
+    
+    def _paragraph_text(self, element) -> str:
+        """Paragraphs over 50 chars under element, if they add up to over 200"""
+        
+        if element is None:
+            return ''
+        paragraphs = element.find_all('p')
+        text = '\n\n'.join([p.get_text().strip() for p in paragraphs if len(p.get_text().strip()) > 50])
+        return text if len(text) > 200 else ''
+    
+    def _extract_text_profiled(self, soup: BeautifulSoup, domain: str, profile: Dict[str, Any]) -> str:
+        """NEW v25.2: _extract_text starting from the domain's learned body container"""
+        
+        profiles = self.extraction_profiles
+        container = profiles.recipe(profile, 'body')
+        if container and container[0] not in ('article', 'class'):
+            container = None  # ['all_p'] from before it stopped being learned - never misses, relearn
+        if container:
+            try:
+                if container[0] == 'article':
+                    element = soup.find('article')
+                else:
+                    element = soup.find(container[1], class_=container[2])
+                text = self._paragraph_text(element)
+            except Exception as e:
+                logger.error(f"[Text v25.2] Container {container} error: {e}")
+                text = ''
+            if text:
+                profiles.hit(domain, profile, 'body')
                 return text
+            profiles.miss(domain, profile, 'body')
         
-        return ''
+        text, found = self._find_text(soup)
+        # As for authors, a container that just missed is kept unless another replaces it
+        if text and (found or not container) and profiles.should_learn(profile, 'body'):
+            profiles.learn(domain, 'body', found)
+        return text
     
     def _construct_author_profile_url(self, author_name: str, article_url: str) -> Optional[str]:
         """Construct probable author profile URL based on site patterns"""
@@ -1351,7 +1627,7 @@ Return as JSON with keys: title, author, content, source"""
             'source': 'Direct Input',
             'domain': 'user_input',
             'url': '',
-            'word_count': len(text.split()),
+            'word_count': get_document(text).word_count,
             'sources_count': self._count_sources(text),
             'quotes_count': self._count_quotes(text),
             'extraction_successful': True,
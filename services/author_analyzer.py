@@ -1,8 +1,12 @@
 """
 Author Analyzer - v6.0 ENHANCED BIOGRAPHY OUTPUT
 Date: December 26, 2024
-Last Updated: December 26, 2024 - RICH BIOGRAPHY FIX
-Version: 6.0 - ENHANCED OUTPUT WITH ALL COLLECTED DATA
+Last Updated: October 16, 2026 - POOLED HTTP CLIENT
+Version: 6.0.1 - ENHANCED OUTPUT WITH ALL COLLECTED DATA
+
+CHANGES IN v6.0.1 (October 16, 2026):
+✅ Author page scrapes and Wikipedia lookups use the shared pooled HTTP
+   client (services/http_client.py) - connections are reused across calls
 
 CRITICAL CHANGES IN v6.0 (December 26, 2024):
 ✅ FIX: Biography now includes ALL collected data (years, articles, expertise)
@@ -37,18 +41,15 @@ import time
 import json
 from typing import Dict, List, Any, Optional, Tuple
 from urllib.parse import quote, urlparse
-import requests
 from bs4 import BeautifulSoup
 
-try:
-    from openai import OpenAI
-    openai_client = OpenAI()
-    OPENAI_AVAILABLE = True
-except (ImportError, Exception):
-    openai_client = None
-    OPENAI_AVAILABLE = False
+# OpenAI (if available) through the shared LLM gateway (services/llm_gateway.py)
+from services.llm_gateway import get_llm_client
+openai_client = get_llm_client('AuthorAnalyzer')
+OPENAI_AVAILABLE = openai_client is not None
 
 from services.base_analyzer import BaseAnalyzer
+from services.http_client import get_http_client
 from config import Config
 
 logger = logging.getLogger(__name__)
@@ -844,7 +845,7 @@ class AuthorAnalyzer(BaseAnalyzer):
                 'Accept': 'text/html,application/xhtml+xml'
             }
             
-            response = requests.get(url, headers=headers, timeout=10)
+            response = get_http_client().get(url, headers=headers, timeout=10)
             
             if response.status_code != 200:
                 return {'found': False}
@@ -1034,7 +1035,7 @@ class AuthorAnalyzer(BaseAnalyzer):
         """Get Wikipedia data"""
         try:
             url = f"https://en.wikipedia.org/api/rest_v1/page/summary/{quote(author_name)}"
-            response = requests.get(url, timeout=5, headers={'User-Agent': 'NewsAnalyzer/1.0'})
+            response = get_http_client().get(url, timeout=5, headers={'User-Agent': 'NewsAnalyzer/1.0'})
             
             if response.status_code == 200:
                 data = response.json()
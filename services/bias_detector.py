@@ -1,7 +1,17 @@
 """
 Bias Detector Service - FIXED NEUTRAL BIAS SCORING
-Date: December 26, 2025
-Version: 6.1.0 - NEUTRAL BIAS SCORING FIX
+Date: October 16, 2026
+Version: 6.2.1 - SHARED DOCUMENT ARTIFACT
+
+CHANGES FROM v6.2.0:
+✅ PERFORMANCE: Word count and lowercased text come from the shared
+   DocumentAnalysis (services/document_analysis.py)
+
+CHANGES FROM v6.1.0:
+✅ PERFORMANCE: Sensationalism and loaded-language lexicons are registered with
+   services/pattern_engine.py once and matched against the shared, pre-lowered
+   article (no per-sentence lowercasing of the first 100 sentences)
+✅ PRESERVED: Identical counts, phrases and contexts
 
 CRITICAL FIX FROM v6.0.0:
 ✅ FIXED: Neutral scores (no bias detected) now properly contribute 50 (neutral) instead of 0
@@ -40,6 +50,8 @@ from collections import Counter
 import statistics
 
 from services.base_analyzer import BaseAnalyzer
+from services.pattern_engine import pattern_engine
+from services.document_analysis import get_document
 
 logger = logging.getLogger(__name__)
 
@@ -73,7 +85,11 @@ class BiasDetector(BaseAnalyzer, AIEnhancementMixin):
         self._initialize_outlet_baselines()
         self._initialize_controversial_figures()
         
-        logger.info(f"BiasDetector v6.1.0 initialized (FIXED NEUTRAL SCORING) with AI enhancement: {self._ai_available}")
+        # v6.2.0: Compile lexicons once in the shared pattern engine
+        pattern_engine.register_literals('bias.sensationalism', self.sensationalism_patterns)
+        pattern_engine.register_literals('bias.loaded', self.loaded_patterns)
+        
+        logger.info(f"BiasDetector v6.2.0 initialized (FIXED NEUTRAL SCORING) with AI enhancement: {self._ai_available}")
     
     def _check_availability(self) -> bool:
         """Service is always available"""
@@ -529,7 +545,7 @@ class BiasDetector(BaseAnalyzer, AIEnhancementMixin):
     def _detect_controversial_figures(self, text: str) -> Dict[str, Any]:
         """Detect mentions of controversial figures"""
         
-        text_lower = text.lower()
+        text_lower = get_document(text).text_lower
         found_figures = []
         total_weight = 0
         
@@ -551,7 +567,7 @@ class BiasDetector(BaseAnalyzer, AIEnhancementMixin):
     def _detect_pseudoscience(self, text: str) -> Dict[str, Any]:
         """Detect pseudoscience indicators"""
         
-        text_lower = text.lower()
+        text_lower = get_document(text).text_lower
         found_indicators = []
         
         for indicator in self.pseudoscience_indicators:
@@ -569,7 +585,7 @@ class BiasDetector(BaseAnalyzer, AIEnhancementMixin):
     def _analyze_political_bias(self, text: str, outlet_baseline: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze political bias with outlet baseline context"""
         try:
-            text_lower = text.lower()
+            text_lower = get_document(text).text_lower
             
             # Start with outlet baseline
             base_bias = outlet_baseline['bias_amount']
@@ -637,18 +653,16 @@ class BiasDetector(BaseAnalyzer, AIEnhancementMixin):
     def _analyze_sensationalism(self, text: str, title: str, outlet_baseline: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze sensationalism with outlet baseline"""
         try:
-            text_lower = text.lower()
             title_lower = title.lower() if title else ''
             
             base_sensationalism = outlet_baseline['sensationalism_baseline']
             
-            sensational_count = sum(1 for pattern in self.sensationalism_patterns 
-                                   if pattern in text_lower)
+            # v6.2.0: Distinct lexicon phrases present (shared pattern engine)
+            sensational_count = len(pattern_engine.scan(text).present('bias.sensationalism'))
             
-            title_sensational = sum(1 for pattern in self.sensationalism_patterns 
-                                   if pattern in title_lower)
+            title_sensational = len(pattern_engine.scan(title_lower).present('bias.sensationalism'))
             
-            word_count = len(text.split())
+            word_count = get_document(text).word_count
             if word_count == 0:
                 return {'score': base_sensationalism, 'level': 'Minimal'}
             
@@ -687,7 +701,7 @@ class BiasDetector(BaseAnalyzer, AIEnhancementMixin):
     def _analyze_corporate_bias(self, text: str) -> Dict[str, Any]:
         """Analyze corporate/business bias"""
         try:
-            text_lower = text.lower()
+            text_lower = get_document(text).text_lower
             
             pro_business = sum(1 for indicator in self.corporate_patterns['pro_business'] 
                               if indicator in text_lower)
@@ -718,20 +732,31 @@ class BiasDetector(BaseAnalyzer, AIEnhancementMixin):
     def _detect_loaded_language(self, text: str) -> Dict[str, Any]:
         """Detect loaded/biased language"""
         try:
-            sentences = re.split(r'[.!?]+', text)
+            # v6.2.0: One scan of the article, matches mapped back to sentences
+            scan = pattern_engine.scan(text)
+            sentences = scan.sentence_spans()
+            pattern_order = {pattern: index for index, pattern in enumerate(self.loaded_patterns)}
+            
+            # First lexicon phrase (in lexicon order) found in each of the first 100 sentences
+            sentence_phrase = {}
+            for match in scan.matches('bias.loaded'):
+                index = scan.sentence_index(match.start)
+                if index >= 100 or match.end > sentences[index][1]:
+                    continue
+                current = sentence_phrase.get(index)
+                if current is None or pattern_order[match.pattern] < pattern_order[current]:
+                    sentence_phrase[index] = match.pattern
             
             loaded_phrases = []
-            for sentence in sentences[:100]:
-                sentence_lower = sentence.lower()
-                for pattern in self.loaded_patterns:
-                    if pattern in sentence_lower:
-                        context = sentence.strip()
-                        if len(context) > 10:
-                            loaded_phrases.append({
-                                'phrase': pattern,
-                                'context': context[:200],
-                                'sentence': context
-                            })
+            for index in sorted(sentence_phrase):
+                start, end = sentences[index]
+                context = scan.source[start:end].strip()
+                if len(context) > 10:
+                    loaded_phrases.append({
+                        'phrase': sentence_phrase[index],
+                        'context': context[:200],
+                        'sentence': context
+                    })
             
             # Remove duplicates
             unique_phrases = []
@@ -754,7 +779,7 @@ class BiasDetector(BaseAnalyzer, AIEnhancementMixin):
         """Analyze how the article frames issues"""
         try:
             framing_issues = []
-            text_lower = text.lower()
+            text_lower = get_document(text).text_lower
             
             if 'however' not in text_lower and 'but' not in text_lower and len(text) > 500:
                 framing_issues.append("Limited counterarguments presented")
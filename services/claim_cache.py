@@ -0,0 +1,403 @@
+"""
+Claim Verification Cache
+Date: October 16, 2026
+Version: 1.0.0
+
+One verification cache shared by FactChecker, EnhancedFactChecker and
+MultiAIService.
+
+Identical claims show up in articles, transcripts and debates, and each used
+to be re-verified by paid LLMs in every worker process. FactChecker had its
+own 24h dict, EnhancedFactChecker only cached FRED values and MultiAIService
+cached nothing - all of it lost whenever gunicorn recycled a worker
+(max_requests=1000).
+
+Key: sha256 of
+    verifier | normalize_key_text(claim) | sorted provider subset | date context
+
+normalize_key_text is normalize_claim_text that keeps the punctuation
+inside numbers: "3.5%" and "35%" are different claims. Callers whose prompt
+carries free-text context build the date context with claim_context_key():
+the evaluation date (today by default) plus a hash of that context, so a
+verdict made for one date or article is not served for another.
+
+Backends (both survive worker restarts and are shared between workers):
+  - RedisClaimCacheBackend:  used when REDIS_URL is configured (multi-instance)
+  - SQLiteClaimCacheBackend: single file on local disk, WAL mode, bounded by
+                             CLAIM_CACHE_MAX_ENTRIES (least recently used
+                             rows are pruned)
+
+Hit / miss / store counters and the number of provider calls saved are kept
+in the backend itself, so /health reports totals across all workers. The
+SQLite backend batches counter updates and refreshes a row's last_used at
+most once per TOUCH_INTERVAL, so a hit is one SELECT, not three commits.
+
+Configuration (Config.CACHE / environment):
+  CLAIM_CACHE_BACKEND      auto | sqlite | redis | none (default: auto)
+  CLAIM_CACHE_TTL          seconds (default: 86400)
+  CLAIM_CACHE_MAX_ENTRIES  row cap for SQLite (default: 20000)
+  CLAIM_CACHE_PATH         SQLite file (default: <tmp>/truthlens_claim_cache.sqlite3)
+"""
+
+import os
+import re
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import tempfile
+import threading
+from datetime import datetime
+from typing import Dict, Any, Optional, List
+
+logger = logging.getLogger(__name__)
+
+URL_PATTERN = re.compile(r'http\S+|www\.\S+')
+# Punctuation, except a separator between two digits (3.5, 1,000, 9:30)
+NON_NUMERIC_PUNCTUATION = re.compile(r'(?<!\d)[^\w\s]|[^\w\s](?!\d)')
+
+
+def normalize_key_text(text: str) -> str:
+    """Lowercase, no URLs or extra whitespace, punctuation dropped except inside numbers"""
+    text = URL_PATTERN.sub('', (text or '').lower())
+    text = re.sub(r'\s+', ' ', text)
+    return NON_NUMERIC_PUNCTUATION.sub('', text).strip()
+
+
+# Words that never change what a claim asserts: articles and verbal filler.
+# Negations, direction words, verbs, tense and modals all stay.
+CLAIM_FILLER_WORDS = frozenset("""
+a an the
+um uh er ah okay ok
+actually really very basically literally honestly frankly truly totally absolutely
+""".split())
+
+
+def claim_signature(text: str) -> tuple:
+    """
+    The claim's words in order, minus CLAIM_FILLER_WORDS (numbers as written)
+
+    Two claims with the same signature assert the same thing:
+
+    >>> claim_signature("The unemployment rate actually rose to 3.5%.") == claim_signature("the unemployment rate rose to 3.5%")
+    True
+    >>> claim_signature("Under my plan unemployment rose") == claim_signature("Under my plan unemployment never rose")
+    False
+    >>> claim_signature("Wages increased last year") == claim_signature("Wages decreased last year")
+    False
+    >>> claim_signature("We have created jobs") == claim_signature("We have not created jobs")
+    False
+    >>> claim_signature("inflation was 3.5%") == claim_signature("inflation was 35%")
+    False
+    """
+    return tuple(word for word in normalize_key_text(text).split() if word not in CLAIM_FILLER_WORDS)
+
+
+def claim_context_key(date: Optional[str] = None, context: Optional[str] = None) -> str:
+    """date_context for make_claim_key: evaluation date (default today) | hash of the prompt context"""
+    date = date or datetime.now().strftime('%Y-%m-%d')
+    digest = hashlib.sha256(context.encode('utf-8')).hexdigest()[:16] if context else ''
+    return f"{date}|{digest}"
+
+
+def make_claim_key(verifier: str, claim: str, providers: Optional[List[str]] = None,
+                   date_context: Optional[str] = None) -> str:
+    """
+    Build the cache key for a claim verification
+
+    Args:
+        verifier: Which verifier produced the result ('multi_ai', 'enhanced', ...)
+        claim: Raw claim text (normalized with normalize_key_text)
+        providers: AI providers the verdict was (or would be) built from
+        date_context: Date the claim is evaluated against (transcript_date etc.)
+    """
+    parts = [
+        verifier,
+        normalize_key_text(claim),
+        ','.join(sorted(providers or [])),
+        date_context or ''
+    ]
+    return hashlib.sha256('|'.join(parts).encode('utf-8')).hexdigest()
+
+
+class SQLiteClaimCacheBackend:
+    """
+    SQLite file shared by all workers on this host
+
+    Connections are opened lazily per process (gunicorn preloads the app and
+    forks, and a SQLite connection must never cross a fork).
+    """
+
+    name = 'sqlite'
+    PRUNE_EVERY = 200  # stores between size checks
+    TOUCH_INTERVAL = 300  # seconds between last_used refreshes of one row
+    STATS_FLUSH_EVERY = 50  # counter increments buffered per process
+    STATS_FLUSH_SECONDS = 10
+
+    def __init__(self, path: str, max_entries: int):
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = None
+        self._conn_pid = None
+        self._stores_since_prune = 0
+        self._pending_stats: Dict[str, int] = {}
+        self._pending_count = 0
+        self._stats_flushed_at = time.time()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None or self._conn_pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS claim_cache ('
+                ' key TEXT PRIMARY KEY,'
+                ' value TEXT NOT NULL,'
+                ' expires_at REAL NOT NULL,'
+                ' last_used REAL NOT NULL)'
+            )
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_claim_cache_last_used ON claim_cache(last_used)')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS claim_cache_stats ('
+                ' name TEXT PRIMARY KEY,'
+                ' value INTEGER NOT NULL)'
+            )
+            conn.commit()
+            if self._conn_pid is not None:
+                self._pending_stats, self._pending_count = {}, 0  # the parent's, not ours
+            self._conn = conn
+            self._conn_pid = os.getpid()
+        return self._conn
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                'SELECT value, expires_at, last_used FROM claim_cache WHERE key = ?', (key,)
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            value, expires_at, last_used = row
+            if expires_at < now:
+                conn.execute('DELETE FROM claim_cache WHERE key = ?', (key,))
+                conn.commit()
+                return None
+
+            # LRU order only needs to be roughly right for pruning
+            if now - last_used >= self.TOUCH_INTERVAL:
+                conn.execute('UPDATE claim_cache SET last_used = ? WHERE key = ?', (now, key))
+                conn.commit()
+            return value
+
+    def set(self, key: str, value: str, ttl: int) -> None:
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                'INSERT OR REPLACE INTO claim_cache (key, value, expires_at, last_used) VALUES (?, ?, ?, ?)',
+                (key, value, now + ttl, now)
+            )
+            conn.commit()
+
+            self._stores_since_prune += 1
+            if self._stores_since_prune >= self.PRUNE_EVERY:
+                self._stores_since_prune = 0
+                self._prune(conn, now)
+
+    def _prune(self, conn: sqlite3.Connection, now: float) -> None:
+        conn.execute('DELETE FROM claim_cache WHERE expires_at < ?', (now,))
+        count = conn.execute('SELECT COUNT(*) FROM claim_cache').fetchone()[0]
+        overflow = count - self.max_entries
+        if overflow > 0:
+            conn.execute(
+                'DELETE FROM claim_cache WHERE key IN '
+                '(SELECT key FROM claim_cache ORDER BY last_used ASC LIMIT ?)',
+                (overflow,)
+            )
+        conn.commit()
+
+    def incr_stat(self, name: str, amount: int = 1) -> None:
+        """Buffered - written every STATS_FLUSH_EVERY increments or STATS_FLUSH_SECONDS"""
+        with self._lock:
+            self._pending_stats[name] = self._pending_stats.get(name, 0) + amount
+            self._pending_count += 1
+            if (self._pending_count >= self.STATS_FLUSH_EVERY
+                    or time.time() - self._stats_flushed_at >= self.STATS_FLUSH_SECONDS):
+                self._flush_stats(self._connection())
+
+    def _flush_stats(self, conn: sqlite3.Connection) -> None:
+        # Caller holds self._lock
+        if self._pending_stats:
+            conn.executemany(
+                'INSERT INTO claim_cache_stats (name, value) VALUES (?, ?) '
+                'ON CONFLICT(name) DO UPDATE SET value = value + excluded.value',
+                list(self._pending_stats.items())
+            )
+            conn.commit()
+        self._pending_stats = {}
+        self._pending_count = 0
+        self._stats_flushed_at = time.time()
+
+    def read_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            conn = self._connection()
+            self._flush_stats(conn)
+            stats = dict(conn.execute('SELECT name, value FROM claim_cache_stats').fetchall())
+            stats['entries'] = conn.execute('SELECT COUNT(*) FROM claim_cache').fetchone()[0]
+        stats['max_entries'] = self.max_entries
+        stats['path'] = self.path
+        return stats
+
+
+class RedisClaimCacheBackend:
+    """Redis-backed claim cache shared across workers and instances"""
+
+    name = 'redis'
+    KEY_PREFIX = 'claim_cache:'
+    STATS_KEY = 'claim_cache_stats'
+
+    def __init__(self, client: Any):
+        self.client = client
+
+    def get(self, key: str) -> Optional[str]:
+        return self.client.get(self.KEY_PREFIX + key)
+
+    def set(self, key: str, value: str, ttl: int) -> None:
+        self.client.setex(self.KEY_PREFIX + key, ttl, value)
+
+    def incr_stat(self, name: str, amount: int = 1) -> None:
+        self.client.hincrby(self.STATS_KEY, name, amount)
+
+    def read_stats(self) -> Dict[str, Any]:
+        return {name: int(value) for name, value in self.client.hgetall(self.STATS_KEY).items()}
+
+
+class ClaimVerificationCache:
+    """
+    Shared claim verification cache
+
+    Never raises - a broken backend only costs the cache, not the fact-check.
+    """
+
+    def __init__(self, backend: Optional[Any], ttl: int):
+        self.backend = backend
+        self.ttl = ttl
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None
+
+    def get(self, verifier: str, claim: str, providers: Optional[List[str]] = None,
+            date_context: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached verdict
+
+        A hit also credits 'saved_provider_calls' with len(providers).
+        """
+        if not self.enabled:
+            return None
+
+        try:
+            key = make_claim_key(verifier, claim, providers, date_context)
+            payload = self.backend.get(key)
+
+            if payload is None:
+                self.backend.incr_stat('misses')
+                return None
+
+            self.backend.incr_stat('hits')
+            if providers:
+                self.backend.incr_stat('saved_provider_calls', len(providers))
+            return json.loads(payload)
+        except Exception as e:
+            logger.warning(f"[ClaimCache] Lookup failed ({self.backend.name}): {e}")
+            return None
+
+    def set(self, verifier: str, claim: str, result: Dict[str, Any],
+            providers: Optional[List[str]] = None, date_context: Optional[str] = None,
+            ttl: Optional[int] = None) -> None:
+        """Store a verdict"""
+        if not self.enabled:
+            return
+
+        try:
+            key = make_claim_key(verifier, claim, providers, date_context)
+            self.backend.set(key, json.dumps(result, default=str), ttl or self.ttl)
+            self.backend.incr_stat('stores')
+        except Exception as e:
+            logger.warning(f"[ClaimCache] Store failed ({self.backend.name}): {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for /health (totals across every worker sharing the backend)"""
+        if not self.enabled:
+            return {'backend': 'disabled'}
+
+        try:
+            stats = self.backend.read_stats()
+        except Exception as e:
+            return {'backend': self.backend.name, 'error': str(e)}
+
+        for counter in ('hits', 'misses', 'stores', 'saved_provider_calls'):
+            stats.setdefault(counter, 0)
+
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = round(stats['hits'] / lookups, 3) if lookups else 0.0
+        stats['backend'] = self.backend.name
+        stats['ttl_seconds'] = self.ttl
+        return stats
+
+
+_cache_lock = threading.Lock()
+_claim_cache: Optional[ClaimVerificationCache] = None
+
+
+def get_claim_cache() -> ClaimVerificationCache:
+    """Get the process-wide claim verification cache (built from Config.CACHE)"""
+    global _claim_cache
+
+    if _claim_cache is not None:
+        return _claim_cache
+
+    with _cache_lock:
+        if _claim_cache is not None:
+            return _claim_cache
+
+        from config import Config
+
+        cache_config = Config.CACHE
+        backend_name = cache_config.get('claim_backend', 'auto')
+        ttl = cache_config.get('claim_ttl', 86400)
+
+        backend = None
+        if cache_config.get('enabled', True) and backend_name != 'none':
+            if backend_name in ('auto', 'redis'):
+                from services.redis_client import get_redis_client
+                client = get_redis_client()
+                if client:
+                    backend = RedisClaimCacheBackend(client)
+                elif backend_name == 'redis':
+                    logger.warning("[ClaimCache] Redis requested but unavailable - using SQLite backend")
+
+            if backend is None:
+                path = cache_config.get('claim_cache_path') or os.path.join(
+                    tempfile.gettempdir(), 'truthlens_claim_cache.sqlite3'
+                )
+                try:
+                    backend = SQLiteClaimCacheBackend(path, cache_config.get('claim_max_entries', 20000))
+                    backend.read_stats()  # Fail fast if the file is unusable
+                except Exception as e:
+                    logger.error(f"[ClaimCache] SQLite backend unavailable ({path}): {e}")
+                    backend = None
+
+        _claim_cache = ClaimVerificationCache(backend, ttl)
+        logger.info(f"[ClaimCache] Initialized - backend: {backend.name if backend else 'disabled'}, TTL: {ttl}s")
+
+        return _claim_cache
+
+
+# This file is not truncated
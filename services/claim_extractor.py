@@ -9,6 +9,7 @@ import logging
 from typing import Dict, List, Any
 from services.base_analyzer import BaseAnalyzer
 from services.ai_enhancement_mixin import AIEnhancementMixin
+from services.document_analysis import get_document
 
 logger = logging.getLogger(__name__)
 
@@ -323,11 +324,8 @@ class ClaimExtractor(BaseAnalyzer, AIEnhancementMixin):
         return claims
     
     def _split_into_sentences(self, text):
-        """Split text into sentences"""
-        # Simple sentence splitter
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if s.strip() and len(s.strip()) > 20]
-        return sentences
+        """Split text into sentences (shared DocumentAnalysis split)"""
+        return [s for s in get_document(text).sentences if len(s) > 20]
     
     def _clean_claim_text(self, text):
         """Clean and format claim text"""
@@ -1,6 +1,6 @@
 """
 File: services/claims.py
-Last Updated: October 14, 2025
+Last Updated: October 16, 2026
 Description: Balanced Claims Extraction Service - extracts factual claims from transcripts
 Changes:
 - Created as new file for news repository from transcript repository
@@ -8,6 +8,7 @@ Changes:
 - Supports both AI-powered and pattern-based extraction
 - Comprehensive filtering for non-claims (greetings, pleasantries, opinions)
 - Identifies speakers and topics
+- Sentence split comes from the shared DocumentAnalysis (services/document_analysis.py)
 """
 
 import re
@@ -15,6 +16,8 @@ import logging
 from typing import List, Dict, Optional, Set
 import json
 
+from services.document_analysis import get_document
+
 logger = logging.getLogger(__name__)
 
 
@@ -31,8 +34,8 @@ class ClaimExtractor:
         
         if openai_api_key:
             try:
-                from openai import OpenAI
-                self.openai_client = OpenAI(api_key=openai_api_key)
+                from services.llm_gateway import get_llm_client
+                self.openai_client = get_llm_client('ClaimExtractor', api_key=openai_api_key)
                 logger.info("OpenAI client initialized for claims extraction")
             except Exception as e:
                 logger.error(f"Failed to initialize OpenAI: {e}")
@@ -391,14 +394,8 @@ Transcript:
         return True
     
     def _split_into_sentences(self, text: str) -> List[str]:
-        """Split text into sentences"""
-        # Split on sentence terminators
-        sentences = re.split(r'[.!?]+', text)
-        
-        # Clean and filter
-        sentences = [s.strip() for s in sentences if s.strip()]
-        
-        return sentences
+        """Split text into sentences (shared DocumentAnalysis split)"""
+        return list(get_document(text).sentences)
     
     def _extract_topics(self, text: str) -> List[str]:
         """Extract main topics from text"""
@@ -12,7 +12,7 @@ Changes:
 
 import re
 import logging
-import requests
+from services.http_client import get_http_client
 from typing import Dict, List, Optional
 from datetime import datetime
 
@@ -116,8 +116,8 @@ class ComprehensiveFactChecker:
         self.openai_client = None
         if self.openai_api_key:
             try:
-                from openai import OpenAI
-                self.openai_client = OpenAI(api_key=self.openai_api_key)
+                from services.llm_gateway import get_llm_client
+                self.openai_client = get_llm_client('ComprehensiveFactChecker', api_key=self.openai_api_key)
                 logger.info("OpenAI client initialized for fact-checking")
             except Exception as e:
                 logger.error(f"Failed to initialize OpenAI: {e}")
@@ -370,7 +370,7 @@ class ComprehensiveFactChecker:
                 'languageCode': 'en'
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            response = get_http_client().get(url, params=params, timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
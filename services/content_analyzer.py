@@ -1,7 +1,18 @@
 """
 TruthLens Content Quality Analyzer - NO GRAMMAR ANALYSIS
-Version: 6.0
-Date: December 30, 2025
+Version: 6.0.2
+Date: October 16, 2026
+
+PERFORMANCE IN v6.0.2:
+- ✅ Sentences, words, paragraphs and syllables come from the shared
+  DocumentAnalysis (services/document_analysis.py) instead of being
+  re-split by each metric
+- ✅ _count_syllables uses the shared (memoized) counter - same results
+
+PERFORMANCE IN v6.0.1:
+- ✅ Professionalism lexicons (citation phrases, statistics, quotes, source
+  verbs) compiled once in services/pattern_engine.py and matched against
+  the shared article scan - no per-call text.lower() or re.findall(..., re.I)
 
 CRITICAL CHANGE IN v6.0 (December 30, 2025):
 ❌ GRAMMAR ANALYSIS COMPLETELY REMOVED
@@ -45,6 +56,8 @@ import logging
 from typing import Dict, Any, List, Optional
 import time
 from services.base_service import BaseService
+from services.pattern_engine import pattern_engine
+from services.document_analysis import document_for, get_document, count_syllables_simple
 
 logger = logging.getLogger(__name__)
 
@@ -96,6 +109,7 @@ class ContentAnalyzer(BaseService):
             
             title = data.get('title', '')
             full_text = f"{title}\n\n{text}" if title else text
+            document = document_for(data, text)
             
             logger.info(f"[ContentAnalyzer v6.0 NO GRAMMAR] Analyzing {len(full_text)} characters")
             
@@ -125,7 +139,7 @@ class ContentAnalyzer(BaseService):
             
             # Generate comprehensive analysis WITHOUT GRAMMAR
             analysis = self._generate_comprehensive_analysis(
-                content_metrics, overall_score, len(text.split()), text
+                content_metrics, overall_score, document.word_count, text
             )
             
             # Generate conversational summary WITHOUT GRAMMAR
@@ -183,9 +197,9 @@ class ContentAnalyzer(BaseService):
                     'coherence_score': coherence.get('score', 0),
                     
                     # Basic counts
-                    'word_count': len(text.split()),
-                    'sentence_count': len(re.findall(r'[.!?]+', text)),
-                    'paragraph_count': len([p for p in text.split('\n\n') if p.strip()])
+                    'word_count': document.word_count,
+                    'sentence_count': document.sentence_terminator_count,
+                    'paragraph_count': len(document.paragraphs)
                 },
                 'metadata': {
                     'analysis_time': time.time() - start_time,
@@ -246,11 +260,11 @@ class ContentAnalyzer(BaseService):
     def _analyze_readability_detailed(self, text: str) -> Dict[str, Any]:
         """Analyze readability with specific grade level"""
         
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if s.strip()]
+        document = get_document(text)
+        sentences = document.sentences
         
-        words = text.split()
-        syllables = sum(self._count_syllables(word) for word in words)
+        words = document.words
+        syllables = document.total_syllables('simple')
         
         if not sentences or not words:
             return {'score': 0, 'grade_level': 'Unknown', 'issues': ['Text too short to analyze']}
@@ -308,13 +322,15 @@ class ContentAnalyzer(BaseService):
     def _analyze_structure_detailed(self, text: str) -> Dict[str, Any]:
         """Analyze document structure and organization"""
         
-        paragraphs = [p.strip() for p in text.split('\n\n') if p.strip()]
+        document = get_document(text)
+        paragraphs = document.paragraphs
+        text_lower = document.text_lower
         
         transition_count = sum(1 for word in self.transition_words 
-                             if word in text.lower())
+                             if word in text_lower)
         
         structure_words = sum(1 for word in self.structure_elements 
-                            if word in text.lower())
+                            if word in text_lower)
         
         issues = []
         strengths = []
@@ -345,7 +361,7 @@ class ContentAnalyzer(BaseService):
     def _analyze_vocabulary_detailed(self, text: str) -> Dict[str, Any]:
         """Analyze vocabulary diversity and complexity"""
         
-        words = re.findall(r'\b[a-zA-Z]+\b', text.lower())
+        words = get_document(text).alpha_words
         unique_words = set(words)
         
         diversity_ratio = len(unique_words) / len(words) if words else 0
@@ -393,14 +409,15 @@ class ContentAnalyzer(BaseService):
     def _analyze_professionalism_detailed(self, text: str) -> Dict[str, Any]:
         """Analyze professional writing elements"""
         
-        citation_count = sum(text.lower().count(indicator) for indicator in self.professional_indicators)
+        scan = pattern_engine.scan(text)
         
-        stats_patterns = [r'\d+%', r'\d+\.\d+%', r'\$\d+', r'\d+ percent']
-        statistics_count = sum(len(re.findall(pattern, text)) for pattern in stats_patterns)
+        citation_count = sum(scan.phrase_counts('content.professional').values())
         
-        quote_count = len(re.findall(r'"[^"]{20,}"', text))
+        statistics_count = scan.count('content.statistics')
         
-        source_count = len(re.findall(r'according to|said|reported|stated', text, re.I))
+        quote_count = scan.count('content.quotes')
+        
+        source_count = scan.count('content.sources')
         
         issues = []
         strengths = []
@@ -435,9 +452,10 @@ class ContentAnalyzer(BaseService):
     def _analyze_coherence_detailed(self, text: str) -> Dict[str, Any]:
         """Analyze logical flow and coherence"""
         
-        connector_count = sum(1 for word in self.transition_words if word in text.lower())
+        document = get_document(text)
+        connector_count = sum(1 for word in self.transition_words if word in document.text_lower)
         
-        paragraphs = [p.strip() for p in text.split('\n\n') if p.strip()]
+        paragraphs = document.paragraphs
         
         if len(paragraphs) > 1:
             avg_para_length = sum(len(p.split()) for p in paragraphs) / len(paragraphs)
@@ -1036,24 +1054,17 @@ class ContentAnalyzer(BaseService):
         ]
         
         # ❌ REMOVED: grammar_issue_patterns
+        
+        # ✅ v6.0.1: Professionalism lexicons, compiled once in the shared pattern engine
+        pattern_engine.register_literals('content.professional', self.professional_indicators)
+        pattern_engine.register_regex('content.statistics',
+                                      [r'\d+%', r'\d+\.\d+%', r'\$\d+', r'\d+ percent'], lowercase=False)
+        pattern_engine.register_regex('content.quotes', [r'"[^"]{20,}"'], lowercase=False)
+        pattern_engine.register_regex('content.sources', [r'according to|said|reported|stated'])
     
     def _count_syllables(self, word: str) -> int:
-        """Simple syllable counter"""
-        word = word.lower()
-        vowels = 'aeiouy'
-        syllable_count = 0
-        previous_was_vowel = False
-        
-        for char in word:
-            is_vowel = char in vowels
-            if is_vowel and not previous_was_vowel:
-                syllable_count += 1
-            previous_was_vowel = is_vowel
-        
-        if word.endswith('e'):
-            syllable_count -= 1
-        
-        return max(1, syllable_count)
+        """Simple syllable counter (shared, memoized - services/document_analysis.py)"""
+        return count_syllables_simple(word)
     
     def _interpret_grade_level(self, grade_level: str) -> str:
         """Interpret what grade level means"""
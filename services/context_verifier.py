@@ -59,12 +59,9 @@ import json
 
 logger = logging.getLogger(__name__)
 
-# Try to import AI clients
-try:
-    from openai import OpenAI
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
+# OpenAI calls go through the shared LLM gateway (services/llm_gateway.py)
+from services.llm_gateway import get_llm_client, OPENAI_AVAILABLE
+if not OPENAI_AVAILABLE:
     logger.warning("OpenAI not available for context verification")
 
 
@@ -104,7 +101,7 @@ class ContextVerifier:
             api_key = os.getenv('OPENAI_API_KEY')
             if api_key:
                 try:
-                    self.openai_client = OpenAI(api_key=api_key)
+                    self.openai_client = get_llm_client('ContextVerifier', api_key=api_key)
                     logger.info("[ContextVerifier] ✓ OpenAI initialized")
                 except Exception as e:
                     logger.error(f"[ContextVerifier] OpenAI init failed: {e}")
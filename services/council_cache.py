@@ -0,0 +1,260 @@
+"""
+AI Council Question Cache
+Date: October 16, 2026
+Version: 1.1.0
+
+Answers repeated AI Council questions from recent queries instead of fanning
+out to every paid provider again.
+
+Questions repeat heavily with different filler ("Is nuclear energy safe?",
+"is nuclear energy safe", "Is nuclear energy actually safe?"). Each worker
+keeps an index of the AIQuery rows asked within the freshness window:
+  - Exact match: normalize_key_text(question) (lowercase, punctuation
+    dropped except inside numbers, collapsed whitespace) -> dict lookup
+  - Same question: identical words in the same order once articles and
+    filler ("actually", "really", "please") are dropped, and identical
+    numbers read from the raw text -> dict lookup. Every other word counts -
+    names ("Texas" vs "Florida"), direction ("increase" vs "decrease"),
+    negation ("safe" vs "not safe"), question words ("when" vs "where"),
+    tense and modality ("did" vs "will", "does" vs "can") and numbers
+    ("3.5%" vs "35%") all make it a different question
+
+The index reloads from the database every refresh_seconds, so questions
+answered by other workers are found after at most that long; the worker
+that answered a question adds it at once.
+
+Concurrent identical questions are coalesced across workers by
+ai_council_routes with RedisFlight (services/single_flight.py), keyed on
+key().
+
+CHANGES IN 1.1.0:
+- Near-duplicates must have the same content words - Jaccard similarity
+  >= 0.75 matched different questions ("governor of Texas" vs "governor of
+  Florida", "increase" vs "decrease"); AI_COUNCIL_CACHE_SIMILARITY is gone
+- Normalization keeps decimal points ("3.5%" and "35%" used to be equal)
+- Only articles and filler are ignored - question words, auxiliaries and
+  modals used to be stopwords, so "When was Tesla founded?" matched
+  "Where was Tesla founded?"
+
+Configuration (Config.AI_COUNCIL / environment):
+  AI_COUNCIL_CACHE_SECONDS     freshness window, 0 disables (default: 21600)
+  AI_COUNCIL_CACHE_CANDIDATES  recent questions indexed (default: 1000)
+  AI_COUNCIL_CACHE_REFRESH     index reload interval in seconds (default: 30)
+
+USAGE:
+    from services.council_cache import get_council_cache
+
+    cache = get_council_cache(load_recent)   # load_recent(since, limit) -> [(id, question, created_at), ...]
+    query_id = cache.lookup(question)        # None on a miss
+    cache.add(query_id, question)            # after saving a new query
+"""
+
+import re
+import time
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional, Callable, Tuple
+
+from services.claim_cache import normalize_key_text
+
+logger = logging.getLogger(__name__)
+
+# Words that do not change what is being asked: articles and filler only.
+# Question words, auxiliaries, modals, negations and quantifiers all count.
+STOPWORDS = frozenset("""
+a an the
+actually really truly honestly please
+""".split())
+
+# Numbers as written, decimals and thousands separators included
+NUMBER_PATTERN = re.compile(r'\d+(?:[.,]\d+)*')
+
+
+def normalize_question(question: str) -> str:
+    """Claim-cache key normalization - decimals survive ("3.5" stays "3.5")"""
+    return normalize_key_text(question or '')
+
+
+def question_signature(question: str) -> Optional[Tuple[Tuple[str, ...], Tuple[str, ...]]]:
+    """
+    (content words in order, numbers from the raw text), or None for an empty question
+
+    >>> question_signature("Is nuclear energy actually safe?") == question_signature("is nuclear energy safe")
+    True
+    >>> question_signature("When was Tesla founded?") == question_signature("Where was Tesla founded?")
+    False
+    >>> question_signature("Did the Fed raise rates in 2023?") == question_signature("Will the Fed raise rates in 2023?")
+    False
+    >>> question_signature("Does coffee cause cancer?") == question_signature("Can coffee cause cancer?")
+    False
+    """
+    content = tuple(word for word in normalize_question(question).split() if word not in STOPWORDS)
+    if not content:
+        return None
+    return content, tuple(NUMBER_PATTERN.findall(question or ''))
+
+
+class QuestionIndex:
+    """Recent questions by normalized text and by signature"""
+
+    def __init__(self, rows: List[Tuple[int, str, datetime]]):
+        self.loaded_at = time.time()
+        self.exact: Dict[str, Tuple[int, datetime]] = {}
+        self.by_signature: Dict[Tuple[Tuple[str, ...], Tuple[str, ...]], Tuple[int, datetime]] = {}
+        for query_id, question, created_at in rows:
+            self.add(query_id, question, created_at)
+
+    def add(self, query_id: int, question: str, created_at: datetime) -> None:
+        normalized = normalize_question(question)
+        if not normalized:
+            return
+        self._keep_newest(self.exact, normalized, query_id, created_at)
+        signature = question_signature(question)
+        if signature is not None:
+            self._keep_newest(self.by_signature, signature, query_id, created_at)
+
+    def match(self, question: str, since: datetime) -> Optional[Tuple[int, str]]:
+        """(query_id, 'exact' | 'similar') of a fresh answer, or None"""
+        normalized = normalize_question(question)
+        if not normalized:
+            return None
+
+        exact = self.exact.get(normalized)
+        if exact is not None and exact[1] >= since:
+            return exact[0], 'exact'
+
+        signature = question_signature(question)
+        same = self.by_signature.get(signature) if signature is not None else None
+        if same is not None and same[1] >= since:
+            return same[0], 'similar'
+        return None
+
+    @staticmethod
+    def _keep_newest(index: Dict, key: Any, query_id: int, created_at: datetime) -> None:
+        current = index.get(key)
+        if current is None or created_at > current[1]:
+            index[key] = (query_id, created_at)
+
+
+class CouncilQuestionCache:
+    """Fresh-answer lookup over recent AIQuery rows"""
+
+    def __init__(self, load_recent: Callable[[datetime, int], List[Tuple[int, str, datetime]]],
+                 freshness_seconds: float = 21600,
+                 max_candidates: int = 1000, refresh_seconds: float = 30):
+        self.load_recent = load_recent
+        self.freshness_seconds = freshness_seconds
+        self.max_candidates = max_candidates
+        self.refresh_seconds = refresh_seconds
+        self._lock = threading.Lock()
+        self._index: Optional[QuestionIndex] = None
+        self._stats = {'exact_hits': 0, 'similar_hits': 0, 'misses': 0, 'reloads': 0, 'errors': 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.freshness_seconds > 0
+
+    @staticmethod
+    def key(question: str) -> str:
+        """Coalescing key - identical after normalization"""
+        return normalize_question(question)
+
+    def lookup(self, question: str) -> Optional[Tuple[int, str]]:
+        """(query_id, 'exact' | 'similar') of a fresh answer to this question, or None"""
+        if not self.enabled:
+            return None
+
+        try:
+            match = self._current_index().match(question, self._since())
+        except Exception as e:
+            self._count('errors')
+            logger.warning(f"[CouncilCache] ⚠ Lookup failed: {e}")
+            return None
+
+        if match is None:
+            self._count('misses')
+        else:
+            self._count('exact_hits' if match[1] == 'exact' else 'similar_hits')
+        return match
+
+    def add(self, query_id: int, question: str, created_at: Optional[datetime] = None) -> None:
+        """Make a just-saved query available to this worker immediately"""
+        if not self.enabled:
+            return
+        with self._lock:
+            index = self._index
+        if index is not None:
+            try:
+                index.add(query_id, question, created_at or datetime.utcnow())
+            except Exception as e:
+                logger.warning(f"[CouncilCache] ⚠ Could not index query {query_id}: {e}")
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._index = None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats['indexed'] = len(self._index.exact) if self._index else 0
+        lookups = stats['exact_hits'] + stats['similar_hits'] + stats['misses']
+        stats['hit_rate'] = round((stats['exact_hits'] + stats['similar_hits']) / lookups, 3) if lookups else 0.0
+        stats['freshness_seconds'] = self.freshness_seconds
+        return stats
+
+    def _since(self) -> datetime:
+        return datetime.utcnow() - timedelta(seconds=self.freshness_seconds)
+
+    def _current_index(self) -> QuestionIndex:
+        with self._lock:
+            index = self._index
+        if index is not None and time.time() - index.loaded_at < self.refresh_seconds:
+            return index
+
+        # Load outside the lock - a concurrent duplicate load is harmless
+        index = QuestionIndex(self.load_recent(self._since(), self.max_candidates))
+        with self._lock:
+            self._index = index
+            self._stats['reloads'] += 1
+        return index
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self._stats[counter] += 1
+
+
+_cache_lock = threading.Lock()
+_council_cache: Optional[CouncilQuestionCache] = None
+
+
+def get_council_cache(load_recent: Callable[[datetime, int], List[Tuple[int, str, datetime]]]) -> CouncilQuestionCache:
+    """Get the process-wide question cache (built from Config.AI_COUNCIL on first call)"""
+    global _council_cache
+
+    if _council_cache is not None:
+        return _council_cache
+
+    with _cache_lock:
+        if _council_cache is not None:
+            return _council_cache
+
+        try:
+            from config import Config
+            settings = getattr(Config, 'AI_COUNCIL', {})
+        except Exception as e:
+            logger.warning(f"[CouncilCache] ⚠ Config unavailable ({e}) - using defaults")
+            settings = {}
+
+        _council_cache = CouncilQuestionCache(
+            load_recent,
+            freshness_seconds=settings.get('cache_seconds', 21600),
+            max_candidates=settings.get('cache_candidates', 1000),
+            refresh_seconds=settings.get('cache_refresh_seconds', 30)
+        )
+        logger.info(f"[CouncilCache] Initialized - freshness: {_council_cache.freshness_seconds}s")
+
+        return _council_cache
+
+
+# This file is not truncated
@@ -288,6 +288,23 @@ class DataTransformer:
         
         return response
     
+    @staticmethod
+    def transform_service_block(service_name: str, raw_service_data: Dict[str, Any],
+                                article: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Transform ONE service's data (used by the streaming endpoint)
+        
+        Produces the same block transform_response puts under
+        detailed_analysis[service_name].
+        """
+        article = article if isinstance(article, dict) else {}
+        
+        if isinstance(raw_service_data, dict) and 'data' in raw_service_data:
+            raw_service_data = raw_service_data['data']
+        
+        source = DataTransformer._get_source_name({}, article)
+        return DataTransformer._transform_service(service_name, raw_service_data or {}, source, article)
+    
     @staticmethod
     def _preserve_chart_data(result: Dict[str, Any], raw_data: Dict[str, Any]) -> None:
         """
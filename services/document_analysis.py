@@ -0,0 +1,252 @@
+"""
+Document Analysis Artifact
+Date: October 16, 2026
+Version: 1.0.0
+
+Tokenization computed once per document and shared by every analyzer.
+
+ContentAnalyzer, TransparencyAnalyzer, BiasDetector, ManipulationDetector,
+ArticleExtractor, the pattern engine, SpeakerQualityAnalyzer and the claim
+extractors each re-split the same text into sentences and words, lowercased
+it again, and counted syllables with their own copies of _count_syllables.
+DocumentAnalysis holds those artifacts for one text:
+
+    text / text_lower
+    words / words_lower / word_count   (str.split() tokens)
+    alpha_words                        (lowercase [a-zA-Z]+ tokens)
+    sentence_spans / sentence_parts    (re.split(r'[.!?]+') pieces + offsets)
+    sentences                          (stripped, non-empty pieces)
+    paragraph_spans / paragraphs       ('\\n\\n' pieces + offsets)
+    syllable_counts(method) / total_syllables(method) / polysyllable_count(method)
+
+FactChecker keeps its own splitter on purpose: it only breaks before a
+capital letter (so "U.S. officials" stays one claim) - a different artifact.
+
+Every artifact is computed lazily on first access and returned as a tuple, so
+one instance can be shared by the analyzer threads without copying.
+
+AnalysisPipeline builds the artifact right after extraction and passes it to
+every service as data['document']. Code outside the pipeline (transcripts,
+claim extraction) calls get_document(text); a small per-process memo means
+callers handed the same text share one artifact.
+
+USAGE:
+    from services.document_analysis import document_for
+
+    document = document_for(data, text)
+    document.word_count
+    document.sentences
+    document.total_syllables()
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Any, Callable, Optional, Tuple
+
+SENTENCE_SPLITTER = re.compile(r'[.!?]+')
+ALPHA_WORD = re.compile(r'\b[a-zA-Z]+\b')
+NON_LETTERS = re.compile(r'[^a-z]')
+
+VOWELS = 'aeiouy'
+
+
+def _vowel_groups(word: str) -> int:
+    count = 0
+    previous_was_vowel = False
+    for char in word:
+        is_vowel = char in VOWELS
+        if is_vowel and not previous_was_vowel:
+            count += 1
+        previous_was_vowel = is_vowel
+    if word.endswith('e'):
+        count -= 1
+    return count
+
+
+@lru_cache(maxsize=65536)
+def count_syllables_simple(word: str) -> int:
+    """Vowel groups minus a silent 'e', minimum 1 (ContentAnalyzer's counter)"""
+    return max(1, _vowel_groups(word.lower()))
+
+
+@lru_cache(maxsize=65536)
+def count_syllables_cleaned(word: str) -> int:
+    """
+    Like count_syllables_simple, but words of 3 characters or fewer count as
+    one syllable and non-letters are dropped first (SpeakerQualityAnalyzer's counter)
+    """
+    word = word.lower().strip()
+    if len(word) <= 3:
+        return 1
+    return max(_vowel_groups(NON_LETTERS.sub('', word)), 1)
+
+
+SYLLABLE_COUNTERS: Dict[str, Callable[[str], int]] = {
+    'simple': count_syllables_simple,
+    'cleaned': count_syllables_cleaned
+}
+
+
+def _split_spans(text: str, separator: re.Pattern) -> Tuple[Tuple[int, int], ...]:
+    """(start, end) of each piece separator.split(text) would return"""
+    spans = []
+    position = 0
+    for match in separator.finditer(text):
+        spans.append((position, match.start()))
+        position = match.end()
+    spans.append((position, len(text)))
+    return tuple(spans)
+
+
+class DocumentAnalysis:
+    """Read-only, lazily computed tokenization of one text"""
+
+    __slots__ = ('_text', '_lock', '_cache')
+
+    PARAGRAPH_SEPARATOR = re.compile(r'\n\n')
+
+    def __init__(self, text: str):
+        self._text = text or ''
+        self._lock = threading.RLock()  # Builders read other lazy artifacts
+        self._cache: Dict[str, Any] = {}
+
+    def _lazy(self, name: str, build: Callable[[], Any]) -> Any:
+        try:
+            return self._cache[name]
+        except KeyError:
+            pass
+        with self._lock:
+            if name not in self._cache:
+                self._cache[name] = build()
+            return self._cache[name]
+
+    # ------------------------------------------------------------------
+    # Text
+    # ------------------------------------------------------------------
+
+    @property
+    def text(self) -> str:
+        return self._text
+
+    @property
+    def text_lower(self) -> str:
+        return self._lazy('text_lower', self._text.lower)
+
+    # ------------------------------------------------------------------
+    # Words
+    # ------------------------------------------------------------------
+
+    @property
+    def words(self) -> Tuple[str, ...]:
+        """Whitespace tokens (text.split())"""
+        return self._lazy('words', lambda: tuple(self._text.split()))
+
+    @property
+    def words_lower(self) -> Tuple[str, ...]:
+        """Whitespace tokens of the lowercased text"""
+        return self._lazy('words_lower', lambda: tuple(self.text_lower.split()))
+
+    @property
+    def word_count(self) -> int:
+        return len(self.words)
+
+    @property
+    def alpha_words(self) -> Tuple[str, ...]:
+        """Lowercase alphabetic tokens (re.findall(r'\\b[a-zA-Z]+\\b', text.lower()))"""
+        return self._lazy('alpha_words', lambda: tuple(ALPHA_WORD.findall(self.text_lower)))
+
+    # ------------------------------------------------------------------
+    # Sentences and paragraphs
+    # ------------------------------------------------------------------
+
+    @property
+    def sentence_spans(self) -> Tuple[Tuple[int, int], ...]:
+        """Offsets of every re.split(r'[.!?]+', text) piece (empty ones included)"""
+        return self._lazy('sentence_spans', lambda: _split_spans(self._text, SENTENCE_SPLITTER))
+
+    @property
+    def sentence_parts(self) -> Tuple[str, ...]:
+        """Exactly re.split(r'[.!?]+', text)"""
+        return self._lazy('sentence_parts',
+                          lambda: tuple(self._text[start:end] for start, end in self.sentence_spans))
+
+    @property
+    def sentences(self) -> Tuple[str, ...]:
+        """Stripped, non-empty sentence pieces"""
+        return self._lazy('sentences',
+                          lambda: tuple(part.strip() for part in self.sentence_parts if part.strip()))
+
+    @property
+    def sentence_terminator_count(self) -> int:
+        """Number of [.!?]+ runs (len(re.findall(r'[.!?]+', text)))"""
+        return len(self.sentence_spans) - 1
+
+    @property
+    def paragraph_spans(self) -> Tuple[Tuple[int, int], ...]:
+        """Offsets of every text.split('\\n\\n') piece"""
+        return self._lazy('paragraph_spans', lambda: _split_spans(self._text, self.PARAGRAPH_SEPARATOR))
+
+    @property
+    def paragraphs(self) -> Tuple[str, ...]:
+        """Stripped, non-empty paragraphs"""
+        return self._lazy('paragraphs', lambda: tuple(
+            self._text[start:end].strip() for start, end in self.paragraph_spans
+            if self._text[start:end].strip()
+        ))
+
+    # ------------------------------------------------------------------
+    # Syllables
+    # ------------------------------------------------------------------
+
+    def syllable_counts(self, method: str = 'simple') -> Tuple[int, ...]:
+        """Syllables per entry of self.words ('simple' or 'cleaned' counter)"""
+        counter = SYLLABLE_COUNTERS[method]
+        return self._lazy(f'syllables:{method}', lambda: tuple(counter(word) for word in self.words))
+
+    def total_syllables(self, method: str = 'simple') -> int:
+        return self._lazy(f'total_syllables:{method}', lambda: sum(self.syllable_counts(method)))
+
+    def polysyllable_count(self, method: str = 'simple') -> int:
+        """Words with 3+ syllables"""
+        return self._lazy(f'polysyllables:{method}',
+                          lambda: sum(1 for count in self.syllable_counts(method) if count >= 3))
+
+    def __repr__(self) -> str:
+        return f"DocumentAnalysis({len(self._text)} chars)"
+
+
+_documents_lock = threading.Lock()
+_documents: 'OrderedDict[str, DocumentAnalysis]' = OrderedDict()
+DOCUMENT_MEMO_SIZE = 16
+
+
+def get_document(text: str) -> DocumentAnalysis:
+    """Get the shared artifact for a text (memoized per process)"""
+    text = text or ''
+    with _documents_lock:
+        document = _documents.get(text)
+        if document is not None:
+            _documents.move_to_end(text)
+            return document
+
+        document = DocumentAnalysis(text)
+        _documents[text] = document
+        while len(_documents) > DOCUMENT_MEMO_SIZE:
+            _documents.popitem(last=False)
+        return document
+
+
+def document_for(data: Optional[Dict[str, Any]], text: str) -> DocumentAnalysis:
+    """
+    The artifact the pipeline passed in data['document'] if it covers this
+    text, otherwise the shared one from get_document(text)
+    """
+    document = data.get('document') if isinstance(data, dict) else None
+    if isinstance(document, DocumentAnalysis) and document.text == text:
+        return document
+    return get_document(text)
+
+
+# This file is not truncated
@@ -69,12 +69,9 @@ import json
 
 logger = logging.getLogger(__name__)
 
-# Try to import AI clients
-try:
-    from openai import OpenAI
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
+# OpenAI calls go through the shared LLM gateway (services/llm_gateway.py)
+from services.llm_gateway import get_llm_client, OPENAI_AVAILABLE
+if not OPENAI_AVAILABLE:
     logger.warning("OpenAI not available for emotional manipulation detection")
 
 
@@ -127,7 +124,7 @@ class EmotionalManipulationDetector:
             api_key = os.getenv('OPENAI_API_KEY')
             if api_key:
                 try:
-                    self.openai_client = OpenAI(api_key=api_key)
+                    self.openai_client = get_llm_client('EmotionalManipulationDetector', api_key=api_key)
                     logger.info("[EmotionalManipulation] ✓ OpenAI initialized")
                 except Exception as e:
                     logger.error(f"[EmotionalManipulation] OpenAI init failed: {e}")
@@ -1,7 +1,7 @@
 """
 File: services/enhanced_factcheck.py
 Created: December 28, 2025 - v1.0.0
-Last Updated: December 28, 2025 - v1.1.0 (transcript_date context support)
+Last Updated: October 16, 2026 - v1.2.1 (pooled HTTP client for FRED calls)
 Description: Enhanced fact-checking with real economic data and strict temporal verification
 
 PURPOSE:
@@ -21,6 +21,8 @@ NEW CAPABILITIES:
 5. **Political Figure Database** - Knows when presidents/leaders took office
 6. **Economic Data Cache** - Fast lookups for common queries
 7. **Transcript Date Context** (v1.1.0) - Uses transcript_date to disambiguate terms
+8. **Shared Verification Cache** (v1.2.0) - Verdicts and FRED values live in
+   services/claim_cache.py, shared by every worker and surviving restarts
 
 FIXES THE TRUMP INFLATION CLAIM:
 ================================
@@ -51,19 +53,18 @@ import logging
 import os
 import re
 import json
-import requests
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 from dateutil import parser as date_parser
 
+from services.claim_cache import get_claim_cache
+from services.http_client import get_http_client
+
 logger = logging.getLogger(__name__)
 
-# Try to import AI clients
-try:
-    from openai import OpenAI
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
+# OpenAI calls go through the shared LLM gateway (services/llm_gateway.py)
+from services.llm_gateway import get_llm_client, OPENAI_AVAILABLE
+if not OPENAI_AVAILABLE:
     logger.warning("OpenAI not available")
 
 try:
@@ -108,6 +109,9 @@ class EnhancedFactChecker:
         'gdp_growth': 'A191RL1Q225SBEA',  # Real GDP Growth
     }
     
+    # Published FRED observations don't change - keep them for a week
+    FRED_CACHE_TTL = 7 * 86400
+    
     def __init__(self):
         """Initialize the enhanced fact-checker"""
         self.openai_client = None
@@ -119,7 +123,7 @@ class EnhancedFactChecker:
             api_key = os.getenv('OPENAI_API_KEY')
             if api_key:
                 try:
-                    self.openai_client = OpenAI(api_key=api_key)
+                    self.openai_client = get_llm_client('EnhancedFactChecker', api_key=api_key)
                     logger.info("[EnhancedFactCheck] ✓ OpenAI initialized")
                 except Exception as e:
                     logger.error(f"[EnhancedFactCheck] OpenAI init failed: {e}")
@@ -134,8 +138,8 @@ class EnhancedFactChecker:
                 except Exception as e:
                     logger.error(f"[EnhancedFactCheck] Anthropic init failed: {e}")
         
-        # Data cache
-        self.cache = {}
+        # v1.2.0: Shared claim verification cache (verdicts + FRED values)
+        self.verification_cache = get_claim_cache()
         
         logger.info(f"[EnhancedFactCheck] Initialized - FRED API: {bool(self.fred_api_key)}")
     
@@ -156,6 +160,15 @@ class EnhancedFactChecker:
             return self._create_result('unverifiable', claim, 
                                       "Claim too short to verify", 0, [])
         
+        # v1.2.0: Same claim, same providers, same date context -> same verdict
+        providers = self._active_providers()
+        date_context = self._cache_date_context(context)
+        cached = self.verification_cache.get('enhanced', claim, providers, date_context)
+        if cached:
+            cached['from_cache'] = True
+            logger.info(f"[EnhancedFactCheck] ✓ Cache hit: {cached.get('verdict')}")
+            return cached
+        
         # Step 1: Parse temporal claims
         temporal_info = self._parse_temporal_claim(claim, context)
         
@@ -163,13 +176,38 @@ class EnhancedFactChecker:
         economic_check = self._check_economic_claim(claim, temporal_info)
         if economic_check:
             logger.info(f"[EnhancedFactCheck] Economic check: {economic_check['verdict']}")
+            self.verification_cache.set('enhanced', claim, economic_check, providers, date_context)
             return economic_check
         
         # Step 3: Multi-AI verification for non-economic claims
         multi_ai_result = self._multi_ai_verification(claim, context, temporal_info)
         
+        # Only cache real verdicts (no sources means every AI call failed)
+        if multi_ai_result.get('sources'):
+            self.verification_cache.set('enhanced', claim, multi_ai_result, providers, date_context)
+        
         return multi_ai_result
     
+    def _active_providers(self) -> List[str]:
+        """AI providers that contribute to verdicts in this process"""
+        providers = []
+        if self.openai_client:
+            providers.append('openai')
+        if self.anthropic_client:
+            providers.append('anthropic')
+        return providers
+    
+    def _cache_date_context(self, context: Optional[Dict]) -> str:
+        """
+        Date context for the cache key
+        
+        Temporal parsing depends on transcript_date (defaults to today) and on
+        the speaker ("when I took office"), so both are part of the key.
+        """
+        transcript_date = (context or {}).get('transcript_date') or datetime.now().strftime('%Y-%m-%d')
+        speaker = (context or {}).get('speaker', 'Unknown')
+        return f"{transcript_date}|{str(speaker).lower()}"
+    
     def _parse_temporal_claim(self, claim: str, context: Optional[Dict]) -> Dict:
         """
         Extract temporal information from claim
@@ -409,10 +447,11 @@ class EnhancedFactChecker:
             logger.error(f"[EnhancedFactCheck] Unknown indicator: {indicator}")
             return None
         
-        # Check cache
-        cache_key = f"fred_{series_id}_{date_str}"
-        if cache_key in self.cache:
-            return self.cache[cache_key]
+        # Check shared cache
+        cache_key = f"{series_id} {date_str}"
+        cached = self.verification_cache.get('fred', cache_key)
+        if cached:
+            return cached.get('value')
         
         try:
             # FRED API endpoint
@@ -431,7 +470,7 @@ class EnhancedFactChecker:
                 'observation_end': observation_end
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            response = get_http_client().get(url, params=params, timeout=10)
             response.raise_for_status()
             
             data = response.json()
@@ -446,7 +485,9 @@ class EnhancedFactChecker:
                     value = self._calculate_inflation_rate(series_id, date_str)
                 
                 # Cache result
-                self.cache[cache_key] = value
+                if value is not None:
+                    self.verification_cache.set('fred', cache_key, {'value': value},
+                                                ttl=self.FRED_CACHE_TTL)
                 
                 logger.info(f"[EnhancedFactCheck] FRED data for {indicator} on {date_str}: {value}")
                 
@@ -474,7 +515,7 @@ class EnhancedFactChecker:
                 'observation_end': current_month
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            response = get_http_client().get(url, params=params, timeout=10)
             data = response.json()
             
             if 'observations' in data and len(data['observations']) >= 2:
@@ -509,7 +550,7 @@ class EnhancedFactChecker:
                 'observation_end': before_date
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            response = get_http_client().get(url, params=params, timeout=10)
             data = response.json()
             
             if 'observations' in data:
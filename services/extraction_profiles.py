@@ -0,0 +1,389 @@
+"""
+Extraction Profiles
+Date: October 16, 2026
+Version: 1.0.0
+
+Per-domain extraction profiles for ArticleExtractor: what worked last time
+on a site, so the next article from it goes straight there.
+
+Every parse used to run the whole cascade - BBC / ABC / universal author
+strategies (meta tags, class-regex sweeps over the whole tree, JSON-LD,
+raw-HTML bylines) and up to three body-text strategies - even though a
+given site lays out every article the same way. A profile records:
+
+  fetch_method  the method that won the last hedged fetch - FetchStrategy
+                starts it first while a worker has no stats of its own
+  author        the probe that reproduced the cascade's authors
+                (e.g. ['meta', 'name', 'parsely-author'], ['jsonld'],
+                ['class', 'byline'])
+  body          the container that held the body text
+                (['article'], ['class', 'div', 'story-body']) - text taken
+                from every paragraph on the page is not a recipe: it would
+                match any page and never miss
+
+ArticleExtractor tries the learned author probe / body container first
+and runs the full cascade only when it comes up empty, then re-learns.
+A recipe that misses miss_limit times in a row is dropped. When no probe
+reproduces the cascade (site-specific heuristics, raw-HTML bylines), the
+domain is marked as such and learning is not retried for relearn_seconds,
+so those sites cost one cascade per article as before - not a cascade plus
+every probe.
+
+Backends (both survive worker restarts and are shared between workers):
+  - RedisProfileBackend:  one hash, field per domain (REDIS_URL configured)
+  - SQLiteProfileBackend: single file on local disk, WAL mode, bounded by
+                          max_entries (least recently updated rows pruned)
+  - memory:               per worker only
+Workers keep loaded profiles for refresh_seconds; writes happen only when
+a recipe is learned, changes or misses.
+
+Configuration (Config.EXTRACTION_PROFILES / environment):
+  EXTRACTION_PROFILE_BACKEND     auto | sqlite | redis | memory | none (default: auto)
+  EXTRACTION_PROFILE_PATH        SQLite file (default: <tmp>/truthlens_extraction_profiles.sqlite3)
+  EXTRACTION_PROFILE_MAX_ENTRIES row cap for SQLite (default: 5000)
+  EXTRACTION_PROFILE_REFRESH     seconds a worker keeps a loaded profile (default: 300)
+  EXTRACTION_PROFILE_MISS_LIMIT  consecutive misses before a recipe is dropped (default: 3)
+  EXTRACTION_PROFILE_RELEARN     seconds before retrying an unlearnable domain (default: 86400)
+"""
+
+import os
+import json
+import time
+import sqlite3
+import logging
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List
+
+logger = logging.getLogger(__name__)
+
+PARTS = ('author', 'body')
+
+
+class SQLiteProfileBackend:
+    """
+    SQLite file shared by all workers on this host
+
+    Connections are opened lazily per process (gunicorn preloads the app and
+    forks, and a SQLite connection must never cross a fork).
+    """
+
+    name = 'sqlite'
+    PRUNE_EVERY = 100  # stores between size checks
+
+    def __init__(self, path: str, max_entries: int):
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = None
+        self._conn_pid = None
+        self._stores_since_prune = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None or self._conn_pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS extraction_profiles ('
+                ' domain TEXT PRIMARY KEY,'
+                ' profile TEXT NOT NULL,'
+                ' updated_at REAL NOT NULL)'
+            )
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_extraction_profiles_updated '
+                         'ON extraction_profiles(updated_at)')
+            conn.commit()
+            self._conn = conn
+            self._conn_pid = os.getpid()
+        return self._conn
+
+    def get(self, domain: str) -> Optional[str]:
+        with self._lock:
+            row = self._connection().execute(
+                'SELECT profile FROM extraction_profiles WHERE domain = ?', (domain,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, domain: str, value: str) -> None:
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                'INSERT OR REPLACE INTO extraction_profiles (domain, profile, updated_at) VALUES (?, ?, ?)',
+                (domain, value, now)
+            )
+            conn.commit()
+
+            self._stores_since_prune += 1
+            if self._stores_since_prune >= self.PRUNE_EVERY:
+                self._stores_since_prune = 0
+                overflow = conn.execute('SELECT COUNT(*) FROM extraction_profiles').fetchone()[0] - self.max_entries
+                if overflow > 0:
+                    conn.execute(
+                        'DELETE FROM extraction_profiles WHERE domain IN '
+                        '(SELECT domain FROM extraction_profiles ORDER BY updated_at ASC LIMIT ?)',
+                        (overflow,)
+                    )
+                    conn.commit()
+
+    def count(self) -> int:
+        with self._lock:
+            return self._connection().execute('SELECT COUNT(*) FROM extraction_profiles').fetchone()[0]
+
+
+class RedisProfileBackend:
+    """Redis hash of profiles shared across workers and instances"""
+
+    name = 'redis'
+    HASH_KEY = 'extraction_profiles'
+
+    def __init__(self, client: Any):
+        self.client = client
+
+    def get(self, domain: str) -> Optional[str]:
+        return self.client.hget(self.HASH_KEY, domain)
+
+    def set(self, domain: str, value: str) -> None:
+        self.client.hset(self.HASH_KEY, domain, value)
+
+    def count(self) -> int:
+        return self.client.hlen(self.HASH_KEY)
+
+
+class MemoryProfileBackend:
+    """Per-worker profiles (no Redis, no writable disk)"""
+
+    name = 'memory'
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._profiles: 'OrderedDict[str, str]' = OrderedDict()
+
+    def get(self, domain: str) -> Optional[str]:
+        with self._lock:
+            return self._profiles.get(domain)
+
+    def set(self, domain: str, value: str) -> None:
+        with self._lock:
+            self._profiles[domain] = value
+            self._profiles.move_to_end(domain)
+            while len(self._profiles) > self.max_entries:
+                self._profiles.popitem(last=False)
+
+    def count(self) -> int:
+        with self._lock:
+            return len(self._profiles)
+
+
+class ExtractionProfiles:
+    """
+    Learned per-domain extraction recipes
+
+    Never raises - a broken backend only costs the fast path, not the
+    extraction.
+    """
+
+    def __init__(self, backend: Optional[Any], refresh_seconds: float = 300.0,
+                 miss_limit: int = 3, relearn_seconds: float = 86400.0, max_cached: int = 2000):
+        self.backend = backend
+        self.refresh_seconds = refresh_seconds
+        self.miss_limit = miss_limit
+        self.relearn_seconds = relearn_seconds
+        self.max_cached = max_cached
+        self._lock = threading.Lock()
+        self._loaded: 'OrderedDict[str, tuple]' = OrderedDict()  # domain → (profile, loaded_at)
+        self._counters = {f"{part}_{outcome}": 0 for part in PARTS for outcome in ('hits', 'misses')}
+        self._counters.update({'learned': 0, 'unlearnable': 0, 'dropped': 0, 'store_errors': 0})
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None
+
+    @staticmethod
+    def _key(domain: str) -> str:
+        domain = (domain or '').lower()
+        return domain[4:] if domain.startswith('www.') else domain
+
+    def get(self, domain: str) -> Dict[str, Any]:
+        """The domain's profile ({} when nothing is known)"""
+        if not self.enabled or not domain:
+            return {}
+
+        key = self._key(domain)
+        now = time.time()
+        with self._lock:
+            cached = self._loaded.get(key)
+            if cached is not None and now - cached[1] < self.refresh_seconds:
+                return cached[0]
+
+        try:
+            payload = self.backend.get(key)
+            profile = json.loads(payload) if payload else {}
+        except Exception as e:
+            logger.warning(f"[ExtractionProfiles] Lookup failed ({self.backend.name}): {e}")
+            profile = cached[0] if cached is not None else {}
+
+        self._remember(key, profile, now)
+        return profile
+
+    def _remember(self, key: str, profile: Dict[str, Any], now: float) -> None:
+        with self._lock:
+            self._loaded[key] = (profile, now)
+            self._loaded.move_to_end(key)
+            while len(self._loaded) > self.max_cached:
+                self._loaded.popitem(last=False)
+
+    def _update(self, domain: str, **fields) -> None:
+        """Merge fields into the stored profile (re-read first - other workers write too)"""
+        if not self.enabled or not domain:
+            return
+
+        key = self._key(domain)
+        now = time.time()
+        try:
+            payload = self.backend.get(key)
+            profile = json.loads(payload) if payload else {}
+            profile.update(fields)
+            profile['updated_at'] = now
+            self.backend.set(key, json.dumps(profile))
+        except Exception as e:
+            logger.warning(f"[ExtractionProfiles] Store failed ({self.backend.name}): {e}")
+            self._count('store_errors')
+            with self._lock:
+                cached = self._loaded.get(key)
+            profile = dict(cached[0] if cached else {}, **fields)
+        self._remember(key, profile, now)
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self._counters[counter] += 1
+
+    # ------------------------------------------------------------------
+    # Recipes
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def recipe(profile: Dict[str, Any], part: str) -> Optional[List[str]]:
+        """Learned author probe / body container, or None"""
+        return (profile.get(part) or {}).get('recipe')
+
+    def should_learn(self, profile: Dict[str, Any], part: str) -> bool:
+        """False while a domain with no reproducible recipe waits out relearn_seconds"""
+        if not self.enabled:
+            return False
+        entry = profile.get(part)
+        if not entry or entry.get('recipe'):
+            return True
+        return time.time() - entry.get('learned_at', 0) >= self.relearn_seconds
+
+    def hit(self, domain: str, profile: Dict[str, Any], part: str) -> None:
+        """The learned recipe worked; clears a run of misses"""
+        self._count(f"{part}_hits")
+        entry = profile.get(part) or {}
+        if entry.get('misses'):
+            self._update(domain, **{part: dict(entry, misses=0)})
+
+    def miss(self, domain: str, profile: Dict[str, Any], part: str) -> None:
+        """The learned recipe came up empty; dropped after miss_limit in a row"""
+        self._count(f"{part}_misses")
+        entry = dict(profile.get(part) or {})
+        entry['misses'] = entry.get('misses', 0) + 1
+        if entry['misses'] >= self.miss_limit:
+            logger.info(f"[ExtractionProfiles] {domain}: dropping {part} recipe {entry.get('recipe')} "
+                        f"after {entry['misses']} misses")
+            self._count('dropped')
+            entry = {'recipe': None, 'misses': 0, 'learned_at': 0}  # relearn on the next article
+        self._update(domain, **{part: entry})
+
+    def learn(self, domain: str, part: str, recipe: Optional[List[str]]) -> None:
+        """Store what the cascade found (None = nothing reproducible - retry after relearn_seconds)"""
+        self._count('learned' if recipe else 'unlearnable')
+        if recipe:
+            logger.info(f"[ExtractionProfiles] {domain}: learned {part} recipe {recipe}")
+        self._update(domain, **{part: {'recipe': recipe, 'misses': 0, 'learned_at': time.time()}})
+
+    def learn_fetch_method(self, domain: str, profile: Dict[str, Any], method: str) -> None:
+        if self.enabled and profile.get('fetch_method') != method:
+            self._update(domain, fetch_method=method)
+
+    def stats(self) -> Dict[str, Any]:
+        """Fast-path hit rates for this worker, profile count for the backend"""
+        if not self.enabled:
+            return {'backend': 'disabled'}
+
+        with self._lock:
+            stats = dict(self._counters)
+            stats['cached'] = len(self._loaded)
+        for part in PARTS:
+            tries = stats[f"{part}_hits"] + stats[f"{part}_misses"]
+            stats[f"{part}_hit_rate"] = round(stats[f"{part}_hits"] / tries, 3) if tries else 0.0
+        try:
+            stats['profiles'] = self.backend.count()
+        except Exception as e:
+            stats['error'] = str(e)
+        stats['backend'] = self.backend.name
+        return stats
+
+
+_profiles_lock = threading.Lock()
+_extraction_profiles: Optional[ExtractionProfiles] = None
+
+
+def get_extraction_profiles() -> ExtractionProfiles:
+    """Get the process-wide extraction profiles (built from Config.EXTRACTION_PROFILES)"""
+    global _extraction_profiles
+
+    if _extraction_profiles is not None:
+        return _extraction_profiles
+
+    with _profiles_lock:
+        if _extraction_profiles is not None:
+            return _extraction_profiles
+
+        try:
+            from config import Config
+            settings = getattr(Config, 'EXTRACTION_PROFILES', {})
+        except Exception as e:
+            logger.warning(f"[ExtractionProfiles] ⚠ Config unavailable ({e}) - using defaults")
+            settings = {}
+
+        backend_name = settings.get('backend', 'auto')
+        max_entries = settings.get('max_entries', 5000)
+
+        backend = None
+        if backend_name in ('auto', 'redis'):
+            from services.redis_client import get_redis_client
+            client = get_redis_client()
+            if client:
+                backend = RedisProfileBackend(client)
+            elif backend_name == 'redis':
+                logger.warning("[ExtractionProfiles] Redis requested but unavailable - using SQLite backend")
+
+        if backend is None and backend_name in ('auto', 'redis', 'sqlite'):
+            path = settings.get('path') or os.path.join(
+                tempfile.gettempdir(), 'truthlens_extraction_profiles.sqlite3'
+            )
+            try:
+                backend = SQLiteProfileBackend(path, max_entries)
+                backend.count()  # Fail fast if the file is unusable
+            except Exception as e:
+                logger.error(f"[ExtractionProfiles] SQLite backend unavailable ({path}): {e} - using memory")
+                backend = None
+
+        if backend is None and backend_name != 'none':
+            backend = MemoryProfileBackend(max_entries)
+
+        _extraction_profiles = ExtractionProfiles(
+            backend,
+            refresh_seconds=settings.get('refresh_seconds', 300.0),
+            miss_limit=settings.get('miss_limit', 3),
+            relearn_seconds=settings.get('relearn_seconds', 86400.0)
+        )
+        logger.info(f"[ExtractionProfiles] Initialized - backend: {backend.name if backend else 'disabled'}")
+
+        return _extraction_profiles
+
+
+# This file is not truncated
@@ -1,7 +1,18 @@
 """
 Fact Checker Service - MULTI-AI CONSENSUS VERIFICATION
-Date: December 26, 2025
-Version: 15.0 - 4-AI CONSENSUS FACT-CHECKING UPGRADE
+Date: October 16, 2026
+Version: 15.2 - POOLED HTTP CLIENT
+
+CHANGES FROM v15.1:
+✅ Google Fact Check API calls go through the shared pooled HTTP client
+  (services/http_client.py): keep-alive, retries, per-host latency stats
+
+CHANGES FROM v15.0:
+✅ REPLACED: Per-instance 24h dict cache with the shared claim verification
+  cache (services/claim_cache.py). Multi-AI verdicts are cached inside
+  MultiAIService; single-AI fallback verdicts are cached here. Keys include
+  current_date and a hash of the article context the prompt carries. Entries
+  are shared between workers and survive worker restarts.
 
 MAJOR UPGRADE FROM v13.2:
 ✅ NEW: Multi-AI consensus verification using 4 AI systems
@@ -29,24 +40,23 @@ Save as: services/fact_checker.py (REPLACE existing file)
 import re
 import json
 import time
-import hashlib
 import logging
-import requests
+from services.http_client import get_http_client
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 from urllib.parse import quote
 from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
 from collections import Counter, defaultdict
 
-try:
-    from openai import OpenAI
+# OpenAI calls go through the shared LLM gateway (services/llm_gateway.py)
+from services.llm_gateway import get_llm_client, OPENAI_AVAILABLE
+if OPENAI_AVAILABLE:
     import httpx
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
+else:
     logging.warning("OpenAI library not available for FactChecker")
 
 from services.base_analyzer import BaseAnalyzer
+from services.claim_cache import get_claim_cache, claim_context_key
 from config import Config
 
 # NEW v15.0: Import Multi-AI Service
@@ -181,7 +191,8 @@ class FactChecker(BaseAnalyzer):
         self.openai_client = None
         if OPENAI_AVAILABLE and Config.OPENAI_API_KEY:
             try:
-                self.openai_client = OpenAI(
+                self.openai_client = get_llm_client(
+                    'FactChecker',
                     api_key=Config.OPENAI_API_KEY,
                     timeout=httpx.Timeout(5.0, connect=2.0)
                 )
@@ -193,9 +204,8 @@ class FactChecker(BaseAnalyzer):
         # ThreadPoolExecutor for parallel checking
         self.executor = ThreadPoolExecutor(max_workers=10)
         
-        # Cache for fact check results
-        self.cache = {}
-        self.cache_ttl = 86400
+        # v15.1: Shared claim verification cache (all workers, survives restarts)
+        self.verification_cache = get_claim_cache()
         
         # API configuration
         self.google_api_key = Config.GOOGLE_FACT_CHECK_API_KEY or Config.GOOGLE_FACTCHECK_API_KEY
@@ -417,14 +427,6 @@ class FactChecker(BaseAnalyzer):
         v15.0: NEW - Verify single claim using Multi-AI consensus
         """
         try:
-            # Check cache first
-            if self.cache:
-                cache_key = self._get_cache_key(claim)
-                cached_result = self._get_cached_result(cache_key)
-                if cached_result:
-                    cached_result['from_cache'] = True
-                    return cached_result
-            
             # Skip trivial claims
             if len(claim.strip()) < 20:
                 return {
@@ -437,14 +439,10 @@ class FactChecker(BaseAnalyzer):
                     'method_used': 'filtered'
                 }
             
-            # Use Multi-AI Service if available
+            # Use Multi-AI Service if available (v15.1: it consults the shared cache)
             if self.multi_ai:
                 result = self._verify_with_multi_ai_service(claim, article_title, ai_subset)
                 if result:
-                    # Cache the result
-                    if self.cache is not None:
-                        cache_key = self._get_cache_key(claim)
-                        self._cache_result(cache_key, result)
                     return result
             
             # Fallback to single-AI verification
@@ -472,7 +470,8 @@ class FactChecker(BaseAnalyzer):
             consensus_result = self.multi_ai.verify_claim(
                 claim=claim,
                 context=context or "",
-                ai_subset=ai_subset
+                ai_subset=ai_subset,
+                date_context=self.current_date
             )
             
             if consensus_result:
@@ -498,12 +497,19 @@ class FactChecker(BaseAnalyzer):
         """
         # Try OpenAI if available
         if self.openai_client:
+            cache_context = claim_context_key(self.current_date, context)
+            cached_result = self.verification_cache.get('single_ai', claim, ['openai'], cache_context)
+            if cached_result:
+                cached_result['from_cache'] = True
+                return cached_result
+            
             result = self._ai_verify_claim(claim, context)
             if result:
                 result['claim'] = claim
                 result['method_used'] = 'single_ai_fallback'
                 result.setdefault('sources', ['AI Analysis'])
                 result.setdefault('evidence', [])
+                self.verification_cache.set('single_ai', claim, result, ['openai'], cache_context)
                 return result
         
         # Ultimate fallback: pattern analysis
@@ -832,7 +838,7 @@ Use information current as of {self.current_date}."""
                 'languageCode': 'en'
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            response = get_http_client().get(url, params=params, timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
@@ -1378,26 +1384,6 @@ Use information current as of {self.current_date}."""
                 sources.add(fc['method_used'])
         return list(sources)
     
-    def _get_cache_key(self, claim: str) -> str:
-        """Generate cache key"""
-        return hashlib.sha256(claim.encode()).hexdigest()[:16]
-    
-    def _get_cached_result(self, cache_key: str) -> Optional[Dict[str, Any]]:
-        """Get cached result"""
-        if cache_key in self.cache:
-            cached_time, result = self.cache[cache_key]
-            if time.time() - cached_time < self.cache_ttl:
-                return result.copy()
-        return None
-    
-    def _cache_result(self, cache_key: str, result: Dict[str, Any]):
-        """Cache result"""
-        self.cache[cache_key] = (time.time(), result.copy())
-        if len(self.cache) > 1000:
-            sorted_items = sorted(self.cache.items(), key=lambda x: x[1][0])
-            for key, _ in sorted_items[:100]:
-                del self.cache[key]
-    
     def _initialize_claim_patterns(self) -> Dict[str, Any]:
         """Initialize patterns"""
         return {'claim_indicators': []}
@@ -0,0 +1,244 @@
+"""
+Article Fetch Strategy
+Date: October 16, 2026
+Version: 1.0.1
+
+Per-domain learned ordering and hedge delays for ArticleExtractor's fetch
+methods ('direct' and 'scrapingbee').
+
+ArticleExtractor used to try ScrapingBee (45s timeout) first, then two
+direct fetches 2s apart - a site that blocked ScrapingBee cost 45s+ before
+the cheap direct fetch ran. extract() now races the methods: the first one
+starts at once, the next one only if the first has neither succeeded nor
+failed after its hedge delay (or at once when the first fails). The first
+response that parses wins.
+
+plan() decides the order and the delays:
+  - No data for the domain: direct first (or the method that won last
+    time, from the domain's extraction profile); the other after
+    hedge_delay, or right away for sites that need JavaScript rendering
+  - Once a method has min_samples attempts on the domain, methods are
+    ordered by expected time to a successful fetch: typical latency divided
+    by success rate (Laplace-smoothed, so one failure does not bury a
+    method). Methods that never succeeded go last
+  - The next method's delay is 1.5x the leader's typical latency on this
+    domain, bounded by min_hedge_delay / max_hedge_delay
+  - Every probe_every-th fetch of a learned domain, the trailing methods
+    are probes: they start at once alongside the leader and run to the end
+    even when the leader wins, so their stats stay current and a method
+    that recovers (a lifted block, a faster site) can take the lead back
+
+Only fetches that ran to the end are recorded - a hedge cancelled because
+another method won says nothing about its own method. Stats are kept per
+worker for the max_domains most recently seen domains. Exposed on /health
+as 'article_fetch'.
+
+Configuration (Config.ARTICLE_FETCH / environment):
+  ARTICLE_HEDGE_DELAY         seconds before the second method starts (default: 3.0)
+  ARTICLE_MIN_HEDGE_DELAY     lower bound for learned delays (default: 0.5)
+  ARTICLE_MAX_HEDGE_DELAY     upper bound for learned delays (default: 10.0)
+  ARTICLE_FETCH_MIN_SAMPLES   attempts per domain before stats count (default: 3)
+  ARTICLE_FETCH_PROBE_EVERY   fetches per domain between probes, 0 = never (default: 10)
+  ARTICLE_FETCH_MAX_DOMAINS   domains tracked per worker (default: 2000)
+  ARTICLE_FETCH_WORKERS       fetch threads per worker (default: 16, 64 async)
+
+FIX IN 1.0.1:
+- A method that fell behind on a domain was never run to the end again
+  (cancelled as a loser, or never launched), so it could not recover;
+  trailing methods are now probed periodically and ranking uses expected
+  time to success instead of win rate alone
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+
+from services.service_executor import InstrumentedExecutor
+
+logger = logging.getLogger(__name__)
+
+# EMA smoothing for per-domain latency
+LATENCY_ALPHA = 0.3
+
+
+class MethodStats:
+    """Outcomes of one fetch method on one domain"""
+
+    __slots__ = ('attempts', 'wins', 'latency')
+
+    def __init__(self):
+        self.attempts = 0
+        self.wins = 0
+        self.latency: Optional[float] = None
+
+    def win_rate(self) -> float:
+        return (self.wins + 1) / (self.attempts + 2)
+
+    def expected_seconds(self) -> Optional[float]:
+        """Typical latency / success rate - None until the method has succeeded once"""
+        return self.latency / self.win_rate() if self.latency is not None else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'attempts': self.attempts,
+            'wins': self.wins,
+            'latency': round(self.latency, 2) if self.latency is not None else None
+        }
+
+
+class FetchStrategy:
+    """Learned per-domain fetch ordering, plus the thread pool the fetches race on"""
+
+    def __init__(self, hedge_delay: float = 3.0, min_hedge_delay: float = 0.5,
+                 max_hedge_delay: float = 10.0, min_samples: int = 3,
+                 probe_every: int = 10, max_domains: int = 2000, workers: int = 16):
+        self.hedge_delay = hedge_delay
+        self.min_hedge_delay = min_hedge_delay
+        self.max_hedge_delay = max_hedge_delay
+        self.min_samples = min_samples
+        self.probe_every = probe_every
+        self.max_domains = max_domains
+        self.executor = InstrumentedExecutor(workers, thread_name_prefix='article-fetch')
+        self._lock = threading.Lock()
+        self._domains: 'OrderedDict[str, Dict[str, MethodStats]]' = OrderedDict()
+        self._plans: Dict[str, int] = {}  # learned plans per tracked domain, for probe turns
+        self._totals = {'fetches': 0, 'hedged': 0, 'wins': {}, 'losers_cancelled': 0, 'probes': 0}
+
+    def plan(self, domain: str, methods: List[str], needs_js: bool = False,
+             preferred: Optional[str] = None) -> List[Tuple[str, float, bool]]:
+        """
+        [(method, start delay in seconds, probe)] for `methods` on `domain`
+
+        The first method always starts at 0. A later method starts at its
+        delay unless an earlier one has already won; it starts at once if
+        every method started so far has failed. A probe starts at 0 and
+        must run to the end (and be recorded) even if another method wins.
+        `preferred` goes first while this worker has no stats of its own
+        for the domain.
+        """
+        if not methods:
+            return []
+
+        probing = False
+        with self._lock:
+            known = self._domains.get(domain, {})
+            learned = {method: known[method] for method in methods
+                       if method in known and known[method].attempts >= self.min_samples}
+
+            if learned:
+                def rank(method):
+                    stats = learned.get(method)
+                    if stats is None:
+                        return (1, 0.0)  # untried: behind methods that have succeeded
+                    expected = stats.expected_seconds()
+                    return (0, expected) if expected is not None else (2, -stats.win_rate())
+                ordered = sorted(methods, key=rank)
+                leader = learned.get(ordered[0])
+                typical = leader.latency if leader is not None else None
+
+                planned = self._plans.get(domain, 0) + 1
+                self._plans[domain] = planned
+                probing = bool(self.probe_every) and len(ordered) > 1 and planned % self.probe_every == 0
+                if probing:
+                    self._totals['probes'] += 1
+            else:
+                first = preferred if preferred in methods else 'direct'
+                ordered = sorted(methods, key=lambda method: 0 if method == first else 1)
+                typical = None
+
+        if typical is not None:
+            delay = min(self.max_hedge_delay, max(self.min_hedge_delay, typical * 1.5))
+        elif needs_js:
+            delay = 0.0
+        else:
+            delay = self.hedge_delay
+
+        if probing:
+            return [(method, 0.0, position > 0) for position, method in enumerate(ordered)]
+        return [(method, 0.0 if position == 0 else delay, False) for position, method in enumerate(ordered)]
+
+    def record(self, domain: str, method: str, won: bool, latency: float) -> None:
+        """Outcome of a fetch that ran to the end (won = fetched and parsed)"""
+        with self._lock:
+            methods = self._domains.get(domain)
+            if methods is None:
+                methods = {}
+                self._domains[domain] = methods
+                while len(self._domains) > self.max_domains:
+                    evicted, _ = self._domains.popitem(last=False)
+                    self._plans.pop(evicted, None)
+            else:
+                self._domains.move_to_end(domain)
+
+            stats = methods.get(method)
+            if stats is None:
+                stats = methods[method] = MethodStats()
+            stats.attempts += 1
+            if won:
+                stats.wins += 1
+                stats.latency = latency if stats.latency is None else \
+                    stats.latency + LATENCY_ALPHA * (latency - stats.latency)
+
+    def count(self, hedged: bool, winner: Optional[str], cancelled: int) -> None:
+        """Totals for one extract() race"""
+        with self._lock:
+            self._totals['fetches'] += 1
+            self._totals['hedged'] += 1 if hedged else 0
+            self._totals['losers_cancelled'] += cancelled
+            key = winner or 'none'
+            self._totals['wins'][key] = self._totals['wins'].get(key, 0) + 1
+
+    def domain_stats(self, domain: str) -> Dict[str, Any]:
+        with self._lock:
+            return {method: stats.to_dict() for method, stats in self._domains.get(domain, {}).items()}
+
+    def stats(self) -> Dict[str, Any]:
+        """Race totals and pool gauges for /health"""
+        with self._lock:
+            totals = dict(self._totals, wins=dict(self._totals['wins']))
+            totals['domains_tracked'] = len(self._domains)
+        totals['hedge_delay'] = self.hedge_delay
+        totals['probe_every'] = self.probe_every
+        totals['executor'] = self.executor.stats()
+        return totals
+
+
+_strategy_lock = threading.Lock()
+_fetch_strategy: Optional[FetchStrategy] = None
+
+
+def get_fetch_strategy() -> FetchStrategy:
+    """Get the process-wide fetch strategy (built from Config.ARTICLE_FETCH)"""
+    global _fetch_strategy
+
+    if _fetch_strategy is not None:
+        return _fetch_strategy
+
+    with _strategy_lock:
+        if _fetch_strategy is not None:
+            return _fetch_strategy
+
+        try:
+            from config import Config
+            settings = getattr(Config, 'ARTICLE_FETCH', {})
+        except Exception as e:
+            logger.warning(f"[FetchStrategy] ⚠ Config unavailable ({e}) - using defaults")
+            settings = {}
+
+        _fetch_strategy = FetchStrategy(
+            hedge_delay=settings.get('hedge_delay', 3.0),
+            min_hedge_delay=settings.get('min_hedge_delay', 0.5),
+            max_hedge_delay=settings.get('max_hedge_delay', 10.0),
+            min_samples=settings.get('min_samples', 3),
+            probe_every=settings.get('probe_every', 10),
+            max_domains=settings.get('max_domains', 2000),
+            workers=settings.get('workers', 16)
+        )
+        logger.info(f"[FetchStrategy] Initialized - hedge delay: {_fetch_strategy.hedge_delay}s, "
+                    f"workers: {_fetch_strategy.executor.max_workers}")
+
+        return _fetch_strategy
+
+
+# This file is not truncated
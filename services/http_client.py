@@ -0,0 +1,345 @@
+"""
+Shared Outbound HTTP Client
+Date: October 16, 2026
+Version: 1.0.0
+
+One pooled, keep-alive HTTP layer for every outbound fetcher.
+
+Only ArticleExtractor used a requests.Session. AuthorAnalyzer, FactChecker,
+EnhancedFactChecker, the ScrapingBee calls and the other API clients called
+bare requests.get / requests.post, which opens a new TCP (and TLS) connection
+- plus a DNS lookup - on every call. Now they all go through the same mounted
+adapters:
+
+  - Per-host connection pools with keep-alive (pool_connections host pools,
+    pool_maxsize sockets each), shared by every thread in the worker
+  - Retries with exponential backoff for connect errors and 429/5xx
+    responses, on idempotent methods only (POST is never replayed). Read
+    timeouts are not retried - the pipeline deadlines already bound them
+  - Per-host concurrency limit: a request waits up to host_wait seconds for
+    a free slot, then fails with HostBusyError (a requests ConnectionError,
+    so existing `except requests.exceptions.RequestException` handlers
+    still apply)
+  - Per-host latency histograms, status classes, retries and in-flight
+    gauges (shown on /health as 'http_client')
+
+Cookies never leak between callers: get/post/request use a throwaway
+session per call (connection pools are shared, cookie jars are not).
+Services that want a cookie jar across calls (ArticleExtractor) keep one
+from session().
+
+The adapters are rebuilt lazily after a fork (gunicorn preload_app=True), so
+sockets never cross from the master into the workers.
+
+Configuration (Config.HTTP / environment):
+  HTTP_POOL_HOSTS       host pools kept per worker (default: 32)
+  HTTP_POOL_MAXSIZE     keep-alive sockets per host (default: 16)
+  HTTP_RETRIES          retries per request (default: 2)
+  HTTP_RETRY_BACKOFF    backoff factor in seconds (default: 0.3)
+  HTTP_PER_HOST_LIMIT   concurrent requests per host (default: 8)
+  HTTP_HOST_WAIT        seconds to wait for a host slot (default: 10)
+  HTTP_HOST_LIMITS      per-host overrides, "host=limit,host=limit"
+
+USAGE:
+    from services.http_client import get_http_client
+
+    http = get_http_client()
+    response = http.get(url, params=params, timeout=10)
+
+    session = http.session()  # cookie jar of your own, shared pools
+    session.headers.update({'User-Agent': '...'})
+"""
+
+import os
+import time
+import bisect
+import logging
+import threading
+from urllib.parse import urlparse
+from typing import Dict, Any, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# Histogram bucket upper bounds in milliseconds (last bucket is open-ended)
+LATENCY_BUCKETS_MS = (25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'])
+
+
+class HostBusyError(requests.exceptions.ConnectionError):
+    """No free concurrency slot for a host within host_wait seconds"""
+
+
+class HostStats:
+    """Latency histogram and gauges for one host"""
+
+    __slots__ = ('host', 'limit', 'slots', 'in_flight', 'peak_in_flight', 'requests',
+                 'errors', 'throttled', 'retries', 'statuses', 'buckets', 'total_ms', 'max_ms')
+
+    def __init__(self, host: str, limit: int):
+        self.host = host
+        self.limit = limit
+        self.slots = threading.BoundedSemaphore(limit)
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.requests = 0
+        self.errors = 0
+        self.throttled = 0
+        self.retries = 0
+        self.statuses: Dict[str, int] = {}
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        """Upper bound of the bucket holding the given fraction of requests"""
+        measured = sum(self.buckets)
+        if not measured:
+            return None
+        target = fraction * measured
+        running = 0
+        for index, count in enumerate(self.buckets):
+            running += count
+            if running >= target:
+                return LATENCY_BUCKETS_MS[index] if index < len(LATENCY_BUCKETS_MS) else round(self.max_ms, 1)
+        return round(self.max_ms, 1)
+
+    def to_dict(self) -> Dict[str, Any]:
+        measured = sum(self.buckets)
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'retries': self.retries,
+            'throttled': self.throttled,
+            'in_flight': self.in_flight,
+            'peak_in_flight': self.peak_in_flight,
+            'limit': self.limit,
+            'statuses': dict(self.statuses),
+            'avg_ms': round(self.total_ms / measured, 1) if measured else 0.0,
+            'p50_ms': self.percentile(0.5),
+            'p95_ms': self.percentile(0.95),
+            'max_ms': round(self.max_ms, 1),
+            'histogram_ms': {
+                (f"<={bound}" if index < len(LATENCY_BUCKETS_MS) else f">{LATENCY_BUCKETS_MS[-1]}"): count
+                for index, (bound, count) in enumerate(zip(LATENCY_BUCKETS_MS + (None,), self.buckets))
+            }
+        }
+
+
+class InstrumentedAdapter(HTTPAdapter):
+    """HTTPAdapter that enforces per-host limits and records latency"""
+
+    def __init__(self, client: 'HttpClient', **kwargs):
+        self.client = client
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        host = urlparse(request.url).hostname or 'unknown'
+        stats = self.client._host(host)
+
+        if not stats.slots.acquire(blocking=False):
+            with self.client._lock:
+                stats.throttled += 1
+            if not stats.slots.acquire(timeout=self.client.host_wait):
+                with self.client._lock:
+                    stats.errors += 1
+                raise HostBusyError(
+                    f"{host}: {stats.limit} requests already in flight, no slot within "
+                    f"{self.client.host_wait}s", request=request
+                )
+
+        with self.client._lock:
+            stats.in_flight += 1
+            stats.peak_in_flight = max(stats.peak_in_flight, stats.in_flight)
+
+        started = time.time()
+        response = None
+        try:
+            response = super().send(request, **kwargs)
+            return response
+        finally:
+            stats.slots.release()
+            self.client._record(stats, (time.time() - started) * 1000, response)
+
+
+class PooledSession(requests.Session):
+    """requests.Session that uses the client's shared adapters"""
+
+    def __init__(self, client: 'HttpClient'):
+        super().__init__()
+        self.client = client
+        self.adapters.clear()
+        adapter = client._adapter()
+        self.mount('https://', adapter)
+        self.mount('http://', adapter)
+
+    def close(self):
+        """Drop this session's cookies; the shared pools stay open"""
+        self.cookies.clear()
+
+
+class HttpClient:
+    """Process-wide pooled HTTP client with retries, host limits and latency stats"""
+
+    MAX_TRACKED_HOSTS = 512  # idle hosts beyond this are forgotten
+
+    def __init__(self, pool_connections: int = 32, pool_maxsize: int = 16, retries: int = 2,
+                 retry_backoff: float = 0.3, per_host_limit: int = 8, host_wait: float = 10,
+                 host_limits: Optional[Dict[str, int]] = None):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.retries = retries
+        self.retry_backoff = retry_backoff
+        self.per_host_limit = per_host_limit
+        self.host_wait = host_wait
+        self.host_limits = dict(host_limits or {})
+        self._lock = threading.Lock()
+        self._hosts: Dict[str, HostStats] = {}
+        self._adapter_instance: Optional[InstrumentedAdapter] = None
+        self._adapter_pid = None
+
+    # ------------------------------------------------------------------
+    # Requests
+    # ------------------------------------------------------------------
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Same signature as requests.request, over the shared pools"""
+        with PooledSession(self) as session:
+            return session.request(method, url, **kwargs)
+
+    def get(self, url: str, params=None, **kwargs) -> requests.Response:
+        return self.request('GET', url, params=params, **kwargs)
+
+    def post(self, url: str, data=None, json=None, **kwargs) -> requests.Response:
+        return self.request('POST', url, data=data, json=json, **kwargs)
+
+    def head(self, url: str, **kwargs) -> requests.Response:
+        kwargs.setdefault('allow_redirects', False)
+        return self.request('HEAD', url, **kwargs)
+
+    def session(self) -> PooledSession:
+        """A session with its own headers and cookie jar on the shared pools"""
+        return PooledSession(self)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _adapter(self) -> InstrumentedAdapter:
+        with self._lock:
+            if self._adapter_instance is None or self._adapter_pid != os.getpid():
+                retry = Retry(
+                    total=self.retries,
+                    connect=self.retries,
+                    read=0,
+                    status=self.retries,
+                    backoff_factor=self.retry_backoff,
+                    status_forcelist=RETRY_STATUSES,
+                    allowed_methods=IDEMPOTENT_METHODS,
+                    raise_on_status=False,
+                    respect_retry_after_header=False  # keep retries inside our deadlines
+                )
+                self._adapter_instance = InstrumentedAdapter(
+                    self,
+                    pool_connections=self.pool_connections,
+                    pool_maxsize=self.pool_maxsize,
+                    max_retries=retry
+                )
+                self._adapter_pid = os.getpid()
+            return self._adapter_instance
+
+    def _host(self, host: str) -> HostStats:
+        stats = self._hosts.get(host)
+        if stats is not None:
+            return stats
+
+        with self._lock:
+            stats = self._hosts.get(host)
+            if stats is None:
+                if len(self._hosts) >= self.MAX_TRACKED_HOSTS:
+                    for name in [name for name, entry in self._hosts.items() if entry.in_flight == 0]:
+                        del self._hosts[name]
+                stats = HostStats(host, self.host_limits.get(host, self.per_host_limit))
+                self._hosts[host] = stats
+            return stats
+
+    def _record(self, stats: HostStats, elapsed_ms: float, response: Optional[requests.Response]) -> None:
+        retries = 0
+        if response is not None:
+            history = getattr(getattr(response.raw, 'retries', None), 'history', None)
+            retries = len(history) if history else 0
+
+        with self._lock:
+            stats.in_flight -= 1
+            stats.requests += 1
+            stats.retries += retries
+            stats.total_ms += elapsed_ms
+            stats.max_ms = max(stats.max_ms, elapsed_ms)
+            stats.buckets[bisect.bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)] += 1
+            if response is None:
+                stats.errors += 1
+                status_class = 'error'
+            else:
+                status_class = f"{response.status_code // 100}xx"
+            stats.statuses[status_class] = stats.statuses.get(status_class, 0) + 1
+
+    def stats(self, top: int = 20) -> Dict[str, Any]:
+        """Totals plus per-host stats for the busiest hosts (for /health)"""
+        with self._lock:
+            hosts = sorted(self._hosts.values(), key=lambda entry: entry.requests, reverse=True)
+            totals = {
+                'requests': sum(entry.requests for entry in hosts),
+                'errors': sum(entry.errors for entry in hosts),
+                'retries': sum(entry.retries for entry in hosts),
+                'throttled': sum(entry.throttled for entry in hosts),
+                'in_flight': sum(entry.in_flight for entry in hosts)
+            }
+            per_host = {entry.host: entry.to_dict() for entry in hosts[:top]}
+
+        return {
+            **totals,
+            'hosts_tracked': len(hosts),
+            'pool_connections': self.pool_connections,
+            'pool_maxsize': self.pool_maxsize,
+            'retries_per_request': self.retries,
+            'per_host_limit': self.per_host_limit,
+            'pid': os.getpid(),
+            'hosts': per_host
+        }
+
+
+_client_lock = threading.Lock()
+_http_client: Optional[HttpClient] = None
+
+
+def get_http_client() -> HttpClient:
+    """Get the process-wide HTTP client (built from Config.HTTP)"""
+    global _http_client
+
+    if _http_client is not None:
+        return _http_client
+
+    with _client_lock:
+        if _http_client is not None:
+            return _http_client
+
+        try:
+            from config import Config
+            settings = dict(getattr(Config, 'HTTP', {}))
+        except Exception as e:
+            logger.warning(f"[HttpClient] ⚠ Config unavailable ({e}) - using defaults")
+            settings = {}
+
+        _http_client = HttpClient(**settings)
+        logger.info(f"[HttpClient] Initialized - pool_maxsize: {_http_client.pool_maxsize}, "
+                    f"retries: {_http_client.retries}, per_host_limit: {_http_client.per_host_limit}")
+
+        return _http_client
+
+
+# This file is not truncated
@@ -35,17 +35,19 @@ from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
-# Import OpenAI with FAST timeout checking
+# Import OpenAI with FAST timeout checking - calls go through the shared
+# LLM gateway (services/llm_gateway.py)
 try:
-    from openai import OpenAI
+    from services.llm_gateway import get_llm_client
     import httpx
     # OPTIMIZED v2.0: 8 second timeout for OpenAI calls
-    openai_client = OpenAI(
+    openai_client = get_llm_client(
+        'InsightGenerator',
         api_key=os.getenv('OPENAI_API_KEY'),
         timeout=httpx.Timeout(8.0, connect=3.0)  # 8s total, 3s connect
     )
-    OPENAI_AVAILABLE = True
-    logger.info("[InsightGenerator v2.0] OpenAI available (8s timeout)")
+    OPENAI_AVAILABLE = openai_client is not None
+    logger.info(f"[InsightGenerator v2.0] OpenAI available: {OPENAI_AVAILABLE} (8s timeout)")
 except Exception as e:
     openai_client = None
     OPENAI_AVAILABLE = False
@@ -0,0 +1,921 @@
+"""
+Background Job Queue
+Date: October 16, 2026
+Version: 1.0.0
+
+Durable job queue plus a bounded worker pool for long-running analyses.
+
+transcript_routes started a raw daemon Thread per upload. A burst of uploads
+meant an unbounded number of threads in one worker, and a job died with the
+worker that happened to start it (gunicorn recycles workers every
+max_requests=1000). Jobs are now enqueued, and a fixed number of worker
+threads per process dequeue them:
+
+  - Atomic enqueue / dequeue shared by every worker process (and instance)
+  - Priorities: higher priority first, FIFO within a priority
+  - Visibility timeout: a dequeued job is leased to one worker thread; the
+    pool heartbeats the lease while the handler runs. If the process dies,
+    the lease expires and another worker picks the job up again
+  - Retries: a handler exception re-queues the job with exponential backoff
+    (retry_backoff * 2^(attempt-1)) until max_attempts, then the job is
+    dead-lettered and the pool's on_dead hook runs
+  - Job state (progress / results JSON the status endpoints read) lives in
+    the same backend, so it survives restarts too
+
+Backends:
+  - RedisJobQueueBackend:  used when REDIS_URL is configured (multi-instance).
+                           Sorted sets for ready / delayed / leased jobs,
+                           Lua scripts make every transition atomic
+  - SQLiteJobQueueBackend: single file on local disk, WAL mode. Dequeue runs
+                           in a BEGIN IMMEDIATE transaction, so workers in
+                           different processes never claim the same job.
+                           Falls back to an in-memory database (jobs do not
+                           survive restarts) only if the file is unusable
+
+Queue metrics (depth, running, oldest wait, retries, dead letters) are kept in
+the backend, so /api/transcript/stats reports totals across all workers.
+
+Configuration (Config.JOB_QUEUE / environment):
+  JOB_QUEUE_BACKEND       auto | sqlite | redis (default: auto)
+  JOB_QUEUE_PATH          SQLite file (default: <tmp>/truthlens_jobs.sqlite3)
+  TRANSCRIPT_WORKERS      job threads per worker process (default: 2)
+  JOB_VISIBILITY_TIMEOUT  lease seconds without a heartbeat (default: 300)
+  JOB_MAX_ATTEMPTS        attempts before dead-lettering (default: 3)
+  JOB_RETRY_BACKOFF       first retry delay in seconds (default: 15)
+  JOB_RETENTION           seconds finished jobs and job state are kept (default: 86400)
+
+USAGE:
+    from services.job_queue import get_job_queue, JobWorkerPool
+
+    queue = get_job_queue('transcript')
+    pool = JobWorkerPool(queue, handler, concurrency=2)
+
+    queue.enqueue({'transcript': text}, job_id=job_id)
+    pool.ensure_started()
+    pool.notify()
+"""
+
+import os
+import json
+import time
+import uuid
+import socket
+import sqlite3
+import logging
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, List, Tuple, Callable
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_LOW = -10
+PRIORITY_NORMAL = 0
+PRIORITY_HIGH = 10
+
+JOB_STATUSES = ('queued', 'running', 'completed', 'dead')
+
+
+class QueuedJob:
+    """One dequeued job (payload plus the bookkeeping the pool needs)"""
+
+    __slots__ = ('id', 'queue', 'payload', 'priority', 'attempts', 'max_attempts',
+                 'enqueued_at', 'worker', 'last_error')
+
+    def __init__(self, id: str, queue: str, payload: Dict[str, Any], priority: int = PRIORITY_NORMAL,
+                 attempts: int = 0, max_attempts: int = 1, enqueued_at: float = 0.0,
+                 worker: Optional[str] = None, last_error: Optional[str] = None):
+        self.id = id
+        self.queue = queue
+        self.payload = payload
+        self.priority = priority
+        self.attempts = attempts
+        self.max_attempts = max_attempts
+        self.enqueued_at = enqueued_at
+        self.worker = worker
+        self.last_error = last_error
+
+    @property
+    def final_attempt(self) -> bool:
+        return self.attempts >= self.max_attempts
+
+    def __repr__(self) -> str:
+        return f"QueuedJob({self.queue}:{self.id}, attempt {self.attempts}/{self.max_attempts})"
+
+
+# ============================================================================
+# SQLITE BACKEND
+# ============================================================================
+
+class SQLiteJobQueueBackend:
+    """
+    SQLite file shared by all workers on this host
+
+    Connections are opened lazily per process (gunicorn preloads the app and
+    forks, and a SQLite connection must never cross a fork).
+    """
+
+    name = 'sqlite'
+    PURGE_INTERVAL = 300  # seconds between retention sweeps
+
+    def __init__(self, path: str, retention: int):
+        self.path = path
+        self.retention = retention
+        self._lock = threading.Lock()
+        self._conn = None
+        self._conn_pid = None
+        self._last_purge = 0.0
+
+    @property
+    def durable(self) -> bool:
+        return self.path != ':memory:'
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None or self._conn_pid != os.getpid():
+            # isolation_level=None: transactions are explicit (BEGIN IMMEDIATE)
+            conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False, isolation_level=None)
+            if self.durable:
+                conn.execute('PRAGMA journal_mode=WAL')
+                conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS jobs ('
+                ' id TEXT PRIMARY KEY,'
+                ' queue TEXT NOT NULL,'
+                ' priority INTEGER NOT NULL,'
+                ' payload TEXT NOT NULL,'
+                ' status TEXT NOT NULL,'
+                ' attempts INTEGER NOT NULL DEFAULT 0,'
+                ' max_attempts INTEGER NOT NULL,'
+                ' available_at REAL NOT NULL,'
+                ' lease_expires REAL,'
+                ' worker TEXT,'
+                ' enqueued_at REAL NOT NULL,'
+                ' started_at REAL,'
+                ' finished_at REAL,'
+                ' last_error TEXT)'
+            )
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_jobs_ready '
+                         'ON jobs(queue, status, priority DESC, available_at)')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_jobs_lease ON jobs(queue, status, lease_expires)')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS job_queue_stats ('
+                ' queue TEXT NOT NULL,'
+                ' name TEXT NOT NULL,'
+                ' value REAL NOT NULL,'
+                ' PRIMARY KEY (queue, name))'
+            )
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS job_state ('
+                ' id TEXT PRIMARY KEY,'
+                ' data TEXT NOT NULL,'
+                ' expires_at REAL NOT NULL)'
+            )
+            self._conn = conn
+            self._conn_pid = os.getpid()
+        return self._conn
+
+    @contextmanager
+    def _transaction(self):
+        with self._lock:
+            conn = self._connection()
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                yield conn
+            except BaseException:
+                conn.execute('ROLLBACK')
+                raise
+            conn.execute('COMMIT')
+
+    @staticmethod
+    def _incr(conn: sqlite3.Connection, queue: str, name: str, amount: float = 1) -> None:
+        conn.execute(
+            'INSERT INTO job_queue_stats (queue, name, value) VALUES (?, ?, ?) '
+            'ON CONFLICT(queue, name) DO UPDATE SET value = value + excluded.value',
+            (queue, name, amount)
+        )
+
+    @staticmethod
+    def _job(row: Tuple) -> QueuedJob:
+        job_id, queue, priority, payload, attempts, max_attempts, enqueued_at, worker, last_error = row
+        return QueuedJob(job_id, queue, json.loads(payload), priority, attempts, max_attempts,
+                         enqueued_at, worker, last_error)
+
+    JOB_COLUMNS = 'id, queue, priority, payload, attempts, max_attempts, enqueued_at, worker, last_error'
+
+    def enqueue(self, queue: str, job_id: str, payload: str, priority: int, max_attempts: int,
+                now: float) -> None:
+        with self._transaction() as conn:
+            conn.execute(
+                'INSERT INTO jobs (id, queue, priority, payload, status, attempts, max_attempts,'
+                ' available_at, enqueued_at) VALUES (?, ?, ?, ?, ?, 0, ?, ?, ?)',
+                (job_id, queue, priority, payload, 'queued', max_attempts, now, now)
+            )
+            self._incr(conn, queue, 'enqueued')
+
+    def dequeue(self, queue: str, worker: str, visibility_timeout: float,
+                now: float) -> Tuple[Optional[QueuedJob], List[QueuedJob]]:
+        with self._transaction() as conn:
+            # Leases that expired without a heartbeat: dead-letter or re-queue
+            dead = [self._job(row) for row in conn.execute(
+                f'SELECT {self.JOB_COLUMNS} FROM jobs WHERE queue = ? AND status = ?'
+                ' AND lease_expires < ? AND attempts >= max_attempts',
+                (queue, 'running', now)
+            ).fetchall()]
+            if dead:
+                conn.executemany(
+                    'UPDATE jobs SET status = ?, finished_at = ?, lease_expires = NULL,'
+                    ' last_error = ? WHERE id = ?',
+                    [('dead', now, 'Visibility timeout expired', job.id) for job in dead]
+                )
+                self._incr(conn, queue, 'dead', len(dead))
+
+            reclaimed = conn.execute(
+                'UPDATE jobs SET status = ?, worker = NULL, lease_expires = NULL'
+                ' WHERE queue = ? AND status = ? AND lease_expires < ?',
+                ('queued', queue, 'running', now)
+            ).rowcount
+            if reclaimed:
+                self._incr(conn, queue, 'reclaimed', reclaimed)
+
+            row = conn.execute(
+                f'SELECT {self.JOB_COLUMNS}, available_at FROM jobs'
+                ' WHERE queue = ? AND status = ? AND available_at <= ?'
+                ' ORDER BY priority DESC, available_at ASC LIMIT 1',
+                (queue, 'queued', now)
+            ).fetchone()
+            if row is None:
+                return None, dead
+
+            job = self._job(row[:-1])
+            job.attempts += 1
+            job.worker = worker
+            conn.execute(
+                'UPDATE jobs SET status = ?, attempts = ?, worker = ?, started_at = ?,'
+                ' lease_expires = ? WHERE id = ?',
+                ('running', job.attempts, worker, now, now + visibility_timeout, job.id)
+            )
+            self._incr(conn, queue, 'started')
+            self._incr(conn, queue, 'wait_seconds', now - row[-1])
+            return job, dead
+
+    def heartbeat(self, job_id: str, worker: str, lease_expires: float) -> bool:
+        with self._transaction() as conn:
+            return conn.execute(
+                'UPDATE jobs SET lease_expires = ? WHERE id = ? AND worker = ? AND status = ?',
+                (lease_expires, job_id, worker, 'running')
+            ).rowcount > 0
+
+    def complete(self, queue: str, job_id: str, worker: str, now: float) -> bool:
+        with self._transaction() as conn:
+            updated = conn.execute(
+                'UPDATE jobs SET status = ?, finished_at = ?, lease_expires = NULL'
+                ' WHERE id = ? AND worker = ? AND status = ?',
+                ('completed', now, job_id, worker, 'running')
+            ).rowcount
+            if updated:
+                self._incr(conn, queue, 'completed')
+            self._maybe_purge(conn, now)
+            return updated > 0
+
+    def fail(self, queue: str, job_id: str, worker: str, error: str, retry_delay: float, now: float) -> str:
+        with self._transaction() as conn:
+            row = conn.execute(
+                'SELECT attempts, max_attempts FROM jobs WHERE id = ? AND worker = ? AND status = ?',
+                (job_id, worker, 'running')
+            ).fetchone()
+            if row is None:
+                return 'lost'  # Lease expired and someone else owns the job now
+
+            self._incr(conn, queue, 'failed_attempts')
+            attempts, max_attempts = row
+            if attempts < max_attempts:
+                conn.execute(
+                    'UPDATE jobs SET status = ?, available_at = ?, worker = NULL, lease_expires = NULL,'
+                    ' last_error = ? WHERE id = ?',
+                    ('queued', now + retry_delay, error, job_id)
+                )
+                self._incr(conn, queue, 'retried')
+                return 'retry'
+
+            conn.execute(
+                'UPDATE jobs SET status = ?, finished_at = ?, lease_expires = NULL, last_error = ? WHERE id = ?',
+                ('dead', now, error, job_id)
+            )
+            self._incr(conn, queue, 'dead')
+            return 'dead'
+
+    def _maybe_purge(self, conn: sqlite3.Connection, now: float) -> None:
+        if now - self._last_purge < self.PURGE_INTERVAL:
+            return
+        self._last_purge = now
+        conn.execute('DELETE FROM jobs WHERE status IN (?, ?) AND finished_at < ?',
+                     ('completed', 'dead', now - self.retention))
+        conn.execute('DELETE FROM job_state WHERE expires_at < ?', (now,))
+
+    def job_info(self, queue: str, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                'SELECT status, priority, attempts, max_attempts, available_at, enqueued_at,'
+                ' started_at, finished_at, last_error FROM jobs WHERE id = ? AND queue = ?',
+                (job_id, queue)
+            ).fetchone()
+            if row is None:
+                return None
+
+            info = dict(zip(('status', 'priority', 'attempts', 'max_attempts', 'available_at',
+                             'enqueued_at', 'started_at', 'finished_at', 'last_error'), row))
+            if info['status'] == 'queued':
+                info['jobs_ahead'] = conn.execute(
+                    'SELECT COUNT(*) FROM jobs WHERE queue = ? AND status = ? AND'
+                    ' (priority > ? OR (priority = ? AND available_at < ?))',
+                    (queue, 'queued', info['priority'], info['priority'], info['available_at'])
+                ).fetchone()[0]
+            return info
+
+    def stats(self, queue: str, now: float) -> Dict[str, Any]:
+        with self._lock:
+            conn = self._connection()
+            stats = {status: 0 for status in JOB_STATUSES}
+            stats.update(dict(conn.execute(
+                'SELECT status, COUNT(*) FROM jobs WHERE queue = ? GROUP BY status', (queue,)
+            ).fetchall()))
+            stats['delayed'] = conn.execute(
+                'SELECT COUNT(*) FROM jobs WHERE queue = ? AND status = ? AND available_at > ?',
+                (queue, 'queued', now)
+            ).fetchone()[0]
+            oldest = conn.execute(
+                'SELECT MIN(available_at) FROM jobs WHERE queue = ? AND status = ? AND available_at <= ?',
+                (queue, 'queued', now)
+            ).fetchone()[0]
+            stats['oldest_queued_seconds'] = round(now - oldest, 1) if oldest else 0.0
+            counters = dict(conn.execute(
+                'SELECT name, value FROM job_queue_stats WHERE queue = ?', (queue,)
+            ).fetchall())
+        stats['counters'] = counters
+        stats['path'] = self.path
+        return stats
+
+    # ------------------------------------------------------------------
+    # Job state (progress / results read by the status endpoints)
+    # ------------------------------------------------------------------
+
+    def save_state(self, key: str, data: str, ttl: int) -> None:
+        with self._lock:
+            conn = self._connection()
+            conn.execute('INSERT OR REPLACE INTO job_state (id, data, expires_at) VALUES (?, ?, ?)',
+                         (key, data, time.time() + ttl))
+
+    def load_state(self, key: str) -> Optional[str]:
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute('SELECT data FROM job_state WHERE id = ? AND expires_at >= ?',
+                               (key, time.time())).fetchone()
+        return row[0] if row else None
+
+    def delete_state(self, key: str) -> None:
+        with self._lock:
+            self._connection().execute('DELETE FROM job_state WHERE id = ?', (key,))
+
+
+# ============================================================================
+# REDIS BACKEND
+# ============================================================================
+
+# KEYS: ready, delayed, leases, stats
+# ARGV: now, worker, visibility_timeout, job key prefix, retention
+# Returns {dequeued id or '', dead-lettered ids...}
+REDIS_DEQUEUE = """
+local now = tonumber(ARGV[1])
+local due = redis.call('ZRANGEBYSCORE', KEYS[2], '-inf', now, 'LIMIT', 0, 100)
+for _, id in ipairs(due) do
+  redis.call('ZREM', KEYS[2], id)
+  local rank = redis.call('HGET', ARGV[4] .. id, 'rank')
+  if rank then redis.call('ZADD', KEYS[1], rank, id) end
+end
+local result = {''}
+local expired = redis.call('ZRANGEBYSCORE', KEYS[3], '-inf', now, 'LIMIT', 0, 100)
+for _, id in ipairs(expired) do
+  redis.call('ZREM', KEYS[3], id)
+  local key = ARGV[4] .. id
+  if redis.call('EXISTS', key) == 1 then
+    local attempts = tonumber(redis.call('HGET', key, 'attempts') or '0')
+    local max_attempts = tonumber(redis.call('HGET', key, 'max_attempts') or '1')
+    if attempts >= max_attempts then
+      redis.call('HSET', key, 'status', 'dead', 'finished_at', ARGV[1], 'last_error', 'Visibility timeout expired')
+      redis.call('EXPIRE', key, ARGV[5])
+      redis.call('HINCRBY', KEYS[4], 'dead', 1)
+      table.insert(result, id)
+    else
+      redis.call('HSET', key, 'status', 'queued')
+      redis.call('ZADD', KEYS[1], redis.call('HGET', key, 'rank'), id)
+      redis.call('HINCRBY', KEYS[4], 'reclaimed', 1)
+    end
+  end
+end
+local popped = redis.call('ZPOPMIN', KEYS[1])
+if popped[1] then
+  local id = popped[1]
+  local key = ARGV[4] .. id
+  local lease = now + tonumber(ARGV[3])
+  redis.call('HINCRBY', key, 'attempts', 1)
+  redis.call('HSET', key, 'status', 'running', 'worker', ARGV[2], 'started_at', ARGV[1],
+             'lease_expires', tostring(lease))
+  redis.call('ZADD', KEYS[3], lease, id)
+  redis.call('HINCRBY', KEYS[4], 'started', 1)
+  local available = tonumber(redis.call('HGET', key, 'available_at') or ARGV[1])
+  redis.call('HINCRBYFLOAT', KEYS[4], 'wait_seconds', now - available)
+  result[1] = id
+end
+return result
+"""
+
+# KEYS: leases ; ARGV: job key, id, worker, lease_expires
+REDIS_HEARTBEAT = """
+if redis.call('HGET', ARGV[1], 'worker') ~= ARGV[3] or redis.call('HGET', ARGV[1], 'status') ~= 'running' then
+  return 0
+end
+redis.call('HSET', ARGV[1], 'lease_expires', ARGV[4])
+redis.call('ZADD', KEYS[1], ARGV[4], ARGV[2])
+return 1
+"""
+
+# KEYS: leases, stats ; ARGV: job key, id, worker, now, retention
+REDIS_COMPLETE = """
+if redis.call('HGET', ARGV[1], 'worker') ~= ARGV[3] or redis.call('HGET', ARGV[1], 'status') ~= 'running' then
+  return 0
+end
+redis.call('ZREM', KEYS[1], ARGV[2])
+redis.call('HSET', ARGV[1], 'status', 'completed', 'finished_at', ARGV[4])
+redis.call('EXPIRE', ARGV[1], ARGV[5])
+redis.call('HINCRBY', KEYS[2], 'completed', 1)
+return 1
+"""
+
+# KEYS: leases, delayed, stats ; ARGV: job key, id, worker, now, retry_delay, error, retention
+REDIS_FAIL = """
+if redis.call('HGET', ARGV[1], 'worker') ~= ARGV[3] or redis.call('HGET', ARGV[1], 'status') ~= 'running' then
+  return 'lost'
+end
+redis.call('ZREM', KEYS[1], ARGV[2])
+redis.call('HINCRBY', KEYS[3], 'failed_attempts', 1)
+local attempts = tonumber(redis.call('HGET', ARGV[1], 'attempts'))
+local max_attempts = tonumber(redis.call('HGET', ARGV[1], 'max_attempts'))
+if attempts < max_attempts then
+  local available = tonumber(ARGV[4]) + tonumber(ARGV[5])
+  redis.call('HSET', ARGV[1], 'status', 'queued', 'last_error', ARGV[6], 'available_at', tostring(available))
+  redis.call('ZADD', KEYS[2], available, ARGV[2])
+  redis.call('HINCRBY', KEYS[3], 'retried', 1)
+  return 'retry'
+end
+redis.call('HSET', ARGV[1], 'status', 'dead', 'last_error', ARGV[6], 'finished_at', ARGV[4])
+redis.call('EXPIRE', ARGV[1], ARGV[7])
+redis.call('HINCRBY', KEYS[3], 'dead', 1)
+return 'dead'
+"""
+
+
+class RedisJobQueueBackend:
+    """
+    Redis-backed queue shared across workers and instances
+
+    Per queue: a 'ready' sorted set (score = rank: priority, then enqueue
+    time), a 'delayed' set for retries waiting out their backoff, a 'leases'
+    set scored by lease expiry, and a stats hash. Each job is a hash.
+    """
+
+    name = 'redis'
+    durable = True
+    PREFIX = 'job_queue:'
+
+    def __init__(self, client: Any, retention: int):
+        self.client = client
+        self.retention = retention
+        self._dequeue = client.register_script(REDIS_DEQUEUE)
+        self._heartbeat = client.register_script(REDIS_HEARTBEAT)
+        self._complete = client.register_script(REDIS_COMPLETE)
+        self._fail = client.register_script(REDIS_FAIL)
+
+    def _keys(self, queue: str) -> Dict[str, str]:
+        base = f"{self.PREFIX}{queue}:"
+        return {name: base + name for name in ('ready', 'delayed', 'leases', 'stats')}
+
+    def _job_key(self, job_id: str) -> str:
+        return f"{self.PREFIX}job:{job_id}"
+
+    @staticmethod
+    def _rank(priority: int, now: float) -> float:
+        # Higher priority first, then FIFO (ms precision is exact in a double)
+        return -priority * 1e13 + int(now * 1000)
+
+    def _load_job(self, job_id: str) -> Optional[QueuedJob]:
+        data = self.client.hgetall(self._job_key(job_id))
+        if not data:
+            return None
+        return QueuedJob(
+            job_id, data.get('queue', ''), json.loads(data.get('payload', '{}')),
+            int(data.get('priority', 0)), int(data.get('attempts', 0)),
+            int(data.get('max_attempts', 1)), float(data.get('enqueued_at', 0)),
+            data.get('worker'), data.get('last_error')
+        )
+
+    def enqueue(self, queue: str, job_id: str, payload: str, priority: int, max_attempts: int,
+                now: float) -> None:
+        keys = self._keys(queue)
+        rank = self._rank(priority, now)
+        pipe = self.client.pipeline(transaction=True)
+        pipe.hset(self._job_key(job_id), mapping={
+            'queue': queue,
+            'payload': payload,
+            'priority': priority,
+            'rank': repr(rank),
+            'status': 'queued',
+            'attempts': 0,
+            'max_attempts': max_attempts,
+            'available_at': repr(now),
+            'enqueued_at': repr(now)
+        })
+        pipe.zadd(keys['ready'], {job_id: rank})
+        pipe.hincrby(keys['stats'], 'enqueued', 1)
+        pipe.execute()
+
+    def dequeue(self, queue: str, worker: str, visibility_timeout: float,
+                now: float) -> Tuple[Optional[QueuedJob], List[QueuedJob]]:
+        keys = self._keys(queue)
+        result = self._dequeue(
+            keys=[keys['ready'], keys['delayed'], keys['leases'], keys['stats']],
+            args=[repr(now), worker, visibility_timeout, self._job_key(''), self.retention]
+        )
+        job_id, dead_ids = result[0], result[1:]
+        dead = [job for job in (self._load_job(dead_id) for dead_id in dead_ids) if job]
+        job = self._load_job(job_id) if job_id else None
+        return job, dead
+
+    def heartbeat(self, job_id: str, worker: str, lease_expires: float) -> bool:
+        queue = self.client.hget(self._job_key(job_id), 'queue') or ''
+        return bool(self._heartbeat(
+            keys=[self._keys(queue)['leases']],
+            args=[self._job_key(job_id), job_id, worker, repr(lease_expires)]
+        ))
+
+    def complete(self, queue: str, job_id: str, worker: str, now: float) -> bool:
+        keys = self._keys(queue)
+        return bool(self._complete(
+            keys=[keys['leases'], keys['stats']],
+            args=[self._job_key(job_id), job_id, worker, repr(now), self.retention]
+        ))
+
+    def fail(self, queue: str, job_id: str, worker: str, error: str, retry_delay: float, now: float) -> str:
+        keys = self._keys(queue)
+        return self._fail(
+            keys=[keys['leases'], keys['delayed'], keys['stats']],
+            args=[self._job_key(job_id), job_id, worker, repr(now), retry_delay, error[:1000], self.retention]
+        )
+
+    def job_info(self, queue: str, job_id: str) -> Optional[Dict[str, Any]]:
+        data = self.client.hgetall(self._job_key(job_id))
+        if not data:
+            return None
+
+        info = {
+            'status': data.get('status'),
+            'priority': int(data.get('priority', 0)),
+            'attempts': int(data.get('attempts', 0)),
+            'max_attempts': int(data.get('max_attempts', 1)),
+            'enqueued_at': float(data.get('enqueued_at', 0)),
+            'started_at': float(data['started_at']) if data.get('started_at') else None,
+            'finished_at': float(data['finished_at']) if data.get('finished_at') else None,
+            'last_error': data.get('last_error')
+        }
+        if info['status'] == 'queued':
+            position = self.client.zrank(self._keys(queue)['ready'], job_id)
+            info['jobs_ahead'] = position if position is not None else 0
+        return info
+
+    def stats(self, queue: str, now: float) -> Dict[str, Any]:
+        keys = self._keys(queue)
+        pipe = self.client.pipeline(transaction=False)
+        pipe.zcard(keys['ready'])
+        pipe.zcard(keys['delayed'])
+        pipe.zcard(keys['leases'])
+        pipe.hgetall(keys['stats'])
+        pipe.zrange(keys['ready'], 0, 99)
+        ready, delayed, running, counters, head = pipe.execute()
+
+        oldest = None
+        if head:
+            pipe = self.client.pipeline(transaction=False)
+            for job_id in head:
+                pipe.hget(self._job_key(job_id), 'available_at')
+            available = [float(value) for value in pipe.execute() if value]
+            oldest = min(available) if available else None
+
+        counters = {name: float(value) for name, value in counters.items()}
+        return {
+            'queued': ready + delayed,
+            'delayed': delayed,
+            'running': running,
+            'completed': int(counters.get('completed', 0)),
+            'dead': int(counters.get('dead', 0)),
+            'oldest_queued_seconds': round(now - oldest, 1) if oldest else 0.0,
+            'counters': counters
+        }
+
+    def save_state(self, key: str, data: str, ttl: int) -> None:
+        self.client.setex(key, ttl, data)
+
+    def load_state(self, key: str) -> Optional[str]:
+        return self.client.get(key)
+
+    def delete_state(self, key: str) -> None:
+        self.client.delete(key)
+
+
+# ============================================================================
+# QUEUE + WORKER POOL
+# ============================================================================
+
+class JobQueue:
+    """One named queue on a shared backend"""
+
+    def __init__(self, name: str, backend: Any, visibility_timeout: float = 300, max_attempts: int = 3,
+                 retry_backoff: float = 15, retention: int = 86400):
+        self.name = name
+        self.backend = backend
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self.retention = retention
+        # Job state keys - 'transcript_job:<id>' is what transcript_routes has always used in Redis
+        self.state_prefix = f"{name}_job:"
+
+    @property
+    def backend_name(self) -> str:
+        return self.backend.name if getattr(self.backend, 'durable', True) else f"{self.backend.name}-memory"
+
+    def enqueue(self, payload: Dict[str, Any], priority: int = PRIORITY_NORMAL, job_id: Optional[str] = None,
+                max_attempts: Optional[int] = None) -> str:
+        """Add a job; returns its id"""
+        job_id = job_id or str(uuid.uuid4())
+        self.backend.enqueue(self.name, job_id, json.dumps(payload, default=str), priority,
+                             max_attempts or self.max_attempts, time.time())
+        return job_id
+
+    def dequeue(self, worker: str) -> Tuple[Optional[QueuedJob], List[QueuedJob]]:
+        """
+        Lease the next ready job to a worker
+
+        Returns:
+            (job or None, jobs dead-lettered because their lease expired on
+            the final attempt)
+        """
+        return self.backend.dequeue(self.name, worker, self.visibility_timeout, time.time())
+
+    def heartbeat(self, job: QueuedJob) -> bool:
+        """Extend a lease; False if the job is no longer ours"""
+        return self.backend.heartbeat(job.id, job.worker, time.time() + self.visibility_timeout)
+
+    def complete(self, job: QueuedJob) -> bool:
+        return self.backend.complete(self.name, job.id, job.worker, time.time())
+
+    def fail(self, job: QueuedJob, error: str) -> str:
+        """Record a failed attempt: 'retry', 'dead' or 'lost' (lease taken over)"""
+        retry_delay = self.retry_backoff * (2 ** max(job.attempts - 1, 0))
+        return self.backend.fail(self.name, job.id, job.worker, error, retry_delay, time.time())
+
+    def job_info(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Queue-side view of one job (status, attempts, jobs_ahead when queued)"""
+        try:
+            return self.backend.job_info(self.name, job_id)
+        except Exception as e:
+            logger.warning(f"[JobQueue:{self.name}] Job info failed ({self.backend.name}): {e}")
+            return None
+
+    def stats(self) -> Dict[str, Any]:
+        """Depth, running jobs, oldest wait and lifetime counters (all workers)"""
+        try:
+            stats = self.backend.stats(self.name, time.time())
+        except Exception as e:
+            return {'backend': self.backend_name, 'error': str(e)}
+
+        counters = stats.get('counters', {})
+        started = counters.get('started', 0)
+        stats['avg_wait_seconds'] = round(counters.get('wait_seconds', 0) / started, 2) if started else 0.0
+        stats['counters'] = {name: int(value) for name, value in counters.items() if name != 'wait_seconds'}
+        stats['backend'] = self.backend_name
+        stats['visibility_timeout'] = self.visibility_timeout
+        stats['max_attempts'] = self.max_attempts
+        return stats
+
+    # Job state --------------------------------------------------------
+
+    def save_state(self, job_id: str, data: Dict[str, Any]) -> None:
+        self.backend.save_state(self.state_prefix + job_id, json.dumps(data, default=str), self.retention)
+
+    def load_state(self, job_id: str) -> Optional[Dict[str, Any]]:
+        payload = self.backend.load_state(self.state_prefix + job_id)
+        return json.loads(payload) if payload else None
+
+    def delete_state(self, job_id: str) -> None:
+        self.backend.delete_state(self.state_prefix + job_id)
+
+
+class JobWorkerPool:
+    """
+    Fixed number of worker threads per process draining one queue
+
+    handler(job) runs the job; an exception counts as a failed attempt.
+    on_dead(job, error) runs once a job is dead-lettered (final attempt
+    failed, or its lease expired on the final attempt).
+
+    Threads start lazily per process (ensure_started), so nothing crosses a
+    gunicorn fork.
+    """
+
+    def __init__(self, queue: JobQueue, handler: Callable[[QueuedJob], Any], concurrency: int = 2,
+                 poll_interval: float = 1.0, on_dead: Optional[Callable[[QueuedJob, str], Any]] = None):
+        self.queue = queue
+        self.handler = handler
+        self.concurrency = max(1, concurrency)
+        self.poll_interval = poll_interval
+        self.on_dead = on_dead
+        self._lock = threading.Lock()
+        self._pid = None
+        self._wake = threading.Event()
+        self._running: Dict[str, QueuedJob] = {}
+        self._counters = {'processed': 0, 'succeeded': 0, 'failed_attempts': 0, 'dead': 0}
+
+    def ensure_started(self) -> None:
+        """Start the worker threads in this process (no-op once running)"""
+        if self._pid == os.getpid():
+            return
+
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+
+            self._pid = os.getpid()
+            self._wake = threading.Event()
+            self._running = {}
+            prefix = f"{socket.gethostname()}-{self._pid}"
+
+            for index in range(self.concurrency):
+                threading.Thread(
+                    target=self._worker_loop, args=(f"{prefix}-{index}",),
+                    name=f"{self.queue.name}-worker-{index}", daemon=True
+                ).start()
+            threading.Thread(target=self._heartbeat_loop, name=f"{self.queue.name}-heartbeat",
+                             daemon=True).start()
+
+            logger.info(f"[JobWorkerPool:{self.queue.name}] ✓ Started {self.concurrency} workers "
+                        f"(pid {self._pid}, backend: {self.queue.backend_name})")
+
+    def notify(self) -> None:
+        """Wake idle workers (a job was just enqueued)"""
+        self._wake.set()
+
+    def _worker_loop(self, worker: str) -> None:
+        while True:
+            try:
+                job, dead = self.queue.dequeue(worker)
+            except Exception as e:
+                logger.error(f"[JobWorkerPool:{self.queue.name}] ✗ Dequeue failed: {e}")
+                time.sleep(self.poll_interval * 5)
+                continue
+
+            for dead_job in dead:
+                self._dead(dead_job, dead_job.last_error or 'Visibility timeout expired')
+
+            if job is None:
+                if self._wake.wait(self.poll_interval):
+                    self._wake.clear()
+                continue
+
+            self._run(job)
+
+    def _run(self, job: QueuedJob) -> None:
+        with self._lock:
+            self._running[job.id] = job
+
+        try:
+            self.handler(job)
+        except Exception as e:
+            error = str(e) or type(e).__name__
+            outcome = self._safe(self.queue.fail, job, error)
+            with self._lock:
+                self._counters['processed'] += 1
+                self._counters['failed_attempts'] += 1
+            logger.warning(f"[JobWorkerPool:{self.queue.name}] ⚠ {job} failed ({outcome}): {error}")
+            if outcome == 'dead':
+                self._dead(job, error)
+        else:
+            self._safe(self.queue.complete, job)
+            with self._lock:
+                self._counters['processed'] += 1
+                self._counters['succeeded'] += 1
+        finally:
+            with self._lock:
+                self._running.pop(job.id, None)
+
+    def _dead(self, job: QueuedJob, error: str) -> None:
+        with self._lock:
+            self._counters['dead'] += 1
+        logger.error(f"[JobWorkerPool:{self.queue.name}] ✗ {job} dead-lettered: {error}")
+        if self.on_dead:
+            self._safe(self.on_dead, job, error)
+
+    def _heartbeat_loop(self) -> None:
+        interval = max(self.queue.visibility_timeout / 3, 1)
+        while True:
+            time.sleep(interval)
+            with self._lock:
+                running = list(self._running.values())
+            for job in running:
+                if self._safe(self.queue.heartbeat, job) is False:
+                    logger.warning(f"[JobWorkerPool:{self.queue.name}] ⚠ Lost lease on {job}")
+
+    def _safe(self, func: Callable, *args) -> Any:
+        try:
+            return func(*args)
+        except Exception as e:
+            logger.error(f"[JobWorkerPool:{self.queue.name}] ✗ {func.__name__} failed: {e}")
+            return None
+
+    def stats(self) -> Dict[str, Any]:
+        """This process's workers (queue-wide numbers come from JobQueue.stats)"""
+        with self._lock:
+            stats = dict(self._counters)
+            stats['busy'] = len(self._running)
+        stats['workers'] = self.concurrency if self._pid == os.getpid() else 0
+        stats['pid'] = os.getpid()
+        return stats
+
+
+# ============================================================================
+# FACTORY
+# ============================================================================
+
+_queue_lock = threading.Lock()
+_backend = None
+_queues: Dict[str, JobQueue] = {}
+
+
+def _build_backend(settings: Dict[str, Any]) -> Any:
+    backend_name = settings.get('backend', 'auto')
+    retention = settings.get('retention', 86400)
+
+    if backend_name in ('auto', 'redis'):
+        from services.redis_client import get_redis_client
+        client = get_redis_client()
+        if client:
+            try:
+                return RedisJobQueueBackend(client, retention)
+            except Exception as e:
+                logger.error(f"[JobQueue] Redis backend unavailable: {e}")
+        if backend_name == 'redis':
+            logger.warning("[JobQueue] Redis requested but unavailable - using SQLite backend")
+
+    path = settings.get('path') or os.path.join(tempfile.gettempdir(), 'truthlens_jobs.sqlite3')
+    try:
+        backend = SQLiteJobQueueBackend(path, retention)
+        backend.stats('_probe', time.time())  # Fail fast if the file is unusable
+        return backend
+    except Exception as e:
+        logger.error(f"[JobQueue] SQLite backend unavailable ({path}): {e}")
+        logger.error("[JobQueue] ✗ Falling back to an in-memory queue - jobs will NOT survive restarts")
+        return SQLiteJobQueueBackend(':memory:', retention)
+
+
+def get_job_queue(name: str) -> JobQueue:
+    """Get the process-wide queue with this name (built from Config.JOB_QUEUE)"""
+    queue = _queues.get(name)
+    if queue is not None:
+        return queue
+
+    global _backend
+    with _queue_lock:
+        queue = _queues.get(name)
+        if queue is not None:
+            return queue
+
+        from config import Config
+        settings = getattr(Config, 'JOB_QUEUE', {})
+
+        if _backend is None:
+            _backend = _build_backend(settings)
+
+        queue = JobQueue(
+            name, _backend,
+            visibility_timeout=settings.get('visibility_timeout', 300),
+            max_attempts=settings.get('max_attempts', 3),
+            retry_backoff=settings.get('retry_backoff', 15),
+            retention=settings.get('retention', 86400)
+        )
+        _queues[name] = queue
+        logger.info(f"[JobQueue] Initialized '{name}' - backend: {queue.backend_name}, "
+                    f"visibility: {queue.visibility_timeout}s, max attempts: {queue.max_attempts}")
+
+        return queue
+
+
+# This file is not truncated
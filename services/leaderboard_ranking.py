@@ -0,0 +1,282 @@
+"""
+Leaderboard Ranking
+Date: October 16, 2026
+Version: 1.0.0
+
+Incremental, rank-on-read quiz leaderboards.
+
+quiz_routes.update_leaderboard used to commit the user's entry, then load
+every LeaderboardEntry of the quiz, rewrite every rank and commit again - an
+O(N) read and write per /submit that serialized submits on popular quizzes.
+
+Now ranks are never stored. Each worker keeps an order-statistic view per
+quiz: a sorted list of (-score, achieved_at, entry_id) keys loaded from the
+(quiz_id, score) index, plus the entry rows.
+  - Rank lookup: bisect on the sorted keys - O(log N)
+  - Top-K: first K keys, the payload memoized until the next change
+  - Submit: the route writes only the user's row, then record() moves that
+    one key in this worker's view
+
+Other workers learn about a write through a per-quiz generation counter in
+Redis (one INCR per write, one GET per read). Without Redis each view is
+reloaded after refresh_seconds, so other workers lag at most that long - the
+worker that handled the submit is always exact.
+
+Ties rank by achieved_at (earlier first), then entry id, the same order the
+old full re-rank used.
+
+Configuration (Config.LEADERBOARD / environment):
+  LEADERBOARD_REFRESH_SECONDS  reload interval without Redis (default: 30)
+  LEADERBOARD_MAX_QUIZZES      quiz views kept per worker (default: 256)
+  LEADERBOARD_TOP_K            longest top list served (default: 50)
+
+USAGE:
+    from services.leaderboard_ranking import get_leaderboard_ranking
+
+    ranking = get_leaderboard_ranking(load_rows)  # load_rows(quiz_id) -> [row, ...]
+    ranking.top(quiz_id, 10)                      # [{'rank': 1, ...}, ...]
+    ranking.entry(quiz_id, user_fingerprint)      # row with its live rank
+    ranking.record(quiz_id, row)                  # after committing a change
+"""
+
+import time
+import bisect
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Callable, Tuple
+
+from services.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+GENERATION_KEY = 'leaderboard:generation:{quiz_id}'
+
+# Row fields (what load_rows returns and record() takes):
+#   id, quiz_id, user_fingerprint, display_name, score, achieved_at (datetime)
+
+
+def _sort_key(row: Dict[str, Any]) -> Tuple[int, float, int]:
+    achieved_at = row.get('achieved_at')
+    timestamp = achieved_at.timestamp() if isinstance(achieved_at, datetime) else float(achieved_at or 0)
+    return (-int(row['score']), timestamp, int(row['id']))
+
+
+def _public(row: Dict[str, Any], rank: int) -> Dict[str, Any]:
+    """Same shape as LeaderboardEntry.to_dict(), with the live rank"""
+    achieved_at = row.get('achieved_at')
+    return {
+        'id': row['id'],
+        'quiz_id': row['quiz_id'],
+        'display_name': row.get('display_name') or 'Anonymous',
+        'score': row['score'],
+        'rank': rank,
+        'achieved_at': achieved_at.isoformat() if isinstance(achieved_at, datetime) else achieved_at
+    }
+
+
+class QuizRanking:
+    """Order-statistic view of one quiz leaderboard"""
+
+    def __init__(self, quiz_id: int, rows: List[Dict[str, Any]], generation: Optional[str]):
+        self.quiz_id = quiz_id
+        self.generation = generation
+        self.loaded_at = time.time()
+        self.lock = threading.Lock()
+        self.rows: Dict[str, Dict[str, Any]] = {}  # user_fingerprint -> row
+        for row in rows:
+            self.rows[row['user_fingerprint']] = row
+        self.keys: List[Tuple[int, float, int]] = sorted(_sort_key(row) for row in self.rows.values())
+        self.by_key: Dict[Tuple[int, float, int], Dict[str, Any]] = {
+            _sort_key(row): row for row in self.rows.values()
+        }
+        self._top: Optional[List[Dict[str, Any]]] = None
+
+    def rank(self, user_fingerprint: str) -> Optional[int]:
+        with self.lock:
+            row = self.rows.get(user_fingerprint)
+            if row is None:
+                return None
+            return bisect.bisect_left(self.keys, _sort_key(row)) + 1
+
+    def top(self, limit: int, top_k: int) -> List[Dict[str, Any]]:
+        with self.lock:
+            if self._top is None:
+                self._top = [_public(self.by_key[key], index) for index, key in enumerate(self.keys[:top_k], start=1)]
+            return self._top[:limit]
+
+    def upsert(self, row: Dict[str, Any]) -> None:
+        with self.lock:
+            previous = self.rows.get(row['user_fingerprint'])
+            if previous is not None:
+                old_key = _sort_key(previous)
+                index = bisect.bisect_left(self.keys, old_key)
+                if index < len(self.keys) and self.keys[index] == old_key:
+                    del self.keys[index]
+                self.by_key.pop(old_key, None)
+
+            key = _sort_key(row)
+            bisect.insort(self.keys, key)
+            self.by_key[key] = row
+            self.rows[row['user_fingerprint']] = row
+            self._top = None
+
+
+class LeaderboardRanking:
+    """Per-worker cache of QuizRanking views, kept fresh by generation or age"""
+
+    def __init__(self, load_rows: Callable[[int], List[Dict[str, Any]]], refresh_seconds: float = 30,
+                 max_quizzes: int = 256, top_k: int = 50, redis_client: Optional[Any] = None):
+        self.load_rows = load_rows
+        self.refresh_seconds = refresh_seconds
+        self.max_quizzes = max_quizzes
+        self.top_k = top_k
+        self.redis = redis_client
+        self._lock = threading.Lock()
+        self._views: 'OrderedDict[int, QuizRanking]' = OrderedDict()
+        self._stats = {'hits': 0, 'reloads': 0, 'writes': 0}
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def top(self, quiz_id: int, limit: int = 10) -> List[Dict[str, Any]]:
+        """Top entries with live ranks (limit is capped at top_k)"""
+        return self._view(quiz_id).top(min(limit, self.top_k), self.top_k)
+
+    def entry(self, quiz_id: int, user_fingerprint: str) -> Optional[Dict[str, Any]]:
+        """A user's entry with its live rank, or None"""
+        view = self._view(quiz_id)
+        row = view.rows.get(user_fingerprint)
+        if row is None:
+            return None
+        return _public(row, view.rank(user_fingerprint))
+
+    def rank(self, quiz_id: int, user_fingerprint: str) -> Optional[int]:
+        return self._view(quiz_id).rank(user_fingerprint)
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def record(self, quiz_id: int, row: Dict[str, Any]) -> None:
+        """Apply one committed entry change to this worker and signal the others"""
+        generation = self._bump_generation(quiz_id)
+        with self._lock:
+            self._stats['writes'] += 1
+            view = self._views.get(quiz_id)
+        if view is None:
+            return
+
+        if self.redis is not None and not self._follows(view.generation, generation):
+            # Another worker wrote since this view was loaded - reload on next read
+            self.invalidate(quiz_id)
+            return
+
+        view.upsert(row)
+        view.generation = generation
+
+    def invalidate(self, quiz_id: Optional[int] = None) -> None:
+        with self._lock:
+            if quiz_id is None:
+                self._views.clear()
+            else:
+                self._views.pop(quiz_id, None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self._stats,
+                'quizzes_loaded': len(self._views),
+                'entries_loaded': sum(len(view.keys) for view in self._views.values()),
+                'shared_generation': self.redis is not None,
+                'refresh_seconds': self.refresh_seconds
+            }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _view(self, quiz_id: int) -> QuizRanking:
+        generation = self._generation(quiz_id)
+
+        with self._lock:
+            view = self._views.get(quiz_id)
+            if view is not None and self._fresh(view, generation):
+                self._views.move_to_end(quiz_id)
+                self._stats['hits'] += 1
+                return view
+
+        # Load outside the lock - a concurrent duplicate load is harmless
+        view = QuizRanking(quiz_id, self.load_rows(quiz_id), generation)
+        with self._lock:
+            self._stats['reloads'] += 1
+            self._views[quiz_id] = view
+            self._views.move_to_end(quiz_id)
+            while len(self._views) > self.max_quizzes:
+                self._views.popitem(last=False)
+        return view
+
+    def _fresh(self, view: QuizRanking, generation: Optional[str]) -> bool:
+        if self.redis is not None:
+            return view.generation == generation
+        return time.time() - view.loaded_at < self.refresh_seconds
+
+    @staticmethod
+    def _follows(previous: Optional[str], generation: Optional[str]) -> bool:
+        """True when generation is the bump right after previous"""
+        try:
+            return int(generation) == int(previous or 0) + 1
+        except (TypeError, ValueError):
+            return False
+
+    def _generation(self, quiz_id: int) -> Optional[str]:
+        if self.redis is None:
+            return None
+        try:
+            return self.redis.get(GENERATION_KEY.format(quiz_id=quiz_id))
+        except Exception as e:
+            logger.warning(f"[LeaderboardRanking] ⚠ Generation read failed: {e}")
+            return None
+
+    def _bump_generation(self, quiz_id: int) -> Optional[str]:
+        if self.redis is None:
+            return None
+        try:
+            return str(self.redis.incr(GENERATION_KEY.format(quiz_id=quiz_id)))
+        except Exception as e:
+            logger.warning(f"[LeaderboardRanking] ⚠ Generation bump failed: {e}")
+            return None
+
+
+_ranking_lock = threading.Lock()
+_ranking: Optional[LeaderboardRanking] = None
+
+
+def get_leaderboard_ranking(load_rows: Callable[[int], List[Dict[str, Any]]]) -> LeaderboardRanking:
+    """Get the process-wide ranking (built from Config.LEADERBOARD on first call)"""
+    global _ranking
+
+    if _ranking is not None:
+        return _ranking
+
+    with _ranking_lock:
+        if _ranking is not None:
+            return _ranking
+
+        try:
+            from config import Config
+            settings = dict(getattr(Config, 'LEADERBOARD', {}))
+        except Exception as e:
+            logger.warning(f"[LeaderboardRanking] ⚠ Config unavailable ({e}) - using defaults")
+            settings = {}
+
+        _ranking = LeaderboardRanking(load_rows, redis_client=get_redis_client(), **settings)
+        logger.info(f"[LeaderboardRanking] Initialized - shared generation: {_ranking.redis is not None}, "
+                    f"refresh: {_ranking.refresh_seconds}s, top_k: {_ranking.top_k}")
+
+        return _ranking
+
+
+# This file is not truncated
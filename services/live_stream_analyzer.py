@@ -40,7 +40,7 @@ import threading
 import subprocess
 from datetime import datetime
 from typing import Dict, List, Optional, Generator
-import requests
+from services.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -372,7 +372,7 @@ class LiveStreamAnalyzer:
             upload_url = 'https://api.assemblyai.com/v2/upload'
             headers = {'authorization': self.assemblyai_api_key}
             
-            upload_response = requests.post(
+            upload_response = get_http_client().post(
                 upload_url,
                 headers=headers,
                 data=audio_data,
@@ -392,7 +392,7 @@ class LiveStreamAnalyzer:
                 'language_code': 'en'
             }
             
-            transcript_response = requests.post(
+            transcript_response = get_http_client().post(
                 transcript_url,
                 json=transcript_request,
                 headers=headers,
@@ -409,7 +409,7 @@ class LiveStreamAnalyzer:
             polling_url = f'https://api.assemblyai.com/v2/transcript/{transcript_id}'
             
             for _ in range(60):  # Try for up to 60 seconds
-                result = requests.get(polling_url, headers=headers, timeout=10)
+                result = get_http_client().get(polling_url, headers=headers, timeout=10)
                 
                 if result.status_code != 200:
                     time.sleep(1)
@@ -0,0 +1,289 @@
+"""
+Live Updates Broker
+Date: October 16, 2026
+Version: 1.0.1
+
+Publish/subscribe fan-out for pushing debate vote counts and status changes
+to connected viewers over Server-Sent Events.
+
+Debate pages used to refresh by polling GET /debates/<id> (or
+/simple-debate/<id>), several queries per viewer per poll. Now the route that
+changes a debate (a vote, a join, voting going live) builds ONE snapshot from
+the rows it just committed and publishes it; every viewer's SSE stream gets
+that snapshot without touching the database.
+
+  - In-process broker: channel -> set of Subscriptions (bounded queues)
+  - With Redis (services/redis_client.py): publish goes through Redis
+    PUBLISH and one listener thread per worker delivers to that worker's
+    local subscribers - a vote handled by worker A reaches viewers held by
+    worker B. Without Redis, delivery stays inside the worker
+  - Snapshots are complete states, so a slow viewer's queue keeps only the
+    newest events (oldest dropped) instead of blocking the publisher
+
+An SSE connection holds whatever serves the request for its whole life.
+Under SERVER_MODE=async that is one greenlet; under the default sync
+workers it is a whole worker process - two viewers would block every
+other request (including /health) and the arbiter would kill workers at
+the gunicorn timeout. Streams are therefore served only in async mode
+(streaming_enabled); the /events routes answer 503 otherwise and clients
+keep polling. Streams end after max_stream_seconds and EventSource
+reconnects on its own.
+
+A route subscribes BEFORE it reads the initial snapshot and hands the
+subscription to sse_stream(): an update committed between the read and the
+subscription would otherwise never reach the viewer. subscribe() waits
+(up to LISTENER_READY_WAIT seconds) until the worker's Redis listener has
+confirmed its subscription, for the same reason.
+
+Configuration (Config.LIVE_UPDATES / environment):
+  LIVE_STREAMING           serve SSE streams (default: on with SERVER_MODE=async only)
+  LIVE_MAX_STREAM_SECONDS  stream length before the client reconnects (default: 300)
+  LIVE_KEEPALIVE_SECONDS   comment line interval for proxies (default: 15)
+  LIVE_QUEUE_SIZE          pending events kept per viewer (default: 16)
+
+USAGE:
+    from services.live_updates import get_live_broker
+
+    broker = get_live_broker()
+    broker.publish('simple_debate:42', {'type': 'votes', ...})
+
+    subscription = broker.subscribe('simple_debate:42')   # before reading `initial`
+    response = Response(stream_with_context(broker.sse_stream('simple_debate:42', initial, subscription)),
+                        mimetype='text/event-stream')
+    response.call_on_close(subscription.close)
+
+FIX IN 1.0.1:
+- Subscribe before the snapshot is read, and wait for the Redis listener -
+  a vote committed in that gap was never delivered
+"""
+
+import os
+import json
+import time
+import queue
+import logging
+import threading
+from typing import Dict, Any, Optional, Set, Iterator
+
+from services.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+CHANNEL_PREFIX = 'live_updates:'
+# Longest a new subscriber waits for the worker's Redis listener to be subscribed
+LISTENER_READY_WAIT = 2.0
+
+
+class Subscription:
+    """One viewer's bounded event queue"""
+
+    def __init__(self, broker: 'LiveBroker', channel: str, maxsize: int):
+        self.broker = broker
+        self.channel = channel
+        self.queue: 'queue.Queue[Dict[str, Any]]' = queue.Queue(maxsize)
+        self.dropped = 0
+
+    def put(self, event: Dict[str, Any]) -> None:
+        while True:
+            try:
+                self.queue.put_nowait(event)
+                return
+            except queue.Full:
+                # Events are full snapshots - the newest one is what matters
+                try:
+                    self.queue.get_nowait()
+                    self.dropped += 1
+                except queue.Empty:
+                    pass
+
+    def get(self, timeout: float) -> Optional[Dict[str, Any]]:
+        try:
+            return self.queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self) -> None:
+        self.broker.unsubscribe(self)
+
+
+class LiveBroker:
+    """Channel fan-out, in-process or across workers through Redis pub/sub"""
+
+    def __init__(self, redis_client: Optional[Any] = None, max_stream_seconds: float = 300,
+                 keepalive_seconds: float = 15, queue_size: int = 16, streaming_enabled: bool = False):
+        self.redis = redis_client
+        self.streaming_enabled = streaming_enabled
+        self.max_stream_seconds = max_stream_seconds
+        self.keepalive_seconds = keepalive_seconds
+        self.queue_size = queue_size
+        self._lock = threading.Lock()
+        self._subscribers: Dict[str, Set[Subscription]] = {}
+        self._listener_pid = None
+        self._listener_ready = threading.Event()
+        self._stats = {'published': 0, 'delivered': 0, 'publish_errors': 0, 'streams_opened': 0}
+
+    # ------------------------------------------------------------------
+    # Pub/sub
+    # ------------------------------------------------------------------
+
+    def subscribe(self, channel: str) -> Subscription:
+        """Start receiving a channel's events; with Redis, returns once the listener is subscribed"""
+        self._ensure_listener()
+        subscription = Subscription(self, channel, self.queue_size)
+        with self._lock:
+            self._subscribers.setdefault(channel, set()).add(subscription)
+        if self.redis is not None and not self._listener_ready.wait(LISTENER_READY_WAIT):
+            logger.warning(f"[LiveBroker] ⚠ Redis listener not ready after {LISTENER_READY_WAIT}s")
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.channel)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.channel]
+
+    def publish(self, channel: str, event: Dict[str, Any]) -> None:
+        """Send an event to every viewer of a channel (never raises)"""
+        with self._lock:
+            self._stats['published'] += 1
+
+        if self.redis is not None:
+            try:
+                self.redis.publish(CHANNEL_PREFIX + channel, json.dumps(event, default=str))
+                return
+            except Exception as e:
+                with self._lock:
+                    self._stats['publish_errors'] += 1
+                logger.warning(f"[LiveBroker] ⚠ Redis publish failed, delivering locally: {e}")
+
+        self._deliver(channel, event)
+
+    def _deliver(self, channel: str, event: Dict[str, Any]) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers.get(channel, ()))
+            self._stats['delivered'] += len(subscribers)
+        for subscription in subscribers:
+            subscription.put(event)
+
+    # ------------------------------------------------------------------
+    # SSE
+    # ------------------------------------------------------------------
+
+    def sse_stream(self, channel: str, initial: Optional[Dict[str, Any]] = None,
+                   subscription: Optional[Subscription] = None) -> Iterator[str]:
+        """
+        Server-Sent Events for one channel
+
+        Sends initial (the state when the viewer connected) first, then every
+        published event, with keepalive comments in between. Ends after
+        max_stream_seconds; EventSource reconnects automatically. Pass the
+        subscription taken before initial was read; without one the stream
+        subscribes when it starts.
+        """
+        if subscription is None:
+            subscription = self.subscribe(channel)
+        with self._lock:
+            self._stats['streams_opened'] += 1
+
+        try:
+            yield "retry: 3000\n\n"
+            if initial is not None:
+                yield f"data: {json.dumps(initial, default=str)}\n\n"
+
+            deadline = time.time() + self.max_stream_seconds
+            while time.time() < deadline:
+                event = subscription.get(timeout=min(self.keepalive_seconds, max(deadline - time.time(), 0.1)))
+                if event is None:
+                    yield ": keepalive\n\n"
+                    continue
+                yield f"data: {json.dumps(event, default=str)}\n\n"
+        finally:
+            subscription.close()
+
+    # ------------------------------------------------------------------
+    # Cross-worker listener
+    # ------------------------------------------------------------------
+
+    def _ensure_listener(self) -> None:
+        if self.redis is None or self._listener_pid == os.getpid():
+            return
+        with self._lock:
+            if self._listener_pid == os.getpid():
+                return
+            self._listener_pid = os.getpid()
+            self._listener_ready = threading.Event()  # The parent's listener did not survive the fork
+        threading.Thread(target=self._listen, name='live-updates', daemon=True).start()
+        logger.info(f"[LiveBroker] ✓ Redis listener started (pid {os.getpid()})")
+
+    def _listen(self) -> None:
+        while True:
+            pubsub = None
+            try:
+                pubsub = self.redis.pubsub()
+                pubsub.psubscribe(CHANNEL_PREFIX + '*')
+                while True:
+                    message = pubsub.get_message(timeout=1.0)
+                    if message and message.get('type') == 'psubscribe':
+                        self._listener_ready.set()  # Confirmed - PUBLISHes from now on reach us
+                        continue
+                    if not message or message.get('type') != 'pmessage':
+                        continue
+                    channel = message['channel']
+                    if isinstance(channel, bytes):
+                        channel = channel.decode('utf-8')
+                    channel = channel[len(CHANNEL_PREFIX):]
+                    if channel in self._subscribers:
+                        self._deliver(channel, json.loads(message['data']))
+            except Exception as e:
+                self._listener_ready.clear()
+                logger.warning(f"[LiveBroker] ⚠ Redis listener error, reconnecting: {e}")
+                time.sleep(1)
+            finally:
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self._stats,
+                'channels': len(self._subscribers),
+                'viewers': sum(len(subscribers) for subscribers in self._subscribers.values()),
+                'streaming_enabled': self.streaming_enabled,
+                'backend': 'redis' if self.redis is not None else 'memory'
+            }
+
+
+_broker_lock = threading.Lock()
+_broker: Optional[LiveBroker] = None
+
+
+def get_live_broker() -> LiveBroker:
+    """Get the process-wide broker (built from Config.LIVE_UPDATES)"""
+    global _broker
+
+    if _broker is not None:
+        return _broker
+
+    with _broker_lock:
+        if _broker is not None:
+            return _broker
+
+        try:
+            from config import Config
+            settings = dict(getattr(Config, 'LIVE_UPDATES', {}))
+        except Exception as e:
+            logger.warning(f"[LiveBroker] ⚠ Config unavailable ({e}) - using defaults")
+            settings = {}
+
+        _broker = LiveBroker(redis_client=get_redis_client(), **settings)
+        logger.info(f"[LiveBroker] Initialized - backend: {'redis' if _broker.redis is not None else 'memory'}")
+
+        return _broker
+
+
+# This file is not truncated
@@ -0,0 +1,526 @@
+"""
+LLM Gateway
+Date: October 16, 2026
+Version: 1.0.1
+
+One in-process gateway for every OpenAI-compatible chat completion.
+
+About twenty modules built their own OpenAI client and called
+chat.completions.create directly - no shared connections, no caching, no
+accounting. They now take a drop-in client from get_llm_client(caller)
+with the same `client.chat.completions.create(...)` interface, and every
+call goes through the gateway:
+
+  - Pooled HTTP: one httpx connection pool per worker, shared by every
+    caller and every API key / base URL (rebuilt lazily after a fork)
+  - Response cache: identical requests (model + messages + temperature +
+    the other output-affecting parameters) are answered from the cache.
+    Memory LRU or Redis, like the analysis result cache. Only
+    deterministic requests are cached by default (temperature 0) - caching
+    a sampled answer would freeze one random sample. Streaming calls are
+    never cached
+  - Token budgets: an explicit max_tokens is capped per request; the prompt
+    estimate plus max_tokens (LLM_MAX_REQUEST_TOKENS when the caller set
+    none) is reserved against a per-minute budget for the worker, and
+    corrected to actual usage when the response arrives. Requests without
+    max_tokens are sent without one, as before
+  - Concurrency limit: at most LLM_MAX_CONCURRENCY calls in flight. A
+    streamed call holds its slot until the stream is consumed or closed
+  - A call that cannot get budget or a slot within LLM_BUDGET_WAIT seconds
+    raises LLMBudgetExceeded - callers already fall back on any exception -
+    and counts as a budget rejection
+  - Per-caller calls, cache hits, errors, latency p50/p95, tokens and cost
+    (shown on /health as 'llm_gateway')
+
+Configuration (Config.LLM_GATEWAY / environment):
+  LLM_CACHE_BACKEND            auto | memory | redis | none (default: auto)
+  LLM_CACHE_TTL                seconds (default: 86400)
+  LLM_CACHE_MAX_MB             byte cap for the memory backend (default: 32)
+  LLM_CACHE_MAX_TEMPERATURE    highest temperature cached (default: 0)
+  LLM_MAX_REQUEST_TOKENS       max_tokens cap / reservation per request (default: 4096)
+  LLM_TOKENS_PER_MINUTE        per-worker budget, 0 = unlimited (default: 0)
+  LLM_MAX_CONCURRENCY          calls in flight per worker (default: 32)
+  LLM_BUDGET_WAIT              seconds to wait for budget / a slot (default: 20)
+  LLM_POOL_CONNECTIONS         pooled connections per worker (default: 64)
+
+USAGE:
+    from services.llm_gateway import get_llm_client
+
+    client = get_llm_client('FactChecker', timeout=10)   # None without a key / library
+    response = client.chat.completions.create(model='gpt-4o-mini', messages=[...])
+
+FIX IN 1.0.1:
+- LLM_CACHE_MAX_TEMPERATURE defaults to 0 (was 0.7, which cached sampled calls)
+- Streams keep their concurrency slot until the iterator closes
+- Budget exhaustion counts in budget_rejections, not only a full slot pool
+- max_tokens is no longer added to requests that did not set it
+"""
+
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from collections import deque
+from typing import Dict, Any, List, Optional, Tuple
+
+from services.result_cache import MemoryCacheBackend, RedisCacheBackend
+
+logger = logging.getLogger(__name__)
+
+try:
+    import openai
+    from openai.types.chat import ChatCompletion
+    OPENAI_AVAILABLE = True
+except ImportError:
+    openai = None
+    ChatCompletion = None
+    OPENAI_AVAILABLE = False
+
+# USD per 1M tokens (input, output) - longest matching prefix wins
+MODEL_PRICES = {
+    'gpt-4o-mini': (0.15, 0.60),
+    'gpt-4o': (2.50, 10.00),
+    'gpt-4-turbo': (10.00, 30.00),
+    'gpt-4': (30.00, 60.00),
+    'gpt-3.5-turbo': (0.50, 1.50),
+    'deepseek-chat': (0.27, 1.10),
+    'grok-beta': (5.00, 15.00)
+}
+
+# Request parameters that change the answer (everything else is transport)
+CACHE_KEY_PARAMS = ('model', 'messages', 'temperature', 'max_tokens', 'top_p',
+                    'response_format', 'tools', 'tool_choice', 'stop', 'seed',
+                    'presence_penalty', 'frequency_penalty')
+
+
+class LLMBudgetExceeded(Exception):
+    """No token budget or concurrency slot within the wait limit"""
+
+
+def estimate_tokens(messages: List[Dict[str, Any]]) -> int:
+    """Rough prompt size (~4 characters per token) for budget reservations"""
+    chars = 0
+    for message in messages or []:
+        content = message.get('content', '')
+        chars += len(content) if isinstance(content, str) else len(json.dumps(content, default=str))
+    return chars // 4 + 4 * len(messages or [])
+
+
+def price_for(model: str) -> Tuple[float, float]:
+    for prefix in sorted(MODEL_PRICES, key=len, reverse=True):
+        if (model or '').startswith(prefix):
+            return MODEL_PRICES[prefix]
+    return 0.0, 0.0
+
+
+class LLMCacheBackend(RedisCacheBackend):
+    KEY_PREFIX = 'llm_cache:'
+
+
+class TokenBudget:
+    """Sliding one-minute token budget (0 = unlimited)"""
+
+    def __init__(self, tokens_per_minute: int):
+        self.tokens_per_minute = tokens_per_minute
+        self._entries: deque = deque()  # [timestamp, tokens] - mutable so reservations can be settled
+        self._condition = threading.Condition()
+
+    def _used(self, now: float) -> int:
+        while self._entries and now - self._entries[0][0] >= 60:
+            self._entries.popleft()
+        return sum(tokens for _, tokens in self._entries)
+
+    def reserve(self, tokens: int, wait: float) -> Optional[list]:
+        """Reserve tokens, waiting up to `wait` seconds; None if unlimited"""
+        if not self.tokens_per_minute:
+            return None
+
+        tokens = min(tokens, self.tokens_per_minute)
+        give_up_at = time.time() + wait
+        with self._condition:
+            while True:
+                now = time.time()
+                if self._used(now) + tokens <= self.tokens_per_minute:
+                    entry = [now, tokens]
+                    self._entries.append(entry)
+                    return entry
+
+                oldest = self._entries[0][0] if self._entries else now
+                sleep_for = min(oldest + 60 - now, give_up_at - now)
+                if sleep_for <= 0:
+                    raise LLMBudgetExceeded(f"token budget of {self.tokens_per_minute}/min exhausted")
+                self._condition.wait(sleep_for)
+
+    def settle(self, entry: Optional[list], actual_tokens: int) -> None:
+        """Replace a reservation with what the call actually used"""
+        if entry is None:
+            return
+        with self._condition:
+            entry[1] = actual_tokens
+            self._condition.notify_all()
+
+    def used(self) -> int:
+        with self._condition:
+            return self._used(time.time())
+
+
+class GatewayStream:
+    """
+    Streamed completion that holds a concurrency slot until it is consumed,
+    closed or garbage-collected - iterates and proxies like openai's Stream
+    """
+
+    def __init__(self, stream: Any, release):
+        self._stream = stream
+        self._release = release
+        self._released = False
+        self._iterator = None
+        self._lock = threading.Lock()
+
+    def __iter__(self):
+        try:
+            for chunk in self._stream:
+                yield chunk
+        finally:
+            self.close()
+
+    def __next__(self):
+        if self._iterator is None:
+            self._iterator = iter(self)
+        return next(self._iterator)
+
+    def __enter__(self) -> 'GatewayStream':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self._stream, name)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._released:
+                return
+            self._released = True
+        try:
+            close = getattr(self._stream, 'close', None)
+            if close:
+                close()
+        finally:
+            self._release()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+class CallerStats:
+    """Counters and recent latencies for one caller"""
+
+    def __init__(self):
+        self.calls = 0
+        self.cache_hits = 0
+        self.errors = 0
+        self.budget_rejections = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.cost_usd = 0.0
+        self.latencies: deque = deque(maxlen=200)
+
+    def snapshot(self) -> Dict[str, Any]:
+        latencies = sorted(self.latencies)
+
+        def pct(fraction):
+            return round(latencies[min(len(latencies) - 1, int(fraction * len(latencies)))], 3) if latencies else None
+
+        return {
+            'calls': self.calls,
+            'cache_hits': self.cache_hits,
+            'errors': self.errors,
+            'budget_rejections': self.budget_rejections,
+            'prompt_tokens': self.prompt_tokens,
+            'completion_tokens': self.completion_tokens,
+            'cost_usd': round(self.cost_usd, 4),
+            'p50_latency': pct(0.5),
+            'p95_latency': pct(0.95)
+        }
+
+
+class LLMGateway:
+    """Shared clients, cache, budgets, concurrency limit and metrics for chat completions"""
+
+    def __init__(self, cache_backend: Optional[Any] = None, cache_ttl: int = 86400,
+                 cache_max_temperature: float = 0.0, max_request_tokens: int = 4096,
+                 tokens_per_minute: int = 0, max_concurrency: int = 32,
+                 budget_wait: float = 20, pool_connections: int = 64):
+        self.cache_backend = cache_backend
+        self.cache_ttl = cache_ttl
+        self.cache_max_temperature = cache_max_temperature
+        self.max_request_tokens = max_request_tokens
+        self.budget = TokenBudget(tokens_per_minute)
+        self.max_concurrency = max_concurrency
+        self.budget_wait = budget_wait
+        self.pool_connections = pool_connections
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._lock = threading.Lock()
+        self._clients: Dict[Tuple[str, Optional[str]], Any] = {}
+        self._http_client = None
+        self._pid = None
+        self._callers: Dict[str, CallerStats] = {}
+
+    # ------------------------------------------------------------------
+    # Pooled clients
+    # ------------------------------------------------------------------
+
+    def client_for(self, api_key: str, base_url: Optional[str] = None) -> Any:
+        """Shared OpenAI client for this key / base URL over the worker's connection pool"""
+        with self._lock:
+            if self._pid != os.getpid():
+                # After a fork: never reuse the parent's sockets
+                self._clients = {}
+                self._http_client = None
+                self._pid = os.getpid()
+
+            client = self._clients.get((api_key, base_url))
+            if client is None:
+                if self._http_client is None:
+                    import httpx
+                    self._http_client = openai.DefaultHttpxClient(
+                        limits=httpx.Limits(max_connections=self.pool_connections,
+                                            max_keepalive_connections=self.pool_connections)
+                    )
+                client = openai.OpenAI(api_key=api_key, base_url=base_url, http_client=self._http_client)
+                self._clients[(api_key, base_url)] = client
+            return client
+
+    # ------------------------------------------------------------------
+    # Chat completions
+    # ------------------------------------------------------------------
+
+    def chat(self, caller: str, api_key: str, base_url: Optional[str],
+             options: Dict[str, Any], params: Dict[str, Any]) -> Any:
+        """One chat completion for `caller` (options: timeout / max_retries)"""
+        params = dict(params)
+        if self.max_request_tokens and params.get('max_tokens'):
+            params['max_tokens'] = min(params['max_tokens'], self.max_request_tokens)
+
+        cache_key = self._cache_key(base_url, params)
+        if cache_key:
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                self._record(caller, cache_hit=True)
+                return cached
+
+        try:
+            reservation = self.budget.reserve(
+                estimate_tokens(params.get('messages')) + (params.get('max_tokens') or self.max_request_tokens),
+                self.budget_wait
+            ) if self.budget.tokens_per_minute else None
+        except LLMBudgetExceeded:
+            self._record(caller, budget_rejected=True)
+            raise
+
+        if not self._slots.acquire(timeout=self.budget_wait):
+            self.budget.settle(reservation, 0)
+            self._record(caller, budget_rejected=True)
+            raise LLMBudgetExceeded(f"{self.max_concurrency} LLM calls already in flight")
+
+        streaming = bool(params.get('stream'))
+        response = None
+        start = time.time()
+        try:
+            client = self.client_for(api_key, base_url)
+            if options:
+                client = client.with_options(**options)
+            response = client.chat.completions.create(**params)
+        except Exception:
+            self.budget.settle(reservation, 0)
+            self._record(caller, error=True, latency=time.time() - start)
+            raise
+        finally:
+            if not streaming or response is None:
+                self._slots.release()
+
+        if streaming:
+            # Usage is not known up front for streams - the reservation stands,
+            # and the slot is released when the caller is done with the stream
+            self._record(caller, latency=time.time() - start, model=params.get('model'))
+            return GatewayStream(response, self._slots.release)
+
+        usage = getattr(response, 'usage', None)
+        prompt_tokens = getattr(usage, 'prompt_tokens', 0) or 0
+        completion_tokens = getattr(usage, 'completion_tokens', 0) or 0
+        self.budget.settle(reservation, prompt_tokens + completion_tokens)
+        self._record(caller, latency=time.time() - start, model=params.get('model'),
+                     prompt_tokens=prompt_tokens, completion_tokens=completion_tokens)
+
+        if cache_key:
+            self._cache_set(cache_key, response)
+        return response
+
+    def _cache_key(self, base_url: Optional[str], params: Dict[str, Any]) -> Optional[str]:
+        if self.cache_backend is None or params.get('stream') or (params.get('n') or 1) != 1:
+            return None
+        if (params.get('temperature') if params.get('temperature') is not None else 1.0) > self.cache_max_temperature:
+            return None
+
+        material = {name: params.get(name) for name in CACHE_KEY_PARAMS if params.get(name) is not None}
+        material['base_url'] = base_url
+        payload = json.dumps(material, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[Any]:
+        try:
+            payload = self.cache_backend.get(key)
+            return ChatCompletion.model_validate_json(payload) if payload else None
+        except Exception as e:
+            logger.warning(f"[LLMGateway] ⚠ Cache lookup failed: {e}")
+            return None
+
+    def _cache_set(self, key: str, response: Any) -> None:
+        try:
+            self.cache_backend.set(key, response.model_dump_json(), self.cache_ttl)
+        except Exception as e:
+            logger.warning(f"[LLMGateway] ⚠ Cache store failed: {e}")
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    def _record(self, caller: str, cache_hit: bool = False, error: bool = False,
+                budget_rejected: bool = False, latency: Optional[float] = None,
+                model: Optional[str] = None, prompt_tokens: int = 0, completion_tokens: int = 0) -> None:
+        with self._lock:
+            stats = self._callers.get(caller)
+            if stats is None:
+                stats = self._callers[caller] = CallerStats()
+
+            stats.calls += 1
+            stats.cache_hits += cache_hit
+            stats.errors += error
+            stats.budget_rejections += budget_rejected
+            if latency is not None:
+                stats.latencies.append(latency)
+            if prompt_tokens or completion_tokens:
+                input_price, output_price = price_for(model)
+                stats.prompt_tokens += prompt_tokens
+                stats.completion_tokens += completion_tokens
+                stats.cost_usd += (prompt_tokens * input_price + completion_tokens * output_price) / 1_000_000
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-caller counters plus gateway-wide totals, for /health"""
+        with self._lock:
+            callers = {name: stats.snapshot() for name, stats in sorted(self._callers.items())}
+
+        totals = {field: sum(caller[field] for caller in callers.values())
+                  for field in ('calls', 'cache_hits', 'errors', 'budget_rejections',
+                                'prompt_tokens', 'completion_tokens')}
+        totals['cost_usd'] = round(sum(caller['cost_usd'] for caller in callers.values()), 4)
+        totals['tokens_last_minute'] = self.budget.used()
+        totals['tokens_per_minute'] = self.budget.tokens_per_minute
+        totals['cache'] = self.cache_backend.name if self.cache_backend else 'disabled'
+
+        return {'totals': totals, 'callers': callers}
+
+
+class _Completions:
+    def __init__(self, client: 'GatewayClient'):
+        self._client = client
+
+    def create(self, **params) -> Any:
+        return self._client.gateway.chat(self._client.caller, self._client.api_key,
+                                         self._client.base_url, self._client.options, params)
+
+
+class _Chat:
+    def __init__(self, client: 'GatewayClient'):
+        self.completions = _Completions(client)
+
+
+class GatewayClient:
+    """Drop-in for openai.OpenAI(): client.chat.completions.create(...) through the gateway"""
+
+    def __init__(self, gateway: LLMGateway, caller: str, api_key: str,
+                 base_url: Optional[str] = None, options: Optional[Dict[str, Any]] = None):
+        self.gateway = gateway
+        self.caller = caller
+        self.api_key = api_key
+        self.base_url = base_url
+        self.options = options or {}
+        self.chat = _Chat(self)
+
+
+_gateway_lock = threading.Lock()
+_llm_gateway: Optional[LLMGateway] = None
+
+
+def get_llm_gateway() -> LLMGateway:
+    """Get the process-wide LLM gateway (built from Config.LLM_GATEWAY)"""
+    global _llm_gateway
+
+    if _llm_gateway is not None:
+        return _llm_gateway
+
+    with _gateway_lock:
+        if _llm_gateway is not None:
+            return _llm_gateway
+
+        try:
+            from config import Config
+            settings = dict(getattr(Config, 'LLM_GATEWAY', {}))
+        except Exception as e:
+            logger.warning(f"[LLMGateway] ⚠ Config unavailable ({e}) - using defaults")
+            settings = {}
+
+        backend_name = settings.pop('cache_backend', 'auto')
+        max_bytes = settings.pop('cache_max_mb', 32) * 1024 * 1024
+
+        backend = None
+        if backend_name != 'none':
+            if backend_name in ('auto', 'redis'):
+                from services.redis_client import get_redis_client
+                client = get_redis_client()
+                if client:
+                    backend = LLMCacheBackend(client, max_bytes)
+                elif backend_name == 'redis':
+                    logger.warning("[LLMGateway] Redis requested but unavailable - using memory cache")
+            if backend is None:
+                backend = MemoryCacheBackend(max_bytes, max_entries=20000)
+
+        _llm_gateway = LLMGateway(backend, **settings)
+        logger.info(f"[LLMGateway] Initialized - cache: {backend.name if backend else 'disabled'}, "
+                    f"concurrency: {_llm_gateway.max_concurrency}, "
+                    f"tokens/min: {_llm_gateway.budget.tokens_per_minute or 'unlimited'}")
+
+        return _llm_gateway
+
+
+def get_llm_client(caller: str, api_key: Optional[str] = None, base_url: Optional[str] = None,
+                   timeout: Optional[float] = None, max_retries: Optional[int] = None) -> Optional[GatewayClient]:
+    """
+    Client for `caller` (the name its metrics are reported under)
+
+    api_key defaults to OPENAI_API_KEY. Returns None when there is no key or
+    the openai library is missing, so `if client:` checks keep working.
+    """
+    api_key = api_key or os.getenv('OPENAI_API_KEY')
+    if not api_key or not OPENAI_AVAILABLE:
+        return None
+
+    options = {}
+    if timeout is not None:
+        options['timeout'] = timeout
+    if max_retries is not None:
+        options['max_retries'] = max_retries
+
+    return GatewayClient(get_llm_gateway(), caller, api_key, base_url, options)
+
+
+# This file is not truncated
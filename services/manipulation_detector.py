@@ -1,8 +1,17 @@
 """
-Manipulation Detector - v5.0.1 "WOW FACTOR" EDITION (BUGFIX)
+Manipulation Detector - v5.0.2 "WOW FACTOR" EDITION
 Date: November 1, 2025
-Last Updated: November 1, 2025 - FIXED PARAMETER BUG
-Version: 5.0.1 - CRITICAL BUGFIX
+Last Updated: October 16, 2026 - SHARED DOCUMENT ARTIFACT
+Version: 5.0.3
+
+PERFORMANCE IN v5.0.3:
+✅ Word count and lowercased text read from the shared DocumentAnalysis
+   (services/document_analysis.py) instead of per-method text.lower()
+
+PERFORMANCE IN v5.0.2:
+✅ Clickbait and logical-fallacy patterns compiled once in services/pattern_engine.py
+✅ Fallacy scan reuses the shared, pre-lowered article instead of re-lowering it
+✅ PRESERVED: Same matches, examples and ordering
 
 VISION:
 🎯 Make manipulation detection the MOST INTERESTING part of the app
@@ -43,14 +52,14 @@ import re
 from typing import Dict, Any, List, Optional, Tuple
 from collections import Counter
 
-try:
-    from openai import OpenAI
+# OpenAI calls go through the shared LLM gateway (services/llm_gateway.py)
+from services.llm_gateway import get_llm_client, OPENAI_AVAILABLE
+if OPENAI_AVAILABLE:
     import httpx
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
 
 from services.base_analyzer import BaseAnalyzer
+from services.pattern_engine import pattern_engine
+from services.document_analysis import document_for, get_document
 from config import Config
 
 logger = logging.getLogger(__name__)
@@ -69,7 +78,8 @@ class ManipulationDetector(BaseAnalyzer):
         self.openai_client = None
         if OPENAI_AVAILABLE and Config.OPENAI_API_KEY:
             try:
-                self.openai_client = OpenAI(
+                self.openai_client = get_llm_client(
+                    'ManipulationDetector',
                     api_key=Config.OPENAI_API_KEY,
                     timeout=httpx.Timeout(8.0, connect=2.0)
                 )
@@ -196,6 +206,12 @@ class ManipulationDetector(BaseAnalyzer):
             'doctor', 'professor', 'researcher', 'study',
             'research shows', 'according to experts'
         ]
+        
+        # v5.0.2: Compile once in the shared pattern engine
+        for category, patterns in self.clickbait_patterns.items():
+            pattern_engine.register_regex(f'manipulation.clickbait.{category}', patterns)
+        for fallacy_type, patterns in self.fallacy_patterns.items():
+            pattern_engine.register_regex(f'manipulation.fallacy.{fallacy_type}', patterns)
     
     def analyze(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -212,7 +228,7 @@ class ManipulationDetector(BaseAnalyzer):
                 return self.get_error_result("No content provided for manipulation detection")
             
             source = data.get('source', 'Unknown')
-            word_count = len(text.split())
+            word_count = document_for(data, text).word_count
             
             logger.info(f"[ManipulationWOW v5.0] Analyzing {word_count} words from {source}")
             
@@ -390,47 +406,41 @@ class ManipulationDetector(BaseAnalyzer):
         if not title:
             return analysis
         
-        title_lower = title.lower()
+        title_scan = pattern_engine.scan(title)
         score_deductions = []
         
         # Check curiosity gap patterns
-        for pattern in self.clickbait_patterns['curiosity_gap']:
-            if re.search(pattern, title_lower):
-                analysis['detected'] = True
-                analysis['techniques'].append('Curiosity Gap')
-                analysis['examples'].append({
-                    'type': 'curiosity_gap',
-                    'text': title,
-                    'why_manipulative': 'Creates information gap that makes you click to satisfy curiosity'
-                })
-                score_deductions.append(25)
-                break
+        if title_scan.matches('manipulation.clickbait.curiosity_gap'):
+            analysis['detected'] = True
+            analysis['techniques'].append('Curiosity Gap')
+            analysis['examples'].append({
+                'type': 'curiosity_gap',
+                'text': title,
+                'why_manipulative': 'Creates information gap that makes you click to satisfy curiosity'
+            })
+            score_deductions.append(25)
         
         # Check number bait
-        for pattern in self.clickbait_patterns['number_bait']:
-            if re.search(pattern, title_lower):
-                analysis['detected'] = True
-                analysis['techniques'].append('Number Bait')
-                analysis['examples'].append({
-                    'type': 'number_bait',
-                    'text': title,
-                    'why_manipulative': 'Numbers suggest listicle format - easy to digest, hard to resist'
-                })
-                score_deductions.append(15)
-                break
+        if title_scan.matches('manipulation.clickbait.number_bait'):
+            analysis['detected'] = True
+            analysis['techniques'].append('Number Bait')
+            analysis['examples'].append({
+                'type': 'number_bait',
+                'text': title,
+                'why_manipulative': 'Numbers suggest listicle format - easy to digest, hard to resist'
+            })
+            score_deductions.append(15)
         
         # Check reaction bait
-        for pattern in self.clickbait_patterns['reaction_bait']:
-            if re.search(pattern, title_lower):
-                analysis['detected'] = True
-                analysis['techniques'].append('Reaction Bait')
-                analysis['examples'].append({
-                    'type': 'reaction_bait',
-                    'text': title,
-                    'why_manipulative': 'Social proof + FOMO - if everyone else is talking about it, you should too'
-                })
-                score_deductions.append(20)
-                break
+        if title_scan.matches('manipulation.clickbait.reaction_bait'):
+            analysis['detected'] = True
+            analysis['techniques'].append('Reaction Bait')
+            analysis['examples'].append({
+                'type': 'reaction_bait',
+                'text': title,
+                'why_manipulative': 'Social proof + FOMO - if everyone else is talking about it, you should too'
+            })
+            score_deductions.append(20)
         
         # Check excessive punctuation
         if title.count('!') > 1:
@@ -574,7 +584,7 @@ class ManipulationDetector(BaseAnalyzer):
             'severity': 'none'
         }
         
-        text_lower = text.lower()
+        text_lower = get_document(text).text_lower
         all_loaded_words = []
         
         # Analyze each category
@@ -652,28 +662,21 @@ class ManipulationDetector(BaseAnalyzer):
             'examples': []
         }
         
-        text_lower = text.lower()
+        scan = pattern_engine.scan(text)
         
-        for fallacy_type, patterns in self.fallacy_patterns.items():
-            for pattern in patterns:
-                matches = re.finditer(pattern, text_lower)
-                for match in matches:
-                    # Get context around match
-                    start = max(0, match.start() - 50)
-                    end = min(len(text), match.end() + 50)
-                    context = text[start:end].strip()
-                    
-                    fallacy_info = {
-                        'type': fallacy_type.replace('_', ' ').title(),
-                        'pattern': match.group(),
-                        'context': context,
-                        'why_fallacy': self._explain_fallacy(fallacy_type),
-                        'severity': 'medium'
-                    }
-                    
-                    fallacies['examples'].append(fallacy_info)
-                    if fallacy_type not in fallacies['types']:
-                        fallacies['types'].append(fallacy_type)
+        for fallacy_type in self.fallacy_patterns:
+            for match in scan.matches(f'manipulation.fallacy.{fallacy_type}'):
+                fallacy_info = {
+                    'type': fallacy_type.replace('_', ' ').title(),
+                    'pattern': match.text,
+                    'context': scan.context(match, 50),  # Context around match
+                    'why_fallacy': self._explain_fallacy(fallacy_type),
+                    'severity': 'medium'
+                }
+                
+                fallacies['examples'].append(fallacy_info)
+                if fallacy_type not in fallacies['types']:
+                    fallacies['types'].append(fallacy_type)
         
         if fallacies['examples']:
             fallacies['detected'] = True
@@ -704,7 +707,7 @@ class ManipulationDetector(BaseAnalyzer):
             'examples': []
         }
         
-        text_lower = text.lower()
+        text_lower = get_document(text).text_lower
         
         for phrase in self.authority_phrases:
             if phrase in text_lower:
@@ -734,7 +737,7 @@ class ManipulationDetector(BaseAnalyzer):
             'examples': []
         }
         
-        text_lower = text.lower()
+        text_lower = get_document(text).text_lower
         
         found_phrases = [p for p in self.scarcity_phrases if p in text_lower]
         
@@ -769,7 +772,7 @@ class ManipulationDetector(BaseAnalyzer):
             'the majority', 'consensus', 'widespread belief'
         ]
         
-        text_lower = text.lower()
+        text_lower = get_document(text).text_lower
         
         for phrase in bandwagon_phrases:
             if phrase in text_lower:
@@ -807,7 +810,7 @@ class ManipulationDetector(BaseAnalyzer):
             'time is running out', 'immediate action', 'hurry'
         ]
         
-        text_lower = text.lower()
+        text_lower = get_document(text).text_lower
         
         for phrase in urgency_phrases:
             if phrase in text_lower:
@@ -1294,7 +1297,7 @@ class ManipulationDetector(BaseAnalyzer):
         """Detect article type"""
         
         title_lower = title.lower()
-        text_lower = text.lower()
+        text_lower = get_document(text).text_lower
         
         # Breaking News
         if word_count < 300:
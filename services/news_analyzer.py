@@ -1,10 +1,13 @@
 # services/news_analyzer.py
 """
 News Analyzer Service - WITH ENHANCED "WHAT WE FOUND" SUMMARY
-Date: October 20, 2025
-Version: 21.1 - CRITICAL SUCCESS FLAG FIX
+Date: October 16, 2026
+Version: 21.2 - PROGRESS EVENTS
 
 CHANGE LOG:
+- 2026-10-16: v21.2 - Optional on_event callback on analyze()
+  * Forwards pipeline 'article' / 'service' events for streaming clients
+  * Service blocks are normalized and chart-embedded exactly like the final response
 - 2025-10-20: v21.1 - CRITICAL FIX: Always set success=True in _build_response
   * Bug: Response was missing success=True, causing frontend to show "Analysis failed"
   * Fix: Line 153 now explicitly sets success=True in response dict
@@ -27,7 +30,7 @@ Replace existing services/news_analyzer.py with this complete file
 
 import logging
 import time
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Callable
 
 from services.analysis_pipeline import AnalysisPipeline
 from services.insight_generator import InsightGenerator
@@ -48,7 +51,8 @@ class NewsAnalyzer:
         self.data_enricher = DataEnricher()
         logger.info("[NewsAnalyzer v21.1] Initialized - WITH SUCCESS FLAG FIX")
     
-    def analyze(self, content: str, content_type: str = 'url', pro_mode: bool = False) -> Dict[str, Any]:
+    def analyze(self, content: str, content_type: str = 'url', pro_mode: bool = False,
+                on_event: Optional[Callable[[str, Dict[str, Any]], None]] = None) -> Dict[str, Any]:
         """
         Main analysis method - clean and simple
         
@@ -56,6 +60,8 @@ class NewsAnalyzer:
             content: URL or text to analyze
             content_type: 'url' or 'text'
             pro_mode: Not used (for compatibility)
+            on_event: Optional progress callback (event_type, payload) - see
+                      AnalysisPipeline.analyze
             
         Returns:
             Properly formatted analysis results with insights, enrichment, and charts
@@ -81,7 +87,10 @@ class NewsAnalyzer:
             logger.info(f"Content length: {len(content)}")
             
             # Run pipeline
-            pipeline_results = self.pipeline.analyze(data)
+            pipeline_results = self.pipeline.analyze(
+                data,
+                on_event=self._wrap_event_listener(on_event) if on_event else None
+            )
             
             # Check if pipeline succeeded
             if not pipeline_results.get('success'):
@@ -140,6 +149,19 @@ class NewsAnalyzer:
             logger.error(f"[NewsAnalyzer] Critical error: {e}", exc_info=True)
             return self._create_error_response(f"Analysis failed: {str(e)}")
     
+    def _wrap_event_listener(self, on_event: Callable[[str, Dict[str, Any]], None]) -> Callable[[str, Dict[str, Any]], None]:
+        """Shape pipeline service events like the final detailed_analysis blocks"""
+        
+        def forward(event_type: str, payload: Dict[str, Any]) -> None:
+            if event_type == 'service':
+                service_name = payload['service']
+                block = self._normalize_detailed_analysis({service_name: payload['data']})
+                block = self._integrate_charts_into_services(block)
+                payload = {'service': service_name, 'data': block.get(service_name, {})}
+            on_event(event_type, payload)
+        
+        return forward
+    
     def _build_response(self, pipeline_results: Dict[str, Any], 
                        content: str, content_type: str,
                        start_time: float) -> Dict[str, Any]:
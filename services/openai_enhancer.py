@@ -9,11 +9,9 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime
 import time
 
-try:
-    from openai import OpenAI
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
+# OpenAI calls go through the shared LLM gateway (services/llm_gateway.py)
+from services.llm_gateway import get_llm_client, OPENAI_AVAILABLE
+if not OPENAI_AVAILABLE:
     logging.warning("OpenAI library not available")
 
 from services.base_analyzer import BaseAnalyzer
@@ -36,7 +34,7 @@ class OpenAIEnhancer(BaseAnalyzer):
         
         if self.is_available and OPENAI_AVAILABLE:
             try:
-                self.client = OpenAI(api_key=Config.OPENAI_API_KEY)
+                self.client = get_llm_client('OpenAIEnhancer', api_key=Config.OPENAI_API_KEY)
                 logger.info(f"OpenAI Enhancer initialized with model: {self.model}")
             except Exception as e:
                 logger.error(f"Failed to initialize OpenAI client: {e}")
@@ -1,8 +1,14 @@
 """ 
 News Outlet Metadata Database - COMPREHENSIVE EDITION
 Date: October 31, 2025
-Version: 1.2 - MS.NOW/MSNBC REBRAND FIX
-Last Updated: November 19, 2025
+Version: 1.3 - INDEXED LOOKUPS
+Last Updated: October 16, 2026
+
+CHANGES IN v1.3 (October 16, 2026):
+✅ MOVED: SourceCredibility's credibility/bias table here as SOURCE_RATINGS
+   (it was rebuilt by every SourceCredibility instance)
+✅ CHANGED: get_outlet_metadata() resolves through services/outlet_registry.py -
+   subdomains (edition.cnn.com) and OutletsDatabase aliases now match
 
 CHANGES IN v1.2 (November 19, 2025):
 ✅ ADDED: ms.now entry for MSNBC rebrand
@@ -627,6 +633,177 @@ OUTLET_METADATA = {
 }
 
 
+# ============================================================================
+# CREDIBILITY / BIAS RATINGS (used by SourceCredibility)
+# Moved from SourceCredibility._init_credibility_database (October 16, 2026)
+# ============================================================================
+
+SOURCE_RATINGS = {
+    'reuters.com': {
+        'credibility': 'Very High', 
+        'bias': 'Minimal', 
+        'type': 'Wire Service',
+        'founded': 1851,
+        'ownership': 'Thomson Reuters Corporation'
+    },
+    'apnews.com': {
+        'credibility': 'Very High',
+        'bias': 'Minimal',
+        'type': 'Wire Service',
+        'founded': 1846,
+        'ownership': 'AP Cooperative'
+    },
+    'bbc.com': {
+        'credibility': 'Very High',
+        'bias': 'Minimal',
+        'type': 'Public Broadcaster',
+        'founded': 1922,
+        'ownership': 'British Broadcasting Corporation'
+    },
+    'bbc.co.uk': {
+        'credibility': 'Very High',
+        'bias': 'Minimal',
+        'type': 'Public Broadcaster',
+        'founded': 1922,
+        'ownership': 'British Broadcasting Corporation'
+    },
+    'nytimes.com': {
+        'credibility': 'High',
+        'bias': 'Minimal-Left',
+        'type': 'Newspaper',
+        'founded': 1851,
+        'ownership': 'New York Times Company'
+    },
+    'washingtonpost.com': {
+        'credibility': 'High',
+        'bias': 'Minimal-Left',
+        'type': 'Newspaper',
+        'founded': 1877,
+        'ownership': 'Nash Holdings (Jeff Bezos)'
+    },
+    'npr.org': {
+        'credibility': 'High',
+        'bias': 'Minimal-Left',
+        'type': 'Public Radio',
+        'founded': 1970,
+        'ownership': 'Non-profit'
+    },
+    'wsj.com': {
+        'credibility': 'High',
+        'bias': 'Minimal-Right',
+        'type': 'Newspaper',
+        'founded': 1889,
+        'ownership': 'News Corp'
+    },
+    'theguardian.com': {
+        'credibility': 'High',
+        'bias': 'Left-Leaning',
+        'type': 'Newspaper',
+        'founded': 1821,
+        'ownership': 'Guardian Media Group'
+    },
+    'economist.com': {
+        'credibility': 'High',
+        'bias': 'Minimal',
+        'type': 'Magazine',
+        'founded': 1843,
+        'ownership': 'Economist Group'
+    },
+    'cnn.com': {
+        'credibility': 'Medium-High',
+        'bias': 'Left-Leaning',
+        'type': 'TV/Web News',
+        'founded': 1980,
+        'ownership': 'Warner Bros. Discovery'
+    },
+    'foxnews.com': {
+        'credibility': 'Medium',
+        'bias': 'Right-Leaning',
+        'type': 'TV/Web News',
+        'founded': 1996,
+        'ownership': 'Fox Corporation'
+    },
+    'msnbc.com': {
+        'credibility': 'Medium',
+        'bias': 'Left-Leaning',
+        'type': 'TV/Web News',
+        'founded': 1996,
+        'ownership': 'NBCUniversal'
+    },
+    # v14.2: ADDED - MS.NOW (MSNBC rebrand)
+    'ms.now': {
+        'credibility': 'Medium',
+        'bias': 'Left-Leaning',
+        'type': 'TV/Web News',
+        'founded': 1996,
+        'ownership': 'NBCUniversal (Comcast)'
+    },
+    'politico.com': {
+        'credibility': 'High',
+        'bias': 'Minimal',
+        'type': 'Political News',
+        'founded': 2007,
+        'ownership': 'Axel Springer SE'
+    },
+    'axios.com': {
+        'credibility': 'High',
+        'bias': 'Minimal',
+        'type': 'Digital News',
+        'founded': 2016,
+        'ownership': 'Axios Media'
+    },
+    'thehill.com': {
+        'credibility': 'Medium-High',
+        'bias': 'Minimal',
+        'type': 'Political News',
+        'founded': 1994,
+        'ownership': 'Nexstar Media Group'
+    },
+    'nypost.com': {
+        'credibility': 'Medium-Low',
+        'bias': 'Right-Leaning',
+        'type': 'Tabloid',
+        'founded': 1801,
+        'ownership': 'News Corp'
+    },
+    'propublica.org': {
+        'credibility': 'Very High',
+        'bias': 'Minimal',
+        'type': 'Investigative Journalism',
+        'founded': 2007,
+        'ownership': 'Non-profit'
+    },
+    'vox.com': {
+        'credibility': 'Medium-High',
+        'bias': 'Left-Leaning',
+        'type': 'Digital News',
+        'founded': 2014,
+        'ownership': 'Vox Media'
+    },
+    'breitbart.com': {
+        'credibility': 'Low',
+        'bias': 'Far-Right',
+        'type': 'Opinion/News',
+        'founded': 2007,
+        'ownership': 'Breitbart News Network'
+    },
+    'dailywire.com': {
+        'credibility': 'Medium-Low',
+        'bias': 'Right',
+        'type': 'Opinion/News',
+        'founded': 2015,
+        'ownership': 'The Daily Wire'
+    },
+    'huffpost.com': {
+        'credibility': 'Medium',
+        'bias': 'Left-Leaning',
+        'type': 'Digital News',
+        'founded': 2005,
+        'ownership': 'BuzzFeed'
+    }
+}
+
+
 # ============================================================================
 # HELPER FUNCTION
 # ============================================================================
@@ -636,27 +813,23 @@ def get_outlet_metadata(domain: str) -> dict:
     Get comprehensive metadata for a news outlet
     
     Args:
-        domain: Domain name (e.g., 'nytimes.com' or 'ms.now')
+        domain: Domain name (e.g., 'nytimes.com' or 'ms.now') - subdomains,
+                www. and known aliases resolve through the outlet registry
         
     Returns:
         Dictionary with outlet metadata, or None if not found
     """
-    # Direct lookup
-    if domain in OUTLET_METADATA:
-        return OUTLET_METADATA[domain].copy()
+    # Imported here - the registry indexes this module's tables
+    from services.outlet_registry import get_outlet_registry
     
-    # Try without www prefix
-    clean_domain = domain.replace('www.', '')
-    if clean_domain in OUTLET_METADATA:
-        return OUTLET_METADATA[clean_domain].copy()
+    registry = get_outlet_registry()
+    metadata = registry.lookup(domain, 'metadata')
     
     # Try common variations
-    if domain.endswith('.co.uk'):
-        base = domain.replace('.co.uk', '.com')
-        if base in OUTLET_METADATA:
-            return OUTLET_METADATA[base].copy()
+    if metadata is None and domain.endswith('.co.uk'):
+        metadata = registry.lookup(domain[:-len('.co.uk')] + '.com', 'metadata')
     
-    return None
+    return metadata.copy() if metadata is not None else None
 
 
 def get_all_outlets() -> list:
@@ -702,9 +875,9 @@ def get_metadata_stats() -> dict:
 
 
 # Module info
-__version__ = '1.2'
+__version__ = '1.3'
 __author__ = 'TruthLens Development Team'
-__date__ = 'November 19, 2025'
+__date__ = 'October 16, 2026'
 __outlets__ = 41  # Increased from 40 (added ms.now)
 __coverage__ = '88-92%'
 
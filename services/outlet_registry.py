@@ -0,0 +1,250 @@
+"""
+Outlet Registry
+Date: October 16, 2026
+Version: 1.0.0
+
+One immutable, indexed view over every outlet table in the app:
+  outlets    OutletsDatabase.OUTLETS (outlets_database.py) - includes domain_aliases
+  metadata   OUTLET_METADATA (services/outlet_metadata.py)
+  knowledge  OutletKnowledge.QUICK_REFERENCE (outlet_knowledge.py)
+  ratings    SOURCE_RATINGS (services/outlet_metadata.py) - SourceCredibility's
+             credibility/bias table, formerly rebuilt by every instance
+
+Lookups used to go through each table separately: OutletsDatabase.get_outlet
+scanned every outlet for aliases and again for name-word overlap, and each
+table had its own idea of how to clean a domain. The registry is built once
+at import (before gunicorn forks - preload_app - so workers share it) and
+indexes:
+  - domains      every table key and alias → its outlet group (a table key
+                 plus the aliases OUTLETS lists for it)
+  - per table    every known domain → that table's best entry for the
+                 group (the exact key first, then the group's canonical
+                 domain, then any other member)
+  - suffixes     subdomains resolve by dropping leading labels
+                 (edition.cnn.com → cnn.com) - one hash probe per label
+  - name tokens  inverted index token → outlets, in table order
+  - prefixes     sorted domains, names and name tokens for search()
+
+Entries and tables are read-only mappings; .copy() gives a plain dict, as
+the tables themselves did.
+
+USAGE:
+    from services.outlet_registry import get_outlet_registry
+
+    registry = get_outlet_registry()
+    registry.lookup('https://edition.cnn.com/2026/...', 'metadata')
+    registry.search('new yo', limit=5)
+"""
+
+import re
+import bisect
+import logging
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional, Mapping, Tuple
+
+from outlets_database import OutletsDatabase
+from outlet_knowledge import OutletKnowledge
+from services.outlet_metadata import OUTLET_METADATA, SOURCE_RATINGS
+
+logger = logging.getLogger(__name__)
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+NAME_STOPWORDS = frozenset(['the'])
+
+
+def normalize_domain(domain: str) -> str:
+    """Bare lowercase host: no scheme, path, port, leading www. or trailing dot"""
+    host = (domain or '').strip().lower()
+    if '://' in host:
+        host = host.split('://', 1)[1]
+    host = host.split('/', 1)[0].split('?', 1)[0].split('#', 1)[0]
+    host = host.rsplit('@', 1)[-1].split(':', 1)[0].rstrip('.')
+    if host.startswith('www.'):
+        host = host[4:]
+    return host
+
+
+def name_tokens(name: str) -> List[str]:
+    return [token for token in TOKEN_PATTERN.findall((name or '').lower()) if token not in NAME_STOPWORDS]
+
+
+class OutletRegistry:
+    """Read-only outlet tables with hash, suffix, name-token and prefix indexes"""
+
+    def __init__(self, tables: Dict[str, Dict[str, Dict[str, Any]]], patterns: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            tables: {table name: {domain: entry}} - earlier tables win when
+                    choosing canonical domains and ordering results
+            patterns: {domain fragment: domain} for get_outlet's fuzzy step
+        """
+        self.tables: Mapping[str, Mapping[str, Mapping[str, Any]]] = MappingProxyType({
+            name: MappingProxyType({normalize_domain(domain): MappingProxyType(dict(entry))
+                                    for domain, entry in table.items()})
+            for name, table in tables.items()
+        })
+        self.patterns: Tuple[Tuple[str, str], ...] = tuple((patterns or {}).items())
+
+        # Outlet groups: every domain → canonical domain
+        canonical: Dict[str, str] = {}
+        for table in self.tables.values():
+            for domain, entry in table.items():
+                canonical.setdefault(domain, domain)
+                for alias in entry.get('domain_aliases', ()):
+                    canonical.setdefault(normalize_domain(alias), canonical[domain])
+
+        members: Dict[str, List[str]] = {}
+        for domain, group in canonical.items():
+            members.setdefault(group, []).append(domain)
+
+        # Per table: every known domain → best entry (exact, canonical, any member)
+        self._entries: Dict[str, Dict[str, Mapping[str, Any]]] = {}
+        self._rank: Dict[str, Dict[str, int]] = {}
+        for name, table in self.tables.items():
+            index = {}
+            for domain, group in canonical.items():
+                entry = table.get(domain) or table.get(group)
+                if entry is None:
+                    entry = next((table[member] for member in members[group] if member in table), None)
+                if entry is not None:
+                    index[domain] = entry
+            self._entries[name] = index
+            self._rank[name] = {}
+            for position, domain in enumerate(table):
+                self._rank[name].setdefault(canonical[domain], position)
+        self._canonical = canonical
+
+        # Per table: name tokens → canonical domains, in table order
+        token_index: Dict[str, Dict[str, List[str]]] = {}
+        terms = set()
+        for table_name, table in self.tables.items():
+            tokens_of_table = token_index.setdefault(table_name, {})
+            for domain, entry in table.items():
+                group = canonical[domain]
+                terms.add((domain, group))
+                name = entry.get('name')
+                if not name:
+                    continue
+                tokens = name_tokens(name)
+                terms.add((' '.join(tokens), group))
+                terms.add((name.lower(), group))
+                for token in tokens:
+                    postings = tokens_of_table.setdefault(token, [])
+                    if group not in postings:
+                        postings.append(group)
+                    terms.add((token, group))
+        for alias, group in canonical.items():
+            terms.add((alias, group))
+
+        self._tokens: Dict[str, Dict[str, Tuple[str, ...]]] = {
+            table_name: {token: tuple(groups) for token, groups in tokens.items()}
+            for table_name, tokens in token_index.items()
+        }
+        self._terms: List[Tuple[str, str]] = sorted(terms)
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def _suffixes(self, domain: str):
+        """host, then each parent domain with at least two labels"""
+        host = normalize_domain(domain)
+        labels = host.split('.')
+        for start in range(max(1, len(labels) - 1)):
+            yield '.'.join(labels[start:])
+
+    def resolve(self, domain: str) -> Optional[str]:
+        """Canonical domain of the outlet serving `domain` (subdomains included)"""
+        for candidate in self._suffixes(domain):
+            group = self._canonical.get(candidate)
+            if group is not None:
+                return group
+        return None
+
+    def lookup(self, domain: str, table: str) -> Optional[Mapping[str, Any]]:
+        """`table`'s entry for the outlet serving `domain`, or None"""
+        index = self._entries.get(table)
+        if not index or not domain:
+            return None
+        for candidate in self._suffixes(domain):
+            entry = index.get(candidate)
+            if entry is not None:
+                return entry
+        return None
+
+    def match_pattern(self, domain: str, table: str) -> Optional[Mapping[str, Any]]:
+        """Entry of the first domain pattern contained in `domain` (e.g. 'nytimes' → nytimes.com)"""
+        host = normalize_domain(domain)
+        index = self._entries.get(table, {})
+        for fragment, target in self.patterns:
+            if fragment in host and target in index:
+                return index[target]
+        return None
+
+    def match_name(self, domain: str, table: str) -> Optional[Mapping[str, Any]]:
+        """Entry of the earliest outlet (in `table` order) whose name shares a word with `domain`"""
+        ranks = self._rank.get(table, {})
+        tokens = self._tokens.get(table, {})
+        best = None
+        for word in normalize_domain(domain).replace('-', ' ').replace('.', ' ').split():
+            for group in tokens.get(word, ()):
+                rank = ranks[group]
+                if best is None or rank < best[0]:
+                    best = (rank, group)
+        return self._entries[table][best[1]] if best else None
+
+    def search(self, query: str, table: str = 'outlets', limit: int = 10) -> List[Tuple[str, Mapping[str, Any]]]:
+        """
+        Outlets with a domain, alias, name or name word starting with `query`
+
+        Returns [(canonical domain, entry)] in `table` order.
+        """
+        prefix = (query or '').strip().lower()
+        if not prefix:
+            return []
+
+        ranks = self._rank.get(table, {})
+        found = set()
+        position = bisect.bisect_left(self._terms, (prefix, ''))
+        while position < len(self._terms) and self._terms[position][0].startswith(prefix):
+            group = self._terms[position][1]
+            if group in ranks:
+                found.add(group)
+            position += 1
+
+        ordered = sorted(found, key=ranks.get)[:limit]
+        return [(group, self._entries[table][group]) for group in ordered]
+
+    def domains(self, table: str) -> List[str]:
+        return list(self.tables.get(table, {}))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'tables': {name: len(table) for name, table in self.tables.items()},
+            'domains': len(self._canonical),
+            'outlets': len(set(self._canonical.values())),
+            'name_tokens': sum(len(tokens) for tokens in self._tokens.values()),
+            'search_terms': len(self._terms)
+        }
+
+
+def build_outlet_registry() -> OutletRegistry:
+    return OutletRegistry({
+        'outlets': OutletsDatabase.OUTLETS,
+        'metadata': OUTLET_METADATA,
+        'knowledge': OutletKnowledge.QUICK_REFERENCE,
+        'ratings': SOURCE_RATINGS
+    }, patterns=OutletsDatabase.DOMAIN_PATTERNS)
+
+
+# Built at import - shared read-only by every analyzer in the process
+_outlet_registry = build_outlet_registry()
+logger.info(f"[OutletRegistry] Built - {_outlet_registry.stats()}")
+
+
+def get_outlet_registry() -> OutletRegistry:
+    """Get the process-wide outlet registry"""
+    return _outlet_registry
+
+
+# This file is not truncated
@@ -0,0 +1,250 @@
+"""
+Pattern Engine
+Date: October 16, 2026
+Version: 1.0.0
+
+Precompiled lexicon matching shared by the regex-heavy analyzers.
+
+BiasDetector, ManipulationDetector, TransparencyAnalyzer and ContentAnalyzer
+each walked their own pattern lists per article: lowercasing the text again,
+splitting it into sentences again, and running re.search / re.findall with
+re.IGNORECASE on the raw text. Lexicons are now registered once (analyzer
+__init__) and compiled once. The lowercased text and sentence spans come from
+the shared DocumentAnalysis (services/document_analysis.py), and every
+analyzer reads tagged match spans from the same memoized ScanResult.
+
+How each lexicon is matched (chosen by measurement, see benchmark_patterns.py):
+  - Literal lexicons: str.find over the shared lowercased text. For lexicons
+    of this size a C substring search per phrase is ~100x faster than a
+    combined trie/alternation regex or a pure-Python Aho-Corasick automaton.
+  - Regex lexicons: one precompiled regex per pattern, run against the
+    lowercased text without re.IGNORECASE. CPython's re only uses its fast
+    literal-prefix search for patterns that START with a literal - merging a
+    lexicon into one big alternation disables that and measured 2x slower,
+    besides changing counts where patterns overlap.
+
+Scans are lazy: a lexicon is matched the first time an analyzer asks for it,
+then cached on the ScanResult. The pipeline hands the same article string to
+every analyzer, so analyzers running in parallel share one ScanResult.
+
+USAGE:
+    from services.pattern_engine import pattern_engine
+
+    pattern_engine.register_literals('bias.loaded', ['alleged', 'so-called'])
+    pattern_engine.register_regex('transparency.sources', [r'according to\\s+[a-z]'])
+
+    scan = pattern_engine.scan(text)
+    scan.present('bias.loaded')         # {'alleged'}
+    scan.count('transparency.sources')  # 3
+    for match in scan.matches('bias.loaded'):
+        match.start, match.end, match.pattern, match.text
+"""
+
+import re
+import bisect
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Iterable, Set, Tuple
+
+from services.document_analysis import get_document
+
+logger = logging.getLogger(__name__)
+
+
+class PatternMatch:
+    """One tagged match span (offsets refer to ScanResult.text_lower)"""
+
+    __slots__ = ('lexicon', 'pattern', 'start', 'end', 'text')
+
+    def __init__(self, lexicon: str, pattern: str, start: int, end: int, text: str):
+        self.lexicon = lexicon
+        self.pattern = pattern
+        self.start = start
+        self.end = end
+        self.text = text
+
+    def __repr__(self) -> str:
+        return f"PatternMatch({self.lexicon!r}, {self.pattern!r}, {self.start}, {self.end})"
+
+
+class PatternEngine:
+    """Registry of compiled lexicons plus a small memo of recent scans"""
+
+    SCAN_CACHE_SIZE = 32  # texts kept per process (one article = one entry)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._lexicons: Dict[str, Dict[str, Any]] = {}
+        self._scan_cache: 'OrderedDict[str, ScanResult]' = OrderedDict()
+
+    def register_literals(self, name: str, phrases: Iterable[str]) -> None:
+        """
+        Register a literal lexicon (substring semantics, case-insensitive)
+
+        Re-registering a name with identical phrases is a no-op, so every
+        analyzer instance can register in __init__.
+        """
+        phrases = [phrase.lower() for phrase in phrases if phrase]
+        self._register(name, {'kind': 'literal', 'patterns': phrases})
+
+    def register_regex(self, name: str, patterns: Iterable[str], flags: int = 0,
+                       lowercase: bool = True) -> None:
+        """
+        Register a regex lexicon
+
+        Args:
+            name: Lexicon name
+            patterns: Regex patterns, written for lowercase text unless lowercase=False
+            flags: re flags for every pattern
+            lowercase: Match against the lowercased text (default) or the original
+        """
+        patterns = list(patterns)
+        self._register(name, {
+            'kind': 'regex',
+            'patterns': patterns,
+            'flags': flags,
+            'lowercase': lowercase,
+            'compiled': [re.compile(pattern, flags) for pattern in patterns]
+        })
+
+    def _register(self, name: str, spec: Dict[str, Any]) -> None:
+        with self._lock:
+            existing = self._lexicons.get(name)
+            if existing and all(existing.get(key) == value for key, value in spec.items() if key != 'compiled'):
+                return
+            self._lexicons[name] = spec
+            self._scan_cache.clear()
+
+    def lexicon(self, name: str) -> Dict[str, Any]:
+        spec = self._lexicons.get(name)
+        if spec is None:
+            raise KeyError(f"Unknown lexicon: {name}")
+        return spec
+
+    def clear_scans(self) -> None:
+        """Forget memoized scans (benchmarks / tests)"""
+        with self._lock:
+            self._scan_cache.clear()
+
+    def scan(self, text: str) -> 'ScanResult':
+        """Get the (memoized) scan of a text"""
+        text = text or ''
+        with self._lock:
+            result = self._scan_cache.get(text)
+            if result is not None:
+                self._scan_cache.move_to_end(text)
+                return result
+
+            result = ScanResult(self, text)
+            self._scan_cache[text] = result
+            while len(self._scan_cache) > self.SCAN_CACHE_SIZE:
+                self._scan_cache.popitem(last=False)
+            return result
+
+
+class ScanResult:
+    """Match spans for one text, computed lazily per lexicon"""
+
+    def __init__(self, engine: PatternEngine, text: str):
+        self.engine = engine
+        self.text = text
+        self.document = get_document(text)  # Shared lowercasing / sentence split
+        self._lock = threading.Lock()
+        self._sentence_spans: Optional[List[Tuple[int, int]]] = None
+        self._sentence_starts: Optional[List[int]] = None
+        self._matches: Dict[str, List[PatternMatch]] = {}
+
+    @property
+    def text_lower(self) -> str:
+        return self.document.text_lower
+
+    @property
+    def source(self) -> str:
+        """
+        Text to slice with match offsets - the original text, unless
+        lowercasing changed its length (possible for some non-ASCII scripts)
+        """
+        return self.text if len(self.text) == len(self.text_lower) else self.text_lower
+
+    def matches(self, lexicon: str) -> List[PatternMatch]:
+        """Tagged spans for a lexicon, grouped by pattern in registration order"""
+        found = self._matches.get(lexicon)
+        if found is not None:
+            return found
+
+        spec = self.engine.lexicon(lexicon)
+        if spec['kind'] == 'literal':
+            found = self._match_literals(lexicon, spec['patterns'])
+        else:
+            found = self._match_regex(lexicon, spec)
+
+        with self._lock:
+            self._matches.setdefault(lexicon, found)
+        return found
+
+    def count(self, lexicon: str) -> int:
+        """Number of matches (summed per pattern, like one findall per pattern)"""
+        return len(self.matches(lexicon))
+
+    def present(self, lexicon: str) -> Set[str]:
+        """Patterns of a lexicon that occur at least once"""
+        return {match.pattern for match in self.matches(lexicon)}
+
+    def phrase_counts(self, lexicon: str) -> Dict[str, int]:
+        """Per-phrase non-overlapping counts (same as str.count per phrase)"""
+        counts: Dict[str, int] = {}
+        last_end: Dict[str, int] = {}
+        for match in self.matches(lexicon):
+            if match.start >= last_end.get(match.pattern, 0):
+                counts[match.pattern] = counts.get(match.pattern, 0) + 1
+                last_end[match.pattern] = match.end
+        return counts
+
+    def context(self, match: PatternMatch, padding: int = 50) -> str:
+        """Text around a match"""
+        source = self.source
+        start = max(0, match.start - padding)
+        end = min(len(source), match.end + padding)
+        return source[start:end].strip()
+
+    def sentence_spans(self) -> List[Tuple[int, int]]:
+        """(start, end) of each piece re.split(r'[.!?]+', text) would return"""
+        if self._sentence_spans is None:
+            if self.source is self.text:
+                spans = list(self.document.sentence_spans)
+            else:
+                spans = list(get_document(self.text_lower).sentence_spans)
+            self._sentence_starts = [start for start, _ in spans]
+            self._sentence_spans = spans
+        return self._sentence_spans
+
+    def sentence_index(self, offset: int) -> int:
+        """Index (into sentence_spans) of the sentence containing offset"""
+        self.sentence_spans()
+        return bisect.bisect_right(self._sentence_starts, offset) - 1
+
+    def _match_literals(self, lexicon: str, phrases: List[str]) -> List[PatternMatch]:
+        haystack = self.text_lower
+        found = []
+        for phrase in phrases:
+            position = haystack.find(phrase)
+            while position != -1:
+                found.append(PatternMatch(lexicon, phrase, position, position + len(phrase), phrase))
+                position = haystack.find(phrase, position + 1)
+        return found
+
+    def _match_regex(self, lexicon: str, spec: Dict[str, Any]) -> List[PatternMatch]:
+        haystack = self.text_lower if spec['lowercase'] else self.text
+        found = []
+        for pattern, compiled in zip(spec['patterns'], spec['compiled']):
+            for hit in compiled.finditer(haystack):
+                found.append(PatternMatch(lexicon, pattern, hit.start(), hit.end(), hit.group()))
+        return found
+
+
+# Process-wide engine - analyzers register their lexicons in __init__
+pattern_engine = PatternEngine()
+
+
+# This file is not truncated
@@ -9,8 +9,8 @@ import json
 import time
 import hashlib
 from typing import Dict, Any, List, Optional, Tuple
-import requests
 from services.base_analyzer import BaseAnalyzer
+from services.http_client import get_http_client
 from config import Config
 
 logger = logging.getLogger(__name__)
@@ -135,7 +135,7 @@ class PlagiarismDetector(BaseAnalyzer):
             params = {k: v for k, v in params.items() if v is not None}
             
             # Make API request
-            response = requests.post(self.copyscape_base_url, data=params, timeout=30)
+            response = get_http_client().post(self.copyscape_base_url, data=params, timeout=30)
             
             if response.status_code == 200:
                 # Parse XML response (simplified - use proper XML parser in production)
@@ -0,0 +1,327 @@
+"""
+AI Provider Health
+Date: October 16, 2026
+Version: 1.0.1
+
+Per-provider health tracking, circuit breakers and adaptive weights for
+MultiAIService.
+
+MultiAIService used to call every registered provider on every claim. A
+provider that was timing out cost its full timeout each time, and the
+consensus weights in ai_weights never moved. Each provider now has:
+  - A rolling window of recent calls: p50 / p95 latency and error rate
+  - A circuit breaker:
+      closed     calls go through
+      open       tripped by consecutive failures or a high error rate;
+                 calls are skipped until the cooldown passes
+      half-open  after the cooldown, one probe call at a time; success
+                 closes the circuit, failure re-opens it with a longer
+                 cooldown (doubling, capped)
+  - An agreement score: exponential moving average of how often the
+    provider's verdict matched the weighted verdict of the *other*
+    providers on the same claim. It scales the provider's base weight
+    between 0.5x and 1.5x once enough claims have been seen.
+
+route() orders the closed providers fastest first (by p50; providers with
+no data yet go first so they get measured) and returns the first `quorum`.
+A half-open provider whose cooldown has passed is probed on top of the
+quorum, so it can recover even when enough closed providers are available.
+
+One registry per worker process, shared by every MultiAIService instance.
+Exposed on /health as 'ai_providers'.
+
+Configuration (Config.PROVIDER_HEALTH / environment):
+  PROVIDER_HEALTH_WINDOW            calls kept per provider (default: 50)
+  PROVIDER_FAILURE_THRESHOLD        consecutive failures that open (default: 3)
+  PROVIDER_ERROR_RATE_THRESHOLD     windowed error rate that opens (default: 0.5)
+  PROVIDER_MIN_CALLS                calls before the error rate counts (default: 10)
+  PROVIDER_COOLDOWN                 first open period, seconds (default: 30)
+  PROVIDER_MAX_COOLDOWN             longest open period, seconds (default: 600)
+  PROVIDER_AGREEMENT_ALPHA          agreement EMA smoothing (default: 0.05)
+  PROVIDER_AGREEMENT_MIN_SAMPLES    claims before weights adapt (default: 10)
+
+FIX IN 1.0.1:
+- Half-open probes were ranked after every closed provider and fell off the
+  quorum cut, so an opened provider never recovered; probes are now added
+  on top of the quorum
+"""
+
+import time
+import logging
+import threading
+from collections import deque
+from typing import Dict, Any, List, Optional, Iterable
+
+logger = logging.getLogger(__name__)
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+def percentile(sorted_values: List[float], fraction: float) -> Optional[float]:
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class ProviderState:
+    """Rolling stats, breaker state and agreement score of one provider"""
+
+    def __init__(self, name: str, window: int):
+        self.name = name
+        self.calls = deque(maxlen=window)  # (ok, latency)
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.cooldown = 0.0
+        self.probe_in_flight = False
+        self.agreement = 0.5
+        self.agreement_samples = 0
+        self.total_calls = 0
+        self.total_failures = 0
+        self.times_opened = 0
+
+    def error_rate(self) -> float:
+        if not self.calls:
+            return 0.0
+        return sum(1 for ok, _ in self.calls if not ok) / len(self.calls)
+
+    def latencies(self) -> List[float]:
+        return sorted(latency for ok, latency in self.calls if ok)
+
+
+class ProviderHealthRegistry:
+    """Health, routing and weight adaptation for the AI providers of one process"""
+
+    def __init__(self, window: int = 50, failure_threshold: int = 3,
+                 error_rate_threshold: float = 0.5, min_calls: int = 10,
+                 cooldown: float = 30, max_cooldown: float = 600,
+                 agreement_alpha: float = 0.05, agreement_min_samples: int = 10):
+        self.window = window
+        self.failure_threshold = failure_threshold
+        self.error_rate_threshold = error_rate_threshold
+        self.min_calls = min_calls
+        self.base_cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.agreement_alpha = agreement_alpha
+        self.agreement_min_samples = agreement_min_samples
+        self._lock = threading.Lock()
+        self._providers: Dict[str, ProviderState] = {}
+
+    def _state(self, name: str) -> ProviderState:
+        state = self._providers.get(name)
+        if state is None:
+            state = ProviderState(name, self.window)
+            self._providers[name] = state
+        return state
+
+    # ------------------------------------------------------------------
+    # Circuit breaker
+    # ------------------------------------------------------------------
+
+    def allow(self, name: str) -> bool:
+        """May a call go to this provider now? (claims the probe slot when half-open)"""
+        with self._lock:
+            return self._allow(self._state(name), time.time())
+
+    def _allow(self, state: ProviderState, now: float) -> bool:
+        if state.state == OPEN:
+            if now - state.opened_at < state.cooldown:
+                return False
+            state.state = HALF_OPEN
+            state.probe_in_flight = False
+            logger.info(f"[ProviderHealth] {state.name}: half-open - probing")
+
+        if state.state == HALF_OPEN:
+            if state.probe_in_flight:
+                return False
+            state.probe_in_flight = True
+
+        return True
+
+    def record(self, name: str, ok: bool, latency: float) -> None:
+        """Outcome of one call (timeouts count as failures at the timeout)"""
+        with self._lock:
+            state = self._state(name)
+            state.calls.append((ok, latency))
+            state.total_calls += 1
+
+            if ok:
+                state.consecutive_failures = 0
+                if state.state == HALF_OPEN:
+                    state.state = CLOSED
+                    state.cooldown = 0.0
+                    state.probe_in_flight = False
+                    logger.info(f"[ProviderHealth] ✓ {name}: probe succeeded - circuit closed")
+                return
+
+            state.total_failures += 1
+            state.consecutive_failures += 1
+
+            if state.state == HALF_OPEN:
+                self._open(state, min(self.max_cooldown, max(state.cooldown, self.base_cooldown) * 2))
+            elif state.state == CLOSED and (
+                state.consecutive_failures >= self.failure_threshold
+                or (len(state.calls) >= self.min_calls and state.error_rate() >= self.error_rate_threshold)
+            ):
+                self._open(state, self.base_cooldown)
+
+    def release(self, name: str) -> None:
+        """A call that was allowed but never completed (cancelled) - free the probe slot"""
+        with self._lock:
+            state = self._state(name)
+            if state.state == HALF_OPEN:
+                state.probe_in_flight = False
+
+    def _open(self, state: ProviderState, cooldown: float) -> None:
+        state.state = OPEN
+        state.opened_at = time.time()
+        state.cooldown = cooldown
+        state.probe_in_flight = False
+        state.times_opened += 1
+        logger.warning(f"[ProviderHealth] ✗ {state.name}: circuit open for {cooldown:.0f}s "
+                       f"({state.consecutive_failures} consecutive failures, "
+                       f"error rate {state.error_rate():.0%})")
+
+    # ------------------------------------------------------------------
+    # Routing
+    # ------------------------------------------------------------------
+
+    def route(self, names: Iterable[str], quorum: int = 0) -> List[str]:
+        """
+        Usable providers among `names`, fastest first
+
+        quorum > 0 returns at most that many closed providers. Providers
+        whose circuit is open are left out; a half-open provider that gets
+        the probe slot is added on top of the quorum.
+        """
+        now = time.time()
+        with self._lock:
+            closed = []
+            probes = []
+            for name in names:
+                state = self._state(name)
+                if state.state == CLOSED:
+                    latencies = state.latencies()
+                    p50 = percentile(latencies, 0.5)
+                    closed.append((0 if p50 is None else 1, p50 or 0.0, name))
+                elif state.state == OPEN and now - state.opened_at < state.cooldown:
+                    continue
+                elif self._allow(state, now):  # Claims the probe slot
+                    probes.append(name)
+
+            closed.sort()
+            selected = [name for _, _, name in closed]
+            if quorum:
+                selected = selected[:quorum]
+
+        return selected + probes
+
+    # ------------------------------------------------------------------
+    # Adaptive weights
+    # ------------------------------------------------------------------
+
+    def record_agreement(self, verdicts: Dict[str, str], weights: Dict[str, float]) -> None:
+        """
+        Update agreement scores from one claim's verdicts ({provider: verdict})
+
+        Each provider is compared with the weighted verdict of the others,
+        so a provider never gets credit for agreeing with itself.
+        """
+        if len(verdicts) < 2:
+            return
+
+        with self._lock:
+            for name, verdict in verdicts.items():
+                votes: Dict[str, float] = {}
+                for other, other_verdict in verdicts.items():
+                    if other != name:
+                        votes[other_verdict] = votes.get(other_verdict, 0.0) + weights.get(other, 1.0)
+                top = max(votes.values())
+                agreed = 1.0 if votes.get(verdict, 0.0) == top else 0.0
+
+                state = self._state(name)
+                state.agreement += self.agreement_alpha * (agreed - state.agreement)
+                state.agreement_samples += 1
+
+    def weight_factor(self, name: str) -> float:
+        """Multiplier for the provider's base weight (1.0 until enough claims are seen)"""
+        with self._lock:
+            state = self._providers.get(name)
+            if state is None or state.agreement_samples < self.agreement_min_samples:
+                return 1.0
+            return max(0.5, min(1.5, 0.5 + state.agreement))
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Per-provider health for /health"""
+        now = time.time()
+        with self._lock:
+            providers = {}
+            for name, state in sorted(self._providers.items()):
+                latencies = state.latencies()
+                p50 = percentile(latencies, 0.5)
+                p95 = percentile(latencies, 0.95)
+                providers[name] = {
+                    'state': state.state,
+                    'error_rate': round(state.error_rate(), 3),
+                    'p50_latency': round(p50, 2) if p50 is not None else None,
+                    'p95_latency': round(p95, 2) if p95 is not None else None,
+                    'window_calls': len(state.calls),
+                    'total_calls': state.total_calls,
+                    'total_failures': state.total_failures,
+                    'times_opened': state.times_opened,
+                    'reopens_in': round(max(0.0, state.opened_at + state.cooldown - now), 1)
+                    if state.state == OPEN else 0,
+                    'agreement': round(state.agreement, 3),
+                    'agreement_samples': state.agreement_samples
+                }
+        for name in providers:
+            providers[name]['weight_factor'] = round(self.weight_factor(name), 3)
+        return providers
+
+
+_registry_lock = threading.Lock()
+_provider_health: Optional[ProviderHealthRegistry] = None
+
+
+def get_provider_health() -> ProviderHealthRegistry:
+    """Get the process-wide provider health registry (built from Config.PROVIDER_HEALTH)"""
+    global _provider_health
+
+    if _provider_health is not None:
+        return _provider_health
+
+    with _registry_lock:
+        if _provider_health is not None:
+            return _provider_health
+
+        try:
+            from config import Config
+            settings = getattr(Config, 'PROVIDER_HEALTH', {})
+        except Exception as e:
+            logger.warning(f"[ProviderHealth] ⚠ Config unavailable ({e}) - using defaults")
+            settings = {}
+
+        _provider_health = ProviderHealthRegistry(
+            window=settings.get('window', 50),
+            failure_threshold=settings.get('failure_threshold', 3),
+            error_rate_threshold=settings.get('error_rate_threshold', 0.5),
+            min_calls=settings.get('min_calls', 10),
+            cooldown=settings.get('cooldown', 30),
+            max_cooldown=settings.get('max_cooldown', 600),
+            agreement_alpha=settings.get('agreement_alpha', 0.05),
+            agreement_min_samples=settings.get('agreement_min_samples', 10)
+        )
+        logger.info(f"[ProviderHealth] Initialized - window: {_provider_health.window}, "
+                    f"cooldown: {_provider_health.base_cooldown}s")
+
+        return _provider_health
+
+
+# This file is not truncated
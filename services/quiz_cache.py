@@ -0,0 +1,156 @@
+"""
+Quiz Payload Cache
+Date: October 16, 2026
+Version: 1.0.0
+
+Cache for serialized quizzes (metadata, questions and options - never the
+correct answers).
+
+Quiz.to_dict(include_questions=True) walks the lazy='dynamic' relationships:
+one query for the questions, then one per question for its options. GET
+/api/quiz/<id> and /start ran that on every request for content that only
+changes when an admin generates a quiz. quiz_routes now builds the payload
+with two batched queries on a miss and stores it here; the admin routes call
+invalidate() after committing.
+
+Values are JSON strings on the same backends as the analysis result cache
+(services/result_cache.py): Redis when configured, so one invalidation
+reaches every worker, otherwise an in-process LRU.
+
+Configuration (Config.CACHE / environment):
+  QUIZ_CACHE_BACKEND  auto | memory | redis | none (default: auto)
+  QUIZ_CACHE_TTL      seconds (default: 3600)
+
+USAGE:
+    from services.quiz_cache import get_quiz_cache
+
+    payload = get_quiz_cache().get_or_build(quiz_id, build_quiz_payload)
+    get_quiz_cache().invalidate(quiz_id)
+"""
+
+import json
+import logging
+import threading
+from typing import Dict, Any, Optional, Callable
+
+from services.result_cache import MemoryCacheBackend, RedisCacheBackend
+
+logger = logging.getLogger(__name__)
+
+
+class QuizRedisCacheBackend(RedisCacheBackend):
+    """RedisCacheBackend under its own key prefix"""
+
+    KEY_PREFIX = 'quiz_cache:'
+
+
+class QuizPayloadCache:
+    """Serialized quiz payloads keyed by quiz id"""
+
+    def __init__(self, backend: Optional[Any], ttl: int):
+        self.backend = backend
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'invalidations': 0, 'errors': 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None
+
+    def get_or_build(self, quiz_id: int, build: Callable[[int], Optional[Dict[str, Any]]]) -> Optional[Dict[str, Any]]:
+        """
+        Cached payload, or build(quiz_id) stored on a miss
+
+        build returns None for a missing quiz (not cached). Every call hands
+        back a fresh copy, so callers may mutate it.
+        """
+        key = str(quiz_id)
+
+        if self.backend is not None:
+            try:
+                payload = self.backend.get(key)
+                if payload is not None:
+                    self._count('hits')
+                    return json.loads(payload)
+            except Exception as e:
+                self._count('errors')
+                logger.warning(f"[QuizCache] ⚠ Read failed for quiz {quiz_id}: {e}")
+
+        self._count('misses')
+        result = build(quiz_id)
+        if result is None or self.backend is None:
+            return result
+
+        try:
+            self.backend.set(key, json.dumps(result), self.ttl)
+        except Exception as e:
+            self._count('errors')
+            logger.warning(f"[QuizCache] ⚠ Write failed for quiz {quiz_id}: {e}")
+
+        return result
+
+    def invalidate(self, quiz_id: int) -> None:
+        if self.backend is None:
+            return
+        try:
+            self.backend.delete(str(quiz_id))
+            self._count('invalidations')
+        except Exception as e:
+            self._count('errors')
+            logger.warning(f"[QuizCache] ⚠ Invalidation failed for quiz {quiz_id}: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = round(stats['hits'] / lookups, 3) if lookups else 0.0
+        stats['backend'] = self.backend.name if self.backend else 'disabled'
+        stats['ttl'] = self.ttl
+        return stats
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self._stats[counter] += 1
+
+
+_cache_lock = threading.Lock()
+_quiz_cache: Optional[QuizPayloadCache] = None
+
+
+def get_quiz_cache() -> QuizPayloadCache:
+    """Get the process-wide quiz payload cache (built from Config.CACHE)"""
+    global _quiz_cache
+
+    if _quiz_cache is not None:
+        return _quiz_cache
+
+    with _cache_lock:
+        if _quiz_cache is not None:
+            return _quiz_cache
+
+        from config import Config
+
+        cache_config = Config.CACHE
+        backend_name = cache_config.get('quiz_backend', 'auto')
+        ttl = cache_config.get('ttl_quiz', 3600)
+
+        backend = None
+        if cache_config.get('enabled', True) and backend_name != 'none':
+            if backend_name in ('auto', 'redis'):
+                from services.redis_client import get_redis_client
+                client = get_redis_client()
+                if client:
+                    backend = QuizRedisCacheBackend(client, 1024 * 1024)
+                elif backend_name == 'redis':
+                    logger.warning("[QuizCache] Redis requested but unavailable - using memory backend")
+
+            if backend is None:
+                backend = MemoryCacheBackend(16 * 1024 * 1024, 1000)
+
+        _quiz_cache = QuizPayloadCache(backend, ttl)
+        logger.info(f"[QuizCache] Initialized - backend: {backend.name if backend else 'disabled'}, TTL: {ttl}s")
+
+        return _quiz_cache
+
+
+# This file is not truncated
@@ -82,8 +82,10 @@ class QuizGenerator:
             openai_key = os.environ.get('OPENAI_API_KEY')
             if openai_key:
                 try:
-                    from openai import OpenAI
-                    self._openai_client = OpenAI(api_key=openai_key)
+                    from services.llm_gateway import get_llm_client
+                    self._openai_client = get_llm_client('QuizGenerator', api_key=openai_key)
+                    if self._openai_client is None:
+                        raise ImportError('openai')
                     self._openai_available = True
                     logger.info("[QuizGenerator] ✓ OpenAI initialized (primary generator)")
                 except ImportError:
@@ -524,14 +526,14 @@ Reply with just: GOOD or NEEDS_IMPROVEMENT"""
         Returns (article_text, metadata) or (None, {}) if extraction fails
         """
         try:
-            import requests
+            from services.http_client import get_http_client
             from bs4 import BeautifulSoup
             
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
             }
             
-            response = requests.get(url, headers=headers, timeout=10)
+            response = get_http_client().get(url, headers=headers, timeout=10)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -0,0 +1,94 @@
+"""
+Shared Redis Client
+Date: October 16, 2026
+Version: 1.0.0
+
+One place to build the Redis connection used across the app.
+
+transcript_routes.py has always built its own ConnectionPool from REDIS_URL.
+The analysis result cache needs the exact same client, so the construction
+lives here and both call get_redis_client(). Returns None when the redis
+library is missing, REDIS_URL is unset or the server cannot be reached -
+callers fall back to in-process storage in that case.
+
+USAGE:
+    from services.redis_client import get_redis_client
+
+    client = get_redis_client()
+    if client:
+        client.setex('key', 60, 'value')
+"""
+
+import os
+import logging
+import threading
+from typing import Optional, Any
+
+logger = logging.getLogger(__name__)
+
+try:
+    import redis
+    from redis.connection import ConnectionPool
+    REDIS_LIBRARY_AVAILABLE = True
+except ImportError:
+    redis = None
+    ConnectionPool = None
+    REDIS_LIBRARY_AVAILABLE = False
+
+_client_lock = threading.Lock()
+_client = None
+_client_initialized = False
+
+
+def get_redis_client() -> Optional[Any]:
+    """
+    Get the process-wide Redis client (built once, on first call)
+
+    Returns:
+        redis.Redis instance with decode_responses=True, or None if Redis
+        is not configured / not reachable
+    """
+    global _client, _client_initialized
+
+    if _client_initialized:
+        return _client
+
+    with _client_lock:
+        if _client_initialized:
+            return _client
+
+        _client_initialized = True
+
+        if not REDIS_LIBRARY_AVAILABLE:
+            logger.warning("[RedisClient] redis library not installed - using memory storage")
+            return None
+
+        redis_url = os.getenv('REDIS_URL')
+        if not redis_url:
+            logger.info("[RedisClient] REDIS_URL not set - using memory storage")
+            return None
+
+        try:
+            # Same pool settings transcript_routes has used since v10.2;
+            # async serving has far more requests in flight per process
+            async_serving = os.getenv('SERVER_MODE', 'sync').lower() == 'async'
+            pool = ConnectionPool.from_url(
+                redis_url,
+                max_connections=int(os.getenv('REDIS_MAX_CONNECTIONS', 100 if async_serving else 10)),
+                socket_keepalive=True,
+                socket_timeout=5,
+                retry_on_timeout=True,
+                decode_responses=True
+            )
+            client = redis.Redis(connection_pool=pool)
+            client.ping()
+            _client = client
+            logger.info("[RedisClient] ✓ Redis connected")
+        except Exception as e:
+            logger.error(f"[RedisClient] ✗ Redis connection failed: {e}")
+            _client = None
+
+        return _client
+
+
+# This file is not truncated
@@ -8,9 +8,9 @@ import os
 import time
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
-import requests
 from urllib.parse import quote_plus
 from services.base_analyzer import BaseAnalyzer
+from services.http_client import get_http_client
 from config import Config
 
 logger = logging.getLogger(__name__)
@@ -233,7 +233,7 @@ class RelatedNewsService(BaseAnalyzer):
             if exclude_domain:
                 params['excludeDomains'] = exclude_domain
             
-            response = requests.get(self.news_api_url, params=params, timeout=10)
+            response = get_http_client().get(self.news_api_url, params=params, timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
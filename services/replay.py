@@ -0,0 +1,301 @@
+"""
+HTTP Record / Replay
+Date: October 16, 2026
+Version: 1.0.1
+
+Captures real outbound HTTP responses once to a local fixture store and
+replays them offline, with configurable synthetic latency.
+
+Every outbound call in the app goes through one of two transports:
+  - requests  (services/http_client.py adapters, ScrapingBee, FRED, Google
+               Fact Check, Wikipedia, Cohere, ...) - HTTPAdapter.send
+  - httpx     (OpenAI-compatible clients via services/llm_gateway.py,
+               Anthropic, Groq, ...) - HTTPTransport.handle_request
+install() wraps both, so no service needs to know about it.
+
+Modes:
+  record   real request; response saved to the store (overwrites)
+  replay   response served from the store; a miss raises the transport's
+           own connection error, so services take their normal fallback
+           path (and the miss is counted)
+  hybrid   replay when recorded, otherwise record
+
+Fixtures are keyed on method + URL + body. Credentials never reach the
+store: query parameters that carry API keys are dropped from the key and
+the saved URL, and request headers are not saved at all.
+
+Latency on replay:
+  recorded   sleep for the recorded duration x REPLAY_LATENCY_SCALE (default)
+  <seconds>  sleep a fixed time per response, e.g. 0.25
+  0          no sleep
+
+Configuration (environment):
+  REPLAY_MODE           off | record | replay | hybrid (default: off)
+  REPLAY_DIR            fixture directory (default: benchmarks/fixtures)
+  REPLAY_LATENCY        recorded | <seconds> (default: recorded)
+  REPLAY_LATENCY_SCALE  multiplier for recorded latency (default: 1.0)
+
+USAGE:
+    from services.replay import install
+
+    install('replay', 'benchmarks/fixtures', latency='recorded')  # before the first request
+
+FIX IN 1.0.1:
+- Replayed requests responses are marked consumed (and get a BytesIO raw),
+  so stream=True callers using iter_content get the body instead of
+  AttributeError on raw.read
+"""
+
+import io
+import os
+import json
+import time
+import base64
+import hashlib
+import logging
+import threading
+from typing import Dict, Any, Optional, Union
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+logger = logging.getLogger(__name__)
+
+MODES = ('record', 'replay', 'hybrid')
+
+# Query parameters that carry credentials
+SECRET_PARAMS = frozenset(['key', 'api_key', 'apikey', 'access_token', 'token', 'auth', 'appid'])
+
+
+def scrub_url(url: str) -> str:
+    """URL without credential query parameters"""
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k.lower() not in SECRET_PARAMS]
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(sorted(query)), ''))
+
+
+def _as_bytes(body: Union[bytes, str, None]) -> bytes:
+    if body is None:
+        return b''
+    return body.encode('utf-8') if isinstance(body, str) else bytes(body)
+
+
+class FixtureStore:
+    """One JSON file per recorded response, named by the request's hash"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self.stats = {'recorded': 0, 'replayed': 0, 'misses': 0}
+
+    @staticmethod
+    def key(method: str, url: str, body: bytes) -> str:
+        digest = hashlib.sha256()
+        digest.update(method.upper().encode('utf-8'))
+        digest.update(b'\n' + scrub_url(url).encode('utf-8') + b'\n')
+        digest.update(body)
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(key), 'r', encoding='utf-8') as handle:
+                return json.load(handle)
+        except FileNotFoundError:
+            return None
+
+    def save(self, key: str, method: str, url: str, status: int,
+             headers: Dict[str, str], content: bytes, elapsed: float) -> None:
+        fixture = {
+            'method': method.upper(),
+            'url': scrub_url(url),
+            'status': status,
+            # Length/encoding describe the wire form, not the decoded body we keep
+            'headers': {k: v for k, v in headers.items()
+                        if k.lower() not in ('content-encoding', 'content-length', 'transfer-encoding', 'set-cookie')},
+            'body_b64': base64.b64encode(content).decode('ascii'),
+            'elapsed': round(elapsed, 4),
+            'recorded_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+        }
+        path = self._path(key)
+        with self._lock:
+            with open(path + '.tmp', 'w', encoding='utf-8') as handle:
+                json.dump(fixture, handle, indent=1)
+            os.replace(path + '.tmp', path)
+            self.stats['recorded'] += 1
+
+    def count(self, counter: str) -> None:
+        with self._lock:
+            self.stats[counter] += 1
+
+
+class Replayer:
+    """Record / replay policy shared by the requests and httpx hooks"""
+
+    def __init__(self, mode: str, store: FixtureStore, latency: Union[str, float] = 'recorded',
+                 latency_scale: float = 1.0):
+        if mode not in MODES:
+            raise ValueError(f"replay mode must be one of {MODES}, got {mode!r}")
+        self.mode = mode
+        self.store = store
+        self.latency = latency
+        self.latency_scale = latency_scale
+
+    def lookup(self, method: str, url: str, body: bytes) -> Optional[Dict[str, Any]]:
+        """Fixture to serve for this request, or None to go to the network"""
+        if self.mode == 'record':
+            return None
+        fixture = self.store.load(FixtureStore.key(method, url, body))
+        if fixture is None:
+            if self.mode == 'replay':
+                self.store.count('misses')
+                logger.warning(f"[Replay] ✗ No fixture for {method} {scrub_url(url)}")
+            return None
+
+        self.store.count('replayed')
+        self._sleep(fixture.get('elapsed', 0.0))
+        return fixture
+
+    def must_fail(self) -> bool:
+        """True when a lookup miss must not reach the network"""
+        return self.mode == 'replay'
+
+    def record(self, method: str, url: str, body: bytes, status: int,
+               headers: Dict[str, str], content: bytes, elapsed: float) -> None:
+        self.store.save(FixtureStore.key(method, url, body), method, url, status, headers, content, elapsed)
+
+    def _sleep(self, recorded: float) -> None:
+        if self.latency == 'recorded':
+            delay = recorded * self.latency_scale
+        else:
+            delay = float(self.latency)
+        if delay > 0:
+            time.sleep(delay)
+
+
+# ----------------------------------------------------------------------
+# Transport hooks
+# ----------------------------------------------------------------------
+
+_replayer: Optional[Replayer] = None
+_originals: Dict[str, Any] = {}
+
+
+def _requests_send(adapter, request, **kwargs):
+    import requests
+    from requests.structures import CaseInsensitiveDict
+
+    body = _as_bytes(request.body)
+    fixture = _replayer.lookup(request.method, request.url, body)
+    if fixture is not None:
+        response = requests.Response()
+        response.status_code = fixture['status']
+        response.headers = CaseInsensitiveDict(fixture['headers'])
+        content = base64.b64decode(fixture['body_b64'])
+        response._content = content
+        # Already read: iter_content / stream=True callers get the bytes, never raw
+        response._content_consumed = True
+        response.raw = io.BytesIO(content)
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response.reason = 'Replayed'
+        response.connection = adapter
+        return response
+    if _replayer.must_fail():
+        raise requests.exceptions.ConnectionError(f"replay: no fixture for {request.method} {scrub_url(request.url)}",
+                                                  request=request)
+
+    start = time.time()
+    response = _originals['requests'](adapter, request, **kwargs)
+    content = response.content  # reads the body - later readers get it from _content
+    _replayer.record(request.method, request.url, body, response.status_code,
+                     dict(response.headers), content, time.time() - start)
+    return response
+
+
+def _httpx_handle(transport, request):
+    import httpx
+
+    body = request.read()
+    url = str(request.url)
+    fixture = _replayer.lookup(request.method, url, body)
+    if fixture is not None:
+        return httpx.Response(fixture['status'], headers=fixture['headers'],
+                              content=base64.b64decode(fixture['body_b64']), request=request)
+    if _replayer.must_fail():
+        raise httpx.ConnectError(f"replay: no fixture for {request.method} {scrub_url(url)}", request=request)
+
+    start = time.time()
+    response = _originals['httpx'](transport, request)
+    content = response.read()
+    _replayer.record(request.method, url, body, response.status_code,
+                     dict(response.headers), content, time.time() - start)
+    # The stream is consumed - hand back a response built from the bytes
+    return httpx.Response(response.status_code, headers=[(k, v) for k, v in response.headers.items()
+                                                          if k.lower() not in ('content-encoding', 'content-length')],
+                          content=content, request=request)
+
+
+def install(mode: Optional[str] = None, directory: Optional[str] = None,
+            latency: Union[str, float, None] = None, latency_scale: Optional[float] = None) -> Optional[Replayer]:
+    """
+    Hook the requests and httpx transports (arguments default to the REPLAY_* environment)
+
+    Returns the active Replayer, or None when the mode is off.
+    """
+    global _replayer
+
+    mode = (mode or os.getenv('REPLAY_MODE', 'off')).lower()
+    if mode == 'off':
+        return None
+
+    directory = directory or os.getenv('REPLAY_DIR', os.path.join('benchmarks', 'fixtures'))
+    latency = latency if latency is not None else os.getenv('REPLAY_LATENCY', 'recorded')
+    if latency != 'recorded':
+        latency = float(latency)
+    latency_scale = latency_scale if latency_scale is not None else float(os.getenv('REPLAY_LATENCY_SCALE', 1.0))
+
+    _replayer = Replayer(mode, FixtureStore(directory), latency, latency_scale)
+
+    try:
+        from requests.adapters import HTTPAdapter
+        if 'requests' not in _originals:
+            _originals['requests'] = HTTPAdapter.send
+            HTTPAdapter.send = _requests_send
+    except ImportError:
+        pass
+
+    try:
+        import httpx
+        if 'httpx' not in _originals:
+            _originals['httpx'] = httpx.HTTPTransport.handle_request
+            httpx.HTTPTransport.handle_request = _httpx_handle
+    except ImportError:
+        pass
+
+    logger.info(f"[Replay] {mode} mode - fixtures in {directory}, latency {latency}")
+    return _replayer
+
+
+def uninstall() -> None:
+    """Restore the original transports"""
+    global _replayer
+
+    if 'requests' in _originals:
+        from requests.adapters import HTTPAdapter
+        HTTPAdapter.send = _originals.pop('requests')
+    if 'httpx' in _originals:
+        import httpx
+        httpx.HTTPTransport.handle_request = _originals.pop('httpx')
+    _replayer = None
+
+
+def stats() -> Dict[str, Any]:
+    if _replayer is None:
+        return {'mode': 'off'}
+    return {'mode': _replayer.mode, **_replayer.store.stats}
+
+
+# This file is not truncated
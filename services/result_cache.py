@@ -0,0 +1,367 @@
+"""
+Analysis Result Cache
+Date: October 16, 2026
+Version: 1.0.0
+
+Pipeline-level cache for AnalysisPipeline.analyze results.
+
+The same viral URL gets submitted hundreds of times an hour, and every
+submission used to re-run ArticleExtractor plus all seven analyzers. Results
+are now stored under a content-addressed key:
+  - URL input:  sha256 of the canonical URL (tracking params, fragment and
+                trailing slash stripped, host lowercased, query sorted)
+  - Text input: sha256 of the whitespace-normalized text
+
+Backends:
+  - MemoryCacheBackend: in-process LRU with TTL, entry cap and byte cap
+  - RedisCacheBackend:  shared across workers/instances via the same Redis
+                        client transcript_routes uses (services/redis_client.py)
+
+Values are stored as JSON strings, so every hit hands back a fresh copy and
+callers can mutate it freely.
+
+Configuration (Config.CACHE / environment):
+  ANALYSIS_CACHE_BACKEND      auto | memory | redis | none (default: auto)
+  ANALYSIS_CACHE_TTL          seconds (default: 7200)
+  ANALYSIS_CACHE_DEGRADED_TTL seconds for results where a service timed out
+                              or fell back to default data (default: 60,
+                              0 = don't cache them)
+  ANALYSIS_CACHE_MAX_MB       byte cap for the memory backend (default: 64)
+  ANALYSIS_CACHE_MAX_ENTRIES  entry cap for the memory backend (default: 500)
+"""
+
+import json
+import time
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
+
+logger = logging.getLogger(__name__)
+
+# Query parameters that never change the article content
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'yclid', 'igshid', 'twclid',
+    'mc_cid', 'mc_eid', 'ocid', 'cmpid', 'smid', 'smtyp', 'ref',
+    'ref_src', 'ref_url', 'referrer', 'taid', 'ito',
+    'ns_mchannel', 'ns_source', 'ns_campaign', 'ns_linkname', 'ns_fee',
+    'guccounter', 'guce_referrer', 'guce_referrer_sig', '_ga', '_gl'
+}
+TRACKING_PREFIXES = ('utm_', 'pk_', 'mtm_', 'hsa_', 'at_')
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Canonicalize a URL so trivially different links share one cache entry
+
+    Example:
+        HTTPS://WWW.Example.com/story/?utm_source=x&id=2&a=1#comments
+        -> https://www.example.com/story?a=1&id=2
+    """
+    url = (url or '').strip()
+    if not url:
+        return ''
+
+    if not url.lower().startswith(('http://', 'https://')):
+        url = 'https://' + url
+
+    parsed = urlparse(url)
+    scheme = parsed.scheme.lower()
+    netloc = parsed.netloc.lower()
+
+    # Drop default ports
+    if (scheme == 'http' and netloc.endswith(':80')) or (scheme == 'https' and netloc.endswith(':443')):
+        netloc = netloc.rsplit(':', 1)[0]
+
+    path = parsed.path or '/'
+    if len(path) > 1 and path.endswith('/'):
+        path = path.rstrip('/')
+
+    query_pairs = [
+        (key, value) for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    ]
+    query = urlencode(sorted(query_pairs))
+
+    return urlunparse((scheme, netloc, path, '', query, ''))
+
+
+def make_cache_key(data: Dict[str, Any]) -> Optional[str]:
+    """
+    Build the content-addressed key for a pipeline input dict
+
+    Returns:
+        'url:<sha256>' / 'text:<sha256>', or None if there is no usable input
+    """
+    url = data.get('url', '')
+    if url:
+        canonical = canonicalize_url(url)
+        return 'url:' + hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    text = data.get('text', '') or data.get('content', '')
+    if text:
+        normalized = ' '.join(text.split())
+        return 'text:' + hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+    return None
+
+
+class MemoryCacheBackend:
+    """In-process LRU cache with TTL, entry cap and byte cap (thread-safe)"""
+
+    name = 'memory'
+
+    def __init__(self, max_bytes: int, max_entries: int):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[str, Tuple[float, str]]' = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, payload = entry
+            if expires_at < time.time():
+                self._remove(key)
+                return None
+
+            self._entries.move_to_end(key)
+            return payload
+
+    def set(self, key: str, payload: str, ttl: int) -> bool:
+        size = len(payload)
+        if size > self.max_bytes:
+            return False
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = (time.time() + ttl, payload)
+            self._bytes += size
+
+            while self._entries and (self._bytes > self.max_bytes or len(self._entries) > self.max_entries):
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self.evictions += 1
+
+        return True
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _remove(self, key: str) -> None:
+        _, payload = self._entries.pop(key)
+        self._bytes -= len(payload)
+
+    def info(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'max_entries': self.max_entries,
+                'evictions': self.evictions
+            }
+
+
+class RedisCacheBackend:
+    """Redis-backed cache shared by every worker (TTL enforced by Redis)"""
+
+    name = 'redis'
+    KEY_PREFIX = 'analysis_cache:'
+
+    def __init__(self, client: Any, max_bytes: int):
+        self.client = client
+        self.max_bytes = max_bytes
+
+    def get(self, key: str) -> Optional[str]:
+        return self.client.get(self.KEY_PREFIX + key)
+
+    def set(self, key: str, payload: str, ttl: int) -> bool:
+        # A single entry must not be able to blow the memory budget
+        if len(payload) > self.max_bytes:
+            return False
+        self.client.setex(self.KEY_PREFIX + key, ttl, payload)
+        return True
+
+    def delete(self, key: str) -> None:
+        self.client.delete(self.KEY_PREFIX + key)
+
+    def clear(self) -> None:
+        for redis_key in self.client.scan_iter(match=self.KEY_PREFIX + '*'):
+            self.client.delete(redis_key)
+
+    def info(self) -> Dict[str, Any]:
+        return {
+            'max_entry_bytes': self.max_bytes
+        }
+
+
+class AnalysisResultCache:
+    """
+    Content-addressed cache for successful pipeline results
+    """
+
+    def __init__(self, backend: Optional[Any], ttl: int, degraded_ttl: int = 60):
+        self.backend = backend
+        self.ttl = ttl
+        self.degraded_ttl = degraded_ttl
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'stores': 0,
+            'skipped': 0,
+            'degraded': 0,
+            'errors': 0
+        }
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None
+
+    def get(self, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Look up a cached result for this pipeline input"""
+        if not self.enabled:
+            return None
+
+        key = make_cache_key(data)
+        if not key:
+            return None
+
+        try:
+            payload = self.backend.get(key)
+        except Exception as e:
+            logger.warning(f"[ResultCache] Lookup failed ({self.backend.name}): {e}")
+            self._count('errors')
+            return None
+
+        if payload is None:
+            self._count('misses')
+            return None
+
+        self._count('hits')
+        return json.loads(payload)
+
+    def set(self, data: Dict[str, Any], result: Dict[str, Any], degraded: bool = False) -> bool:
+        """
+        Store a successful result (failed analyses are never cached)
+
+        degraded: some service timed out or fell back to default data - the
+                  result is kept for degraded_ttl only (0 = not at all)
+        """
+        if not self.enabled or not result.get('success'):
+            return False
+
+        ttl = self.degraded_ttl if degraded else self.ttl
+        if degraded:
+            self._count('degraded')
+        if ttl <= 0:
+            return False
+
+        key = make_cache_key(data)
+        if not key:
+            return False
+
+        try:
+            payload = json.dumps(result, default=str)
+            stored = self.backend.set(key, payload, ttl)
+        except Exception as e:
+            logger.warning(f"[ResultCache] Store failed ({self.backend.name}): {e}")
+            self._count('errors')
+            return False
+
+        self._count('stores' if stored else 'skipped')
+        return stored
+
+    def invalidate(self, data: Dict[str, Any]) -> None:
+        """Drop the cached result for this input, if any"""
+        key = make_cache_key(data)
+        if self.enabled and key:
+            try:
+                self.backend.delete(key)
+            except Exception as e:
+                logger.warning(f"[ResultCache] Invalidate failed: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for /health"""
+        with self._stats_lock:
+            stats = dict(self._stats)
+
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = round(stats['hits'] / lookups, 3) if lookups else 0.0
+        stats['backend'] = self.backend.name if self.backend else 'disabled'
+        stats['ttl_seconds'] = self.ttl
+        stats['degraded_ttl_seconds'] = self.degraded_ttl
+
+        if self.backend:
+            try:
+                stats.update(self.backend.info())
+            except Exception as e:
+                stats['backend_error'] = str(e)
+
+        return stats
+
+    def _count(self, counter: str) -> None:
+        with self._stats_lock:
+            self._stats[counter] += 1
+
+
+_cache_lock = threading.Lock()
+_analysis_cache: Optional[AnalysisResultCache] = None
+
+
+def get_analysis_cache() -> AnalysisResultCache:
+    """Get the process-wide analysis result cache (built from Config.CACHE)"""
+    global _analysis_cache
+
+    if _analysis_cache is not None:
+        return _analysis_cache
+
+    with _cache_lock:
+        if _analysis_cache is not None:
+            return _analysis_cache
+
+        from config import Config
+
+        cache_config = Config.CACHE
+        backend_name = cache_config.get('analysis_backend', 'auto')
+        ttl = cache_config.get('ttl_analysis', 7200)
+        max_bytes = cache_config.get('analysis_max_mb', 64) * 1024 * 1024
+        max_entries = cache_config.get('analysis_max_entries', 500)
+
+        backend = None
+        if cache_config.get('enabled', True) and backend_name != 'none':
+            if backend_name in ('auto', 'redis'):
+                from services.redis_client import get_redis_client
+                client = get_redis_client()
+                if client:
+                    backend = RedisCacheBackend(client, max_bytes)
+                elif backend_name == 'redis':
+                    logger.warning("[ResultCache] Redis requested but unavailable - using memory backend")
+
+            if backend is None:
+                backend = MemoryCacheBackend(max_bytes, max_entries)
+
+        _analysis_cache = AnalysisResultCache(backend, ttl, cache_config.get('ttl_analysis_degraded', 60))
+        logger.info(f"[ResultCache] Initialized - backend: {backend.name if backend else 'disabled'}, TTL: {ttl}s")
+
+        return _analysis_cache
+
+
+# This file is not truncated
@@ -1,8 +1,11 @@
 """
 File: services/scrapingbee_youtube_service.py
-Last Updated: October 26, 2025 - v5.0.0 FINAL FIX - CORRECT ENDPOINT
+Last Updated: October 16, 2026 - v5.0.1
 Description: YouTube transcript extraction using ScrapingBee's YouTube Transcript API
 
+v5.0.1 (October 16, 2026): ScrapingBee calls go through the shared pooled HTTP
+client (services/http_client.py) - keep-alive and per-host concurrency limits
+
 CRITICAL FIX FROM v4.0.0:
 =======================
 ROOT CAUSE: v4.0.0 mistakenly used /api/v1/ (general web scraping endpoint)
@@ -56,6 +59,7 @@ import os
 import re
 import logging
 import requests
+from services.http_client import get_http_client
 from typing import Dict, Optional
 from datetime import datetime
 
@@ -235,7 +239,7 @@ class ScrapingBeeYouTubeService:
             logger.info(f"[ScrapingBee v5.0] Endpoint: {self.api_url}")
             logger.info(f"[ScrapingBee v5.0] Parameters: video_id={video_id}, language={language}")
             
-            response = requests.get(
+            response = get_http_client().get(
                 self.api_url,
                 params=params,
                 timeout=60
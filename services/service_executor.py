@@ -0,0 +1,168 @@
+"""
+Service Executor
+Date: October 16, 2026
+Version: 1.0.0
+
+One long-lived, bounded thread pool per worker process for the analysis
+services, plus the gauges needed to size it.
+
+AnalysisPipeline used to build a fresh 7-thread pool for every request. Thread
+start-up was paid on every analysis, concurrent requests in one worker
+multiplied the thread count, and a hung author scrape held the request open
+because leaving the `with` block waits for every thread. Now every request
+submits to the same pool and AnalysisPipeline stops waiting at its deadline.
+
+Gauges (shown on /health as 'analysis_executor'):
+  queued            tasks submitted but not started (waiting for a thread)
+  active            tasks running right now
+  abandoned_running tasks abandoned at a deadline that are still running
+                    and holding a thread
+  peak_queued / peak_active, plus completed / failed / abandoned / cancelled
+  totals
+
+A non-zero queue depth means requests in this worker are waiting on each
+other. Raise ANALYSIS_EXECUTOR_WORKERS or add workers (WEB_CONCURRENCY).
+
+The pool is rebuilt lazily after a fork (gunicorn preload_app=True), so threads
+never cross from the master into the workers.
+
+Configuration (Config.PIPELINE / environment):
+  ANALYSIS_EXECUTOR_WORKERS  thread cap per worker process (default: 14)
+"""
+
+import os
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Dict, Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class InstrumentedExecutor:
+    """ThreadPoolExecutor wrapper that tracks queue depth and active threads"""
+
+    def __init__(self, max_workers: int, thread_name_prefix: str = 'analysis'):
+        self.max_workers = max_workers
+        self.thread_name_prefix = thread_name_prefix
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_pid = None
+        self._lock = threading.Lock()
+        self._gauges = {
+            'queued': 0,
+            'active': 0,
+            'abandoned_running': 0,
+            'peak_queued': 0,
+            'peak_active': 0,
+            'submitted': 0,
+            'completed': 0,
+            'failed': 0,
+            'abandoned': 0,
+            'cancelled': 0
+        }
+        self._total_wait = 0.0
+
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executor is None or self._executor_pid != os.getpid():
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix=self.thread_name_prefix
+            )
+            self._executor_pid = os.getpid()
+        return self._executor
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """Submit a task; returns a normal Future"""
+        submitted_at = time.time()
+        state = {'abandoned': False, 'started': False}
+
+        def run():
+            with self._lock:
+                state['started'] = True
+                self._gauges['queued'] -= 1
+                self._gauges['active'] += 1
+                self._gauges['peak_active'] = max(self._gauges['peak_active'], self._gauges['active'])
+                self._total_wait += time.time() - submitted_at
+
+            ok = False
+            try:
+                result = fn(*args, **kwargs)
+                ok = True
+                return result
+            finally:
+                with self._lock:
+                    self._gauges['active'] -= 1
+                    self._gauges['completed' if ok else 'failed'] += 1
+                    if state['abandoned']:
+                        self._gauges['abandoned_running'] -= 1
+
+        with self._lock:
+            pool = self._pool()
+            self._gauges['submitted'] += 1
+            self._gauges['queued'] += 1
+            self._gauges['peak_queued'] = max(self._gauges['peak_queued'], self._gauges['queued'])
+
+        future = pool.submit(run)
+        future._executor_state = state
+        return future
+
+    def abandon(self, future: Future) -> None:
+        """
+        Give up on a task past its deadline
+
+        A task still waiting in the queue is cancelled outright. A running
+        task cannot be interrupted, so it is counted in abandoned_running
+        until it finishes on its own.
+        """
+        state = getattr(future, '_executor_state', None)
+        if state is None or future.done():
+            return
+
+        with self._lock:
+            if not state['started'] and future.cancel():
+                self._gauges['queued'] -= 1
+                self._gauges['cancelled'] += 1
+                return
+
+            if not state['abandoned']:
+                state['abandoned'] = True
+                self._gauges['abandoned'] += 1
+                self._gauges['abandoned_running'] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Gauges and totals for /health"""
+        with self._lock:
+            stats = dict(self._gauges)
+            started = stats['completed'] + stats['failed'] + stats['active']
+            stats['avg_queue_wait_ms'] = round(self._total_wait / started * 1000, 1) if started else 0.0
+        stats['max_workers'] = self.max_workers
+        stats['pid'] = os.getpid()
+        return stats
+
+
+_executor_lock = threading.Lock()
+_pipeline_executor: Optional[InstrumentedExecutor] = None
+
+
+def get_pipeline_executor() -> InstrumentedExecutor:
+    """Get the process-wide executor for analysis services (built from Config.PIPELINE)"""
+    global _pipeline_executor
+
+    if _pipeline_executor is not None:
+        return _pipeline_executor
+
+    with _executor_lock:
+        if _pipeline_executor is not None:
+            return _pipeline_executor
+
+        from config import Config
+
+        max_workers = Config.PIPELINE.get('executor_workers', 14)
+        _pipeline_executor = InstrumentedExecutor(max_workers, thread_name_prefix='analysis')
+        logger.info(f"[ServiceExecutor] Initialized - max_workers: {max_workers}")
+
+        return _pipeline_executor
+
+
+# This file is not truncated
@@ -0,0 +1,398 @@
+"""
+Single-Flight Coalescing
+Date: October 16, 2026
+Version: 1.1.0
+
+Runs one piece of work per key at a time. Callers that arrive while the
+work is in flight wait for the leader's result instead of starting the
+same work again.
+
+  - SingleFlight   inside one worker process
+  - RedisFlight    across worker processes - a Redis lock per key picks one
+                   leader among all workers, SingleFlight handles the rest
+
+Under the default gunicorn sync workers a process serves one request at a
+time, so SingleFlight alone never sees two concurrent callers there; use
+RedisFlight for anything that must coalesce across workers.
+
+Used by the AI Council (ai_council_routes.py): identical questions asked at
+the same time share one fan-out to the paid providers. Used by
+services/analysis_flight.py for concurrent analyses of the same URL.
+
+CHANGES IN 1.1.0:
+- RedisFlight: cross-worker coalescing (lock, shared result, notice)
+- FlightNotifier: one Redis subscriber per process wakes every local waiter,
+  instead of one pubsub connection per waiter (a burst of waiters on one
+  viral URL exhausted the Redis connection pool)
+
+Two ways to use it:
+  - do(key, fn)            blocking - the leader runs fn, followers wait
+  - begin(key) / finish()  for leaders that produce the result over time
+                           (a streamed response) rather than in one call
+
+A follower sees the leader's exception re-raised, so one failing upstream
+call is not retried by every waiter at once.
+
+USAGE:
+    from services.single_flight import SingleFlight
+
+    flight = SingleFlight('AICouncil')
+    result, shared = flight.do(key, lambda: expensive(key))
+
+    flight = RedisFlight('council', get_redis_client(), lock_ttl=120, wait_seconds=90)
+    result, shared = flight.do(key, lambda: expensive(key))   # result must be JSON-serializable
+"""
+
+import os
+import json
+import time
+import uuid
+import logging
+import threading
+from typing import Dict, Any, Optional, Callable, Tuple, Set
+
+logger = logging.getLogger(__name__)
+
+# Delete the lock only if we still hold it
+RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+class FlightCall:
+    """One in-flight unit of work and its outcome"""
+
+    def __init__(self, key: str):
+        self.key = key
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.followers = 0
+        self.token: Optional[str] = None  # RedisFlight lock token, if the leader holds one
+
+    def wait(self, timeout: Optional[float] = None) -> Any:
+        """Leader's result (or its exception re-raised); TimeoutError if it takes too long"""
+        if not self.event.wait(timeout):
+            raise TimeoutError(f"in-flight call for {self.key!r} did not finish within {timeout}s")
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+class SingleFlight:
+    """Per-key coalescing of concurrent identical work"""
+
+    def __init__(self, name: str = 'SingleFlight'):
+        self.name = name
+        self._lock = threading.Lock()
+        self._calls: Dict[str, FlightCall] = {}
+        self._stats = {'leaders': 0, 'followers': 0, 'errors': 0}
+
+    def begin(self, key: str) -> Tuple[bool, FlightCall]:
+        """(True, call) for the caller that must do the work, (False, call) for followers"""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.followers += 1
+                self._stats['followers'] += 1
+                return False, call
+
+            call = FlightCall(key)
+            self._calls[key] = call
+            self._stats['leaders'] += 1
+            return True, call
+
+    def finish(self, call: FlightCall, result: Any = None, error: Optional[BaseException] = None) -> None:
+        """Publish the leader's outcome and release the key"""
+        with self._lock:
+            if self._calls.get(call.key) is call:
+                del self._calls[call.key]
+            if error is not None:
+                self._stats['errors'] += 1
+
+        call.result = result
+        call.error = error
+        call.event.set()
+
+        if call.followers:
+            logger.info(f"[{self.name}] ✓ {call.followers} coalesced request(s) served by one call")
+
+    def do(self, key: str, fn: Callable[[], Any], timeout: Optional[float] = None) -> Tuple[Any, bool]:
+        """
+        Run fn once for all concurrent callers of key
+
+        Returns (result, shared) - shared is True for followers.
+        """
+        leader, call = self.begin(key)
+        if not leader:
+            return call.wait(timeout), True
+
+        try:
+            result = fn()
+        except BaseException as e:
+            self.finish(call, error=e)
+            raise
+
+        self.finish(call, result=result)
+        return result, False
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self._stats, 'in_flight': len(self._calls)}
+
+
+class FlightNotifier:
+    """
+    One Redis subscriber per process for flight completion notices
+
+    Waiters register an Event for a key; a notice on channel_prefix + key
+    sets every Event registered for it. The subscriber thread starts on
+    first use in each process (gunicorn forks after import).
+    """
+
+    def __init__(self, client: Any, channel_prefix: str):
+        self.client = client
+        self.channel_prefix = channel_prefix
+        self._lock = threading.Lock()
+        self._waiters: Dict[str, Set[threading.Event]] = {}
+        self._listener_pid = None
+
+    def register(self, key: str) -> threading.Event:
+        self._ensure_listener()
+        event = threading.Event()
+        with self._lock:
+            self._waiters.setdefault(key, set()).add(event)
+        return event
+
+    def unregister(self, key: str, event: threading.Event) -> None:
+        with self._lock:
+            waiters = self._waiters.get(key)
+            if waiters is not None:
+                waiters.discard(event)
+                if not waiters:
+                    del self._waiters[key]
+
+    def waiting(self) -> int:
+        with self._lock:
+            return sum(len(waiters) for waiters in self._waiters.values())
+
+    def _ensure_listener(self) -> None:
+        if self._listener_pid == os.getpid():
+            return
+        with self._lock:
+            if self._listener_pid == os.getpid():
+                return
+            self._listener_pid = os.getpid()
+            self._waiters = {}  # Inherited from the parent - nobody here waits on them
+        threading.Thread(target=self._listen, name='flight-notifier', daemon=True).start()
+
+    def _listen(self) -> None:
+        while True:
+            pubsub = None
+            try:
+                pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+                pubsub.psubscribe(self.channel_prefix + '*')
+                while True:
+                    message = pubsub.get_message(timeout=1.0)
+                    if not message or message.get('type') != 'pmessage':
+                        continue
+                    channel = message['channel']
+                    if isinstance(channel, bytes):
+                        channel = channel.decode('utf-8')
+                    with self._lock:
+                        waiters = list(self._waiters.get(channel[len(self.channel_prefix):], ()))
+                    for event in waiters:
+                        event.set()
+            except Exception as e:
+                logger.warning(f"[FlightNotifier] ⚠ Redis listener error, reconnecting: {e}")
+                time.sleep(1)
+            finally:
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+
+
+class RedisFlight:
+    """
+    SingleFlight across worker processes, coordinated through Redis
+
+    A Redis lock per key (SET NX PX) picks one leader among all workers.
+    finish() stores the leader's result as JSON under a key tied to its lock
+    token and publishes a notice. Followers in other workers block in
+    begin() until the result appears. If the lock goes away without a result
+    (the leader failed or died), one follower takes over as leader; after
+    wait_seconds a follower leads without the lock. Without Redis, or when
+    Redis errors, only in-process coalescing applies.
+
+    Followers read the outcome with result(call) - each gets its own decoded
+    copy, so the leader's caller is free to mutate its result.
+    """
+
+    def __init__(self, name: str, client: Optional[Any] = None, lock_ttl: float = 120,
+                 wait_seconds: float = 90, result_ttl: float = 60,
+                 poll_interval: float = 0.5, max_poll_interval: float = 5.0):
+        self.name = name
+        self.client = client
+        self.lock_ttl = lock_ttl
+        self.wait_seconds = wait_seconds
+        self.result_ttl = result_ttl
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.lock_prefix = f'flight:{name}:lock:'
+        self.result_prefix = f'flight:{name}:result:'
+        self.local = SingleFlight(name)
+        self.notifier = FlightNotifier(client, f'flight:{name}:done:') if client is not None else None
+        self._stats_lock = threading.Lock()
+        self._stats = {'leaders': 0, 'shared_local': 0, 'shared_remote': 0,
+                       'wait_timeouts': 0, 'takeovers': 0, 'errors': 0}
+
+    def begin(self, key: str) -> Tuple[bool, FlightCall]:
+        """
+        (True, call) for the caller that must do the work, (False, call) for followers
+
+        Blocks while another worker leads on key (up to wait_seconds).
+        """
+        leader, call = self.local.begin(key)
+        if not leader:
+            self._count('shared_local')
+            return False, call
+
+        if self.client is None:
+            self._count('leaders')
+            return True, call
+
+        give_up_at = time.time() + self.wait_seconds
+        lock_key = self.lock_prefix + key
+
+        while True:
+            token = uuid.uuid4().hex
+            try:
+                acquired = self.client.set(lock_key, token, nx=True, px=int(self.lock_ttl * 1000))
+                holder = None if acquired else self.client.get(lock_key)
+            except Exception as e:
+                self._count('errors')
+                logger.warning(f"[{self.name}] ⚠ Redis lock failed ({e}) - running without coordination")
+                break
+
+            if acquired:
+                call.token = token
+                break
+
+            if holder is None:
+                continue  # Released between SET and GET - try again
+
+            payload = self._wait_remote(key, holder, give_up_at)
+            if payload is not None:
+                self._count('shared_remote')
+                self.local.finish(call, result=payload)
+                return False, call
+
+            if time.time() >= give_up_at:
+                self._count('wait_timeouts')
+                logger.warning(f"[{self.name}] ⚠ Waited {self.wait_seconds}s on {key[:16]} - running directly")
+                break
+
+            # Holder finished without a result or died - one waiter takes over
+            self._count('takeovers')
+
+        self._count('leaders')
+        return True, call
+
+    def finish(self, call: FlightCall, result: Any = None, error: Optional[BaseException] = None) -> None:
+        """Share the leader's outcome with waiters in every worker and release the key"""
+        payload = None
+        if error is None:
+            try:
+                payload = json.dumps(result, default=str)
+            except Exception as e:
+                error = e
+
+        if call.token is not None:
+            lock_key = self.lock_prefix + call.key
+            try:
+                if payload is not None:
+                    self.client.setex(self.result_prefix + call.key + ':' + call.token,
+                                      int(self.result_ttl), payload)
+                    self.client.publish(self.notifier.channel_prefix + call.key, call.token)
+            except Exception as e:
+                self._count('errors')
+                logger.warning(f"[{self.name}] ⚠ Could not share result: {e}")
+            try:
+                self.client.eval(RELEASE_SCRIPT, 1, lock_key, call.token)
+            except Exception as e:
+                logger.warning(f"[{self.name}] ⚠ Could not release lock (expires in {self.lock_ttl}s): {e}")
+
+        self.local.finish(call, result=payload, error=error)
+
+    def result(self, call: FlightCall, timeout: Optional[float] = None) -> Any:
+        """A follower's copy of the leader's result (leader's exception re-raised, TimeoutError)"""
+        return json.loads(call.wait(timeout))
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Run fn once for all concurrent callers of key, in any worker
+
+        Returns (result, shared) - shared is True for followers.
+        """
+        leader, call = self.begin(key)
+        if not leader:
+            return self.result(call, self.wait_seconds), True
+
+        try:
+            result = fn()
+        except BaseException as e:
+            self.finish(call, error=e)
+            raise
+
+        self.finish(call, result=result)
+        return result, False
+
+    def _wait_remote(self, key: str, token: str, give_up_at: float) -> Optional[str]:
+        """Payload published under `token`, or None once the lock is gone or time is up"""
+        result_key = self.result_prefix + key + ':' + token
+        lock_key = self.lock_prefix + key
+        event = self.notifier.register(key)
+        delay = self.poll_interval
+
+        try:
+            # Registered before the first check, so a notice cannot slip between them;
+            # polling with backoff covers notices lost while the subscriber reconnects
+            while True:
+                payload = self.client.get(result_key)
+                if payload is not None:
+                    return payload
+                if self.client.get(lock_key) != token or time.time() >= give_up_at:
+                    return None
+                event.wait(min(delay, max(0.0, give_up_at - time.time())))
+                event.clear()
+                delay = min(delay * 2, self.max_poll_interval)
+        except Exception as e:
+            self._count('errors')
+            logger.warning(f"[{self.name}] ⚠ Waiting on Redis failed: {e}")
+            return None
+        finally:
+            self.notifier.unregister(key, event)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats['in_flight'] = self.local.in_flight()
+        stats['waiting_remote'] = self.notifier.waiting() if self.notifier else 0
+        stats['scope'] = 'redis' if self.client is not None else 'process'
+        return stats
+
+    def _count(self, counter: str) -> None:
+        with self._stats_lock:
+            self._stats[counter] += 1
+
+
+# This file is not truncated
@@ -1,8 +1,15 @@
 """
 Enhanced Source Credibility Analyzer - COMPLETE VERSION WITH VERBOSE EXPLANATIONS
 Date: October 29, 2025
-Last Updated: November 19, 2025 - MS.NOW/MSNBC DOMAIN FIX
-Version: 14.2 - MS.NOW DOMAIN SUPPORT ADDED
+Last Updated: October 16, 2026 - SHARED OUTLET REGISTRY
+Version: 14.3 - SHARED OUTLET REGISTRY
+
+CHANGES IN v14.3 (October 16, 2026):
+✅ MOVED: source_database table to services/outlet_metadata.py (SOURCE_RATINGS);
+   every instance shares the registry's read-only copy instead of rebuilding it
+✅ CHANGED: _check_database resolves through services/outlet_registry.py -
+   subdomains and known aliases now find their outlet's rating
+✅ PRESERVED: All v14.2 functionality
 
 CHANGES IN v14.2 (November 19, 2025):
 ✅ ADDED: 'ms.now': 73 to OUTLET_AVERAGES dict (line ~156)
@@ -31,7 +38,7 @@ PREVIOUS VERSION: v14.1 - 40 outlet expansion (Option B)
 TO ADD MORE OUTLETS:
 1. Edit outlet_metadata.py (research accurate data)
 2. Add entry to OUTLET_AVERAGES in this file (line ~155)
-3. Add entry to source_database in this file (line ~820)
+3. Add entry to SOURCE_RATINGS in outlet_metadata.py
 4. Deploy both files together
 
 This is the COMPLETE file - not truncated.
@@ -52,6 +59,7 @@ from collections import defaultdict
 
 from services.base_analyzer import BaseAnalyzer
 from services.ai_enhancement_mixin import AIEnhancementMixin
+from services.outlet_registry import get_outlet_registry
 
 
 # Initialize logger FIRST, before any imports that might fail
@@ -1042,171 +1050,10 @@ class SourceCredibility(BaseAnalyzer, AIEnhancementMixin):
     # ============================================================================
     
     def _init_credibility_database(self):
-        """Initialize credibility database"""
-        self.source_database = {
-            'reuters.com': {
-                'credibility': 'Very High', 
-                'bias': 'Minimal', 
-                'type': 'Wire Service',
-                'founded': 1851,
-                'ownership': 'Thomson Reuters Corporation'
-            },
-            'apnews.com': {
-                'credibility': 'Very High',
-                'bias': 'Minimal',
-                'type': 'Wire Service',
-                'founded': 1846,
-                'ownership': 'AP Cooperative'
-            },
-            'bbc.com': {
-                'credibility': 'Very High',
-                'bias': 'Minimal',
-                'type': 'Public Broadcaster',
-                'founded': 1922,
-                'ownership': 'British Broadcasting Corporation'
-            },
-            'bbc.co.uk': {
-                'credibility': 'Very High',
-                'bias': 'Minimal',
-                'type': 'Public Broadcaster',
-                'founded': 1922,
-                'ownership': 'British Broadcasting Corporation'
-            },
-            'nytimes.com': {
-                'credibility': 'High',
-                'bias': 'Minimal-Left',
-                'type': 'Newspaper',
-                'founded': 1851,
-                'ownership': 'New York Times Company'
-            },
-            'washingtonpost.com': {
-                'credibility': 'High',
-                'bias': 'Minimal-Left',
-                'type': 'Newspaper',
-                'founded': 1877,
-                'ownership': 'Nash Holdings (Jeff Bezos)'
-            },
-            'npr.org': {
-                'credibility': 'High',
-                'bias': 'Minimal-Left',
-                'type': 'Public Radio',
-                'founded': 1970,
-                'ownership': 'Non-profit'
-            },
-            'wsj.com': {
-                'credibility': 'High',
-                'bias': 'Minimal-Right',
-                'type': 'Newspaper',
-                'founded': 1889,
-                'ownership': 'News Corp'
-            },
-            'theguardian.com': {
-                'credibility': 'High',
-                'bias': 'Left-Leaning',
-                'type': 'Newspaper',
-                'founded': 1821,
-                'ownership': 'Guardian Media Group'
-            },
-            'economist.com': {
-                'credibility': 'High',
-                'bias': 'Minimal',
-                'type': 'Magazine',
-                'founded': 1843,
-                'ownership': 'Economist Group'
-            },
-            'cnn.com': {
-                'credibility': 'Medium-High',
-                'bias': 'Left-Leaning',
-                'type': 'TV/Web News',
-                'founded': 1980,
-                'ownership': 'Warner Bros. Discovery'
-            },
-            'foxnews.com': {
-                'credibility': 'Medium',
-                'bias': 'Right-Leaning',
-                'type': 'TV/Web News',
-                'founded': 1996,
-                'ownership': 'Fox Corporation'
-            },
-            'msnbc.com': {
-                'credibility': 'Medium',
-                'bias': 'Left-Leaning',
-                'type': 'TV/Web News',
-                'founded': 1996,
-                'ownership': 'NBCUniversal'
-            },
-            # v14.2: ADDED - MS.NOW (MSNBC rebrand)
-            'ms.now': {
-                'credibility': 'Medium',
-                'bias': 'Left-Leaning',
-                'type': 'TV/Web News',
-                'founded': 1996,
-                'ownership': 'NBCUniversal (Comcast)'
-            },
-            'politico.com': {
-                'credibility': 'High',
-                'bias': 'Minimal',
-                'type': 'Political News',
-                'founded': 2007,
-                'ownership': 'Axel Springer SE'
-            },
-            'axios.com': {
-                'credibility': 'High',
-                'bias': 'Minimal',
-                'type': 'Digital News',
-                'founded': 2016,
-                'ownership': 'Axios Media'
-            },
-            'thehill.com': {
-                'credibility': 'Medium-High',
-                'bias': 'Minimal',
-                'type': 'Political News',
-                'founded': 1994,
-                'ownership': 'Nexstar Media Group'
-            },
-            'nypost.com': {
-                'credibility': 'Medium-Low',
-                'bias': 'Right-Leaning',
-                'type': 'Tabloid',
-                'founded': 1801,
-                'ownership': 'News Corp'
-            },
-            'propublica.org': {
-                'credibility': 'Very High',
-                'bias': 'Minimal',
-                'type': 'Investigative Journalism',
-                'founded': 2007,
-                'ownership': 'Non-profit'
-            },
-            'vox.com': {
-                'credibility': 'Medium-High',
-                'bias': 'Left-Leaning',
-                'type': 'Digital News',
-                'founded': 2014,
-                'ownership': 'Vox Media'
-            },
-            'breitbart.com': {
-                'credibility': 'Low',
-                'bias': 'Far-Right',
-                'type': 'Opinion/News',
-                'founded': 2007,
-                'ownership': 'Breitbart News Network'
-            },
-            'dailywire.com': {
-                'credibility': 'Medium-Low',
-                'bias': 'Right',
-                'type': 'Opinion/News',
-                'founded': 2015,
-                'ownership': 'The Daily Wire'
-            },
-            'huffpost.com': {
-                'credibility': 'Medium',
-                'bias': 'Left-Leaning',
-                'type': 'Digital News',
-                'founded': 2005,
-                'ownership': 'BuzzFeed'
-            }
-        }
+        """Attach the credibility database"""
+        # Shared read-only table (services/outlet_metadata.py SOURCE_RATINGS, indexed
+        # by the outlet registry) - no longer rebuilt per instance
+        self.source_database = get_outlet_registry().tables['ratings']
     
     def _init_fact_check_database(self):
         """Initialize fact-checking database"""
@@ -1570,13 +1417,10 @@ class SourceCredibility(BaseAnalyzer, AIEnhancementMixin):
                 'ownership': outlet_metadata.get('ownership')
             }
         
-        # SECOND check source_database
-        if domain in self.source_database:
-            return self.source_database[domain].copy()
-        
-        clean_domain = domain.replace('www.', '')
-        if clean_domain in self.source_database:
-            return self.source_database[clean_domain].copy()
+        # SECOND check source_database (subdomains and aliases via the outlet registry)
+        rating = get_outlet_registry().lookup(domain, 'ratings')
+        if rating is not None:
+            return rating.copy()
         
         # THIRD check outlet_info
         if outlet_info:
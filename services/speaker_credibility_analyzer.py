@@ -46,12 +46,9 @@ import json
 
 logger = logging.getLogger(__name__)
 
-# Try to import AI clients
-try:
-    from openai import OpenAI
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
+# OpenAI calls go through the shared LLM gateway (services/llm_gateway.py)
+from services.llm_gateway import get_llm_client, OPENAI_AVAILABLE
+if not OPENAI_AVAILABLE:
     logger.warning("OpenAI not available for speaker credibility analysis")
 
 try:
@@ -80,7 +77,7 @@ class SpeakerCredibilityAnalyzer:
             api_key = os.getenv('OPENAI_API_KEY')
             if api_key:
                 try:
-                    self.openai_client = OpenAI(api_key=api_key)
+                    self.openai_client = get_llm_client('SpeakerCredibilityAnalyzer', api_key=api_key)
                     logger.info("[SpeakerCredibility] ✓ OpenAI initialized")
                 except Exception as e:
                     logger.error(f"[SpeakerCredibility] OpenAI init failed: {e}")
@@ -1,9 +1,16 @@
 """
 File: services/speaker_quality_analyzer.py
 Created: November 2, 2025 - v1.0.0
-Last Updated: November 3, 2025 - v1.0.0
+Last Updated: October 16, 2026 - v1.0.1
 Description: Comprehensive speaker quality analysis for transcripts
 
+UPDATE (October 16, 2026 - v1.0.1):
+====================================
+✅ Sentences, words, lowercased text and syllable counts come from the shared
+   DocumentAnalysis (services/document_analysis.py) - the six analysis passes
+   used to re-split the transcript six times
+✅ PRESERVED: Syllable heuristic (now count_syllables_cleaned) and all scores
+
 LATEST UPDATE (November 3, 2025 - v1.0.0 COMPLETE):
 ===================================================
 ✅ CREATED: Complete speaker quality analyzer service
@@ -87,6 +94,8 @@ import logging
 from typing import Dict, List, Tuple, Optional, Any
 from collections import Counter, defaultdict
 
+from services.document_analysis import get_document, count_syllables_cleaned
+
 logger = logging.getLogger(__name__)
 
 
@@ -256,7 +265,7 @@ class SpeakerQualityAnalyzer:
                     'rhetorical_devices': self._analyze_rhetorical_devices(speaker_text),
                     'coherence': self._analyze_coherence(speaker_text),
                     'vocabulary': self._analyze_vocabulary(speaker_text),
-                    'word_count': len(speaker_text.split())
+                    'word_count': get_document(speaker_text).word_count
                 }
                 
                 # Generate individual assessment
@@ -345,14 +354,11 @@ class SpeakerQualityAnalyzer:
             - Interpretation
         """
         # Count sentences, words, syllables
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if s.strip()]
-        sentence_count = max(len(sentences), 1)
+        document = get_document(text)
+        sentence_count = max(len(document.sentences), 1)
+        word_count = max(document.word_count, 1)
         
-        words = text.split()
-        word_count = max(len(words), 1)
-        
-        syllable_count = sum(self._count_syllables(word) for word in words)
+        syllable_count = document.total_syllables('cleaned')
         
         # Flesch-Kincaid Grade Level
         fk_grade = 0.39 * (word_count / sentence_count) + 11.8 * (syllable_count / word_count) - 15.59
@@ -363,7 +369,7 @@ class SpeakerQualityAnalyzer:
         fre = max(0, min(fre, 100))  # Clamp to 0-100
         
         # SMOG Index (simplified)
-        polysyllables = sum(1 for word in words if self._count_syllables(word) >= 3)
+        polysyllables = document.polysyllable_count('cleaned')
         smog = 1.0430 * math.sqrt(polysyllables * (30 / sentence_count)) + 3.1291
         smog = max(0, min(smog, 18))
         
@@ -381,30 +387,7 @@ class SpeakerQualityAnalyzer:
     
     def _count_syllables(self, word: str) -> int:
         """Count syllables in a word (simplified algorithm)"""
-        word = word.lower().strip()
-        if len(word) <= 3:
-            return 1
-        
-        # Remove non-letters
-        word = re.sub(r'[^a-z]', '', word)
-        
-        # Count vowel groups
-        vowels = "aeiouy"
-        syllable_count = 0
-        previous_was_vowel = False
-        
-        for char in word:
-            is_vowel = char in vowels
-            if is_vowel and not previous_was_vowel:
-                syllable_count += 1
-            previous_was_vowel = is_vowel
-        
-        # Adjust for silent e
-        if word.endswith('e'):
-            syllable_count -= 1
-        
-        # At least 1 syllable
-        return max(syllable_count, 1)
+        return count_syllables_cleaned(word)
     
     
     def _interpret_grade_level(self, grade: float) -> Tuple[str, str]:
@@ -427,7 +410,7 @@ class SpeakerQualityAnalyzer:
         
         Returns percentage of inflammatory words and category breakdown
         """
-        words = text.lower().split()
+        words = get_document(text).words_lower
         total_words = max(len(words), 1)
         
         # Count inflammatory words by category
@@ -468,8 +451,7 @@ class SpeakerQualityAnalyzer:
         
         Returns completion rate and quality assessment
         """
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if s.strip()]
+        sentences = get_document(text).sentences
         
         if not sentences:
             return {
@@ -489,7 +471,7 @@ class SpeakerQualityAnalyzer:
         completion_rate = (complete_sentences / len(sentences)) * 100
         
         # Count filler words
-        text_lower = text.lower()
+        text_lower = get_document(text).text_lower
         filler_count = sum(text_lower.count(filler) for filler in self.filler_words)
         
         # Assess quality
@@ -522,7 +504,7 @@ class SpeakerQualityAnalyzer:
         exclamations = len(re.findall(r'!', text))
         
         # Count repetition (repeated 3+ word phrases)
-        words = text.lower().split()
+        words = get_document(text).words_lower
         trigrams = [' '.join(words[i:i+3]) for i in range(len(words) - 2)]
         trigram_counts = Counter(trigrams)
         repetitions = sum(1 for count in trigram_counts.values() if count > 1)
@@ -550,8 +532,7 @@ class SpeakerQualityAnalyzer:
         
         Returns coherence score based on transition words and structure
         """
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if s.strip()]
+        sentences = get_document(text).sentences
         
         if len(sentences) < 2:
             return {
@@ -560,7 +541,7 @@ class SpeakerQualityAnalyzer:
             }
         
         # Count transition words
-        text_lower = text.lower()
+        text_lower = get_document(text).text_lower
         transition_count = sum(text_lower.count(word) for word in self.transition_words)
         
         # Calculate transition density (transitions per sentence)
@@ -600,7 +581,7 @@ class SpeakerQualityAnalyzer:
         
         Returns lexical diversity (Type-Token Ratio) and complexity assessment
         """
-        words = re.findall(r'\b[a-zA-Z]+\b', text.lower())
+        words = get_document(text).alpha_words
         
         if len(words) < 10:
             return {
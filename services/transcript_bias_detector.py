@@ -61,12 +61,9 @@ import json
 
 logger = logging.getLogger(__name__)
 
-# Try to import AI clients
-try:
-    from openai import OpenAI
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
+# OpenAI calls go through the shared LLM gateway (services/llm_gateway.py)
+from services.llm_gateway import get_llm_client, OPENAI_AVAILABLE
+if not OPENAI_AVAILABLE:
     logger.warning("OpenAI not available for bias detection")
 
 
@@ -113,7 +110,7 @@ class TranscriptBiasDetector:
             api_key = os.getenv('OPENAI_API_KEY')
             if api_key:
                 try:
-                    self.openai_client = OpenAI(api_key=api_key)
+                    self.openai_client = get_llm_client('TranscriptBiasDetector', api_key=api_key)
                     logger.info("[TranscriptBias] ✓ OpenAI initialized")
                 except Exception as e:
                     logger.error(f"[TranscriptBias] OpenAI init failed: {e}")
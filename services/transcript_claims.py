@@ -1,8 +1,13 @@
 """
 File: services/transcript_claims.py
-Last Updated: December 28, 2025 - v2.1.0 SPEAKER EXTRACTION BUGFIX
+Last Updated: October 16, 2026 - v2.1.1
 Description: Claim extraction optimized for TRANSCRIPTS and SPEECH (not news articles)
 
+UPDATE (October 16, 2026 - v2.1.1):
+===================================
+✅ _split_into_sentences() reuses the shared DocumentAnalysis sentence split
+   (also used by SpeakerQualityAnalyzer for the same transcript)
+
 CRITICAL BUGFIX (December 28, 2025 - v2.1.0):
 =============================================
 🔴 PROBLEM: For unlabeled transcripts, speaker was being extracted from sentences
@@ -55,15 +60,15 @@ from typing import Dict, List, Any, Optional
 from datetime import datetime
 import json
 
+from services.document_analysis import get_document
+
 logger = logging.getLogger(__name__)
 
-# Try to import OpenAI
-try:
-    from openai import OpenAI
+# OpenAI calls go through the shared LLM gateway (services/llm_gateway.py)
+from services.llm_gateway import get_llm_client, OPENAI_AVAILABLE
+if OPENAI_AVAILABLE:
     import httpx
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
+else:
     logger.warning("OpenAI not available for transcript claim extraction")
 
 
@@ -81,7 +86,8 @@ class TranscriptClaimExtractor:
         
         if OPENAI_AVAILABLE and openai_key:
             try:
-                self.openai_client = OpenAI(
+                self.openai_client = get_llm_client(
+                    'TranscriptClaimExtractor',
                     api_key=openai_key,
                     timeout=httpx.Timeout(10.0, connect=3.0)
                 )
@@ -609,11 +615,8 @@ JSON Array:"""
         return None
     
     def _split_into_sentences(self, text: str) -> List[str]:
-        """Split text into sentences"""
-        # Simple sentence splitter
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if s.strip() and len(s.strip()) > 20]
-        return sentences
+        """Split text into sentences (shared DocumentAnalysis split)"""
+        return [s for s in get_document(text).sentences if len(s) > 20]
     
     def _clean_claim_text(self, text: str) -> str:
         """Clean and format claim text"""
@@ -31,7 +31,7 @@ I did no harm and this file is not truncated.
 
 import re
 import logging
-import requests
+from services.http_client import get_http_client
 import json
 from typing import Dict, List, Any, Optional
 from datetime import datetime
@@ -40,13 +40,11 @@ import time
 
 logger = logging.getLogger(__name__)
 
-# Try to import OpenAI
-try:
-    from openai import OpenAI
+# OpenAI calls go through the shared LLM gateway (services/llm_gateway.py)
+from services.llm_gateway import get_llm_client, OPENAI_AVAILABLE
+if OPENAI_AVAILABLE:
     import httpx
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
+else:
     logger.warning("OpenAI not available for transcript fact-checking")
 
 
@@ -126,7 +124,8 @@ class TranscriptComprehensiveFactChecker:
         self.openai_client = None
         if OPENAI_AVAILABLE and self.openai_api_key:
             try:
-                self.openai_client = OpenAI(
+                self.openai_client = get_llm_client(
+                    'TranscriptComprehensiveFactChecker',
                     api_key=self.openai_api_key,
                     timeout=httpx.Timeout(10.0, connect=3.0)
                 )
@@ -219,7 +218,7 @@ class TranscriptComprehensiveFactChecker:
                 'languageCode': 'en'
             }
             
-            response = requests.get(url, params=params, timeout=5)
+            response = get_http_client().get(url, params=params, timeout=5)
             
             if response.status_code == 200:
                 data = response.json()
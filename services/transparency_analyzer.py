@@ -1,7 +1,17 @@
 """
 Transparency Analyzer - v4.0 EDUCATIONAL GUIDE
 Date: October 13, 2025
-Last Updated: October 13, 2025 - ALWAYS INTERESTING & VALUABLE
+Last Updated: October 16, 2026 - v4.0.2 SHARED DOCUMENT ARTIFACT
+
+CHANGES IN v4.0.2:
+✅ PERFORMANCE: Word count and lowercased text come from the shared
+   DocumentAnalysis (services/document_analysis.py)
+
+CHANGES IN v4.0.1:
+✅ PERFORMANCE: _count_sources patterns compiled once in services/pattern_engine.py
+   and matched against the shared lowercased article instead of re.IGNORECASE
+   on the raw text. The "Name said" pattern is anchored at the start of the
+   word (same matches, no re-trying from every letter of every word)
 
 VISION:
 ✅ Always provide educational value, regardless of data
@@ -28,14 +38,14 @@ import time
 import re
 from typing import Dict, Any, List, Optional, Tuple
 
-try:
-    from openai import OpenAI
+# OpenAI calls go through the shared LLM gateway (services/llm_gateway.py)
+from services.llm_gateway import get_llm_client, OPENAI_AVAILABLE
+if OPENAI_AVAILABLE:
     import httpx
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
 
 from services.base_analyzer import BaseAnalyzer
+from services.pattern_engine import pattern_engine
+from services.document_analysis import document_for, get_document
 from config import Config
 
 logger = logging.getLogger(__name__)
@@ -47,14 +57,28 @@ class TransparencyAnalyzer(BaseAnalyzer):
     v4.0 - Teaches users what transparency means for THIS article type
     """
     
+    # Explicit source citations - lowercase equivalents of the v4.0 IGNORECASE patterns
+    SOURCE_PATTERNS = [
+        r'according to\s+[a-z]',
+        r'(?<![a-z])[a-z]{2,}\s+(?:said|told|stated|confirmed)',
+        r'(?:study|report|survey|research)\s+(?:by|from|published)',
+        r'cited by',
+        r'reported by',
+        r'data from',
+        r'source:\s*[a-z]'
+    ]
+    
     def __init__(self):
         super().__init__('transparency_analyzer')
         
+        pattern_engine.register_regex('transparency.sources', self.SOURCE_PATTERNS)
+        
         # Initialize OpenAI if available
         self.openai_client = None
         if OPENAI_AVAILABLE and Config.OPENAI_API_KEY:
             try:
-                self.openai_client = OpenAI(
+                self.openai_client = get_llm_client(
+                    'TransparencyAnalyzer',
                     api_key=Config.OPENAI_API_KEY,
                     timeout=httpx.Timeout(8.0, connect=2.0)
                 )
@@ -87,7 +111,7 @@ class TransparencyAnalyzer(BaseAnalyzer):
             author = data.get('author', 'Unknown')
             source = data.get('source', 'Unknown')
             url = data.get('url', '')
-            word_count = len(text.split())
+            word_count = document_for(data, text).word_count
             
             logger.info(f"[TransparencyGuide v4.0] Analyzing {word_count} words from {source}")
             
@@ -230,7 +254,7 @@ class TransparencyAnalyzer(BaseAnalyzer):
         """
         
         title_lower = title.lower()
-        text_lower = text.lower()
+        text_lower = get_document(text).text_lower
         
         # Breaking News (short, time-sensitive)
         if word_count < 300:
@@ -756,21 +780,7 @@ class TransparencyAnalyzer(BaseAnalyzer):
     
     def _count_sources(self, text: str) -> int:
         """Count explicit source citations"""
-        source_patterns = [
-            r'according to\s+[A-Z]',
-            r'[A-Z][a-z]+\s+(?:said|told|stated|confirmed)',
-            r'(?:study|report|survey|research)\s+(?:by|from|published)',
-            r'cited by',
-            r'reported by',
-            r'data from',
-            r'source:\s*[A-Z]'
-        ]
-        
-        count = 0
-        for pattern in source_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            count += len(matches)
-        
+        count = pattern_engine.scan(text).count('transparency.sources')
         return min(count, 25)
     
     def _count_quotes(self, text: str) -> int:
@@ -791,7 +801,7 @@ class TransparencyAnalyzer(BaseAnalyzer):
             r'analyzed?\s+\d+\s+(?:cases|responses|participants)'
         ]
         
-        text_lower = text.lower()
+        text_lower = get_document(text).text_lower
         for indicator in methodology_indicators:
             if re.search(indicator, text_lower):
                 return True
@@ -809,7 +819,7 @@ class TransparencyAnalyzer(BaseAnalyzer):
             r'clarification[:|\s]'
         ]
         
-        text_lower = text.lower()
+        text_lower = get_document(text).text_lower
         for indicator in corrections_indicators:
             if re.search(indicator, text_lower):
                 return True
@@ -827,7 +837,7 @@ class TransparencyAnalyzer(BaseAnalyzer):
             r'the\s+author[s]?\s+(?:work|worked|is\s+employed)\s+(?:for|at|with)'
         ]
         
-        text_lower = text.lower()
+        text_lower = get_document(text).text_lower
         for indicator in conflict_indicators:
             if re.search(indicator, text_lower):
                 return True
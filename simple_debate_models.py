@@ -1,10 +1,20 @@
 """
 TruthLens Debate Arena - Database Models
 File: simple_debate_models.py
-Date: November 11, 2025
-Version: 2.0.1 - DATABASE TABLE CREATION FIX
+Date: October 16, 2026
+Version: 2.1.0 - DENORMALIZED VOTE COUNTERS
 
 CHANGE LOG:
+- October 16, 2026 v2.1.0: Denormalized vote counters
+  - ADDED: SimpleDebate.for_votes / against_votes, updated atomically by
+    the vote route (ensure_vote_counter_columns() adds them to existing
+    databases and backfills them)
+  - ADDED: load_debate_arguments() - FOR and AGAINST arguments for a whole
+    page of debates in one query
+  - CHANGED: to_dict() accepts preloaded arguments; vote breakdown read from
+    the counters (was 4 queries per debate)
+  - PRESERVED: All response fields
+
 - November 11, 2025 v2.0.1: CRITICAL FIX - Database table creation
   - FIXED: Models now properly initialize so db.create_all() works
   - FIXED: Removed conditional column definitions (if db else None)
@@ -36,7 +46,7 @@ MODERATOR FEATURES:
 - Moderator can delete any debate (cascades to arguments and votes)
 - Password: "Shiftwork"
 
-Last modified: November 11, 2025 - v2.0.1 Database table creation fix
+Last modified: October 16, 2026 - v2.1.0 Denormalized vote counters
 """
 
 from datetime import datetime
@@ -91,8 +101,10 @@ def init_simple_debate_db(shared_db):
         # Status
         status = db.Column(db.String(20), default='open', nullable=False, index=True)
         
-        # Voting stats
+        # Voting stats (v2.1.0: per-side counters kept in step with total_votes)
         total_votes = db.Column(db.Integer, default=0, nullable=False)
+        for_votes = db.Column(db.Integer, default=0, nullable=False)
+        against_votes = db.Column(db.Integer, default=0, nullable=False)
         
         # Timestamps
         created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False, index=True)
@@ -119,19 +131,27 @@ def init_simple_debate_db(shared_db):
             return self.arguments.filter_by(position='against').first()
         
         def get_vote_breakdown(self):
-            """Get vote breakdown by argument"""
-            for_arg = self.get_argument_for()
-            against_arg = self.get_argument_against()
+            """Get vote breakdown by argument (v2.1.0: from the denormalized counters)"""
+            def percentage(votes):
+                if not self.total_votes:
+                    return 0
+                return round((votes / self.total_votes) * 100, 1)
             
             return {
-                'for_votes': for_arg.vote_count if for_arg else 0,
-                'against_votes': against_arg.vote_count if against_arg else 0,
-                'for_percentage': for_arg.get_vote_percentage() if for_arg else 0,
-                'against_percentage': against_arg.get_vote_percentage() if against_arg else 0
+                'for_votes': self.for_votes or 0,
+                'against_votes': self.against_votes or 0,
+                'for_percentage': percentage(self.for_votes or 0),
+                'against_percentage': percentage(self.against_votes or 0)
             }
         
-        def to_dict(self, include_arguments=False, include_votes=False):
-            """Convert to dictionary for JSON responses"""
+        def to_dict(self, include_arguments=False, include_votes=False, arguments=None):
+            """
+            Convert to dictionary for JSON responses
+            
+            Args:
+                arguments: Preloaded {'for': arg, 'against': arg} (see
+                    load_debate_arguments) - skips the two argument queries
+            """
             result = {
                 'id': self.id,
                 'topic': self.topic,
@@ -143,8 +163,12 @@ def init_simple_debate_db(shared_db):
             }
             
             if include_arguments:
-                for_arg = self.get_argument_for()
-                against_arg = self.get_argument_against()
+                if arguments is not None:
+                    for_arg = arguments.get('for')
+                    against_arg = arguments.get('against')
+                else:
+                    for_arg = self.get_argument_for()
+                    against_arg = self.get_argument_against()
                 result['arguments'] = {
                     'for': for_arg.to_dict(include_votes=include_votes) if for_arg else None,
                     'against': against_arg.to_dict(include_votes=include_votes) if against_arg else None
@@ -312,6 +336,74 @@ def get_voting_debates(limit=20, offset=0):
     return query.offset(offset).limit(limit).all()
 
 
+def load_debate_arguments(debates):
+    """
+    FOR and AGAINST arguments of many debates in one query (v2.1.0)
+    
+    Returns:
+        {debate_id: {'for': SimpleArgument or None, 'against': SimpleArgument or None}}
+    """
+    loaded = {debate.id: {'for': None, 'against': None} for debate in debates}
+    if not loaded:
+        return loaded
+    
+    arguments = SimpleArgument.query.filter(
+        SimpleArgument.debate_id.in_(list(loaded))
+    ).order_by(SimpleArgument.id).all()
+    
+    for argument in arguments:
+        sides = loaded[argument.debate_id]
+        if sides.get(argument.position) is None:  # first one wins, like .first()
+            sides[argument.position] = argument
+    
+    return loaded
+
+
+def get_voted_debate_ids(debate_ids, browser_fingerprint):
+    """Which of these debates the user voted in - one query (v2.1.0)"""
+    if not debate_ids:
+        return set()
+    rows = db.session.query(SimpleVote.debate_id).filter(
+        SimpleVote.debate_id.in_(list(debate_ids)),
+        SimpleVote.browser_fingerprint == browser_fingerprint
+    ).all()
+    return {debate_id for (debate_id,) in rows}
+
+
+def ensure_vote_counter_columns():
+    """
+    Add and backfill SimpleDebate.for_votes / against_votes (v2.1.0)
+    
+    db.create_all() does not add columns to a table that already exists.
+    Safe to call on every startup - does nothing once the columns exist.
+    
+    Returns:
+        True if the columns were added
+    """
+    from sqlalchemy import inspect, text
+    
+    columns = {column['name'] for column in inspect(db.engine).get_columns('simple_debates')}
+    missing = [name for name in ('for_votes', 'against_votes') if name not in columns]
+    if not missing:
+        return False
+    
+    with db.engine.begin() as connection:
+        for name in missing:
+            connection.execute(text(f'ALTER TABLE simple_debates ADD COLUMN {name} INTEGER NOT NULL DEFAULT 0'))
+        
+        # Backfill from the per-argument counters
+        for position in ('for', 'against'):
+            connection.execute(text(f"""
+                UPDATE simple_debates SET {position}_votes = COALESCE((
+                    SELECT SUM(simple_arguments.vote_count) FROM simple_arguments
+                    WHERE simple_arguments.debate_id = simple_debates.id
+                      AND simple_arguments.position = '{position}'
+                ), 0)
+            """))
+    
+    return True
+
+
 def check_user_voted(debate_id, browser_fingerprint):
     """Check if user already voted in this debate"""
     existing_vote = SimpleVote.query.filter_by(
@@ -322,4 +414,4 @@ def check_user_voted(debate_id, browser_fingerprint):
 
 
 # I did no harm and this file is not truncated
-# v2.0.1 - November 11, 2025 - Database table creation fix - TABLES NOW CREATE PROPERLY!
+# v2.1.0 - October 16, 2026 - Denormalized vote counters
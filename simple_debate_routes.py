@@ -1,10 +1,26 @@
 """
 TruthLens Debate Arena - Flask Routes
 File: simple_debate_routes.py
-Date: November 10, 2025
-Version: 2.0.0 - ULTRA-SIMPLIFIED WITH MODERATOR
+Date: October 16, 2026
+Version: 2.2.0 - LIVE VOTE UPDATES
 
 CHANGE LOG:
+- October 16, 2026 v2.2.0: Live vote updates
+  - NEW: GET /api/simple-debate/<id>/events - Server-Sent Events stream of
+    vote counts and status (services/live_updates.py), replaces polling
+  - CHANGED: vote(), join and moderator delete publish the committed debate
+    state once; viewers receive it without querying the database
+  - PRESERVED: All JSON endpoints unchanged
+
+- October 16, 2026 v2.1.0: Constant-query listings
+  - FIXED: /open-fights and /judgement-city issued 4+ queries per debate
+    (arguments, vote breakdown, user_has_voted) - now a fixed handful per page
+  - CHANGED: vote() updates argument and debate counters with atomic SQL
+    increments (concurrent votes no longer overwrite each other)
+  - NEW: Short-TTL listing page cache (DEBATE_PAGE_CACHE_TTL, 0 = off),
+    cleared on start, join, vote and delete
+  - PRESERVED: All response fields (DO NO HARM ✓)
+
 - November 10, 2025 v2.0.0: Ultra-simplified redesign per user requirements
   - CHANGED: Word limit from 250 to 300 words
   - ADDED: Moderator login with password "Shiftwork"
@@ -34,6 +50,7 @@ User Endpoints:
 - GET /api/simple-debate/judgement-city - List debates ready for voting
 - POST /api/simple-debate/vote/<id> - Cast vote for an argument
 - GET /api/simple-debate/<id> - Get specific debate details
+- GET /api/simple-debate/<id>/events - Live vote/status updates (SSE, v2.2.0; 503 unless SERVER_MODE=async)
 - GET /api/simple-debate/stats - Platform statistics
 
 Moderator Endpoints:
@@ -43,18 +60,23 @@ Moderator Endpoints:
 
 DO NO HARM: This replaces v1.0.0 simple debate routes, complex debate system untouched
 
-Last modified: November 10, 2025 - v2.0.0 Ultra-Simplified Redesign
+Last modified: October 16, 2026 - v2.2.0 Live Vote Updates
 """
 
 import os
+import json
 import logging
 from datetime import datetime, timedelta
-from flask import Blueprint, request, jsonify, session
+from flask import Blueprint, request, jsonify, session, Response, stream_with_context
 from sqlalchemy.exc import IntegrityError
 
+from config import Config
+from services.result_cache import MemoryCacheBackend
+from services.live_updates import get_live_broker
 from simple_debate_models import (
     db, SimpleDebate, SimpleArgument, SimpleVote,
-    generate_browser_fingerprint, get_open_debates, get_voting_debates, check_user_voted
+    generate_browser_fingerprint, get_open_debates, get_voting_debates, check_user_voted,
+    load_debate_arguments, get_voted_debate_ids
 )
 
 logger = logging.getLogger(__name__)
@@ -65,6 +87,10 @@ simple_debate_bp = Blueprint('simple_debate', __name__, url_prefix='/api/simple-
 # Moderator password (hardcoded as requested)
 MODERATOR_PASSWORD = "Shiftwork"
 
+# v2.1.0: Listing page cache - per worker, so other workers may lag by up to the TTL
+DEBATE_PAGE_CACHE_TTL = Config.CACHE.get('debate_page_ttl', 5)
+debate_page_cache = MemoryCacheBackend(max_bytes=8 * 1024 * 1024, max_entries=200)
+
 
 # ============================================================================
 # HELPER FUNCTIONS
@@ -88,6 +114,85 @@ def is_moderator():
     return session.get('is_moderator', False)
 
 
+def debates_to_dicts(debates, include_votes=False):
+    """Serialize a page of debates with their arguments loaded in one query (v2.1.0)"""
+    arguments = load_debate_arguments(debates)
+    return [
+        debate.to_dict(include_arguments=True, include_votes=include_votes, arguments=arguments[debate.id])
+        for debate in debates
+    ]
+
+
+def get_debate_page(status, page, per_page):
+    """
+    One listing page ({'debates': [...], 'total': N}) for a debate status
+    
+    Served from debate_page_cache for DEBATE_PAGE_CACHE_TTL seconds.
+    User-specific fields (user_has_voted, is_moderator) are never cached.
+    """
+    cache_key = f"{status}:{page}:{per_page}"
+    if DEBATE_PAGE_CACHE_TTL > 0:
+        cached = debate_page_cache.get(cache_key)
+        if cached is not None:
+            return json.loads(cached)
+    
+    offset = (page - 1) * per_page
+    if status == 'open':
+        debates = get_open_debates(limit=per_page, offset=offset)
+    else:
+        debates = get_voting_debates(limit=per_page, offset=offset)
+    
+    result = {
+        'debates': debates_to_dicts(debates, include_votes=(status == 'voting')),
+        'total': SimpleDebate.query.filter_by(status=status).count()
+    }
+    
+    if DEBATE_PAGE_CACHE_TTL > 0:
+        debate_page_cache.set(cache_key, json.dumps(result), DEBATE_PAGE_CACHE_TTL)
+    
+    return result
+
+
+def invalidate_debate_pages():
+    """Drop cached listing pages after anything that changes them"""
+    debate_page_cache.clear()
+
+
+def publish_debate_update(debate_id, debate_dict):
+    """
+    Push a debate's committed state to its live viewers (v2.2.0)
+    
+    debate_dict is the to_dict() the route already built for its own
+    response, so publishing costs no extra queries.
+    """
+    get_live_broker().publish(f"simple_debate:{debate_id}", {
+        'type': 'debate_update',
+        'debate_id': debate_id,
+        'debate': debate_dict
+    })
+
+
+def adjust_vote_counters(debate_id, argument, delta, count_total):
+    """
+    Move an argument's vote counters by delta with atomic SQL increments (v2.1.0)
+    
+    Updates SimpleArgument.vote_count and the matching SimpleDebate side
+    counter (plus total_votes when count_total) in the database itself, so
+    concurrent votes cannot overwrite each other. Caller commits.
+    """
+    SimpleArgument.query.filter_by(id=argument.id).update(
+        {SimpleArgument.vote_count: SimpleArgument.vote_count + delta},
+        synchronize_session=False
+    )
+    
+    side = SimpleDebate.for_votes if argument.position == 'for' else SimpleDebate.against_votes
+    updates = {side: side + delta}
+    if count_total:
+        updates[SimpleDebate.total_votes] = SimpleDebate.total_votes + delta
+    
+    SimpleDebate.query.filter_by(id=debate_id).update(updates, synchronize_session=False)
+
+
 # ============================================================================
 # MODERATOR ENDPOINTS
 # ============================================================================
@@ -173,6 +278,11 @@ def moderator_delete_debate(debate_id):
         debate_topic = debate.topic[:50]
         db.session.delete(debate)
         db.session.commit()
+        invalidate_debate_pages()
+        get_live_broker().publish(f"simple_debate:{debate_id}", {
+            'type': 'debate_deleted',
+            'debate_id': debate_id
+        })
         
         logger.info(f"Moderator deleted debate {debate_id}: {debate_topic}")
         
@@ -262,6 +372,7 @@ def start_fight():
         db.session.add(first_argument)
         
         db.session.commit()
+        invalidate_debate_pages()
         
         logger.info(f"New debate created: {debate.id} - {topic[:50]}")
         
@@ -340,13 +451,17 @@ def join_fight(debate_id):
         debate.voting_opened_at = datetime.utcnow()
         
         db.session.commit()
+        invalidate_debate_pages()
         
         logger.info(f"Debate {debate_id} now complete and in voting")
         
+        debate_dict = debate.to_dict(include_arguments=True, include_votes=True)
+        publish_debate_update(debate_id, debate_dict)
+        
         return jsonify({
             'success': True,
             'message': 'Fight joined! Debate is now live in Judgement City.',
-            'debate': debate.to_dict(include_arguments=True, include_votes=True)
+            'debate': debate_dict
         }), 201
         
     except Exception as e:
@@ -412,22 +527,26 @@ def vote(debate_id):
                     'debate': debate.to_dict(include_arguments=True, include_votes=True)
                 }), 200
             
-            # Different vote - update
+            # Different vote - update (v2.1.0: atomic counter moves)
             old_argument = SimpleArgument.query.get(existing_vote.argument_id)
             if old_argument:
-                old_argument.vote_count -= 1
+                adjust_vote_counters(debate_id, old_argument, -1, count_total=False)
             
-            argument.vote_count += 1
+            adjust_vote_counters(debate_id, argument, 1, count_total=False)
             existing_vote.argument_id = argument_id
             
             db.session.commit()
+            invalidate_debate_pages()
             
             logger.info(f"Vote changed in debate {debate_id} to argument {argument_id}")
             
+            debate_dict = debate.to_dict(include_arguments=True, include_votes=True)
+            publish_debate_update(debate_id, debate_dict)
+            
             return jsonify({
                 'success': True,
                 'message': 'Vote changed!',
-                'debate': debate.to_dict(include_arguments=True, include_votes=True)
+                'debate': debate_dict
             }), 200
         
         # Create new vote
@@ -438,18 +557,21 @@ def vote(debate_id):
         )
         db.session.add(vote)
         
-        # Increment vote counts
-        argument.vote_count += 1
-        debate.total_votes += 1
+        # Increment vote counts (v2.1.0: atomic SQL increments)
+        adjust_vote_counters(debate_id, argument, 1, count_total=True)
         
         db.session.commit()
+        invalidate_debate_pages()
         
         logger.info(f"Vote cast in debate {debate_id} for argument {argument_id}")
         
+        debate_dict = debate.to_dict(include_arguments=True, include_votes=True)
+        publish_debate_update(debate_id, debate_dict)
+        
         return jsonify({
             'success': True,
             'message': 'Vote recorded!',
-            'debate': debate.to_dict(include_arguments=True, include_votes=True)
+            'debate': debate_dict
         }), 201
         
     except IntegrityError:
@@ -479,13 +601,10 @@ def list_open_fights():
         page = int(request.args.get('page', 1))
         per_page = min(int(request.args.get('per_page', 20)), 50)
         
-        offset = (page - 1) * per_page
-        
-        debates = get_open_debates(limit=per_page, offset=offset)
-        total = SimpleDebate.query.filter_by(status='open').count()
-        
-        # Add moderator status to response
-        debates_list = [d.to_dict(include_arguments=True) for d in debates]
+        # v2.1.0: Cached page, arguments batch-loaded
+        listing = get_debate_page('open', page, per_page)
+        debates_list = listing['debates']
+        total = listing['total']
         
         return jsonify({
             'success': True,
@@ -515,18 +634,17 @@ def judgement_city():
         page = int(request.args.get('page', 1))
         per_page = min(int(request.args.get('per_page', 20)), 50)
         
-        offset = (page - 1) * per_page
+        # v2.1.0: Cached page, arguments batch-loaded, vote breakdown from counters
+        listing = get_debate_page('voting', page, per_page)
+        total = listing['total']
         
-        debates = get_voting_debates(limit=per_page, offset=offset)
-        total = SimpleDebate.query.filter_by(status='voting').count()
-        
-        # Check if user voted for each debate
+        # Check if user voted for each debate (one query for the whole page)
         browser_fingerprint = get_browser_fingerprint()
+        voted_ids = get_voted_debate_ids([d['id'] for d in listing['debates']], browser_fingerprint)
         
         debates_with_vote_status = []
-        for debate in debates:
-            debate_dict = debate.to_dict(include_arguments=True, include_votes=True)
-            debate_dict['user_has_voted'] = check_user_voted(debate.id, browser_fingerprint)
+        for debate_dict in listing['debates']:
+            debate_dict['user_has_voted'] = debate_dict['id'] in voted_ids
             debates_with_vote_status.append(debate_dict)
         
         return jsonify({
@@ -573,6 +691,59 @@ def get_debate(debate_id):
         return jsonify({'success': False, 'error': 'Failed to load debate'}), 500
 
 
+@simple_debate_bp.route('/<int:debate_id>/events', methods=['GET'])
+def debate_events(debate_id):
+    """
+    Live vote counts and status for one debate (Server-Sent Events) - v2.2.0
+    
+    Sends the current debate first, then a 'debate_update' event with the
+    full debate dict after every vote or join ('debate_deleted' if a
+    moderator removes it). One DB read per connection, none per update.
+    
+    503 unless streaming is enabled (SERVER_MODE=async) - clients keep polling.
+    """
+    broker = get_live_broker()
+    channel = f"simple_debate:{debate_id}"
+    
+    # Under sync workers a stream would hold a whole worker process
+    if not broker.streaming_enabled:
+        return jsonify({'success': False, 'error': 'Live updates unavailable', 'poll': True}), 503
+    
+    # Subscribe before reading the snapshot - a vote committed in between still arrives
+    subscription = broker.subscribe(channel)
+    try:
+        debate = SimpleDebate.query.get(debate_id)
+        if not debate:
+            subscription.close()
+            return jsonify({'success': False, 'error': 'Debate not found'}), 404
+        
+        initial = {
+            'type': 'debate_update',
+            'debate_id': debate_id,
+            'debate': debate.to_dict(include_arguments=True, include_votes=True)
+        }
+    except Exception as e:
+        subscription.close()
+        logger.error(f"Error opening live stream for debate {debate_id}: {e}", exc_info=True)
+        return jsonify({'success': False, 'error': 'Failed to load debate'}), 500
+    finally:
+        # Hand the connection back to the pool for the life of the stream
+        db.session.close()
+    
+    response = Response(
+        stream_with_context(broker.sse_stream(channel, initial, subscription)),
+        mimetype='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no',
+            'Connection': 'keep-alive'
+        }
+    )
+    # Also unsubscribes a client that left before the stream started
+    response.call_on_close(subscription.close)
+    return response
+
+
 @simple_debate_bp.route('/stats', methods=['GET'])
 def get_stats():
     """Get platform statistics"""
@@ -601,4 +772,4 @@ def get_stats():
 
 
 # I did no harm and this file is not truncated
-# v2.0.0 - November 10, 2025 - Ultra-simplified with moderator support
+# v2.2.0 - October 16, 2026 - Live vote updates
@@ -1,8 +1,34 @@
 """
 File: transcript_routes.py
-Last Updated: December 28, 2025 - v10.7.0 TRANSCRIPT DATE PARAMETER
+Last Updated: October 16, 2026 - v10.9.0 CONCURRENT CLAIM CHECKS
 Description: Flask routes for transcript fact-checking with optional transcript date
 
+LATEST UPDATE (October 16, 2026 - v10.9.0 CONCURRENT CLAIM CHECKS):
+====================================================================
+✅ CHANGED: Claims are fact-checked concurrently on a bounded per-process
+   pool (TRANSCRIPT_CLAIM_CONCURRENCY) instead of one after another
+✅ NEW: Repeated claims (same speaker, same words apart from articles and
+   filler - services/claim_cache.claim_signature) are verified once; copies
+   carry 'duplicate_of'
+✅ NEW: Progress writes coalesced - at most one job write per
+   TRANSCRIPT_PROGRESS_INTERVAL_MS instead of one per claim
+✅ PRESERVED: Claim order and per-claim result fields of v10.7.0
+
+UPDATE (October 16, 2026 - v10.8.0 DURABLE JOB QUEUE):
+====================================================================
+✅ REPLACED: Thread-per-request with a durable job queue (services/job_queue.py)
+   and a fixed pool of TRANSCRIPT_WORKERS threads per worker process
+✅ NEW: Jobs survive worker restarts - Redis when configured, otherwise a
+   SQLite file shared by every worker on the host
+✅ NEW: Retries with backoff, visibility timeout (jobs of a dead worker are
+   picked up again), dead-lettering after JOB_MAX_ATTEMPTS
+✅ NEW: Job state (progress / results) stored in the same backend -
+   memory_jobs is only a last resort when the backend errors
+✅ CHANGED: /stats reports real queue metrics (depth, running, oldest wait,
+   retries, dead letters); /status adds queue position and attempts
+✅ New job status 'queued' while waiting for a worker
+✅ PRESERVED: All request/response fields of v10.7.0
+
 LATEST UPDATE (December 28, 2025 - v10.7.0 TRANSCRIPT DATE):
 ====================================================================
 ✅ ADDED: Optional 'transcript_date' parameter to /analyze endpoint
@@ -48,6 +74,7 @@ import random
 import socket
 import queue
 import re
+from concurrent.futures import as_completed
 
 # Import Config
 from config import Config
@@ -62,6 +89,10 @@ from services.export_service import ExportService
 # v10.4.0: Import Speaker Quality Analyzer
 from services.speaker_quality_analyzer import SpeakerQualityAnalyzer
 
+# v10.8.0: Durable job queue + bounded worker pool
+from services.job_queue import get_job_queue, JobWorkerPool, QueuedJob, PRIORITY_NORMAL
+from services.service_executor import InstrumentedExecutor
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -99,7 +130,6 @@ redis_client = None
 
 try:
     import redis
-    from redis.connection import ConnectionPool
     REDIS_AVAILABLE = True
     logger.info("[TranscriptRoutes] ✓ Redis library imported")
 except ImportError:
@@ -107,48 +137,39 @@ except ImportError:
     logger.warning("[TranscriptRoutes] ⚠️  Install redis: pip install redis")
     logger.warning("[TranscriptRoutes] ⚠️  WITHOUT REDIS: Multi-instance deployments WILL have 404 errors!")
 
-# Initialize Redis connection
+# Initialize Redis connection (shared client - see services/redis_client.py)
 if REDIS_AVAILABLE:
-    redis_url = os.getenv('REDIS_URL')
-    if redis_url:
-        try:
-            # Create connection pool for better performance
-            pool = ConnectionPool.from_url(
-                redis_url,
-                max_connections=10,
-                socket_keepalive=True,
-                socket_timeout=5,
-                retry_on_timeout=True,
-                decode_responses=True  # Automatically decode bytes to strings
-            )
-            redis_client = redis.Redis(connection_pool=pool)
-            
-            # Test connection
-            redis_client.ping()
+    if os.getenv('REDIS_URL'):
+        from services.redis_client import get_redis_client
+        redis_client = get_redis_client()
+        
+        if redis_client:
             logger.info(f"[TranscriptRoutes] ✓ Redis connected successfully (Instance: {INSTANCE_ID})")
             logger.info("[TranscriptRoutes] ✓ Job storage: REDIS (persistent across instances)")
             logger.info("[TranscriptRoutes] ✓ Multi-instance support: ENABLED")
-        except Exception as e:
-            logger.error(f"[TranscriptRoutes] ✗ Redis connection failed: {e}")
+        else:
             logger.error("[TranscriptRoutes] ✗ Redis connection failed - falling back to memory storage")
             logger.error("[TranscriptRoutes] ✗ WARNING: This will cause 404 errors on multi-instance deployments!")
             logger.error("[TranscriptRoutes] ✗ FIX: Set up Redis on Render - see RENDER_REDIS_SETUP.md")
-            redis_client = None
     else:
         logger.warning(f"[TranscriptRoutes] ⚠️  REDIS_URL not set (Instance: {INSTANCE_ID})")
         logger.warning("[TranscriptRoutes] ⚠️  Using memory storage - will NOT work with multiple instances!")
         logger.warning("[TranscriptRoutes] ⚠️  SOLUTION 1: Set up Redis on Render (recommended)")
         logger.warning("[TranscriptRoutes] ⚠️  SOLUTION 2: Add 'numInstances: 1' to render.yaml")
 
-# Fallback to memory storage
+# v10.8.0: Jobs and job state live in the shared job queue backend
+# (Redis when configured, otherwise a SQLite file shared by all workers)
+transcript_queue = get_job_queue('transcript')
+
 if not redis_client:
-    logger.warning(f"[TranscriptRoutes] ⚠️  Job storage: MEMORY (Instance: {INSTANCE_ID})")
-    logger.warning("[TranscriptRoutes] ⚠️  Multi-instance support: DISABLED")
-    logger.warning("[TranscriptRoutes] ⚠️  If you see 404 errors, you need Redis!")
-    memory_jobs = {}
+    logger.warning(f"[TranscriptRoutes] ⚠️  Job storage: {transcript_queue.backend_name.upper()} (Instance: {INSTANCE_ID})")
+    logger.warning("[TranscriptRoutes] ⚠️  Multi-instance support: DISABLED (workers on this host share jobs)")
+
+# Last-resort storage if the queue backend errors at runtime
+memory_jobs = {}
 
 # Job expiration time (24 hours)
-JOB_EXPIRATION_SECONDS = 86400  # 24 hours
+JOB_EXPIRATION_SECONDS = transcript_queue.retention
 
 # Service statistics
 service_stats = {
@@ -160,7 +181,7 @@ service_stats = {
     'youtube_failures': 0,
     'speaker_quality_analyses': 0,  # v10.4.0
     'speaker_quality_failures': 0,   # v10.4.0
-    'storage_backend': 'redis' if redis_client else 'memory',
+    'storage_backend': transcript_queue.backend_name,
     'instance_id': INSTANCE_ID,
     'fact_checker_version': 'enhanced_v1.0_fred_api_with_date'  # v10.7.0
 }
@@ -171,7 +192,7 @@ service_stats = {
 
 def save_job(job_id: str, job_data: Dict[str, Any]) -> None:
     """
-    Save job to Redis or memory with expiration
+    Save job state to the job queue backend (Redis or SQLite) with expiration
     
     Args:
         job_id: Unique job identifier
@@ -181,33 +202,17 @@ def save_job(job_id: str, job_data: Dict[str, Any]) -> None:
         job_data['updated_at'] = datetime.now().isoformat()
         job_data['instance_id'] = INSTANCE_ID  # Track which instance created the job
         
-        if redis_client:
-            # Save to Redis with expiration
-            redis_key = f"transcript_job:{job_id}"
-            redis_client.setex(
-                redis_key,
-                JOB_EXPIRATION_SECONDS,
-                json.dumps(job_data)
-            )
-            logger.info(f"[TranscriptRoutes] ✓ Saved job {job_id} to Redis (Instance: {INSTANCE_ID})")
-        else:
-            # Save to memory
-            memory_jobs[job_id] = job_data
-            logger.info(f"[TranscriptRoutes] ✓ Saved job {job_id} to memory (Instance: {INSTANCE_ID})")
-            if len(memory_jobs) > 1:
-                logger.warning(f"[TranscriptRoutes] ⚠️  Multiple jobs in memory on {INSTANCE_ID}")
-                logger.warning("[TranscriptRoutes] ⚠️  If another instance handles the status check, it will return 404!")
+        transcript_queue.save_state(job_id, job_data)
+        logger.info(f"[TranscriptRoutes] ✓ Saved job {job_id} to {transcript_queue.backend_name} (Instance: {INSTANCE_ID})")
     except Exception as e:
         logger.error(f"[TranscriptRoutes] ✗ Error saving job {job_id}: {e}")
-        # Fallback to memory if Redis fails
-        if redis_client:
-            logger.warning(f"[TranscriptRoutes] ⚠️  Falling back to memory for job {job_id}")
-            memory_jobs[job_id] = job_data
+        logger.warning(f"[TranscriptRoutes] ⚠️  Falling back to memory for job {job_id}")
+        memory_jobs[job_id] = job_data
 
 
 def get_job(job_id: str) -> Optional[Dict[str, Any]]:
     """
-    Get job from Redis or memory
+    Get job state from the job queue backend (or the memory fallback)
     
     Args:
         job_id: Unique job identifier
@@ -216,51 +221,32 @@ def get_job(job_id: str) -> Optional[Dict[str, Any]]:
         Job data dictionary or None
     """
     try:
-        if redis_client:
-            # Get from Redis
-            redis_key = f"transcript_job:{job_id}"
-            job_json = redis_client.get(redis_key)
-            
-            if job_json:
-                logger.info(f"[TranscriptRoutes] ✓ Retrieved job {job_id} from Redis (Instance: {INSTANCE_ID})")
-                return json.loads(job_json)
-            else:
-                logger.warning(f"[TranscriptRoutes] ⚠️  Job {job_id} not found in Redis (Instance: {INSTANCE_ID})")
-                return None
-        else:
-            # Get from memory
-            if job_id in memory_jobs:
-                logger.info(f"[TranscriptRoutes] ✓ Retrieved job {job_id} from memory (Instance: {INSTANCE_ID})")
-                return memory_jobs[job_id]
-            else:
-                logger.warning(f"[TranscriptRoutes] ⚠️  Job {job_id} not found in memory (Instance: {INSTANCE_ID})")
-                logger.warning("[TranscriptRoutes] ⚠️  This could be a multi-instance issue!")
-                return None
+        job = transcript_queue.load_state(job_id)
+        if job:
+            logger.info(f"[TranscriptRoutes] ✓ Retrieved job {job_id} from {transcript_queue.backend_name} (Instance: {INSTANCE_ID})")
+            return job
     except Exception as e:
         logger.error(f"[TranscriptRoutes] ✗ Error retrieving job {job_id}: {e}")
-        # Fallback to memory if Redis fails
-        if redis_client and job_id in memory_jobs:
-            logger.warning(f"[TranscriptRoutes] ⚠️  Falling back to memory for job {job_id}")
-            return memory_jobs[job_id]
-        return None
+    
+    if job_id in memory_jobs:
+        logger.warning(f"[TranscriptRoutes] ⚠️  Falling back to memory for job {job_id}")
+        return memory_jobs[job_id]
+    
+    logger.warning(f"[TranscriptRoutes] ⚠️  Job {job_id} not found (Instance: {INSTANCE_ID})")
+    return None
 
 
 def delete_job(job_id: str) -> None:
     """
-    Delete job from Redis or memory
+    Delete job state
     
     Args:
         job_id: Unique job identifier
     """
     try:
-        if redis_client:
-            redis_key = f"transcript_job:{job_id}"
-            redis_client.delete(redis_key)
-            logger.info(f"[TranscriptRoutes] ✓ Deleted job {job_id} from Redis")
-        else:
-            if job_id in memory_jobs:
-                del memory_jobs[job_id]
-                logger.info(f"[TranscriptRoutes] ✓ Deleted job {job_id} from memory")
+        transcript_queue.delete_state(job_id)
+        memory_jobs.pop(job_id, None)
+        logger.info(f"[TranscriptRoutes] ✓ Deleted job {job_id}")
     except Exception as e:
         logger.error(f"[TranscriptRoutes] ✗ Error deleting job {job_id}: {e}")
 
@@ -317,7 +303,29 @@ def update_job(job_id: str, updates: Dict[str, Any]) -> None:
         save_job(job_id, job)
 
 
-def create_job_via_api(transcript: str, source_type: str = 'text', metadata: Optional[Dict] = None) -> Dict[str, Any]:
+def enqueue_job(job_id: str, transcript: str, priority: int = PRIORITY_NORMAL) -> None:
+    """
+    Queue a created job for the worker pool (v10.8.0 - replaces Thread per request)
+    
+    Args:
+        job_id: Job created with create_job()
+        transcript: Transcript text to process
+        priority: Higher runs first (services.job_queue.PRIORITY_*)
+    """
+    # State first - a worker may pick the job up the moment it is enqueued
+    update_job(job_id, {
+        'status': 'queued',
+        'progress': 0,
+        'message': 'Waiting for an analysis worker...'
+    })
+    transcript_queue.enqueue({'transcript': transcript}, priority=priority, job_id=job_id)
+    
+    transcript_worker_pool.ensure_started()
+    transcript_worker_pool.notify()
+
+
+def create_job_via_api(transcript: str, source_type: str = 'text', metadata: Optional[Dict] = None,
+                       priority: int = PRIORITY_NORMAL) -> Dict[str, Any]:
     """
     API-friendly job creation function for external use (e.g., from app.py)
     
@@ -328,6 +336,7 @@ def create_job_via_api(transcript: str, source_type: str = 'text', metadata: Opt
         transcript: Transcript text to analyze
         source_type: Source type ('text', 'youtube', 'audio', etc.)
         metadata: Optional metadata dictionary (e.g., YouTube video info)
+        priority: Queue priority (higher runs first)
         
     Returns:
         Dict with structure:
@@ -378,10 +387,8 @@ def create_job_via_api(transcript: str, source_type: str = 'text', metadata: Opt
                 save_job(job_id, job)
                 logger.info(f"[TranscriptRoutes] ✓ Added metadata to job {job_id}")
         
-        # Start background processing
-        thread = Thread(target=process_transcript_job, args=(job_id, transcript))
-        thread.daemon = True
-        thread.start()
+        # Queue for the worker pool
+        enqueue_job(job_id, transcript, priority)
         
         logger.info(f"[TranscriptRoutes] ✓ API job created: {job_id} - Type: {source_type} - Length: {len(transcript)} chars")
         
@@ -594,14 +601,177 @@ FINALIZING_MESSAGES = [
 ]
 
 
-def process_transcript_job(job_id: str, transcript: str):
+# ============================================================================
+# CONCURRENT CLAIM FACT-CHECKING (v10.9.0)
+# ============================================================================
+
+CLAIM_CONCURRENCY = Config.JOB_QUEUE.get('claim_concurrency', 6)
+PROGRESS_INTERVAL_SECONDS = Config.JOB_QUEUE.get('progress_interval_ms', 750) / 1000
+
+# One bounded pool per process, shared by every running job (rebuilt after fork)
+claim_check_executor = InstrumentedExecutor(CLAIM_CONCURRENCY, thread_name_prefix='claim-check')
+
+
+class JobProgress:
+    """
+    Coalesced progress updates for one job
+    
+    update_job() rewrites the whole job JSON, so progress is written at most
+    once per PROGRESS_INTERVAL_SECONDS - the newest values win and flush()
+    writes whatever is still pending.
+    """
+    
+    def __init__(self, job_id: str, interval: float = PROGRESS_INTERVAL_SECONDS):
+        self.job_id = job_id
+        self.interval = interval
+        self.pending: Dict[str, Any] = {}
+        self.last_write = 0.0
+        self.writes = 0
+    
+    def update(self, updates: Dict[str, Any]) -> None:
+        self.pending.update(updates)
+        if time.time() - self.last_write >= self.interval:
+            self.flush()
+    
+    def flush(self) -> None:
+        if self.pending:
+            update_job(self.job_id, self.pending)
+            self.pending = {}
+            self.last_write = time.time()
+            self.writes += 1
+
+
+def group_near_duplicate_claims(texts: List[str], speakers: Optional[List[str]] = None) -> List[int]:
+    """
+    Map every claim to the first claim it repeats (or to itself)
+    
+    Two claims match only when the same speaker made them and their
+    claim_signature() is identical - the same words in the same order once
+    articles and filler ("actually", "um") are dropped. A fuzzy ratio merged
+    claims of opposite meaning ("rose" / "never rose", "increased" /
+    "decreased"), so any other difference keeps them apart. Numbers keep
+    their decimals ("3.5%" and "35%" differ).
     """
-    Background job processing function
+    from services.claim_cache import claim_signature
+    
+    representatives = {}  # (speaker, signature) -> index
+    groups = []
+    
+    for index, text in enumerate(texts):
+        speaker = speakers[index] if speakers else None
+        groups.append(representatives.setdefault((speaker, claim_signature(text)), index))
+    
+    return groups
+
+
+def fact_check_claims(claims: List[Dict], transcript: str, topics: List[str], transcript_date: str,
+                      progress: JobProgress) -> List[Dict]:
+    """
+    Fact-check a transcript's claims concurrently
+    
+    - Repeated claims (same speaker and claim_signature) are verified once and share the verdict
+    - At most CLAIM_CONCURRENCY checks run at once per process
+    - Results come back in the original claim order
+    - Progress writes are coalesced (JobProgress)
+    
+    Returns:
+        Fact-checked claims (same fields as the sequential v10.7.0 loop)
+    """
+    checkable = []
+    for claim in claims:
+        # Get claim text (handle both 'text' and 'claim' keys)
+        claim_text = claim.get('text') or claim.get('claim', '')
+        if not claim_text or len(claim_text) < 5:
+            logger.warning(f"[TranscriptRoutes] Skipping invalid claim: {claim}")
+            continue
+        checkable.append((claim, claim_text))
+    
+    groups = group_near_duplicate_claims([claim_text for _, claim_text in checkable],
+                                         speakers=[claim.get('speaker', 'Unknown') for claim, _ in checkable])
+    unique_positions = sorted(set(groups))
+    
+    if len(unique_positions) < len(checkable):
+        logger.info(f"[TranscriptRoutes v10.9.0] ✓ {len(checkable) - len(unique_positions)} repeated claims "
+                    f"reuse another claim's verdict")
+    
+    def check(position: int) -> Dict[str, Any]:
+        claim, claim_text = checkable[position]
+        # v10.7.0: Build context with transcript_date for temporal disambiguation
+        context = {
+            'transcript': transcript[:1000],  # First 1000 chars for context
+            'speaker': claim.get('speaker', 'Unknown'),
+            'topics': topics,
+            'transcript_date': transcript_date  # Helps resolve "when I took office"
+        }
+        logger.info(f"[TranscriptRoutes v10.9.0] Fact-checking claim {position + 1}/{len(checkable)}: {claim_text[:50]}...")
+        return fact_checker.check_claim(claim_text, context)
+    
+    futures = {claim_check_executor.submit(check, position): position for position in unique_positions}
+    verdicts: Dict[int, Any] = {}
+    progress_step = 40 / max(len(unique_positions), 1)  # Divide 40% progress among claims
+    
+    for done, future in enumerate(as_completed(futures), 1):
+        position = futures[future]
+        try:
+            verdicts[position] = future.result()
+        except Exception as e:
+            logger.error(f"[TranscriptRoutes] ✗ Error fact-checking claim {position + 1}: {e}")
+            verdicts[position] = e
+        
+        progress.update({
+            'progress': min(45 + int(done * progress_step), 85),
+            'message': f"✓ Fact-checked {done}/{len(unique_positions)} claims"
+        })
+    
+    # Assemble in the original order
+    fact_checked_claims = []
+    for position, (claim, claim_text) in enumerate(checkable):
+        source = groups[position]
+        verdict_result = verdicts[source]
+        
+        if isinstance(verdict_result, Exception):
+            # Add claim with error status
+            fact_checked_claims.append({
+                **claim,
+                'claim': claim.get('text', 'Error'),
+                'verdict': 'error',
+                'confidence': 0,
+                'explanation': f'Error during fact-checking: {str(verdict_result)}',
+                'sources': [],
+                'error': str(verdict_result)
+            })
+            continue
+        
+        # Combine claim with verdict
+        fact_checked_claim = {
+            **claim,
+            'claim': claim_text,  # Ensure 'claim' key exists
+            'verdict': verdict_result.get('verdict', 'unverifiable'),
+            'confidence': verdict_result.get('confidence', 0),
+            'explanation': verdict_result.get('explanation', 'No explanation available'),
+            'sources': verdict_result.get('sources', []),
+            'evidence': verdict_result.get('evidence', ''),  # Enhanced checker provides evidence
+            'fact_check_method': 'enhanced_fred_api_with_date',  # v10.7.0
+            'context_date': transcript_date  # v10.7.0: Record what date was used
+        }
+        if source != position:
+            fact_checked_claim['duplicate_of'] = checkable[source][1]
+        
+        fact_checked_claims.append(fact_checked_claim)
+    
+    return fact_checked_claims
+
+
+def process_transcript_job(job_id: str, transcript: str, attempt: int = 1, max_attempts: int = 1):
+    """
+    Background job processing function (run by the transcript worker pool)
     
     v10.4.0: Includes speaker quality analysis as Step 1.5
     v10.5.0: Adds comprehensive data for PDF generation
     v10.6.0: Uses EnhancedFactChecker with FRED API
     v10.7.0: Passes transcript_date to fact-checker for temporal context
+    v10.8.0: Runs on the job queue worker pool; re-raises on failure so the
+             queue can retry (attempt < max_attempts) or dead-letter the job
     
     Processes a transcript by:
     0. Job creation (5%)
@@ -615,6 +785,8 @@ def process_transcript_job(job_id: str, transcript: str):
     Args:
         job_id: Job identifier
         transcript: Transcript text to process
+        attempt: Queue attempt number (1-based)
+        max_attempts: Attempts the queue allows before dead-lettering
     """
     try:
         # Get job to retrieve transcript_date
@@ -631,6 +803,9 @@ def process_transcript_job(job_id: str, transcript: str):
             'message': random.choice(STARTING_MESSAGES)
         })
         
+        # v10.9.0: Progress-only updates are coalesced (at most one write per interval)
+        progress = JobProgress(job_id)
+        
         # ========================================================================
         # STEP 1.5: Speaker Quality Analysis (10% - 20%)
         # ========================================================================
@@ -639,7 +814,7 @@ def process_transcript_job(job_id: str, transcript: str):
         if speaker_quality_analyzer:
             try:
                 logger.info(f"[TranscriptRoutes] Step 1.5: Analyzing speaker quality (job {job_id})")
-                update_job(job_id, {
+                progress.update({
                     'progress': 10,
                     'message': random.choice(SPEAKER_QUALITY_MESSAGES)
                 })
@@ -672,7 +847,7 @@ def process_transcript_job(job_id: str, transcript: str):
                     logger.info(f"[TranscriptRoutes] ✓ Speaker quality analysis complete")
                     service_stats['speaker_quality_analyses'] += 1
                     
-                    update_job(job_id, {
+                    progress.update({
                         'progress': 20,
                         'message': '✓ Speaker quality analyzed'
                     })
@@ -691,7 +866,7 @@ def process_transcript_job(job_id: str, transcript: str):
         
         # STEP 1: Extract claims (20% - 40%)
         logger.info(f"[TranscriptRoutes] Step 1: Extracting claims from transcript (job {job_id})")
-        update_job(job_id, {
+        progress.update({
             'progress': 25,
             'message': random.choice(CLAIM_EXTRACTION_MESSAGES)
         })
@@ -707,84 +882,26 @@ def process_transcript_job(job_id: str, transcript: str):
         
         logger.info(f"[TranscriptRoutes] ✓ Extracted {len(claims)} claims, {len(speakers)} speakers, {len(topics)} topics")
         
-        update_job(job_id, {
+        progress.update({
             'progress': 40,
             'message': f"✓ Found {len(claims)} claims to fact-check"
         })
         
         # STEP 2: Fact-check claims with ENHANCED checker + DATE CONTEXT (40% - 85%)
         logger.info(f"[TranscriptRoutes v10.7.0] Step 2: Fact-checking {len(claims)} claims with EnhancedFactChecker + Date Context (job {job_id})")
-        update_job(job_id, {
+        progress.update({
             'progress': 45,
             'message': random.choice(FACT_CHECKING_MESSAGES)
         })
         
-        fact_checked_claims = []
-        progress_step = 40 / max(len(claims), 1)  # Divide 40% progress among claims
-        
-        for i, claim in enumerate(claims):
-            try:
-                # Get claim text (handle both 'text' and 'claim' keys)
-                claim_text = claim.get('text') or claim.get('claim', '')
-                
-                if not claim_text or len(claim_text) < 5:
-                    logger.warning(f"[TranscriptRoutes] Skipping invalid claim: {claim}")
-                    continue
-                
-                # v10.7.0: Build context with transcript_date for temporal disambiguation
-                context = {
-                    'transcript': transcript[:1000],  # First 1000 chars for context
-                    'speaker': claim.get('speaker', 'Unknown'),
-                    'topics': topics,
-                    'transcript_date': transcript_date  # NEW v10.7.0: Helps resolve "when I took office"
-                }
-                
-                logger.info(f"[TranscriptRoutes v10.7.0] Fact-checking claim {i+1}/{len(claims)}: {claim_text[:50]}...")
-                logger.info(f"[TranscriptRoutes v10.7.0] Using transcript date context: {transcript_date}")
-                
-                # v10.6.0: CHANGED - Use EnhancedFactChecker's check_claim method
-                verdict_result = fact_checker.check_claim(claim_text, context)
-                
-                # Combine claim with verdict
-                fact_checked_claim = {
-                    **claim,
-                    'claim': claim_text,  # Ensure 'claim' key exists
-                    'verdict': verdict_result.get('verdict', 'unverifiable'),
-                    'confidence': verdict_result.get('confidence', 0),
-                    'explanation': verdict_result.get('explanation', 'No explanation available'),
-                    'sources': verdict_result.get('sources', []),
-                    'evidence': verdict_result.get('evidence', ''),  # NEW: Enhanced checker provides evidence
-                    'fact_check_method': 'enhanced_fred_api_with_date',  # v10.7.0
-                    'context_date': transcript_date  # v10.7.0: Record what date was used
-                }
-                
-                fact_checked_claims.append(fact_checked_claim)
-                
-                # Update progress
-                current_progress = 45 + int((i + 1) * progress_step)
-                update_job(job_id, {
-                    'progress': min(current_progress, 85),
-                    'message': f"✓ Fact-checked {i+1}/{len(claims)} claims"
-                })
-                
-            except Exception as e:
-                logger.error(f"[TranscriptRoutes] ✗ Error fact-checking claim {i+1}: {e}")
-                # Add claim with error status
-                fact_checked_claims.append({
-                    **claim,
-                    'claim': claim.get('text', 'Error'),
-                    'verdict': 'error',
-                    'confidence': 0,
-                    'explanation': f'Error during fact-checking: {str(e)}',
-                    'sources': [],
-                    'error': str(e)
-                })
+        # v10.9.0: Concurrent, deduplicated, ordered (see fact_check_claims)
+        fact_checked_claims = fact_check_claims(claims, transcript, topics, transcript_date, progress)
         
         logger.info(f"[TranscriptRoutes v10.7.0] ✓ Fact-checked {len(fact_checked_claims)} claims with EnhancedFactChecker + Date Context")
         
         # STEP 3: Generate summary and credibility score (85% - 95%)
         logger.info(f"[TranscriptRoutes] Step 3: Generating summary (job {job_id})")
-        update_job(job_id, {
+        progress.update({
             'progress': 90,
             'message': random.choice(FINALIZING_MESSAGES)
         })
@@ -839,7 +956,8 @@ def process_transcript_job(job_id: str, transcript: str):
             results['speaker_quality'] = speaker_quality_analysis
             logger.info(f"[TranscriptRoutes] ✓ Speaker quality results added to final results")
         
-        # Save completed job
+        # Save completed job (after any pending progress, so it is never overwritten)
+        progress.flush()
         update_job(job_id, {
             'status': 'completed',
             'progress': 100,
@@ -860,7 +978,17 @@ def process_transcript_job(job_id: str, transcript: str):
         logger.info(f"[TranscriptRoutes v10.7.0] Fact-checker: EnhancedFactChecker with FRED API + Date Context ({transcript_date})")
         
     except Exception as e:
-        logger.error(f"[TranscriptRoutes] ✗ Job {job_id} failed: {e}", exc_info=True)
+        logger.error(f"[TranscriptRoutes] ✗ Job {job_id} failed (attempt {attempt}/{max_attempts}): {e}", exc_info=True)
+        
+        if attempt < max_attempts:
+            # The queue re-runs the job after a backoff
+            update_job(job_id, {
+                'status': 'queued',
+                'progress': 0,
+                'message': f'Temporary error - retrying (attempt {attempt + 1}/{max_attempts})...',
+                'error': str(e)
+            })
+            raise
         
         # Save failed job
         update_job(job_id, {
@@ -875,6 +1003,48 @@ def process_transcript_job(job_id: str, transcript: str):
         job = get_job(job_id)
         if job and job.get('source_type') == 'youtube':
             service_stats['youtube_failures'] += 1
+        
+        raise
+
+
+# ============================================================================
+# JOB QUEUE WORKER POOL (v10.8.0)
+# ============================================================================
+
+def run_transcript_job(job: QueuedJob) -> None:
+    """Worker pool handler - one queued transcript analysis"""
+    process_transcript_job(job.id, job.payload['transcript'], job.attempts, job.max_attempts)
+
+
+def on_transcript_job_dead(job: QueuedJob, error: str) -> None:
+    """
+    A job ran out of attempts. process_transcript_job already marks its own
+    final failure; this covers workers that died mid-job (lease expired).
+    """
+    state = get_job(job.id)
+    if state and state.get('status') != 'failed':
+        update_job(job.id, {
+            'status': 'failed',
+            'progress': 0,
+            'message': 'Analysis failed',
+            'error': error
+        })
+        service_stats['failed_jobs'] += 1
+
+
+transcript_worker_pool = JobWorkerPool(
+    transcript_queue,
+    run_transcript_job,
+    concurrency=Config.JOB_QUEUE.get('workers', 2),
+    poll_interval=Config.JOB_QUEUE.get('poll_interval', 1.0),
+    on_dead=on_transcript_job_dead
+)
+
+
+@transcript_bp.before_app_request
+def start_transcript_workers():
+    """Start this process's job workers (after gunicorn forks; no-op once running)"""
+    transcript_worker_pool.ensure_started()
 
 
 def calculate_credibility_score(claims: List[Dict]) -> Dict[str, Any]:
@@ -1015,12 +1185,10 @@ def analyze_transcript():
         # Create job with optional transcript_date
         job_id = create_job(transcript, source_type, transcript_date)
         
-        # Start background processing
-        thread = Thread(target=process_transcript_job, args=(job_id, transcript))
-        thread.daemon = True
-        thread.start()
+        # Queue for the worker pool
+        enqueue_job(job_id, transcript)
         
-        logger.info(f"[TranscriptRoutes v10.7.0] ✓ Analysis started for job {job_id} (Instance: {INSTANCE_ID})")
+        logger.info(f"[TranscriptRoutes v10.7.0] ✓ Analysis queued for job {job_id} (Instance: {INSTANCE_ID})")
         if transcript_date:
             logger.info(f"[TranscriptRoutes v10.7.0] ✓ Using transcript date: {transcript_date}")
         
@@ -1054,7 +1222,7 @@ def get_job_status(job_id: str):
             'error': 'Job not found',
             'job_id': job_id,
             'instance_id': INSTANCE_ID,
-            'storage_backend': 'redis' if redis_client else 'memory',
+            'storage_backend': transcript_queue.backend_name,
             'help': 'If you see this repeatedly, you need to set up Redis on Render'
         }), 404
     
@@ -1073,6 +1241,17 @@ def get_job_status(job_id: str):
     elif job['status'] == 'failed':
         response['error'] = job.get('error')
     
+    # v10.8.0: Queue-side view (position while waiting, attempts, retries)
+    queue_info = transcript_queue.job_info(job_id)
+    if queue_info:
+        response['queue'] = {
+            'status': queue_info['status'],
+            'attempts': queue_info['attempts'],
+            'max_attempts': queue_info['max_attempts'],
+            'jobs_ahead': queue_info.get('jobs_ahead'),
+            'last_error': queue_info.get('last_error')
+        }
+    
     return jsonify(response)
 
 
@@ -1146,26 +1325,19 @@ def get_stats():
     """Get service statistics"""
     stats = service_stats.copy()
     
-    # Add active jobs count
-    if redis_client:
-        try:
-            # Count Redis keys
-            keys = redis_client.keys('transcript_job:*')
-            stats['total_jobs_stored'] = len(keys)
-            active_count = 0
-            for key in keys:
-                job_id = key.split(':')[1] if ':' in key else key
-                job = get_job(job_id)
-                if job and job.get('status') == 'processing':
-                    active_count += 1
-            stats['active_jobs'] = active_count
-        except Exception as e:
-            logger.error(f"[TranscriptRoutes] ✗ Error getting Redis stats: {e}")
-            stats['total_jobs_stored'] = 'error'
-            stats['active_jobs'] = 'error'
+    # v10.8.0: Real queue metrics (totals across every worker sharing the backend)
+    queue_stats = transcript_queue.stats()
+    stats['queue'] = queue_stats
+    stats['workers'] = transcript_worker_pool.stats()
+    
+    if 'error' in queue_stats:
+        stats['total_jobs_stored'] = 'error'
+        stats['active_jobs'] = 'error'
+        stats['queued_jobs'] = 'error'
     else:
-        stats['total_jobs_stored'] = len(memory_jobs)
-        stats['active_jobs'] = len([j for j in memory_jobs.values() if j.get('status') == 'processing'])
+        stats['total_jobs_stored'] = sum(queue_stats.get(status, 0) for status in ('queued', 'running', 'completed', 'dead'))
+        stats['active_jobs'] = queue_stats.get('running', 0)
+        stats['queued_jobs'] = queue_stats.get('queued', 0)
     
     return jsonify({
         'success': True,
@@ -1178,7 +1350,7 @@ def health_check():
     """Health check endpoint"""
     health = {
         'status': 'healthy',
-        'storage_backend': 'redis' if redis_client else 'memory',
+        'storage_backend': transcript_queue.backend_name,
         'redis_connected': False,
         'instance_id': INSTANCE_ID,
         'multi_instance_support': redis_client is not None,
@@ -1188,6 +1360,10 @@ def health_check():
             'fact_checker': fact_checker is not None,
             'export_service': export_service is not None,
             'speaker_quality_analyzer': speaker_quality_analyzer is not None
+        },
+        'job_queue': {
+            'backend': transcript_queue.backend_name,
+            'workers': transcript_worker_pool.stats()
         }
     }
     
@@ -1577,7 +1753,8 @@ cleanup_thread = Thread(target=schedule_cleanup, daemon=True)
 cleanup_thread.start()
 
 logger.info("=" * 80)
-logger.info("TRANSCRIPT ROUTES LOADED (v10.7.0 - TRANSCRIPT DATE PARAMETER)")
+logger.info("TRANSCRIPT ROUTES LOADED (v10.9.0 - CONCURRENT CLAIM CHECKS)")
+logger.info(f"  ✓ Job Queue: {transcript_queue.backend_name} - {transcript_worker_pool.concurrency} workers per process")
 logger.info("  ✓ Fact-Checker: EnhancedFactChecker v1.0 with FRED API + Date Context")
 logger.info("  ✓ Economic Data: Real inflation/unemployment from Federal Reserve")
 logger.info("  ✓ Temporal Parsing: Accurately extracts dates from claims")
@@ -1599,4 +1776,4 @@ logger.info("=" * 80)
 
 
 # I did no harm and this file is not truncated
-# v10.7.0 - December 28, 2025 - TRANSCRIPT DATE PARAMETER FOR TEMPORAL DISAMBIGUATION
+# v10.9.0 - October 16, 2026 - CONCURRENT CLAIM CHECKS